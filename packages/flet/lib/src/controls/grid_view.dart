@@ -1,3 +1,5 @@
+import 'dart:math';
+
 import 'package:flutter/widgets.dart';
 
 import '../controls/control_widget.dart';
@@ -8,6 +10,7 @@ import '../utils/layout.dart';
 import '../utils/misc.dart';
 import '../utils/numbers.dart';
 import '../widgets/error.dart';
+import '../widgets/item_window.dart';
 import 'base_controls.dart';
 import 'scroll_notification_control.dart';
 import 'scrollable_control.dart';
@@ -24,6 +27,7 @@ class GridViewControl extends StatefulWidget {
 
 class _GridViewControlState extends State<GridViewControl> {
   late final ScrollController _controller;
+  final ItemWindow _window = ItemWindow();
 
   @override
   void initState() {
@@ -52,6 +56,8 @@ class _GridViewControlState extends State<GridViewControl> {
     final reverse = widget.control.getBool("reverse", false)!;
     final cacheExtent = widget.control.getDouble("cache_extent");
     final controls = widget.control.children("controls");
+    final itemCount = _window.itemCount(widget.control, controls);
+    _window.check(widget.control);
 
     var clipBehavior =
         widget.control.getClipBehavior("clip_behavior", Clip.hardEdge)!;
@@ -77,8 +83,39 @@ class _GridViewControlState extends State<GridViewControl> {
                 crossAxisSpacing: runSpacing,
                 childAspectRatio: childAspectRatio);
 
+        // Items built by the backend are always built on demand.
         var buildControlsOnDemand =
-            widget.control.getBool("build_controls_on_demand", true)!;
+            widget.control.getBool("build_controls_on_demand", true)! ||
+                itemCount != controls.length;
+
+        double indexOffset(int index) {
+          var crossAxisExtent =
+              (horizontal ? constraints.maxHeight : constraints.maxWidth) -
+                  (horizontal
+                      ? padding?.vertical ?? 0.0
+                      : padding?.horizontal ?? 0.0);
+          if (!crossAxisExtent.isFinite || crossAxisExtent <= 0) {
+            // Estimated from the average item size.
+            var position = _controller.position;
+            return itemCount > 0
+                ? (position.maxScrollExtent + position.viewportDimension) *
+                    index /
+                    itemCount
+                : 0.0;
+          }
+          // Same layout as the grid delegates.
+          var columns = maxExtent == null
+              ? runsCount
+              : max((crossAxisExtent / (maxExtent + runSpacing)).ceil(), 1);
+          var childCrossAxisExtent =
+              max(0.0, crossAxisExtent - runSpacing * (columns - 1)) / columns;
+          var leading =
+              horizontal ? padding?.left ?? 0.0 : padding?.top ?? 0.0;
+          return leading +
+              (index ~/ columns) *
+                  (childCrossAxisExtent / childAspectRatio + spacing);
+        }
+
         Widget child = !buildControlsOnDemand
             ? GridView(
                 scrollDirection: horizontal ? Axis.horizontal : Axis.vertical,
@@ -107,13 +144,20 @@ class _GridViewControlState extends State<GridViewControl> {
                 shrinkWrap: shrinkWrap,
                 padding: padding,
                 gridDelegate: gridDelegate,
-                itemCount: controls.length,
+                itemCount: itemCount,
                 itemBuilder: (context, index) {
-                  return ControlWidget(
-                    key: ValueKey(controls[index].getKey("key")?.value ??
-                        controls[index].id),
-                    control: controls[index],
-                  );
+                  var item = _window.item(widget.control, controls, index);
+                  return _window.track(
+                      widget.control,
+                      index,
+                      item != null
+                          ? ControlWidget(
+                              key: ValueKey(
+                                  item.getKey("key")?.value ?? item.id),
+                              control: item,
+                            )
+                          // Stands for an item not loaded yet.
+                          : const SizedBox.shrink());
                 },
               );
 
@@ -132,6 +176,7 @@ class _GridViewControlState extends State<GridViewControl> {
             control: widget.control,
             scrollDirection: horizontal ? Axis.horizontal : Axis.vertical,
             scrollController: _controller,
+            indexOffset: indexOffset,
             child: child);
 
         if (widget.control.hasEventHandler("scroll")) {
@@ -8,6 +8,7 @@ import '../utils/layout.dart';
 import '../utils/misc.dart';
 import '../utils/numbers.dart';
 import '../widgets/error.dart';
+import '../widgets/item_window.dart';
 import 'base_controls.dart';
 import 'control_widget.dart';
 import 'scroll_notification_control.dart';
@@ -25,6 +26,7 @@ class ListViewControl extends StatefulWidget {
 
 class _ListViewControlState extends State<ListViewControl> {
   late final ScrollController _controller;
+  final ItemWindow _window = ItemWindow();
 
   @override
   void initState() {
@@ -52,16 +54,52 @@ class _ListViewControlState extends State<ListViewControl> {
     var clipBehavior =
         widget.control.getClipBehavior("clip_behavior", Clip.hardEdge)!;
     var scrollDirection = horizontal ? Axis.horizontal : Axis.vertical;
+    var controls = widget.control.children("controls");
+    var itemCount = _window.itemCount(widget.control, controls);
+    // Items built by the backend are always built on demand.
     var buildControlsOnDemand =
-        widget.control.getBool("build_controls_on_demand", true)!;
+        widget.control.getBool("build_controls_on_demand", true)! ||
+            itemCount != controls.length;
     var firstItemPrototype =
         widget.control.getBool("first_item_prototype", false)!;
-    var controls = widget.control.children("controls");
     var prototypeItem = widget.control.buildWidget("prototype_item") ??
         (firstItemPrototype && controls.isNotEmpty
             ? ControlWidget(control: controls.first)
             : null);
 
+    _window.check(widget.control);
+
+    Widget buildItem(BuildContext context, int index) {
+      var item = _window.item(widget.control, controls, index);
+      return _window.track(
+          widget.control,
+          index,
+          item != null
+              ? ControlWidget(
+                  key: ValueKey(item.getKey("key")?.value ?? item.id),
+                  control: item,
+                )
+              // Stands for an item not loaded yet.
+              : SizedBox(
+                  width: horizontal ? kMinInteractiveDimension : null,
+                  height: horizontal ? null : kMinInteractiveDimension));
+    }
+
+    double indexOffset(int index) {
+      var extent = itemExtent;
+      if (extent != null && spacing == 0) {
+        var leading = horizontal ? padding?.left ?? 0.0 : padding?.top ?? 0.0;
+        return leading + index * extent;
+      }
+      // Estimated from the average item size.
+      var position = _controller.position;
+      return itemCount > 0
+          ? (position.maxScrollExtent + position.viewportDimension) *
+              index /
+              itemCount
+          : 0.0;
+    }
+
     Widget listView = LayoutBuilder(
       builder: (BuildContext context, BoxConstraints constraints) {
         debugPrint("ListView constraints.maxWidth: ${constraints.maxWidth}");
@@ -115,14 +153,8 @@ class _ListViewControlState extends State<ListViewControl> {
                     scrollDirection: scrollDirection,
                     shrinkWrap: shrinkWrap,
                     padding: padding,
-                    itemCount: controls.length,
-                    itemBuilder: (context, index) {
-                      return ControlWidget(
-                        key: ValueKey(controls[index].getKey("key")?.value ??
-                            controls[index].id),
-                        control: controls[index],
-                      );
-                    },
+                    itemCount: itemCount,
+                    itemBuilder: buildItem,
                     separatorBuilder: (context, index) {
                       return horizontal
                           ? dividerThickness == 0
@@ -144,15 +176,9 @@ class _ListViewControlState extends State<ListViewControl> {
                     scrollDirection: scrollDirection,
                     shrinkWrap: shrinkWrap,
                     padding: padding,
-                    itemCount: controls.length,
+                    itemCount: itemCount,
                     itemExtent: itemExtent,
-                    itemBuilder: (context, index) {
-                      return ControlWidget(
-                        key: ValueKey(controls[index].getKey("key")?.value ??
-                            controls[index].id),
-                        control: controls[index],
-                      );
-                    },
+                    itemBuilder: buildItem,
                     prototypeItem: prototypeItem,
                   );
 
@@ -171,6 +197,7 @@ class _ListViewControlState extends State<ListViewControl> {
             control: widget.control,
             scrollDirection: horizontal ? Axis.horizontal : Axis.vertical,
             scrollController: _controller,
+            indexOffset: indexOffset,
             child: child);
 
         if (widget.control.hasEventHandler("scroll")) {
@@ -9,6 +9,7 @@ import '../models/control.dart';
 import '../transport/data_channel.dart';
 import '../utils/frame_stream.dart';
 import '../utils/images.dart';
+import '../utils/inflate.dart';
 import '../utils/numbers.dart';
 import 'base_controls.dart';
 
@@ -26,6 +27,14 @@ import 'base_controls.dart';
 ///   [0x01][encoded bytes]                → decode (PNG/JPEG/WebP), replace
 ///   [0x03]                               → clear
 ///   [0x04][w u32 LE][h u32 LE][RGBA8888] → raw full frame (premultiplied)
+///   [0x06][w u32 LE][h u32 LE][zlib(RGBA8888)]
+///                                        → zlib-compressed raw full frame
+///   [0x05][w u32 LE][h u32 LE][n u32 LE]
+///     n × [x u32 LE][y u32 LE][w u32 LE][h u32 LE][RGBA8888]
+///                                        → delta: patch the shown frame
+///
+/// Delta frames are composited onto a copy of the shown frame's pixels,
+/// kept from the last raw frame or read back from the last decoded one.
 ///
 /// After every applied frame the widget sends a 1-byte `[0xFF]` ack back
 /// to Python — the producer awaits it, which is the backpressure that
@@ -40,6 +49,8 @@ import 'base_controls.dart';
 /// widget stops decoding entirely: it coalesces to the most recent frame,
 /// acks each one immediately (keeping the producer loop alive without a
 /// backlog), and applies only that latest frame when the tab returns.
+/// Delta frames can't be skipped, so those received after the latest full
+/// frame are kept too and applied after it.
 class RawImageControl extends StatefulWidget {
   final Control control;
 
@@ -60,11 +71,18 @@ class _RawImageControlState extends State<RawImageControl>
 
   ui.Image? _image;
 
-  // The most recent frame received while hidden (raw opcode + payload,
-  // owned copy). Applied once when the tab becomes visible again; older
-  // frames received while hidden are dropped. Null when nothing is
-  // pending or the tab is visible.
-  Uint8List? _deferredFrame;
+  // Premultiplied RGBA of the shown frame that delta frames are patched
+  // into, or null until a delta frame needs it.
+  Uint8List? _pixels;
+  int _pixelsWidth = 0;
+  int _pixelsHeight = 0;
+
+  // The most recent full frame received while hidden followed by the
+  // delta frames received after it (raw opcode + payload, owned copies).
+  // Applied once when the tab becomes visible again; older frames
+  // received while hidden are dropped. Empty when nothing is pending or
+  // the tab is visible.
+  final List<Uint8List> _deferredFrames = [];
 
   // 1-byte ack sent back to Python after each apply completes; the Python
   // side awaits it, giving `render()` its round-trip backpressure.
@@ -72,12 +90,12 @@ class _RawImageControlState extends State<RawImageControl>
 
   @override
   void onVisibilityRestored() {
-    // Paint the latest frame that arrived while hidden (if any). It was
-    // already acked on arrival, so apply it without acking again.
-    final deferred = _deferredFrame;
-    _deferredFrame = null;
-    if (deferred != null) {
-      _applyFrame(deferred, ack: false);
+    // Paint the latest frames that arrived while hidden (if any). They
+    // were already acked on arrival, so apply them without acking again.
+    final deferred = List<Uint8List>.of(_deferredFrames);
+    _deferredFrames.clear();
+    for (final frame in deferred) {
+      _applyFrame(frame, ack: false);
     }
   }
 
@@ -104,6 +122,7 @@ class _RawImageControlState extends State<RawImageControl>
     _channel = null;
     _image?.dispose();
     _image = null;
+    _pixels = null;
     super.dispose();
   }
 
@@ -115,11 +134,12 @@ class _RawImageControlState extends State<RawImageControl>
     if (!visible) {
       // Tab hidden: the compositor is suspended, so decoding and applying
       // would build a backlog that floods the engine on resume. Drop any
-      // earlier hidden frame, keep only this latest one to paint on
-      // resume, and ack immediately so the producer loop stays alive.
-      // Owned copy: the transport may reuse the inbound buffer before the
-      // tab returns.
-      _deferredFrame = Uint8List.fromList(bytes);
+      // earlier hidden frame, keep only this latest one (plus deltas on
+      // top of it) to paint on resume, and ack immediately so the
+      // producer loop stays alive. Owned copy: the transport may reuse
+      // the inbound buffer before the tab returns.
+      if (bytes[0] != 0x05) _deferredFrames.clear();
+      _deferredFrames.add(Uint8List.fromList(bytes));
       _channel?.send(_frameAppliedAck);
       return;
     }
@@ -130,6 +150,8 @@ class _RawImageControlState extends State<RawImageControl>
   ///   [0x01][encoded bytes]                → apply encoded (PNG/JPEG/WebP)
   ///   [0x03]                               → clear
   ///   [0x04][w u32 LE][h u32 LE][RGBA8888] → apply raw (premultiplied)
+  ///   [0x06][w u32 LE][h u32 LE][zlib(RGBA8888)] → inflate, apply raw
+  ///   [0x05][w u32 LE][h u32 LE][n u32 LE][n sub-rects] → apply delta
   ///
   /// When [ack] is true a `[0xFF]` frame-applied ack is sent once the apply
   /// completes. Frames deferred while hidden pass [ack] `false` because they
@@ -148,6 +170,12 @@ class _RawImageControlState extends State<RawImageControl>
       case 0x04:
         _enqueue(() => _applyRaw(payload), ack: ack);
         break;
+      case 0x05:
+        _enqueue(() => _applyDelta(payload), ack: ack);
+        break;
+      case 0x06:
+        _enqueue(() => _applyCompressed(payload), ack: ack);
+        break;
       default:
         debugPrint(
             "RawImage: unknown data-channel opcode 0x${bytes[0].toRadixString(16)}");
@@ -177,6 +205,7 @@ class _RawImageControlState extends State<RawImageControl>
     // across async boundaries and trigger "EncodingError: Loading error.".
     final owned = Uint8List.fromList(bytes);
     ui.Codec? codec;
+    _pixels = null;
     try {
       codec = await ui.instantiateImageCodec(owned, allowUpscaling: false);
       final frame = await codec.getNextFrame();
@@ -204,6 +233,86 @@ class _RawImageControlState extends State<RawImageControl>
     // implementations may read from the underlying buffer after this call
     // returns.
     final pixels = Uint8List.fromList(Uint8List.sublistView(payload, 8));
+    _pixels = pixels;
+    _pixelsWidth = w;
+    _pixelsHeight = h;
+    await _decodePixels(pixels, w, h);
+  }
+
+  Future<void> _applyCompressed(Uint8List payload) async {
+    if (payload.length < 8) return;
+    final bd = ByteData.sublistView(payload, 0, 8);
+    final w = bd.getUint32(0, Endian.little);
+    final h = bd.getUint32(4, Endian.little);
+    final Uint8List pixels;
+    try {
+      // Inflating allocates a fresh buffer, owned like a raw frame's copy.
+      pixels = await inflate(
+          Uint8List.fromList(Uint8List.sublistView(payload, 8)));
+    } catch (e) {
+      debugPrint("RawImage: inflate failed (${payload.length - 8} bytes): $e");
+      return;
+    }
+    if (w == 0 || h == 0 || pixels.length != w * h * 4) {
+      debugPrint("RawImage: bad compressed frame ${pixels.length} != $w*$h*4");
+      return;
+    }
+    _pixels = pixels;
+    _pixelsWidth = w;
+    _pixelsHeight = h;
+    await _decodePixels(pixels, w, h);
+  }
+
+  Future<void> _applyDelta(Uint8List payload) async {
+    if (payload.length < 12) return;
+    final bd = ByteData.sublistView(payload);
+    final w = bd.getUint32(0, Endian.little);
+    final h = bd.getUint32(4, Endian.little);
+    final count = bd.getUint32(8, Endian.little);
+    var pixels = _pixels;
+    if (pixels == null || _pixelsWidth != w || _pixelsHeight != h) {
+      // The shown frame was decoded from an encoded image; read its
+      // pixels back once to patch them from now on.
+      final image = _image;
+      if (image == null || image.width != w || image.height != h) {
+        debugPrint("RawImage: delta frame without a $w x $h base frame");
+        return;
+      }
+      final data = await image.toByteData(format: ui.ImageByteFormat.rawRgba);
+      if (data == null) return;
+      pixels = Uint8List.fromList(
+          data.buffer.asUint8List(data.offsetInBytes, data.lengthInBytes));
+      _pixels = pixels;
+      _pixelsWidth = w;
+      _pixelsHeight = h;
+    }
+    if (count == 0) return; // nothing changed
+    // Frames are applied one at a time, so the previous decode has
+    // finished reading `pixels` and it can be patched in place.
+    final stride = w * 4;
+    var offset = 12;
+    for (var i = 0; i < count; i++) {
+      if (offset + 16 > payload.length) break;
+      final x = bd.getUint32(offset, Endian.little);
+      final y = bd.getUint32(offset + 4, Endian.little);
+      final rw = bd.getUint32(offset + 8, Endian.little);
+      final rh = bd.getUint32(offset + 12, Endian.little);
+      offset += 16;
+      final rowBytes = rw * 4;
+      if (x + rw > w || y + rh > h || offset + rowBytes * rh > payload.length) {
+        debugPrint("RawImage: bad delta rect $x,$y ${rw}x$rh in $w x $h");
+        break;
+      }
+      for (var row = 0; row < rh; row++) {
+        final dst = (y + row) * stride + x * 4;
+        pixels.setRange(dst, dst + rowBytes, payload, offset);
+        offset += rowBytes;
+      }
+    }
+    await _decodePixels(pixels, w, h);
+  }
+
+  Future<void> _decodePixels(Uint8List pixels, int w, int h) async {
     final completer = Completer<ui.Image>();
     ui.decodeImageFromPixels(
         pixels, w, h, ui.PixelFormat.rgba8888, completer.complete);
@@ -211,6 +320,7 @@ class _RawImageControlState extends State<RawImageControl>
   }
 
   Future<void> _clear() async {
+    _pixels = null;
     _swapImage(null);
   }
 
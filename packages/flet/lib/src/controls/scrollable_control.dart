@@ -16,13 +16,18 @@ class ScrollableControl extends StatefulWidget {
   final ScrollController? scrollController;
   final bool wrapIntoScrollableView;
 
+  /// Returns the scroll offset of the item at an index, for `scroll_to` with
+  /// an `index`.
+  final double Function(int index)? indexOffset;
+
   ScrollableControl(
       {Key? key,
       required this.control,
       required this.child,
       required this.scrollDirection,
       this.scrollController,
-      this.wrapIntoScrollableView = false})
+      this.wrapIntoScrollableView = false,
+      this.indexOffset})
       : super(key: key ?? ValueKey("control_${control.id}"));
 
   @override
@@ -132,6 +137,13 @@ class _ScrollableControlState extends State<ScrollableControl>
             : null;
         var duration = parseDuration(args["duration"], Duration.zero)!;
         var curve = parseCurve(args["curve"], Curves.ease)!;
+        var index = parseInt(args["index"]);
+        if (index != null && widget.indexOffset != null) {
+          var position = _controller.position;
+          offset = widget
+              .indexOffset!(index)
+              .clamp(position.minScrollExtent, position.maxScrollExtent);
+        }
         if (globalKey != null) {
           var ctx = globalKey.currentContext;
           if (ctx != null) {
@@ -20,6 +20,7 @@ import 'protocol/invoke_method_response_body.dart';
 import 'protocol/message.dart';
 import 'protocol/page_media_data.dart';
 import 'protocol/patch_control_request_body.dart';
+import 'protocol/patch_controls_request_body.dart';
 import 'protocol/python_output_body.dart';
 import 'protocol/register_client_request_body.dart';
 import 'protocol/register_client_response_body.dart';
@@ -30,6 +31,7 @@ import 'transport/data_channel.dart';
 import 'transport/flet_backend_channel.dart';
 import 'transport/flet_msgpack_decoder.dart';
 import 'transport/flet_msgpack_encoder.dart';
+import 'transport/frame_compression.dart';
 import 'transport/protocol_muxed_data_channel.dart';
 import 'utils/desktop.dart';
 import 'utils/images.dart';
@@ -75,6 +77,10 @@ class FletBackend extends ChangeNotifier {
   final int? _reconnectTimeoutMs;
   int _reconnectStarted = 0;
   int _reconnectDelayMs = 0;
+
+  /// Sequence number of the last applied message of a resumable session.
+  /// Reported on reconnect so the server replays only the missed messages.
+  int? _lastSeq;
   FletBackendChannel? _backendChannel;
   final FletBackendChannelBuilder? _channelBuilder;
   late final DataChannelFactory _dataChannelFactory;
@@ -277,6 +283,12 @@ class FletBackend extends ChangeNotifier {
             action: MessageAction.registerClient,
             payload: RegisterClientRequestBody(
                 sessionId: SessionStore.getSessionId(),
+                lastSeq: _lastSeq,
+                features: [
+                  // interned keys, see transport/protocol_keys.dart
+                  "keys1",
+                  if (supportsFrameCompression) "deflate1",
+                ],
                 pageName: getWebPageName(pageUri),
                 page: {
                   "route": page.get("route"),
@@ -308,7 +320,11 @@ class FletBackend extends ChangeNotifier {
       _reconnectDelayMs = 0;
       error = "";
 
-      page.update(resp.patch, shouldNotify: true);
+      // no patch when the session is resumed: missed messages follow
+      if (resp.patch != null) {
+        page.update(resp.patch!, shouldNotify: true);
+      }
+      _lastSeq = resp.lastSeq;
 
       // drain send queue
       debugPrint("Send queue: ${_sendQueue.length}");
@@ -498,6 +514,10 @@ class FletBackend extends ChangeNotifier {
   /// discriminator:
   ///   0x00 → MsgPack-encoded Flet control frame (the existing protocol).
   ///   0x01 → raw DataChannel frame `[channel_id:u32 LE][payload]`.
+  ///   0x02 → bundle of packets `([length:u32 LE][packet])*` sent by the
+  ///          server in one WebSocket message.
+  ///   0x03 → packet compressed with raw deflate and the preset dictionary,
+  ///          sent to clients supporting it.
   void _onPacket(Uint8List packet) {
     if (packet.isEmpty) {
       debugPrint("Dropping empty packet");
@@ -509,7 +529,16 @@ class FletBackend extends ChangeNotifier {
       final body = msgpack.deserialize(
           Uint8List.sublistView(packet, 1),
           extDecoder: FletMsgpackDecoder());
-      _onMessage(Message.fromList(body));
+      final message = Message.fromList(body);
+      final seq = message.seq;
+      if (seq != null && _lastSeq != null && seq <= _lastSeq!) {
+        // already applied before reconnecting
+        return;
+      }
+      _onMessage(message);
+      if (seq != null) {
+        _lastSeq = seq;
+      }
     } else if (type == 0x01) {
       if (packet.length < 5) {
         debugPrint("Dropping malformed data channel frame (len=${packet.length})");
@@ -523,6 +552,21 @@ class FletBackend extends ChangeNotifier {
         return;
       }
       channel.deliver(Uint8List.sublistView(packet, 5));
+    } else if (type == 0x02) {
+      final data = ByteData.sublistView(packet);
+      var offset = 1;
+      while (offset + 4 <= packet.length) {
+        final length = data.getUint32(offset, Endian.little);
+        offset += 4;
+        if (offset + length > packet.length) {
+          debugPrint("Dropping truncated packet bundle");
+          return;
+        }
+        _onPacket(Uint8List.sublistView(packet, offset, offset + length));
+        offset += length;
+      }
+    } else if (type == 0x03) {
+      _onPacket(decompressFrame(Uint8List.sublistView(packet, 1)));
     } else {
       debugPrint("Dropping packet with unknown type byte 0x${type.toRadixString(16)}");
     }
@@ -541,6 +585,9 @@ class FletBackend extends ChangeNotifier {
       case MessageAction.patchControl:
         _onPatchControl(PatchControlRequestBody.fromJson(message.payload));
         break;
+      case MessageAction.patchControls:
+        _onPatchControls(PatchControlsRequestBody.fromJson(message.payload));
+        break;
       case MessageAction.invokeControlMethod:
         _onInvokeMethod(InvokeMethodRequestBody.fromJson(message.payload));
         break;
@@ -588,6 +635,14 @@ class FletBackend extends ChangeNotifier {
     }
   }
 
+  _onPatchControls(PatchControlsRequestBody req) {
+    // Patches are applied synchronously, in order, within a single message
+    // so no frame is rendered with only part of the batch applied.
+    for (var patch in req.patches) {
+      _onPatchControl(patch);
+    }
+  }
+
   _onInvokeMethod(InvokeMethodRequestBody req) async {
     var control = controlsIndex.get(req.controlId);
     dynamic result;
@@ -8,7 +8,10 @@ enum MessageAction {
   // Worker → dart: one line of stdout/stderr from the embedded
   // Pyodide runtime (only emitted when running inside a FletApp host
   // that wired stdout/stderr at loadPyodide time).
-  pythonOutput(7);
+  pythonOutput(7),
+  // Python → dart: several control patches sent as one frame and
+  // applied together.
+  patchControls(8);
 
   final int value;
   const MessageAction(this.value);
@@ -18,13 +21,17 @@ class Message {
   final MessageAction action;
   final dynamic payload;
 
-  Message({required this.action, required this.payload});
+  /// Sequence number assigned by sessions that keep a replay buffer.
+  final int? seq;
+
+  Message({required this.action, required this.payload, this.seq});
 
   dynamic toList() => [action.value, payload];
 
   factory Message.fromList(List<dynamic> value) {
     return Message(
         action: MessageAction.values.firstWhere((e) => e.value == value[0]),
-        payload: value[1]);
+        payload: value[1],
+        seq: value.length > 2 ? value[2] as int? : null);
   }
 }
@@ -0,0 +1,15 @@
+import 'patch_control_request_body.dart';
+
+class PatchControlsRequestBody {
+  final List<PatchControlRequestBody> patches;
+
+  PatchControlsRequestBody({required this.patches});
+
+  factory PatchControlsRequestBody.fromJson(Map<dynamic, dynamic> json) {
+    return PatchControlsRequestBody(
+      patches: (json["patches"] as List)
+          .map((p) => PatchControlRequestBody.fromJson(p))
+          .toList(),
+    );
+  }
+}
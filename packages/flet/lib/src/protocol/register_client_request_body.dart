@@ -2,13 +2,21 @@ class RegisterClientRequestBody {
   final String? sessionId;
   final String pageName;
   final Map<String, dynamic> page;
+  final int? lastSeq;
+  final List<String>? features;
 
   RegisterClientRequestBody(
-      {required this.sessionId, required this.pageName, required this.page});
+      {required this.sessionId,
+      required this.pageName,
+      required this.page,
+      this.lastSeq,
+      this.features});
 
   Map<String, dynamic> toMap() => <String, dynamic>{
         'session_id': sessionId,
         'page_name': pageName,
-        'page': page
+        'page': page,
+        'last_seq': lastSeq,
+        'features': features
       };
 }
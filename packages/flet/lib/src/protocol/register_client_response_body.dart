@@ -1,15 +1,22 @@
 class RegisterClientResponseBody {
   final String? sessionId;
-  final Map<String, dynamic> patch;
+  final Map<String, dynamic>? patch;
   final String? error;
+  final int? lastSeq;
 
   RegisterClientResponseBody(
-      {required this.sessionId, required this.patch, required this.error});
+      {required this.sessionId,
+      required this.patch,
+      required this.error,
+      this.lastSeq});
 
   factory RegisterClientResponseBody.fromJson(Map<dynamic, dynamic> json) {
     return RegisterClientResponseBody(
         sessionId: json["session_id"],
-        patch: Map<String, dynamic>.from(json["page_patch"]),
-        error: json['error'] as String?);
+        patch: json["page_patch"] != null
+            ? Map<String, dynamic>.from(json["page_patch"])
+            : null,
+        error: json['error'] as String?,
+        lastSeq: json['last_seq'] as int?);
   }
 }
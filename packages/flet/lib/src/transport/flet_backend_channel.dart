@@ -18,6 +18,8 @@ typedef FletBackendChannelOnDisconnectCallback = void Function();
 ///
 /// where `type == 0x00` is a MsgPack-encoded Flet protocol frame and
 /// `type == 0x01` is a raw DataChannel frame (`[channel_id:u32 LE][bytes]`).
+/// `type == 0x02` is a bundle of packets (`([length:u32 LE][packet])*`).
+/// `type == 0x03` is a compressed packet (raw deflate with a preset dictionary).
 /// Transports are responsible only for delivering packet boundaries; the
 /// type byte is interpreted by [FletBackend].
 typedef FletBackendChannelOnPacketCallback = void Function(Uint8List packet);
@@ -4,6 +4,8 @@ import 'package:flutter/foundation.dart';
 import 'package:flutter/material.dart';
 import 'package:msgpack_dart/msgpack_dart.dart';
 
+import 'protocol_keys.dart';
+
 class FletMsgpackDecoder extends ExtDecoder {
   final codec = const Utf8Codec();
 
@@ -19,6 +21,12 @@ class FletMsgpackDecoder extends ExtDecoder {
     } else if (extType == 3) {
       var microseconds = int.parse(codec.decode(data));
       return Duration(microseconds: microseconds);
+    } else if (extType == 5) {
+      // value encoded once on the Python side and embedded as is
+      return deserialize(data, extDecoder: this);
+    } else if (extType == 6) {
+      // field or control type name interned by the Python side
+      return protocolKeys[data[0]];
     }
     return null;
   }
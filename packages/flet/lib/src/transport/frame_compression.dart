@@ -0,0 +1,5 @@
+/// Decompression of protocol packets compressed by the server with raw
+/// deflate and the preset dictionary shipped with the client: `dart:io`'s
+/// [ZLibDecoder] on native platforms. Browsers can't decompress with a preset
+/// dictionary, web clients rely on WebSocket compression instead.
+export "frame_compression_web.dart" if (dart.library.io) 'frame_compression_io.dart';
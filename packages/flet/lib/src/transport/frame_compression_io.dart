@@ -0,0 +1,16 @@
+import 'dart:convert';
+import 'dart:io' as io;
+import 'dart:typed_data';
+
+import 'protocol_dictionary.dart';
+
+/// Whether this client can decompress compressed protocol packets.
+const bool supportsFrameCompression = true;
+
+final List<int> _dictionary = base64.decode(protocolDictionaryBase64);
+
+/// Restores the packet carried by a compressed packet payload.
+Uint8List decompressFrame(Uint8List data) {
+  final decoder = io.ZLibDecoder(raw: true, dictionary: _dictionary);
+  return Uint8List.fromList(decoder.convert(data));
+}
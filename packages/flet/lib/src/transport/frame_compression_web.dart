@@ -0,0 +1,9 @@
+import 'dart:typed_data';
+
+/// Whether this client can decompress compressed protocol packets.
+const bool supportsFrameCompression = false;
+
+/// Restores the packet carried by a compressed packet payload.
+Uint8List decompressFrame(Uint8List data) {
+  throw UnsupportedError("Compressed protocol packets are not supported");
+}
@@ -0,0 +1,36 @@
+// Generated by sdk/python/packages/flet/tests/bench_protocol_compression.py
+// --write-tables. Do not edit: the Python server uses the same table.
+
+/// Base64-encoded preset dictionary of compressed protocol frames.
+const String protocolDictionaryBase64 =
+    'gdQGLJIBggGRAgKRA5QAAtQGKqMxNTOUAAPUBirLP9yB1AYskgGCAZECApEDlAAC1AYqozEx'
+    'OZQAA9QGKss/1oHUBiySAYIBkQICkQOUAALUBiqiODWUAAPUBirLP9AAgdQGLJIBggGRAgKR'
+    'A5QAAtQGKqI2OJQAA9QGKss/yZmB1AYskgGCAZECApEDlAAC1AYqojUxlAAD1AYqyz/DM2nN'
+    'AbCiX2PUBsWiX2nNAbGG1AYgg9QGKqlQZXJzb24gX2nNArqiX2PUBruiX2nNArvUBhUQ1AZD'
+    'p2dyZXkxMDBfY9QG16Jfac0CX6JfY9QGvKJfac0CYKJfY9QGu6JfaSrDol9j1Abgol9pIKJf'
+    'Y9QGxaJfaSGG1AYgg9QGKqhQJYTUBkikQ2l0edQGeapFbnRlciBjaXR5ol9j1Abdol8VtaJf'
+    'Y9QGuKJfaUrUBmyCol9j1Abgol9pTaJfY9QGxRW1ol9j1Aa4ol9pGNQGbIKiX2PUBuCiX2kb'
+    'ol9j1AbFBuCiX2lSol9j1AbFol9pU4bUBiCD1AYqqVBlcnNvbiAG16Jfac0C5qJfY9QGvKJf'
+    'ac0C56JfY9QGu6Jfac0C6Aa6ol9pzQMy1AYVhNQGNArUBjUK1AY2CtQGNwqiX2nNBmyCol9j'
+    '1Abgol9pzKeiX2PUBsWiX2nMqIbUBiCD1AYGK6VTaGFyZaJfY9QG16Jfac0CeqJfY9QGvKJf'
+    'ac0CewYBiNQGEIKiX2PUBrOiX2nNAgbUBhuCol9j1Aa1ol9pAtSiX2PUBryiX2nNAtWiX2PU'
+    'BruiX2nNAtbUBhUQ1AYCjKJfY9QGvKJfac0CjaJfY9QGu6Jfac0CjtQGFRDUBoHUBiySAYIB'
+    'kQICkQOUAALUBiqjMzA2lAAD1AYqyz/sYXJlol9j1AbXol9pzQKDol9j1Aa8ol9pzQKEol9j'
+    '1AZhcmWiX2PUBteiX2nNAimiX2PUBryiX2nNAiqiX2PUBl9pzQLdol9j1Aa8ol9pzQLeol9j'
+    '1Aa7ol9pzQLf1AYVX2nNAkSiX2PUBryiX2nNAkWiX2PUBruiX2nNAkbUBhVfac0CAITUBg6B'
+    '1AYlw9QGLJKF1AYtw9QGSKZTZWFyY1aiX2PUBryiX2nNAleiX2PUBruiX2nNAljUBhUQ1AZD'
+    'AJICgqJpZBLUBgSSkgCB1AZskQGUAAHUBirDac0DCqJfY9QGvKJfac0DC6JfY9QGu6Jfac0D'
+    'DNQGFRAGKaowMDAwMDAwMDAwol9j1Aa0ol9pzQMgol9pAdQGAoHUBiySAYIBkQICkQOUAALU'
+    'BiqiMTeUAAPUBirLP6mZgdQGLJIBggGRAgKRA5QAAtQGKqMyMDSUAAPUBirLP+NpzQMYhNQG'
+    'Rc4AAQ8s1AZIpVN0YXRzol9j1AbKol9pzWyCol9j1Abgol9pzQEBol9j1AbFol9pzQEChtQG'
+    'IIPUAhDUBgSSkgCB1AYskgGBApEClAAC1AYqywAAAAAAAAAAkgKComlkzQMn1AYEkpEAlAAA'
+    '1AYskEVudGVyIG5hbWWiX2PUBt2iX2nNAyKE1AZIpUVtYWlsZWlnaHSmbWFyZ2luol9j1Aa6'
+    'ol9pzQMy1AYVhNQGNAoyol9j1Aa8ol9pzQIzol9j1Aa7ol9pzQI01AYVENQGQwMc1AYToS+i'
+    'X2PUBrGiX2PUBrDUBhSG1AYVgNQGFoDUFNQGS6Rib2xkol9j1Aa2ol9pzQMPhdQGKqEw1AZK'
+    'INQGDoHUBieTpXdpZHRopmhlaWdodKZtYXJnaW6iX2PUBtQGEYPUBg6B1AYpqjAwMDAwMDAw'
+    'MDCiX2PUBrSiX2nNFYTUBjQK1AY1CtQGNgrUBjcKol9pA9QGE6Evol9j1AYF1AYbgqJfY9QG'
+    'taJfaQLUBhKRhtQGDoHUBiXD1AYsk3JhaXTUBhrC1AYPg9QGDoHUBibDol9j1Aayol9pzQIF'
+    'BhSG1AYVgNQGFoDUBheA1AYYANQGGahwb3J0cmFpdNQAkgGD1AYAp3Nlc3Npb27UBgGI1AYQ'
+    'gqJfY9QGs6JfaQCSAoKiaWTNAyLUBgSSkQCUAADUBgKoUmVxdWlyZWSB1AYskgGCAZECApED'
+    'lAAC1AYqozEwMpQAA9QGKss/0wCSAoKiaWQN1AYEkpIAgdQGbJEBlAAB1AYqwgCSAoKiaWTN'
+    'AhnUBgSTkgCB1AYskgGCAZECApEDlAAC';
@@ -0,0 +1,254 @@
+// Generated by sdk/python/packages/flet/tests/bench_protocol_compression.py
+// --write-tables. Do not edit: the Python server uses the same table.
+
+/// Strings sent as their index in this list by servers interning keys.
+const List<String> protocolKeys = [
+  "session_id",
+  "page_patch",
+  "error",
+  "last_seq",
+  "patch",
+  "patches",
+  "control_id",
+  "call_id",
+  "name",
+  "args",
+  "result",
+  "target",
+  "data",
+  "props",
+  "_internals",
+  "_overlay",
+  "_dialogs",
+  "_services",
+  "views",
+  "route",
+  "media",
+  "padding",
+  "view_padding",
+  "view_insets",
+  "device_pixel_ratio",
+  "orientation",
+  "always_use_24_hour_format",
+  "window",
+  "platform",
+  "platform_brightness",
+  "width",
+  "height",
+  "title",
+  "theme",
+  "dark_theme",
+  "theme_mode",
+  "locale_configuration",
+  "host_expanded",
+  "host_positioned",
+  "skip_properties",
+  "key",
+  "uid",
+  "value",
+  "content",
+  "controls",
+  "expand",
+  "expand_loose",
+  "opacity",
+  "visible",
+  "disabled",
+  "tooltip",
+  "badge",
+  "left",
+  "top",
+  "right",
+  "bottom",
+  "margin",
+  "scale",
+  "offset",
+  "rotate",
+  "align",
+  "alignment",
+  "aspect_ratio",
+  "animate_opacity",
+  "animate_size",
+  "animate_position",
+  "animate_scale",
+  "bgcolor",
+  "color",
+  "icon",
+  "icon_color",
+  "icon_size",
+  "label",
+  "text",
+  "size",
+  "weight",
+  "style",
+  "text_style",
+  "text_align",
+  "font_family",
+  "italic",
+  "max_lines",
+  "overflow",
+  "selectable",
+  "spans",
+  "spacing",
+  "run_spacing",
+  "wrap",
+  "tight",
+  "scroll",
+  "auto_scroll",
+  "horizontal_alignment",
+  "vertical_alignment",
+  "border",
+  "border_radius",
+  "border_color",
+  "border_width",
+  "shape",
+  "elevation",
+  "shadow",
+  "shadows",
+  "gradient",
+  "image",
+  "blur",
+  "clip_behavior",
+  "ink",
+  "animate",
+  "leading",
+  "trailing",
+  "subtitle",
+  "actions",
+  "selected",
+  "selected_index",
+  "destinations",
+  "options",
+  "items",
+  "item_extent",
+  "item_count",
+  "first_item_prototype",
+  "divider_thickness",
+  "build_controls_on_demand",
+  "hint_text",
+  "helper",
+  "counter",
+  "prefix",
+  "suffix",
+  "prefix_icon",
+  "suffix_icon",
+  "password",
+  "can_reveal_password",
+  "multiline",
+  "min_lines",
+  "read_only",
+  "autofocus",
+  "filled",
+  "fill_color",
+  "dense",
+  "src",
+  "fit",
+  "url",
+  "semantics_label",
+  "adaptive",
+  "active_color",
+  "check_color",
+  "thumb_color",
+  "min",
+  "max",
+  "divisions",
+  "open",
+  "modal",
+  "duration",
+  "bar_height",
+  "radius",
+  "stroke_width",
+  "center",
+  "runs_count",
+  "max_extent",
+  "child_aspect_ratio",
+  "col",
+  "columns",
+  "rows",
+  "cells",
+  "mouse_cursor",
+  "on_click",
+  "on_change",
+  "on_submit",
+  "on_focus",
+  "on_blur",
+  "on_hover",
+  "on_long_press",
+  "on_tap",
+  "on_dismiss",
+  "on_scroll",
+  "on_select",
+  "on_size_change",
+  "on_animation_end",
+  "Page",
+  "View",
+  "Overlay",
+  "Dialogs",
+  "ServiceRegistry",
+  "Window",
+  "Text",
+  "TextSpan",
+  "Icon",
+  "Image",
+  "Container",
+  "Column",
+  "Row",
+  "Stack",
+  "ListView",
+  "GridView",
+  "ResponsiveRow",
+  "SafeArea",
+  "Card",
+  "Divider",
+  "VerticalDivider",
+  "ListTile",
+  "ExpansionTile",
+  "AppBar",
+  "BottomAppBar",
+  "NavigationBar",
+  "NavigationBarDestination",
+  "NavigationRail",
+  "NavigationRailDestination",
+  "NavigationDrawer",
+  "NavigationDrawerDestination",
+  "Tabs",
+  "Tab",
+  "TabBar",
+  "TabBarView",
+  "Button",
+  "ElevatedButton",
+  "FilledButton",
+  "FilledTonalButton",
+  "OutlinedButton",
+  "TextButton",
+  "IconButton",
+  "FloatingActionButton",
+  "PopupMenuButton",
+  "PopupMenuItem",
+  "TextField",
+  "Dropdown",
+  "DropdownOption",
+  "Checkbox",
+  "Radio",
+  "RadioGroup",
+  "Switch",
+  "Slider",
+  "Chip",
+  "CircleAvatar",
+  "ProgressBar",
+  "ProgressRing",
+  "AlertDialog",
+  "BottomSheet",
+  "SnackBar",
+  "Banner",
+  "DataTable",
+  "DataColumn",
+  "DataRow",
+  "DataCell",
+  "GestureDetector",
+  "Markdown",
+  "AnimatedSwitcher",
+  "SearchBar",
+  "MenuBar",
+  "SubmenuButton",
+  "MenuItemButton",
+];
@@ -0,0 +1,3 @@
+/// zlib (RFC 1950) decompression: `dart:io`'s [ZLibCodec] on native
+/// platforms, the browser's `DecompressionStream` on the web.
+export "inflate_web.dart" if (dart.library.io) 'inflate_io.dart';
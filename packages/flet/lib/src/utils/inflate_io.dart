@@ -0,0 +1,6 @@
+import 'dart:io' as io;
+import 'dart:typed_data';
+
+Future<Uint8List> inflate(Uint8List data) async {
+  return Uint8List.fromList(io.zlib.decode(data));
+}
@@ -0,0 +1,14 @@
+import 'dart:js_interop';
+import 'dart:typed_data';
+
+import 'package:web/web.dart' as web;
+
+Future<Uint8List> inflate(Uint8List data) async {
+  // "deflate" is the zlib-wrapped format produced by Python's zlib module.
+  final decompressor = web.DecompressionStream("deflate");
+  final stream = web.Blob([data.toJS].toJS).stream().pipeThrough(
+      web.ReadableWritablePair(
+          readable: decompressor.readable, writable: decompressor.writable));
+  final buffer = await web.Response(stream).arrayBuffer().toDart;
+  return buffer.toDart.asUint8List();
+}
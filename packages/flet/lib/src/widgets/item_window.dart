@@ -0,0 +1,122 @@
+import 'package:flutter/widgets.dart';
+
+import '../models/control.dart';
+
+/// Items of a `ListView` or `GridView` that are built by the backend with
+/// `item_builder`.
+///
+/// Only a window of the `item_count` items is loaded: `controls` holds the
+/// items from index `items_offset` on. Items are tracked while Flutter keeps
+/// them built, and when some of them are not loaded, or are about to run out,
+/// the range of built items is requested from the backend with an
+/// `items_request` event once the frame is done.
+class ItemWindow {
+  final Set<int> _built = {};
+  bool _scheduled = false;
+  String? _lastRequest;
+
+  /// Returns the number of items of [control].
+  int itemCount(Control control, List<Control> controls) =>
+      control.getInt("item_count") ?? controls.length;
+
+  /// Returns the loaded control of the item at [index], or `null` if it is
+  /// not loaded.
+  Control? item(Control control, List<Control> controls, int index) {
+    if (control.getInt("item_count") == null) return controls[index];
+    var i = index - control.getInt("items_offset", 0)!;
+    return i >= 0 && i < controls.length ? controls[i] : null;
+  }
+
+  /// Wraps the widget of the item at [index] to track whether it is built.
+  Widget track(Control control, int index, Widget child) {
+    if (control.getInt("item_count") == null) return child;
+    return _WindowItem(
+        key: child.key,
+        index: index,
+        onMount: (index) {
+          _built.add(index);
+          _schedule(control);
+        },
+        onUnmount: _built.remove,
+        child: child);
+  }
+
+  /// Checks the built items once the frame is done, e.g. after the window
+  /// changed.
+  void check(Control control) {
+    if (control.getInt("item_count") != null) _schedule(control);
+  }
+
+  void _schedule(Control control) {
+    if (_scheduled) return;
+    _scheduled = true;
+    WidgetsBinding.instance.addPostFrameCallback((_) {
+      _scheduled = false;
+      _request(control);
+    });
+  }
+
+  void _request(Control control) {
+    var itemCount = control.getInt("item_count");
+    if (itemCount == null || _built.isEmpty) return;
+    var start = _built.reduce((a, b) => a < b ? a : b);
+    var stop = _built.reduce((a, b) => a > b ? a : b) + 1;
+    var offset = control.getInt("items_offset", 0)!;
+    var loaded = control.children("controls").length;
+    // Request ahead of time, when a quarter of the items loaded around the
+    // built ones remains on either side.
+    var margin = ((loaded - (stop - start)) ~/ 4).clamp(0, loaded);
+    if ((start - margin).clamp(0, itemCount) >= offset &&
+        (stop + margin).clamp(0, itemCount) <= offset + loaded) {
+      return;
+    }
+    var request = "$start:$stop:$offset:$loaded:$itemCount";
+    if (request == _lastRequest) return;
+    _lastRequest = request;
+    control.triggerEventWithoutSubscribers(
+        "items_request", {"start": start, "stop": stop});
+  }
+}
+
+class _WindowItem extends StatefulWidget {
+  final int index;
+  final void Function(int index) onMount;
+  final void Function(int index) onUnmount;
+  final Widget child;
+
+  const _WindowItem(
+      {super.key,
+      required this.index,
+      required this.onMount,
+      required this.onUnmount,
+      required this.child});
+
+  @override
+  State<_WindowItem> createState() => _WindowItemState();
+}
+
+class _WindowItemState extends State<_WindowItem> {
+  @override
+  void initState() {
+    super.initState();
+    widget.onMount(widget.index);
+  }
+
+  @override
+  void didUpdateWidget(covariant _WindowItem oldWidget) {
+    super.didUpdateWidget(oldWidget);
+    if (oldWidget.index != widget.index) {
+      oldWidget.onUnmount(oldWidget.index);
+      widget.onMount(widget.index);
+    }
+  }
+
+  @override
+  void dispose() {
+    widget.onUnmount(widget.index);
+    super.dispose();
+  }
+
+  @override
+  Widget build(BuildContext context) => widget.child;
+}
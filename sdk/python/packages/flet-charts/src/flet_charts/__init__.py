@@ -17,6 +17,7 @@ from flet_charts.candlestick_chart_spot import (
     CandlestickChartSpotTooltip,
 )
 from flet_charts.chart_axis import ChartAxis, ChartAxisLabel
+from flet_charts.chart_series import ChartSeries, ChartSeriesChunk, ChartSeriesDtype
 from flet_charts.line_chart import (
     LineChart,
     LineChartEvent,
@@ -89,6 +90,9 @@ __all__ = [
     "ChartGridLines",
     "ChartPointLine",
     "ChartPointShape",
+    "ChartSeries",
+    "ChartSeriesChunk",
+    "ChartSeriesDtype",
     "ChartSquarePoint",
     "HorizontalAlignment",
     "LineChart",
@@ -4,7 +4,9 @@ from typing import Any, Optional
 
 import flet as ft
 from flet_charts.bar_chart_group import BarChartGroup
+from flet_charts.bar_chart_rod import BarChartRod
 from flet_charts.chart_axis import ChartAxis
+from flet_charts.chart_series import ChartSeries
 from flet_charts.types import ChartEventType, ChartGridLines, HorizontalAlignment
 
 __all__ = [
@@ -205,6 +207,21 @@ class BarChart(ft.LayoutControl):
     The list of :class:`~flet_charts.BarChartGroup`s to draw.
     """
 
+    series: Optional[ChartSeries] = None
+    """
+    Bars stored in packed binary arrays, drawn after :attr:`groups`.
+
+    Suited to large or streaming data. Each point is drawn as a group at
+    position X, rounded to an integer, with a single rod up to Y styled after
+    :attr:`series_rod`.
+    """
+
+    series_rod: Optional[BarChartRod] = None
+    """
+    Template for the appearance of the rods of :attr:`series`: its `to_y` is
+    ignored.
+    """
+
     group_spacing: ft.Number = 16.0
     """
     An amount of space between bar :attr:`groups`.
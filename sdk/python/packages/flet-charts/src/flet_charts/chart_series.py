@@ -0,0 +1,297 @@
+import array
+import sys
+from dataclasses import InitVar, field
+from enum import Enum
+from typing import Any, Optional
+
+import flet as ft
+
+__all__ = ["ChartSeries", "ChartSeriesChunk", "ChartSeriesDtype"]
+
+
+class ChartSeriesDtype(Enum):
+    """
+    Floating-point precision of the values of a :class:`~flet_charts.ChartSeries`.
+    """
+
+    FLOAT32 = "float32"
+    """
+    4-byte values: half the size on the wire, about 7 significant digits.
+    """
+
+    FLOAT64 = "float64"
+    """
+    8-byte values, as Python floats.
+    """
+
+
+_TYPECODES = {ChartSeriesDtype.FLOAT32: "f", ChartSeriesDtype.FLOAT64: "d"}
+
+
+@ft.value
+class ChartSeriesChunk:
+    """
+    A block of consecutive points of a :class:`~flet_charts.ChartSeries`:
+    their coordinates as packed little-endian floats.
+    """
+
+    x: bytes
+    """
+    Packed X coordinates.
+    """
+
+    y: bytes
+    """
+    Packed Y coordinates.
+    """
+
+    dtype: ChartSeriesDtype = ChartSeriesDtype.FLOAT64
+    """
+    Precision of the packed values.
+    """
+
+    def __len__(self) -> int:
+        return len(self.x) // _itemsize(self.dtype)
+
+
+@ft.control("ChartSeries", post_init_args=3)
+class ChartSeries(ft.BaseControl):
+    """
+    Chart points stored column by column in packed binary arrays.
+
+    A columnar alternative to lists of point controls, such as
+    :attr:`flet_charts.LineChartData.points`, for large or streaming data:
+    the coordinates of 100k points take two `bytes` objects instead of
+    100k controls, and are sent to the client as binary blobs.
+
+    Coordinates can be given as NumPy arrays, `array.array`, any other
+    object supporting the buffer protocol, or sequences of numbers.
+    :meth:`append` sends only the appended points on the next update and,
+    with `max_points`, keeps a sliding window over the most recent ones:
+
+    ```python
+    series = fch.ChartSeries(x=xs, y=ys)
+    chart = fch.LineChart(data_series=[fch.LineChartData(series=series)])
+    page.add(chart)
+
+    series.append(new_xs, new_ys, max_points=10_000)
+    chart.update()
+    ```
+    """
+
+    x: InitVar[Optional[Any]] = None
+    """
+    Initial X coordinates.
+    """
+
+    y: InitVar[Optional[Any]] = None
+    """
+    Initial Y coordinates, as many as :attr:`x`.
+    """
+
+    dtype: ChartSeriesDtype = ChartSeriesDtype.FLOAT64
+    """
+    Precision coordinates added from now on are stored and sent with.
+    """
+
+    chunks: list[ChartSeriesChunk] = field(default_factory=list)
+    """
+    Blocks the points are stored in, in order.
+
+    Maintained by :meth:`set_data` and :meth:`append`, which add new points
+    as new blocks so that only those are sent on update, and merge blocks so
+    that there are only a few of them.
+    """
+
+    offset: int = 0
+    """
+    Number of leading points of the first of :attr:`chunks` that are no
+    longer part of the series, after :meth:`append` dropped them.
+    """
+
+    def __post_init__(self, ref, x: Optional[Any], y: Optional[Any]):
+        super().__post_init__(ref)
+        if x is not None or y is not None:
+            self.set_data(x, y)
+
+    def __len__(self) -> int:
+        return sum(len(chunk) for chunk in self.chunks) - self.offset
+
+    def set_data(self, x: Any, y: Any) -> None:
+        """
+        Replaces all points of this series.
+
+        Args:
+            x: X coordinates.
+            y: Y coordinates, as many as `x`.
+
+        Raises:
+            ValueError: If `x` and `y` differ in length.
+        """
+        chunk = self._pack(x, y)
+        self.chunks = [chunk] if len(chunk) else []
+        self.offset = 0
+
+    def append(self, x: Any, y: Any, max_points: Optional[int] = None) -> None:
+        """
+        Adds points to the end of this series.
+
+        Only the added points are sent to the client on the next update,
+        plus, from time to time, a merge of recently added blocks.
+
+        Args:
+            x: X coordinates of the new points.
+            y: Y coordinates of the new points, as many as `x`.
+            max_points: If set, the oldest points are dropped so that at most
+                this many remain — a sliding window for streaming data.
+
+        Raises:
+            ValueError: If `x` and `y` differ in length, or `max_points` is
+                negative.
+        """
+        if max_points is not None and max_points < 0:
+            raise ValueError(f"max_points must be >= 0, got {max_points}")
+        chunk = self._pack(x, y)
+        count = len(chunk)
+        if max_points is not None and count > max_points:
+            # Only the tail of the new points fits into the window.
+            chunk = _slice(chunk, count - max_points)
+            count = max_points
+        if count:
+            self.chunks.append(chunk)
+        if max_points is not None:
+            self._trim(len(self) - max_points)
+        self._merge()
+
+    def clear(self) -> None:
+        """
+        Removes all points of this series.
+        """
+        self.chunks = []
+        self.offset = 0
+
+    def arrays(self) -> tuple[array.array, array.array]:
+        """
+        Returns copies of the X and Y coordinates of this series, as arrays
+        of Python floats (typecode `"d"`).
+        """
+        xs, ys = array.array("d"), array.array("d")
+        for index, chunk in enumerate(self.chunks):
+            skip = self.offset if index == 0 else 0
+            for values, data in ((xs, chunk.x), (ys, chunk.y)):
+                part = array.array(_TYPECODES[chunk.dtype], data)
+                if sys.byteorder == "big":
+                    part.byteswap()
+                part = part[skip:]
+                values.extend(part if part.typecode == "d" else part.tolist())
+        return xs, ys
+
+    def _pack(self, x: Any, y: Any) -> ChartSeriesChunk:
+        xs = _pack_values(x, self.dtype)
+        ys = _pack_values(y, self.dtype)
+        if len(xs) != len(ys):
+            raise ValueError(
+                f"x and y must have the same length, got "
+                f"{len(xs) // _itemsize(self.dtype)} and "
+                f"{len(ys) // _itemsize(self.dtype)}"
+            )
+        return ChartSeriesChunk(x=xs, y=ys, dtype=self.dtype)
+
+    def _trim(self, count: int) -> None:
+        """
+        Drops the first `count` points: whole chunks are removed, a partly
+        dropped one stays and is skipped over with :attr:`offset`.
+        """
+        offset = self.offset
+        while count > 0 and self.chunks:
+            visible = len(self.chunks[0]) - offset
+            if count < visible:
+                offset += count
+                break
+            self.chunks.pop(0)
+            count -= visible
+            offset = 0
+        self.offset = offset
+
+    def _merge(self) -> None:
+        """
+        Merges the last chunk with the chunks before it while they are not
+        larger, like the carries of a binary counter: the chunk count stays
+        logarithmic in the number of points, and each point is re-sent only
+        a logarithmic number of times.
+        """
+        chunks = self.chunks
+        if not chunks:
+            return
+        start = len(chunks) - 1
+        size = len(chunks[start])
+        while start > 0:
+            previous = len(chunks[start - 1]) - (self.offset if start == 1 else 0)
+            if previous > size:
+                break
+            size += previous
+            start -= 1
+        if start == len(chunks) - 1:
+            return
+        merged = [self._repack(c) for c in chunks[start:]]
+        skip = 0
+        if start == 0:
+            # Points dropped from the first chunk go away with the merge.
+            skip = self.offset * _itemsize(self.dtype)
+            self.offset = 0
+        del chunks[start:]
+        chunks.append(
+            ChartSeriesChunk(
+                x=b"".join(c.x for c in merged)[skip:],
+                y=b"".join(c.y for c in merged)[skip:],
+                dtype=self.dtype,
+            )
+        )
+
+    def _repack(self, chunk: ChartSeriesChunk) -> ChartSeriesChunk:
+        if chunk.dtype == self.dtype:
+            return chunk
+        source = _TYPECODES[chunk.dtype]
+        target = _TYPECODES[self.dtype]
+        return ChartSeriesChunk(
+            x=array.array(target, array.array(source, chunk.x)).tobytes(),
+            y=array.array(target, array.array(source, chunk.y)).tobytes(),
+            dtype=self.dtype,
+        )
+
+
+def _itemsize(dtype: ChartSeriesDtype) -> int:
+    return 4 if dtype == ChartSeriesDtype.FLOAT32 else 8
+
+
+def _slice(chunk: ChartSeriesChunk, start: int) -> ChartSeriesChunk:
+    offset = start * _itemsize(chunk.dtype)
+    return ChartSeriesChunk(x=chunk.x[offset:], y=chunk.y[offset:], dtype=chunk.dtype)
+
+
+def _pack_values(values: Any, dtype: ChartSeriesDtype) -> bytes:
+    """
+    Packs numbers into little-endian floats of `dtype`.
+
+    NumPy arrays are converted in one vectorized cast; buffers already
+    holding floats of `dtype` are copied as is.
+    """
+    typecode = _TYPECODES[dtype]
+    if hasattr(values, "__array_interface__"):
+        # An object with __array_interface__ guarantees numpy is importable
+        # in practice; import lazily so flet_charts never depends on it.
+        import numpy as np
+
+        return np.ascontiguousarray(values, dtype=f"<{typecode}").ravel().tobytes()
+    try:
+        view = memoryview(values)
+    except TypeError:
+        packed = array.array(typecode, values)
+    else:
+        if view.format == typecode and sys.byteorder == "little":
+            return view.tobytes()
+        # Converted element by element; flatten multi-dimensional buffers.
+        packed = array.array(typecode, view.cast("B").cast(view.format).tolist())
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return packed.tobytes()
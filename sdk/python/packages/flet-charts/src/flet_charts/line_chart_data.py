@@ -2,6 +2,7 @@ from dataclasses import field
 from typing import Optional, Union
 
 import flet as ft
+from flet_charts.chart_series import ChartSeries
 from flet_charts.line_chart_data_point import LineChartDataPoint
 from flet_charts.types import ChartPointLine, ChartPointShape
 
@@ -20,6 +21,15 @@ class LineChartData(ft.BaseControl):
     type representing a single chart line.
     """
 
+    series: Optional[ChartSeries] = None
+    """
+    Points of this line stored in packed binary arrays, drawn after
+    :attr:`points`.
+
+    Suited to large or streaming data. Its points are styled by this line's
+    properties, such as :attr:`point`, and show their Y value as tooltip.
+    """
+
     curved: bool = False
     """
     Whether to draw this chart line as a curve.
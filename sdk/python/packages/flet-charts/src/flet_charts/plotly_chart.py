@@ -1,7 +1,12 @@
+import asyncio
+import hashlib
 import re
+import threading
 import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import field
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import flet as ft
 
@@ -15,6 +20,11 @@ except ImportError as e:  # pragma: no cover - depends on optional dependency
 
 __all__ = ["PlotlyChart"]
 
+RENDER_CACHE_SIZE = 32
+"""
+Maximum number of rendered figures kept in memory, shared by all sessions.
+"""
+
 
 def _require_plotly() -> None:
     """
@@ -30,6 +40,100 @@ def _require_plotly() -> None:
         ) from _PLOTLY_IMPORT_ERROR
 
 
+class _RenderCache:
+    """
+    LRU of rendered SVGs keyed by figure fingerprint, shared by all sessions.
+
+    Renders run one at a time on a background thread, so they never block an
+    event loop, and a figure requested again while being rendered, e.g. by
+    another session, waits for the same render instead of starting a new one.
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__entries: OrderedDict[str, Any] = OrderedDict()
+        self.__pending: dict[str, Future] = {}
+        self.__executor: Optional[ThreadPoolExecutor] = None
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Returns the cached render for `key`, if any.
+        """
+        with self.__lock:
+            value = self.__entries.get(key)
+            if value is not None:
+                self.__entries.move_to_end(key)
+            return value
+
+    def render(self, key: str, render: Callable[[], Any]) -> Future:
+        """
+        Returns a future of the render for `key`, calling `render` on the
+        background thread unless it is cached or already being rendered.
+        """
+        with self.__lock:
+            if key in self.__entries:
+                self.__entries.move_to_end(key)
+                future = Future()
+                future.set_result(self.__entries[key])
+                return future
+            future = self.__pending.get(key)
+            if future is not None:
+                return future
+            if self.__executor is None:
+                # Kaleido renders one figure at a time anyway.
+                self.__executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="flet_plotly_chart"
+                )
+            future = self.__executor.submit(render)
+            self.__pending[key] = future
+        # Outside of the lock: runs right away if the render is already done.
+        future.add_done_callback(lambda f: self.__done(key, f))
+        return future
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        Adds a render to the cache, evicting the least recently used ones.
+        """
+        with self.__lock:
+            self.__entries[key] = value
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > max(RENDER_CACHE_SIZE, 0):
+                self.__entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+
+    def __done(self, key: str, future: Future) -> None:
+        with self.__lock:
+            self.__pending.pop(key, None)
+        if not future.cancelled() and future.exception() is None:
+            self.put(key, future.result())
+
+
+_render_cache = _RenderCache()
+
+
+def _fingerprint(figure: Figure) -> str:
+    """
+    Returns a digest of the full state of `figure`: data, layout and frames.
+    """
+    return hashlib.blake2b(
+        figure.to_json(validate=False).encode(), digest_size=16
+    ).hexdigest()
+
+
+def _render(figure: Figure) -> tuple[str, float]:
+    """
+    Renders `figure` to SVG with Kaleido and returns it with its aspect ratio.
+    """
+    svg = figure.to_image(format="svg").decode("utf-8")
+    root = ET.fromstring(svg)
+    w = float(re.findall(r"\d+", root.attrib["width"])[0])
+    h = float(re.findall(r"\d+", root.attrib["height"])[0])
+    return svg, w / h
+
+
 @ft.control(kw_only=True)
 class PlotlyChart(ft.Container):
     """
@@ -57,6 +161,13 @@ class PlotlyChart(ft.Container):
     Plotly figure to draw.
 
     The value is an instance of [`plotly.graph_objects.Figure`](https://plotly.com/python-api-reference/generated/plotly.graph_objects.Figure.html).
+
+    Note:
+        Once this chart is on a page, a new or changed figure is rendered on a
+        background thread, and the previous one stays on screen meanwhile.
+        Renders are cached by figure content across all sessions, so updating
+        this chart without changing the figure, or showing the same figure to
+        many users, renders it only once.
     """
 
     original_size: bool = False
@@ -70,16 +181,49 @@ class PlotlyChart(ft.Container):
         _require_plotly()
         self.alignment = ft.Alignment.CENTER
         self.__img = ft.Image(src="", fit=ft.BoxFit.FILL)
+        self.__key: Optional[str] = None
         self.content = self.__img
 
     def before_update(self):
         super().before_update()
-        if self.figure is not None:
-            svg = self.figure.to_image(format="svg").decode("utf-8")
-
-            if not self.original_size:
-                root = ET.fromstring(svg)
-                w = float(re.findall(r"\d+", root.attrib["width"])[0])
-                h = float(re.findall(r"\d+", root.attrib["height"])[0])
-                self.__img.aspect_ratio = w / h
-            self.__img.src = svg
+        if self.figure is None:
+            return
+        key = _fingerprint(self.figure)
+        rendered = _render_cache.get(key)
+        if rendered is not None:
+            self.__key = key
+            self.__show(rendered)
+            return
+        if key == self.__key:
+            # Same figure, already being rendered.
+            return
+        self.__key = key
+        figure = self.figure
+        try:
+            page = self.page
+        except RuntimeError:
+            # Not on a page yet: there is no event loop to keep free.
+            self.__show(_render_cache.render(key, lambda: _render(figure)).result())
+            return
+        # Render on a background thread; the chart keeps showing the previous
+        # figure until the new one is ready.
+        page.run_task(self.__render_async, key, figure)
+
+    async def __render_async(self, key: str, figure: Figure):
+        try:
+            rendered = await asyncio.wrap_future(
+                _render_cache.render(key, lambda: _render(figure))
+            )
+        except Exception:
+            if key == self.__key:
+                # Let the next update try again.
+                self.__key = None
+            raise
+        if key == self.__key:
+            self.__show(rendered)
+            self.update()
+
+    def __show(self, rendered: tuple[str, float]):
+        svg, aspect_ratio = rendered
+        self.__img.aspect_ratio = None if self.original_size else aspect_ratio
+        self.__img.src = svg
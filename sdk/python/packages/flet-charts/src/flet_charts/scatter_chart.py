@@ -3,6 +3,7 @@ from typing import Any, Optional
 
 import flet as ft
 from flet_charts.chart_axis import ChartAxis
+from flet_charts.chart_series import ChartSeries
 from flet_charts.scatter_chart_spot import ScatterChartSpot
 from flet_charts.types import ChartEventType, ChartGridLines, HorizontalAlignment
 
@@ -159,6 +160,21 @@ class ScatterChart(ft.LayoutControl):
     List of :class:`~flet_charts.ScatterChartSpot`s to show on the chart.
     """
 
+    series: Optional[ChartSeries] = None
+    """
+    Spots stored in packed binary arrays, drawn after :attr:`spots`.
+
+    Suited to large or streaming data. Its spots are styled after
+    :attr:`series_spot`.
+    """
+
+    series_spot: Optional[ScatterChartSpot] = None
+    """
+    Template for the appearance of the spots of :attr:`series`: its `color`,
+    `radius`, `point`, `render_priority` and tooltip are used, its `x` and `y`
+    are ignored.
+    """
+
     animation: ft.AnimationValue = field(
         default_factory=lambda: ft.Animation(
             duration=ft.Duration(milliseconds=150), curve=ft.AnimationCurve.LINEAR
@@ -40,6 +40,20 @@ class _BarChartControlState extends State<BarChartControl> {
         .map((group) => parseBarChartGroupData(group, interactive, context))
         .toList();
 
+    // Points of a `ChartSeries`: a group per point, with a single rod
+    // styled after the `series_rod` template.
+    var series = widget.control.child("series");
+    if (series != null) {
+      series.notifyParent = true;
+      var template = widget.control.child("series_rod");
+      var rod = template != null
+          ? parseBarChartRodData(template, interactive, context)
+          : BarChartRodData(toY: 0);
+      barGroups.addAll(parseChartSeriesSpots(series).map((spot) =>
+          BarChartGroupData(
+              x: spot.x.round(), barRods: [rod.copyWith(toY: spot.y)])));
+    }
+
     var chart = BarChart(
       BarChartData(
         backgroundColor: widget.control.getColor("bgcolor", context),
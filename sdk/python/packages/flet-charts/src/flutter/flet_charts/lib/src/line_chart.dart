@@ -50,6 +50,12 @@ class _LineChartControlState extends State<LineChartControl> {
           spot.notifyParent = true;
           spots.add(FlSpot(spot.getDouble("x")!, spot.getDouble("y")!));
         }
+
+        var series = lineBar.child("series");
+        if (series != null) {
+          series.notifyParent = true;
+          spots.addAll(parseChartSeriesSpots(series));
+        }
       }
 
       // removed data series
@@ -160,8 +166,9 @@ class _LineChartControlState extends State<LineChartControl> {
                 FlLine? dotLine = parseSelectedFlLine(
                     widget.control
                         .children("data_series")[barIndex]
-                        .children("points")[index]
-                        .get("selected_below_line"),
+                        .children("points")
+                        .elementAtOrNull(index)
+                        ?.get("selected_below_line"),
                     theme,
                     barData.color,
                     barData.gradient);
@@ -188,8 +195,9 @@ class _LineChartControlState extends State<LineChartControl> {
                       var dotPainter = parseChartDotPainter(
                           widget.control
                               .children("data_series")[barIndex]
-                              .children("points")[index]
-                              .get("selected_point"),
+                              .children("points")
+                              .elementAtOrNull(index)
+                              ?.get("selected_point"),
                           theme,
                           percent,
                           barData.color,
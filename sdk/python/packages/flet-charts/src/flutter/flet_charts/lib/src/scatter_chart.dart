@@ -58,6 +58,25 @@ class _ScatterChartControlState extends State<ScatterChartControl> {
                 ));
     }).toList();
 
+    // Points of a `ChartSeries`, styled after the `series_spot` template.
+    final series = widget.control.child("series");
+    if (series != null) {
+      series.notifyParent = true;
+      final template = widget.control.child("series_spot");
+      template?.notifyParent = true;
+      final color = template?.getColor("color", context) ??
+          theme.colorScheme.primary;
+      final dotPainter = template?.get("point") != null
+          ? parseChartDotPainter(template!.get("point"), theme, 0, null, null)!
+          : FlDotCirclePainter(
+              radius: template?.getDouble("radius"), color: color);
+      spots.addAll(parseChartSeriesSpots(series).map((spot) => ScatterSpot(
+          spot.x, spot.y,
+          show: template?.visible ?? true,
+          renderPriority: template?.getInt('render_priority', 0) ?? 0,
+          dotPainter: dotPainter)));
+    }
+
     final chart = ScatterChart(
       ScatterChartData(
         scatterSpots: spots,
@@ -100,13 +119,14 @@ class _ScatterChartControlState extends State<ScatterChartControl> {
         scatterLabelSettings: ScatterLabelSettings(
           showLabel: true,
           getLabelFunction: (spotIndex, spot) {
-            var dp = spotsAsControls[spotIndex];
-            return dp.getString("label_text", "")!;
+            var dp = spotsAsControls.elementAtOrNull(spotIndex);
+            return dp?.getString("label_text", "") ?? "";
           },
           getLabelTextStyleFunction: (spotIndex, spot) {
-            var dp = spotsAsControls[spotIndex];
-            var labelStyle =
-                dp.getTextStyle("label_text_style", theme, const TextStyle())!;
+            var dp = spotsAsControls.elementAtOrNull(spotIndex);
+            var labelStyle = dp?.getTextStyle(
+                    "label_text_style", theme, const TextStyle()) ??
+                const TextStyle();
             if (labelStyle.color == null) {
               labelStyle =
                   labelStyle.copyWith(color: spot.dotPainter.mainColor);
@@ -95,18 +95,24 @@ BarTouchTooltipData? parseBarTouchTooltipData(
       tooltip["horizontal_alignment"],
       FLHorizontalAlignment.center,
     )!,
-    getTooltipItem: (group, groupIndex, rod, rodIndex) {
-      var rod =
-          control.children("groups")[groupIndex].children("rods")[rodIndex];
-      return parseBarTooltipItem(rod, context);
+    getTooltipItem: (group, groupIndex, rodData, rodIndex) {
+      // Groups of a `ChartSeries` follow the `groups` and have no control.
+      var rod = control
+              .children("groups")
+              .elementAtOrNull(groupIndex)
+              ?.children("rods")
+              .elementAtOrNull(rodIndex) ??
+          control.child("series_rod");
+      return parseBarTooltipItem(rod, context, rodData.toY);
     },
   );
 }
 
-BarTooltipItem? parseBarTooltipItem(Control rod, BuildContext context) {
-  if (!rod.getBool("show_tooltip", true)!) return null;
+BarTooltipItem? parseBarTooltipItem(Control? rod, BuildContext context,
+    [double? toY]) {
+  if (rod != null && !rod.getBool("show_tooltip", true)!) return null;
 
-  var tooltip = rod.internals?["tooltip"];
+  var tooltip = rod != null ? rod.internals?["tooltip"] : {};
   if (tooltip == null) return null;
 
   final theme = Theme.of(context);
@@ -117,12 +123,13 @@ BarTooltipItem? parseBarTooltipItem(Control rod, BuildContext context) {
   )!;
   if (tooltipTextStyle.color == null) {
     tooltipTextStyle = tooltipTextStyle.copyWith(
-      color: rod.getGradient("gradient", theme)?.colors.first ??
-          rod.getColor("color", context, Colors.blueGrey)!,
+      color: rod?.getGradient("gradient", theme)?.colors.first ??
+          rod?.getColor("color", context) ??
+          Colors.blueGrey,
     );
   }
   return BarTooltipItem(
-    tooltip["text"] ?? rod.getDouble("to_y", 0)!.toString(),
+    tooltip["text"] ?? (toY ?? rod?.getDouble("to_y", 0) ?? 0).toString(),
     tooltipTextStyle,
     textAlign: parseTextAlign(tooltip["text_align"], TextAlign.center)!,
     textDirection: parseBool(tooltip["rtl"], false)!
@@ -1,3 +1,5 @@
+import 'dart:typed_data';
+
 import 'package:collection/collection.dart';
 import 'package:fl_chart/fl_chart.dart';
 import 'package:flet/flet.dart';
@@ -192,3 +194,40 @@ String resolveFlTouchEventType(FlTouchEvent event) {
   if (event is FlTapUpEvent) return "tapUp";
   return "undefined";
 }
+
+/// Decoded values of `ChartSeries` chunks, keyed by the packed bytes.
+///
+/// Chunks are immutable on the Python side, so a chunk is decoded once and
+/// only newly appended chunks are decoded on update.
+final Expando<Float64List> _seriesValues = Expando();
+
+Float64List _decodeSeriesValues(Uint8List bytes, String? dtype) {
+  return _seriesValues[bytes] ??= () {
+    var data = ByteData.sublistView(bytes);
+    var size = dtype == "float32" ? 4 : 8;
+    var values = Float64List(bytes.lengthInBytes ~/ size);
+    for (var i = 0; i < values.length; i++) {
+      values[i] = size == 4
+          ? data.getFloat32(i * size, Endian.little)
+          : data.getFloat64(i * size, Endian.little);
+    }
+    return values;
+  }();
+}
+
+/// Returns the points of a `ChartSeries` control as `FlSpot`s.
+List<FlSpot> parseChartSeriesSpots(Control? series) {
+  if (series == null) return [];
+  var spots = <FlSpot>[];
+  var skip = series.getInt("offset", 0)!;
+  for (var chunk in series.get("chunks") as List? ?? const []) {
+    var dtype = chunk["dtype"] as String?;
+    var xs = _decodeSeriesValues(chunk["x"] as Uint8List, dtype);
+    var ys = _decodeSeriesValues(chunk["y"] as Uint8List, dtype);
+    for (var i = skip; i < xs.length && i < ys.length; i++) {
+      spots.add(FlSpot(xs[i], ys[i]));
+    }
+    skip = 0;
+  }
+  return spots;
+}
@@ -49,10 +49,13 @@ class LineChartEventDataSpot extends Equatable {
 }
 
 LineTooltipItem? parseLineTooltipItem(
-    Control dataPoint, LineBarSpot spot, BuildContext context) {
-  if (!dataPoint.getBool("show_tooltip", true)!) return null;
+    Control? dataPoint, LineBarSpot spot, BuildContext context) {
+  if (dataPoint != null && !dataPoint.getBool("show_tooltip", true)!) {
+    return null;
+  }
 
-  var tooltip = dataPoint.internals?["tooltip"];
+  // Points of a `ChartSeries` have no control and get a default tooltip.
+  var tooltip = dataPoint != null ? dataPoint.internals?["tooltip"] : {};
   if (tooltip == null) return null;
 
   final theme = Theme.of(context);
@@ -64,7 +67,7 @@ LineTooltipItem? parseLineTooltipItem(
             Colors.blueGrey);
   }
   return LineTooltipItem(
-      tooltip["text"] ?? dataPoint.getDouble("y", 0)!.toString(), style,
+      tooltip["text"] ?? spot.y.toString(), style,
       textAlign: parseTextAlign(tooltip["text_align"], TextAlign.center)!,
       textDirection: parseBool(tooltip["rtl"], false)!
           ? TextDirection.rtl
@@ -109,7 +112,8 @@ LineTouchTooltipData? parseLineTouchTooltipData(
           .map((LineBarSpot spot) => parseLineTooltipItem(
               control
                   .children("data_series")[spot.barIndex]
-                  .children("points")[spot.spotIndex],
+                  .children("points")
+                  .elementAtOrNull(spot.spotIndex),
               spot,
               context))
           .nonNulls
@@ -176,7 +180,7 @@ LineChartBarData parseLineChartBarData(
             var allDotsPainter = parseChartDotPainter(
                 chartData.get("point"), theme, percent, barColor, barGradient);
             var dotPainter = parseChartDotPainter(
-                chartData.children("points")[index].get("point"),
+                chartData.children("points").elementAtOrNull(index)?.get("point"),
                 theme,
                 percent,
                 barColor,
@@ -196,7 +200,7 @@ LineChartBarData parseLineChartBarData(
                 show: aboveLine != null,
                 flLineStyle: aboveLine ?? const FlLine(),
                 checkToShowSpotLine: (spot) =>
-                    spots[spot]!.getBool("show_above_line", true)!,
+                    spots[spot]?.getBool("show_above_line", true) ?? true,
               ))
           : null,
       belowBarData: belowLineBgcolor != null ||
@@ -212,7 +216,7 @@ LineChartBarData parseLineChartBarData(
                 show: belowLine != null,
                 flLineStyle: belowLine ?? const FlLine(),
                 checkToShowSpotLine: (spot) =>
-                    spots[spot]!.getBool("show_below_line", true)!,
+                    spots[spot]?.getBool("show_below_line", true) ?? true,
               ))
           : null,
       color: barColor,
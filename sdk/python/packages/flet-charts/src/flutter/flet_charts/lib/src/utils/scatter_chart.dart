@@ -51,17 +51,23 @@ ScatterTouchTooltipData parseScatterTouchTooltipData(
     getTooltipItems: (ScatterSpot touchedSpot) {
       var spotIndex = spots.indexWhere(
           (spot) => spot.x == touchedSpot.x && spot.y == touchedSpot.y);
+      // Spots of a `ChartSeries` follow the `spots` and have no control.
       return parseScatterTooltipItem(
-          control.children("spots")[spotIndex], touchedSpot, context);
+          control.children("spots").elementAtOrNull(spotIndex) ??
+              control.child("series_spot"),
+          touchedSpot,
+          context);
     },
   );
 }
 
 ScatterTooltipItem? parseScatterTooltipItem(
-    Control dataPoint, ScatterSpot spot, BuildContext context) {
-  if (!dataPoint.getBool("show_tooltip", true)!) return null;
+    Control? dataPoint, ScatterSpot spot, BuildContext context) {
+  if (dataPoint != null && !dataPoint.getBool("show_tooltip", true)!) {
+    return null;
+  }
 
-  var tooltip = dataPoint.internals?["tooltip"];
+  var tooltip = dataPoint != null ? dataPoint.internals?["tooltip"] : {};
   if (tooltip == null) return null;
 
   final theme = Theme.of(context);
@@ -70,7 +76,7 @@ ScatterTooltipItem? parseScatterTooltipItem(
     style = style.copyWith(color: spot.dotPainter.mainColor);
   }
   return ScatterTooltipItem(
-      tooltip["text"] ?? dataPoint.getDouble("y").toString(),
+      tooltip["text"] ?? spot.y.toString(),
       textStyle: style,
       textAlign: parseTextAlign(tooltip["text_align"], TextAlign.center)!,
       textDirection: parseBool(tooltip["rtl"], false)!
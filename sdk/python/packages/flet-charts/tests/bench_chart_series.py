@@ -0,0 +1,130 @@
+"""
+Standalone benchmark for ChartSeries.
+Run with: python bench_chart_series.py
+
+Compares a line chart built from `LineChartDataPoint` controls with one
+backed by a `ChartSeries`, at 1k, 10k and 100k points:
+
+- memory: Python heap allocated to build the chart (tracemalloc);
+- initial message: bytes of the first protocol message carrying the chart;
+- update: latency and message bytes of a streaming update that appends
+  100 points and drops as many from the head (a sliding window), measured
+  as the diff plus the msgpack encoding of the resulting patch.
+
+NumPy is used for the input data when installed.
+"""
+
+import math
+import sys
+import time
+import tracemalloc
+
+import msgpack
+
+import flet as ft
+import flet_charts as fch
+from flet.controls.object_patch import ObjectPatch
+from flet.messaging.protocol import configure_encode_object_for_msgpack
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+SIZES = (1_000, 10_000, 100_000)
+BATCH = 100
+UPDATES = 10
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _message(chart, old):
+    patch, _, _ = ObjectPatch.from_diff(old, chart, control_cls=ft.BaseControl)
+    return msgpack.packb(
+        patch.to_message(),
+        default=configure_encode_object_for_msgpack(ft.BaseControl),
+    )
+
+
+def _data(start: int, count: int):
+    if np is not None:
+        xs = np.arange(start, start + count, dtype=np.float64)
+        return xs, np.sin(xs / 100)
+    xs = [float(x) for x in range(start, start + count)]
+    return xs, [math.sin(x / 100) for x in xs]
+
+
+def _build_points(size: int):
+    xs, ys = _data(0, size)
+    line = fch.LineChartData(
+        points=[fch.LineChartDataPoint(x=x, y=y) for x, y in zip(xs, ys)]
+    )
+
+    def update(start):
+        new_xs, new_ys = _data(start, BATCH)
+        del line.points[:BATCH]
+        line.points.extend(
+            fch.LineChartDataPoint(x=x, y=y) for x, y in zip(new_xs, new_ys)
+        )
+
+    return fch.LineChart(data_series=[line]), update
+
+
+def _build_series(size: int):
+    series = fch.ChartSeries(*_data(0, size))
+
+    def update(start):
+        series.append(*_data(start, BATCH), max_points=size)
+
+    return fch.LineChart(data_series=[fch.LineChartData(series=series)]), update
+
+
+def _bench(label: str, build, size: int):
+    tracemalloc.start()
+    chart, update = build(size)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    initial = len(_message(chart, {}))
+
+    times = []
+    sent = 0
+    for i in range(UPDATES):
+        t0 = time.perf_counter()
+        update(size + i * BATCH)
+        sent += len(_message(chart, chart))
+        times.append(time.perf_counter() - t0)
+    times.sort()
+    print(
+        f"  {label:<8} {memory / 1024:10,.0f} KB  {initial / 1024:10,.0f} KB  "
+        f"{times[len(times) // 2] * 1000:10.2f} ms  {sent / UPDATES:10,.0f} B"
+    )
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+
+def main():
+    print(f"\n{'=' * 70}")
+    print("ChartSeries benchmark")
+    print(f"Python {sys.version.split()[0]}, NumPy {np.__version__ if np else '-'}")
+    print(f"{'=' * 70}")
+
+    for size in SIZES:
+        print(f"\n--- {size:,} points, updates of {BATCH} points ---")
+        print(
+            f"  {'':<8} {'memory':>13}  {'initial msg':>13}  "
+            f"{'update p50':>13}  {'update msg':>12}"
+        )
+        _bench("points", _build_points, size)
+        _bench("series", _build_series, size)
+
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import array
+import struct
+
+import msgpack
+import pytest
+
+import flet as ft
+import flet_charts as fch
+from flet.controls.object_patch import ObjectPatch
+from flet.messaging.protocol import configure_encode_object_for_msgpack
+
+
+def _diff(control, old=None):
+    patch, _, _ = ObjectPatch.from_diff(
+        old if old is not None else control, control, control_cls=ft.BaseControl
+    )
+    message = patch.to_message()
+    return patch.patch, msgpack.packb(
+        message, default=configure_encode_object_for_msgpack(ft.BaseControl)
+    )
+
+
+def test_packs_sequences_as_little_endian_floats():
+    series = fch.ChartSeries(x=[0, 1, 2], y=[1.5, -2, 3])
+
+    assert len(series) == 3
+    [chunk] = series.chunks
+    assert chunk.dtype == fch.ChartSeriesDtype.FLOAT64
+    assert chunk.x == struct.pack("<3d", 0, 1, 2)
+    assert chunk.y == struct.pack("<3d", 1.5, -2, 3)
+    assert series.arrays() == (
+        array.array("d", [0, 1, 2]),
+        array.array("d", [1.5, -2, 3]),
+    )
+
+
+def test_packs_buffers_and_float32():
+    series = fch.ChartSeries(dtype=fch.ChartSeriesDtype.FLOAT32)
+    series.set_data(array.array("i", [1, 2]), array.array("f", [0.5, 0.25]))
+
+    [chunk] = series.chunks
+    assert chunk.dtype == fch.ChartSeriesDtype.FLOAT32
+    assert chunk.x == struct.pack("<2f", 1, 2)
+    assert chunk.y == struct.pack("<2f", 0.5, 0.25)
+
+
+def test_packs_numpy_arrays():
+    np = pytest.importorskip("numpy")
+    series = fch.ChartSeries(x=np.arange(4), y=np.linspace(0, 1, 4)[::-1])
+
+    [chunk] = series.chunks
+    assert chunk.x == np.arange(4, dtype="<f8").tobytes()
+    assert chunk.y == np.linspace(0, 1, 4)[::-1].astype("<f8").tobytes()
+
+
+def test_length_mismatch_raises():
+    with pytest.raises(ValueError, match="same length"):
+        fch.ChartSeries(x=[1, 2], y=[1])
+    series = fch.ChartSeries()
+    with pytest.raises(ValueError, match="max_points"):
+        series.append([1], [1], max_points=-1)
+
+
+def test_append_keeps_sliding_window():
+    series = fch.ChartSeries(x=range(5), y=range(5))
+    for i in range(5, 100):
+        series.append([i], [i * 2], max_points=10)
+
+    xs, ys = series.arrays()
+    assert len(series) == 10
+    assert list(xs) == list(range(90, 100))
+    assert list(ys) == [i * 2 for i in range(90, 100)]
+
+    # a batch larger than the window keeps only its tail
+    series.append(range(100, 130), range(100, 130), max_points=10)
+    assert list(series.arrays()[0]) == list(range(120, 130))
+
+
+def test_append_merges_chunks():
+    series = fch.ChartSeries()
+    for i in range(1000):
+        series.append([i], [i])
+
+    assert len(series) == 1000
+    # like a binary counter: one chunk per set bit of 1000
+    assert len(series.chunks) == bin(1000).count("1")
+    assert list(series.arrays()[0]) == list(range(1000))
+
+
+def test_update_sends_only_new_points():
+    series = fch.ChartSeries(x=range(10_000), y=range(10_000))
+    chart = fch.LineChart(data_series=[fch.LineChartData(series=series)])
+    _, first = _diff(chart, {})
+    assert len(first) > 2 * 8 * 10_000
+
+    series.append([10_000], [1.0], max_points=10_000)
+    patch, update = _diff(chart)
+
+    assert len(update) < 200
+    assert [op["op"] for op in patch] == ["replace", "add"]
+    assert patch[0]["value"] == 1  # offset
+    assert patch[1]["value"].x == struct.pack("<d", 10_000)
@@ -0,0 +1,68 @@
+import asyncio
+import threading
+
+from flet_charts import plotly_chart
+from flet_charts.plotly_chart import _RenderCache
+
+
+def test_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(plotly_chart, "RENDER_CACHE_SIZE", 2)
+    cache = _RenderCache()
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now the least recently used
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_concurrent_renders_of_same_figure_run_once():
+    cache = _RenderCache()
+    release = threading.Event()
+    calls = []
+
+    def render():
+        calls.append(threading.current_thread().name)
+        release.wait(5)
+        return "<svg/>", 2.0
+
+    first = cache.render("fig", render)
+    second = cache.render("fig", render)
+    release.set()
+
+    assert first.result(5) == second.result(5) == ("<svg/>", 2.0)
+    assert len(calls) == 1
+    assert calls[0].startswith("flet_plotly_chart")
+    # completed renders are cached
+    assert cache.get("fig") == ("<svg/>", 2.0)
+    assert cache.render("fig", render).result() == ("<svg/>", 2.0)
+    assert len(calls) == 1
+
+
+def test_render_does_not_block_event_loop():
+    cache = _RenderCache()
+    release = threading.Event()
+
+    async def main():
+        future = asyncio.wrap_future(cache.render("fig", lambda: release.wait(5)))
+        # the loop keeps running while the figure renders
+        await asyncio.sleep(0.01)
+        assert not future.done()
+        release.set()
+        assert await future is True
+
+    asyncio.run(main())
+
+
+def test_failed_render_is_not_cached():
+    cache = _RenderCache()
+
+    def fail():
+        raise ValueError("kaleido failed")
+
+    future = cache.render("fig", fail)
+    assert isinstance(future.exception(5), ValueError)
+    assert cache.get("fig") is None
+    assert cache.render("fig", lambda: ("<svg/>", 1.0)).result(5) == ("<svg/>", 1.0)
@@ -1,10 +1,19 @@
+from flet_datatable2.data_source import (
+    ArrayDataSource,
+    DataTable2DataSource,
+    SqliteDataSource,
+)
 from flet_datatable2.datacolumn2 import DataColumn2, DataColumnSize
 from flet_datatable2.datarow2 import DataRow2
-from flet_datatable2.datatable2 import DataTable2
+from flet_datatable2.datatable2 import DataTable2, DataTable2RowsRequestEvent
 
 __all__ = [
+    "ArrayDataSource",
     "DataColumn2",
     "DataColumnSize",
     "DataRow2",
     "DataTable2",
+    "DataTable2DataSource",
+    "DataTable2RowsRequestEvent",
+    "SqliteDataSource",
 ]
@@ -0,0 +1,323 @@
+import sqlite3
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Any, Optional
+
+__all__ = ["ArrayDataSource", "DataTable2DataSource", "SqliteDataSource"]
+
+
+class DataTable2DataSource(ABC):
+    """
+    Rows of a :class:`~flet_datatable2.DataTable2`, fetched by index range.
+
+    Set as :attr:`flet_datatable2.DataTable2.data_source` so that the table
+    materializes only the rows visible on the client, plus an overscan
+    buffer, instead of holding a control for every row.
+
+    A row returned by :meth:`get_rows` is either a sequence of cell values,
+    one per column, or a :class:`~flet.DataRow` built by the data source
+    itself. A cell value is either a :class:`~flet.Control`, shown as is, or
+    any other value, shown as text; `None` shows an empty cell.
+
+    Subclasses must implement :attr:`row_count` and :meth:`get_rows`, and may
+    implement :meth:`sort` and :meth:`filter` to sort and filter rows where
+    they are stored, e.g. in a database, rather than in the table.
+    """
+
+    @property
+    @abstractmethod
+    def row_count(self) -> int:
+        """
+        The number of rows, after filtering.
+        """
+        ...
+
+    @abstractmethod
+    def get_rows(self, start: int, stop: int) -> Sequence[Any]:
+        """
+        Returns the rows from index `start` up to, but not including, `stop`,
+        in the current sort order.
+
+        Args:
+            start: Index of the first row, `0 <= start <= stop`.
+            stop: Index after the last row, `stop <= row_count`.
+        """
+        ...
+
+    def sort(self, column_index: int, ascending: bool = True) -> None:
+        """
+        Sorts rows by the values of a column.
+
+        Args:
+            column_index: The index of the column to sort by.
+            ascending: Whether to sort in ascending order.
+
+        Raises:
+            NotImplementedError: If this data source cannot sort.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support sorting")
+
+    def filter(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Restricts rows to those matching a condition, the meaning of the
+        arguments being up to the data source.
+
+        Raises:
+            NotImplementedError: If this data source cannot filter.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support filtering")
+
+    def refresh(self) -> None:  # noqa: B027 - optional hook
+        """
+        Forgets what was computed from the rows, e.g. their count, after rows
+        were inserted, changed or deleted.
+
+        Called by :meth:`flet_datatable2.DataTable2.refresh`. Does nothing by
+        default.
+        """
+
+
+class ArrayDataSource(DataTable2DataSource):
+    """
+    Rows stored column by column in sequences, such as lists or NumPy arrays.
+
+    Sorting and filtering reorder an index of row positions, never the
+    columns themselves. With NumPy arrays, sorting, filtering and fetching
+    rows are vectorized.
+
+    ```python
+    source = ftd.ArrayDataSource([ids, names, prices])
+    source.filter(prices > 100)  # a NumPy boolean mask
+    source.sort(2, ascending=False)
+    ```
+    """
+
+    def __init__(self, columns: Sequence[Sequence[Any]]):
+        """
+        Args:
+            columns: The values of each column, all of the same length.
+
+        Raises:
+            ValueError: If columns differ in length.
+        """
+        self.columns = columns
+        self.__length = self.__measure()
+        self.__mask: Optional[Sequence[bool]] = None
+        self.__sort: Optional[tuple[int, bool]] = None
+        self.__index: Optional[Sequence[int]] = None
+
+    @property
+    def row_count(self) -> int:
+        return self.__length if self.__index is None else len(self.__index)
+
+    def get_rows(self, start: int, stop: int) -> list[list[Any]]:
+        if self.__index is None:
+            columns = [column[start:stop] for column in self.columns]
+        else:
+            positions = self.__index[start:stop]
+            columns = [_take(column, positions) for column in self.columns]
+        return [list(row) for row in zip(*map(_to_list, columns))]
+
+    def sort(self, column_index: int, ascending: bool = True) -> None:
+        """
+        Sorts rows by the values of a column.
+
+        The sort is stable, so sorting by several columns in turn orders rows
+        by the last one, then the previous ones.
+        """
+        self.__sort = (column_index, ascending)
+        self.__reindex()
+
+    def filter(self, mask: Optional[Sequence[bool]] = None) -> None:
+        """
+        Keeps only the rows whose item in `mask` is true.
+
+        Args:
+            mask: One boolean per row, e.g. a NumPy boolean array, or `None`
+                to show all rows again.
+
+        Raises:
+            ValueError: If `mask` is not as long as the columns.
+        """
+        self.__length = self.__measure()
+        if mask is not None and len(mask) != self.__length:
+            raise ValueError(
+                f"mask must have one item per row, got {len(mask)} for "
+                f"{self.__length} rows"
+            )
+        self.__mask = mask
+        self.__reindex()
+
+    def refresh(self) -> None:
+        """
+        Sorts and filters rows again, after values of :attr:`columns` were
+        changed, or items were added to or removed from them.
+
+        Raises:
+            ValueError: If columns differ in length, or if the filter mask is
+                not as long as the columns anymore: call :meth:`filter` with
+                a new mask instead.
+        """
+        length = self.__measure()
+        if self.__mask is not None and len(self.__mask) != length:
+            raise ValueError(
+                f"mask must have one item per row, got {len(self.__mask)} for "
+                f"{length} rows"
+            )
+        self.__length = length
+        self.__reindex()
+
+    def __measure(self) -> int:
+        lengths = {len(column) for column in self.columns}
+        if len(lengths) > 1:
+            raise ValueError(
+                f"columns must have the same length, got {sorted(lengths)}"
+            )
+        return lengths.pop() if lengths else 0
+
+    def __reindex(self):
+        np = _numpy(self.__mask, *self.columns)
+        index: Optional[Sequence[int]] = None
+        if self.__mask is not None:
+            if np is not None:
+                index = np.flatnonzero(np.asarray(self.__mask, dtype=bool))
+            else:
+                index = [i for i, keep in enumerate(self.__mask) if keep]
+        if self.__sort is not None:
+            column_index, ascending = self.__sort
+            column = self.columns[column_index]
+            if np is not None:
+                if index is None:
+                    index = np.arange(self.__length)
+                keys = np.asarray(column)[index]
+                if not ascending:
+                    # Reversing twice keeps equal values in their order.
+                    index = index[::-1]
+                    keys = keys[::-1]
+                index = index[np.argsort(keys, kind="stable")]
+                if not ascending:
+                    index = index[::-1]
+            else:
+                if index is None:
+                    index = range(self.__length)
+                index = sorted(index, key=column.__getitem__, reverse=not ascending)
+        self.__index = index
+
+
+class SqliteDataSource(DataTable2DataSource):
+    """
+    Rows of an SQLite table or view, fetched page by page.
+
+    Counting, sorting and filtering run as SQL queries, so rows are never
+    all loaded in memory: only the rows of the window shown by the table
+    are read, with `LIMIT` and `OFFSET`.
+
+    ```python
+    source = ftd.SqliteDataSource(sqlite3.connect("shop.db"), "products")
+    source.filter("price > ?", 100)
+    source.sort(2, ascending=False)
+    ```
+    """
+
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        table: str,
+        columns: Optional[Sequence[str]] = None,
+    ):
+        """
+        Args:
+            connection: The database connection to query.
+            table: The name of the table or view to read rows from.
+            columns: The names of the columns to read, in order. Defaults to
+                all columns of `table`.
+        """
+        self.connection = connection
+        self.table = table
+        if columns is None:
+            cursor = connection.execute(f"SELECT * FROM {_quote(table)} LIMIT 0")
+            columns = [description[0] for description in cursor.description]
+        self.columns = list(columns)
+        self.__where: Optional[str] = None
+        self.__params: tuple[Any, ...] = ()
+        self.__order_by: Optional[str] = None
+        self.__row_count: Optional[int] = None
+
+    @property
+    def row_count(self) -> int:
+        if self.__row_count is None:
+            (self.__row_count,) = self.connection.execute(
+                f"SELECT COUNT(*) FROM {_quote(self.table)}{self.__where_clause()}",
+                self.__params,
+            ).fetchone()
+        return self.__row_count
+
+    def get_rows(self, start: int, stop: int) -> list[tuple[Any, ...]]:
+        query = (
+            f"SELECT {', '.join(_quote(c) for c in self.columns)} "
+            f"FROM {_quote(self.table)}{self.__where_clause()}"
+        )
+        if self.__order_by is not None:
+            query += f" ORDER BY {self.__order_by}"
+        return self.connection.execute(
+            f"{query} LIMIT ? OFFSET ?", (*self.__params, stop - start, start)
+        ).fetchall()
+
+    def sort(self, column_index: int, ascending: bool = True) -> None:
+        """
+        Sorts rows by the values of a column, with an `ORDER BY` clause.
+        """
+        self.__order_by = (
+            f"{_quote(self.columns[column_index])} {'ASC' if ascending else 'DESC'}"
+        )
+
+    def filter(self, where: Optional[str] = None, *params: Any) -> None:
+        """
+        Keeps only the rows matching an SQL condition.
+
+        Args:
+            where: The condition of a `WHERE` clause, e.g. `"price > ?"`,
+                or `None` to show all rows again.
+            *params: The values of the placeholders of `where`.
+        """
+        self.__where = where
+        self.__params = params if where is not None else ()
+        self.__row_count = None
+
+    def refresh(self) -> None:
+        """
+        Forgets the cached row count, after rows were inserted or deleted.
+        """
+        self.__row_count = None
+
+    def __where_clause(self) -> str:
+        return f" WHERE {self.__where}" if self.__where is not None else ""
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _numpy(*values: Any):
+    """
+    Returns the `numpy` module if any of `values` is a NumPy array.
+    """
+    if any(hasattr(v, "__array_interface__") for v in values):
+        # Imported lazily so that flet_datatable2 never depends on it.
+        import numpy as np
+
+        return np
+    return None
+
+
+def _to_list(values: Sequence[Any]) -> Sequence[Any]:
+    """
+    Converts NumPy arrays to lists of Python scalars.
+    """
+    return values.tolist() if hasattr(values, "__array_interface__") else values
+
+
+def _take(column: Sequence[Any], positions: Sequence[int]) -> Sequence[Any]:
+    if hasattr(column, "__array_interface__"):
+        return column[positions]
+    return [column[i] for i in positions]
@@ -1,11 +1,26 @@
-from dataclasses import field
-from typing import Optional, Union
+from dataclasses import dataclass, field
+from typing import Any, Optional, Union
 
 import flet as ft
+from flet_datatable2.data_source import DataTable2DataSource
 from flet_datatable2.datacolumn2 import DataColumn2
 from flet_datatable2.datarow2 import DataRow2
 
-__all__ = ["DataTable2"]
+__all__ = ["DataTable2", "DataTable2RowsRequestEvent"]
+
+
+@dataclass
+class DataTable2RowsRequestEvent(ft.Event["DataTable2"]):
+    """
+    Event emitted when the client scrolls a
+    :class:`~flet_datatable2.DataTable2` to rows that are not loaded.
+    """
+
+    start: int
+    """Index of the first visible row."""
+
+    stop: int
+    """Index after the last visible row."""
 
 
 @ft.control("DataTable2")
@@ -21,6 +36,20 @@ class DataTable2(ft.DataTable):
         and :attr:`flet.DataTable.data_row_max_height`
         properties present in the parent :class:`~flet.DataTable`.
         Use :attr:`data_row_height` instead.
+
+    For large tables, set :attr:`data_source` instead of :attr:`rows`: only the
+    rows visible on the client, plus :attr:`overscan` rows around them, are
+    then materialized as controls and sent, and new ones are fetched from the
+    data source as the user scrolls.
+
+    ```python
+    source = ftd.SqliteDataSource(sqlite3.connect("shop.db"), "products")
+    table = ftd.DataTable2(
+        columns=[ftd.DataColumn2(ft.Text(c)) for c in source.columns],
+        data_source=source,
+        data_row_height=40,
+    )
+    ```
     """
 
     columns: list[Union[DataColumn2, ft.DataColumn]]
@@ -31,6 +60,42 @@ class DataTable2(ft.DataTable):
     rows: list[Union[ft.DataRow, DataRow2]] = field(default_factory=list)
     """
     A list of table rows.
+
+    If :attr:`data_source` is set, the rows currently materialized from it,
+    maintained by this table.
+    """
+
+    data_source: Optional[DataTable2DataSource] = field(
+        default=None, metadata={"skip": True}
+    )
+    """
+    The source to fetch rows from, by index range, as the user scrolls.
+
+    Rows are then materialized on the Python side for the visible part of the
+    table only, and their controls are recycled when scrolling. Rows must all
+    have the same height, :attr:`data_row_height`.
+
+    Call :meth:`refresh` after the rows of the data source change.
+    """
+
+    overscan: int = field(default=50, metadata={"skip": True})
+    """
+    The number of rows materialized before and after the visible ones when
+    :attr:`data_source` is set, so that short scrolls don't wait for rows.
+    """
+
+    row_count: Optional[int] = None
+    """
+    The number of rows of :attr:`data_source`.
+
+    Maintained by this table.
+    """
+
+    rows_offset: int = 0
+    """
+    The index in :attr:`data_source` of the first of :attr:`rows`.
+
+    Maintained by this table.
     """
 
     empty: Optional[ft.Control] = None
@@ -132,6 +197,12 @@ class DataTable2(ft.DataTable):
     Height of each data row.
     """
 
+    on_rows_request: Optional[ft.EventHandler[DataTable2RowsRequestEvent]] = None
+    """
+    Called when the user scrolls to rows of :attr:`data_source` that are not
+    materialized, after this table has fetched them.
+    """
+
     # present in parent (DataTable) but of no use in DataTable2
     data_row_min_height: None = field(
         init=False, repr=False, compare=False, metadata={"skip": True}
@@ -139,3 +210,144 @@ class DataTable2(ft.DataTable):
     data_row_max_height: None = field(
         init=False, repr=False, compare=False, metadata={"skip": True}
     )
+
+    def init(self):
+        super().init()
+        self.__source: Optional[DataTable2DataSource] = None
+        self.__visible = (0, 0)
+        self.__loaded: Optional[tuple[int, int, int]] = None
+        self.__recycled: dict[int, ft.DataRow] = {}
+
+    def sort(self, column_index: int, ascending: bool = True):
+        """
+        Sorts the rows of :attr:`data_source` with its
+        :meth:`~flet_datatable2.DataTable2DataSource.sort` method, updates
+        :attr:`sort_column_index` and :attr:`sort_ascending`, and updates
+        this table.
+
+        Meant to be called from :attr:`flet.DataColumn.on_sort`.
+
+        Args:
+            column_index: The index of the column to sort by.
+            ascending: Whether to sort in ascending order.
+
+        Raises:
+            ValueError: If :attr:`data_source` is not set.
+        """
+        self.__require_source().sort(column_index, ascending)
+        self.sort_column_index = column_index
+        self.sort_ascending = ascending
+        self.__reload()
+
+    def filter(self, *args: Any, **kwargs: Any):
+        """
+        Filters the rows of :attr:`data_source` with its
+        :meth:`~flet_datatable2.DataTable2DataSource.filter` method, passing
+        it all arguments, and updates this table.
+
+        Raises:
+            ValueError: If :attr:`data_source` is not set.
+        """
+        self.__require_source().filter(*args, **kwargs)
+        self.__reload()
+
+    def refresh(self):
+        """
+        Refreshes :attr:`data_source` with its
+        :meth:`~flet_datatable2.DataTable2DataSource.refresh` method, fetches
+        the rows shown again and updates this table, e.g. after rows were
+        added, changed or removed.
+        """
+        if self.data_source is not None:
+            self.data_source.refresh()
+        self.__reload()
+
+    def __reload(self):
+        self.__loaded = None
+        self.update()
+
+    def before_event(self, e: ft.ControlEvent):
+        if isinstance(e, DataTable2RowsRequestEvent):
+            self.__visible = (e.start, e.stop)
+            if self.data_source is not None:
+                self.update()
+        return super().before_event(e)
+
+    def before_update(self):
+        if self.data_source is not None:
+            self.__materialize()
+        elif self.__source is not None:
+            # The data source was removed: its rows go with it.
+            self.__source = None
+            self.__loaded = None
+            self.__recycled = {}
+            self.rows = []
+            self.row_count = None
+            self.rows_offset = 0
+        super().before_update()
+
+    def __require_source(self) -> DataTable2DataSource:
+        if self.data_source is None:
+            raise ValueError("data_source must be set")
+        return self.data_source
+
+    def __materialize(self):
+        """
+        Sets :attr:`rows` to the rows of :attr:`data_source` around the visible
+        ones, reusing row controls.
+        """
+        if self.overscan < 0:
+            raise ValueError(
+                f"overscan must be greater than or equal to 0, got {self.overscan}"
+            )
+        source = self.data_source
+        count = source.row_count
+        start, stop = self.__visible
+        start = max(min(start, count) - self.overscan, 0)
+        stop = min(max(stop, start) + self.overscan, count)
+        if source is self.__source and self.__loaded == (start, stop, count):
+            return
+        if source is not self.__source:
+            self.__recycled = {}
+        self.__source = source
+
+        # Rows still in the window keep their controls; controls of rows out
+        # of it are reused for the new ones, so that only changed cells are
+        # sent to the client.
+        previous = self.__recycled
+        kept = {i: previous.pop(i) for i in range(start, stop) if i in previous}
+        spare = list(previous.values())
+        recycled: dict[int, ft.DataRow] = {}
+        rows = []
+        for index, values in enumerate(source.get_rows(start, stop), start):
+            if isinstance(values, ft.DataRow):
+                rows.append(values)
+                continue
+            row = kept.pop(index, None)
+            if row is None:
+                row = spare.pop() if spare else DataRow2(cells=[])
+            _fill_row(row, values)
+            recycled[index] = row
+            rows.append(row)
+
+        self.__recycled = recycled
+        self.__loaded = (start, stop, count)
+        self.rows = rows
+        self.row_count = count
+        self.rows_offset = start
+
+
+def _fill_row(row: ft.DataRow, values: Any):
+    """
+    Sets the cells of a recycled row to `values`, reusing its cell controls.
+    """
+    values = [
+        v if isinstance(v, ft.Control) else "" if v is None else str(v) for v in values
+    ]
+    cells = row.cells
+    del cells[len(values) :]
+    for i, value in enumerate(values):
+        if i < len(cells):
+            cells[i].content = value
+        else:
+            cells.append(ft.DataCell(value))
@@ -19,14 +19,59 @@ class DataTable2Control extends StatefulWidget {
 
 class _DataTable2ControlState extends State<DataTable2Control> {
   //final ScrollController _horizontalController = ScrollController();
-  //final ScrollController _controller = ScrollController();
+  final ScrollController _controller = ScrollController();
+  String? _lastRowsRequest;
 
-  // @override
-  // void dispose() {
-  //   _horizontalController.dispose();
-  //   _controller.dispose();
-  //   super.dispose();
-  // }
+  @override
+  void initState() {
+    super.initState();
+    _controller.addListener(_requestRows);
+  }
+
+  @override
+  void dispose() {
+    _controller.removeListener(_requestRows);
+    _controller.dispose();
+    super.dispose();
+  }
+
+  double get _rowHeight =>
+      widget.control.getDouble("data_row_height") ?? kMinInteractiveDimension;
+
+  /// With a data source, asks the backend for the visible rows when they
+  /// are not loaded, or when the loaded ones are about to run out.
+  void _requestRows() {
+    var rowCount = widget.control.getInt("row_count");
+    if (rowCount == null || !_controller.hasClients) return;
+    var position = _controller.position;
+    var start = (position.pixels / _rowHeight).floor().clamp(0, rowCount);
+    var stop = ((position.pixels + position.viewportDimension) / _rowHeight)
+        .ceil()
+        .clamp(start, rowCount);
+    var offset = widget.control.getInt("rows_offset", 0)!;
+    var loaded = widget.control.children("rows").length;
+    // Request ahead of time, when a quarter of the rows loaded around the
+    // visible ones remains on either side.
+    var margin = ((loaded - (stop - start)) ~/ 4).clamp(0, loaded);
+    if ((start - margin).clamp(0, rowCount) >= offset &&
+        (stop + margin).clamp(0, rowCount) <= offset + loaded) {
+      return;
+    }
+    var request = "$start:$stop:$offset:$loaded:$rowCount";
+    if (request == _lastRowsRequest) return;
+    _lastRowsRequest = request;
+    widget.control.triggerEventWithoutSubscribers(
+        "rows_request", {"start": start, "stop": stop});
+  }
+
+  /// Rows standing for the rows of the data source that are not loaded,
+  /// keeping the scrollable height of the table that of all rows.
+  DataRow2 _spacerRow(int rowCount, int columnCount) {
+    return DataRow2(
+        specificRowHeight: rowCount * _rowHeight,
+        cells: List.generate(
+            columnCount, (_) => const DataCell(SizedBox.shrink())));
+  }
 
   @override
   Widget build(BuildContext context) {
@@ -55,8 +100,17 @@ class _DataTable2ControlState extends State<DataTable2Control> {
           gradient: gradient);
     }
 
+    var rowCount = widget.control.getInt("row_count");
+    if (rowCount != null) {
+      // Loaded rows or the row count changed: check whether the visible rows
+      // are loaded once laid out.
+      WidgetsBinding.instance.addPostFrameCallback((_) {
+        if (mounted) _requestRows();
+      });
+    }
+
     var datatable2 = DataTable2(
-      // scrollController: _controller,
+      scrollController: _controller,
       // horizontalScrollController: _horizontalController,
       decoration: decoration,
       border: (horizontalLines != null || verticalLines != null)
@@ -136,7 +190,7 @@ class _DataTable2ControlState extends State<DataTable2Control> {
                 : null,
             label: column.buildTextOrWidget("label")!);
       }).toList(),
-      rows: widget.control.children("rows").map((row) {
+      rows: _withSpacers(rowCount, widget.control.children("rows").map((row) {
         row.notifyParent = true;
         return DataRow2(
           key: ValueKey(row.id),
@@ -166,7 +220,7 @@ class _DataTable2ControlState extends State<DataTable2Control> {
           cells: row.children("cells").map((cell) {
             cell.notifyParent = true;
             return DataCell(
-              cell.buildWidget("content")!,
+              cell.buildTextOrWidget("content")!,
               placeholder: cell.getBool("placeholder", false)!,
               showEditIcon: cell.getBool("show_edit_icon", false)!,
               onDoubleTap: cell.getBool("on_double_tap", false)!
@@ -187,9 +241,21 @@ class _DataTable2ControlState extends State<DataTable2Control> {
             );
           }).toList(),
         );
-      }).toList(),
+      }).toList()),
     );
 
     return LayoutControl(control: widget.control, child: datatable2);
   }
+
+  List<DataRow> _withSpacers(int? rowCount, List<DataRow> rows) {
+    if (rowCount == null) return rows;
+    var columnCount = widget.control.children("columns").length;
+    var before = widget.control.getInt("rows_offset", 0)!;
+    var after = rowCount - before - rows.length;
+    return [
+      if (before > 0) _spacerRow(before, columnCount),
+      ...rows,
+      if (after > 0) _spacerRow(after, columnCount),
+    ];
+  }
 }
@@ -0,0 +1,258 @@
+import sqlite3
+
+import msgpack
+import pytest
+
+import flet as ft
+import flet_datatable2 as ftd
+from flet.messaging.connection import Connection
+from flet.messaging.protocol import configure_encode_object_for_msgpack
+from flet.messaging.session import Session
+from flet.pubsub.pubsub_hub import PubSubHub
+from flet_datatable2.datatable2 import _fill_row
+
+
+class _Connection(Connection):
+    def send_message(self, message):
+        pass
+
+
+class _CountingSource(ftd.ArrayDataSource):
+    def __init__(self, columns):
+        super().__init__(columns)
+        self.requests = []
+
+    def get_rows(self, start, stop):
+        self.requests.append((start, stop))
+        return super().get_rows(start, stop)
+
+
+def _table(source, overscan=2):
+    conn = _Connection()
+    conn.pubsubhub = PubSubHub()
+    session = Session(conn)
+    table = ftd.DataTable2(
+        columns=[ftd.DataColumn2(ft.Text("id")), ftd.DataColumn2(ft.Text("name"))],
+        data_source=source,
+        overscan=overscan,
+    )
+    session.page.controls.append(table)
+    msgpack.packb(  # mount controls
+        session.get_page_patch(),
+        default=configure_encode_object_for_msgpack(ft.BaseControl),
+    )
+    return session, table
+
+
+def _scroll(table, start, stop):
+    table.before_event(
+        ftd.DataTable2RowsRequestEvent(
+            name="rows_request", control=table, start=start, stop=stop
+        )
+    )
+
+
+def _values(table):
+    return [[cell.content for cell in row.cells] for row in table.rows]
+
+
+def _source(n=20):
+    return _CountingSource([list(range(n)), [f"row {i}" for i in range(n)]])
+
+
+def test_materializes_visible_rows_with_overscan():
+    source = _source()
+    _, table = _table(source)
+
+    _scroll(table, 5, 8)
+
+    assert (table.rows_offset, table.row_count) == (3, 20)
+    assert _values(table) == [[str(i), f"row {i}"] for i in range(3, 10)]
+    assert source.requests[-1] == (3, 10)
+
+
+def test_overscan_is_clamped_to_row_count():
+    _, table = _table(_source(), overscan=5)
+
+    _scroll(table, 0, 3)
+    assert (table.rows_offset, len(table.rows)) == (0, 8)
+
+    _scroll(table, 17, 25)
+    assert (table.rows_offset, len(table.rows)) == (12, 8)
+
+
+def test_same_window_does_not_fetch_again():
+    source = _source()
+    _, table = _table(source)
+    _scroll(table, 5, 8)
+    requests = len(source.requests)
+
+    table.before_update()
+
+    assert len(source.requests) == requests
+
+
+def test_rows_are_recycled_when_scrolling():
+    _, table = _table(_source())
+    _scroll(table, 5, 8)
+    rows = {id(row): row for row in table.rows}
+    kept = {i + 3: row for i, row in enumerate(table.rows)}
+    cells = {id(cell) for row in table.rows for cell in row.cells}
+
+    _scroll(table, 8, 11)
+
+    assert table.rows_offset == 6
+    assert _values(table) == [[str(i), f"row {i}"] for i in range(6, 13)]
+    # rows still in the window keep their controls, the others are reused
+    assert all(table.rows[i - 6] is kept[i] for i in range(6, 10))
+    assert {id(row) for row in table.rows} == set(rows)
+    assert {id(cell) for row in table.rows for cell in row.cells} == cells
+
+
+def test_fill_row_reuses_cells_and_adjusts_their_number():
+    row = ftd.DataRow2(cells=[])
+    _fill_row(row, [1, None])
+    first = row.cells[0]
+    assert [cell.content for cell in row.cells] == ["1", ""]
+
+    icon = ft.Icon(ft.Icons.CHECK)
+    _fill_row(row, [icon, 4, 5])
+    assert row.cells[0] is first
+    assert [cell.content for cell in row.cells] == [icon, "4", "5"]
+
+    _fill_row(row, ["a"])
+    assert [cell.content for cell in row.cells] == ["a"]
+    assert row.cells[0] is first
+
+
+def test_negative_overscan_is_rejected():
+    _, table = _table(_source())
+    table.overscan = -1
+
+    with pytest.raises(ValueError):
+        table.before_update()
+
+
+def test_array_source_pages_sorts_and_filters():
+    source = ftd.ArrayDataSource([[3, 1, 2, 1], ["c", "a", "b", "d"]])
+
+    assert source.row_count == 4
+    assert source.get_rows(1, 3) == [[1, "a"], [2, "b"]]
+
+    source.sort(0)
+    assert source.get_rows(0, 4) == [[1, "a"], [1, "d"], [2, "b"], [3, "c"]]
+    source.sort(0, ascending=False)
+    assert source.get_rows(0, 4) == [[3, "c"], [2, "b"], [1, "a"], [1, "d"]]
+
+    source.filter([True, True, False, True])
+    assert source.row_count == 3
+    assert source.get_rows(1, 3) == [[1, "a"], [1, "d"]]
+
+    source.filter(None)
+    assert source.row_count == 4
+
+
+def test_array_source_rejects_mismatched_lengths():
+    with pytest.raises(ValueError):
+        ftd.ArrayDataSource([[1, 2], [1]])
+    with pytest.raises(ValueError):
+        ftd.ArrayDataSource([[1, 2]]).filter([True])
+
+
+def test_array_source_with_numpy_arrays():
+    np = pytest.importorskip("numpy")
+    source = ftd.ArrayDataSource([np.array([3, 1, 2, 1]), np.array(list("cabd"))])
+
+    source.filter(source.columns[0] < 3)
+    source.sort(0, ascending=False)
+
+    assert source.row_count == 3
+    assert source.get_rows(0, 3) == [[2, "b"], [1, "a"], [1, "d"]]
+    assert all(type(v) in (int, str) for row in source.get_rows(0, 3) for v in row)
+
+
+def test_sqlite_source_pages_sorts_and_filters():
+    connection = sqlite3.connect(":memory:")
+    connection.execute('CREATE TABLE "my items" (id INTEGER, name TEXT)')
+    connection.executemany(
+        'INSERT INTO "my items" VALUES (?, ?)', [(3, "c"), (1, "a"), (2, "b")]
+    )
+    source = ftd.SqliteDataSource(connection, "my items")
+
+    assert source.columns == ["id", "name"]
+    assert source.row_count == 3
+
+    source.sort(1, ascending=False)
+    assert source.get_rows(0, 2) == [(3, "c"), (2, "b")]
+    assert source.get_rows(2, 3) == [(1, "a")]
+
+    source.filter("id > ?", 1)
+    assert source.row_count == 2
+    assert source.get_rows(0, 10) == [(3, "c"), (2, "b")]
+
+    source.filter()
+    assert source.row_count == 3
+    connection.execute('INSERT INTO "my items" VALUES (4, "d")')
+    assert source.row_count == 3
+    source.refresh()
+    assert source.row_count == 4
+
+
+def test_table_sort_and_filter_go_through_the_source():
+    _, table = _table(_source(6), overscan=10)
+    _scroll(table, 0, 6)
+
+    table.sort(0, ascending=False)
+    assert (table.sort_column_index, table.sort_ascending) == (0, False)
+    assert [row[0] for row in _values(table)] == ["5", "4", "3", "2", "1", "0"]
+
+    table.filter([i % 2 == 0 for i in range(6)])
+    assert table.row_count == 3
+    assert [row[0] for row in _values(table)] == ["4", "2", "0"]
+
+
+def test_table_without_source_rejects_sort():
+    with pytest.raises(ValueError):
+        ftd.DataTable2(columns=[ftd.DataColumn2(ft.Text("id"))]).sort(0)
+
+
+def test_table_refresh_refreshes_array_source():
+    ids, names = [2, 0], ["b", "a"]
+    source = ftd.ArrayDataSource([ids, names])
+    source.sort(0)
+    _, table = _table(source, overscan=10)
+    _scroll(table, 0, 2)
+
+    ids.append(1)
+    names.append("c")
+    table.refresh()
+
+    assert table.row_count == 3
+    assert _values(table) == [["0", "a"], ["1", "c"], ["2", "b"]]
+
+
+def test_array_source_refresh_rejects_outdated_mask():
+    ids = [1, 2]
+    source = ftd.ArrayDataSource([ids])
+    source.filter([True, False])
+    ids.append(3)
+
+    with pytest.raises(ValueError):
+        source.refresh()
+    source.filter([True, False, True])
+    assert source.get_rows(0, source.row_count) == [[1], [3]]
+
+
+def test_table_refresh_refreshes_sqlite_source():
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE items (id INTEGER, name TEXT)")
+    connection.execute("INSERT INTO items VALUES (1, 'a')")
+    _, table = _table(ftd.SqliteDataSource(connection, "items"), overscan=10)
+    _scroll(table, 0, 1)
+    assert table.row_count == 1
+
+    connection.execute("INSERT INTO items VALUES (2, 'b')")
+    table.refresh()
+
+    assert table.row_count == 2
+    assert _values(table) == [["1", "a"], ["2", "b"]]
@@ -1,4 +1,5 @@
 from flet_map.circle_layer import CircleLayer, CircleMarker
+from flet_map.clustered_marker_layer import ClusteredMarkerLayer
 from flet_map.map import Map
 from flet_map.map_layer import MapLayer
 from flet_map.marker_layer import Marker, MarkerLayer
@@ -31,6 +32,7 @@ from flet_map.types import (
     InteractionConfiguration,
     InteractionFlag,
     KeyboardConfiguration,
+    MapCoordinateArray,
     MapEvent,
     MapEventSource,
     MapEventType,
@@ -56,6 +58,7 @@ __all__ = [
     "CameraFit",
     "CircleLayer",
     "CircleMarker",
+    "ClusteredMarkerLayer",
     "CursorKeyboardRotationConfiguration",
     "CursorRotationBehaviour",
     "DashedStrokePattern",
@@ -67,6 +70,7 @@ __all__ = [
     "InteractionFlag",
     "KeyboardConfiguration",
     "Map",
+    "MapCoordinateArray",
     "MapEvent",
     "MapEventSource",
     "MapEventType",
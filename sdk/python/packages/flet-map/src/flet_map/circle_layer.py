@@ -1,8 +1,8 @@
-from typing import Optional
+from typing import Optional, Union
 
 import flet as ft
 from flet_map.map_layer import MapLayer
-from flet_map.types import MapLatitudeLongitude
+from flet_map.types import MapCoordinateArray, MapLatitudeLongitude
 
 __all__ = ["CircleLayer", "CircleMarker"]
 
@@ -17,8 +17,14 @@ class CircleMarker(ft.BaseControl):
     radius: ft.Number
     """The radius of the circle"""
 
-    coordinates: MapLatitudeLongitude
-    """The center coordinates of the circle"""
+    coordinates: Union[MapLatitudeLongitude, MapCoordinateArray]
+    """
+    The center coordinates of the circle.
+
+    With a :class:`~flet_map.MapCoordinateArray`, a circle with the same
+    appearance is drawn at each of the coordinates: a compact way to show
+    many points.
+    """
 
     color: Optional[ft.ColorValue] = None
     """The color of the circle area."""
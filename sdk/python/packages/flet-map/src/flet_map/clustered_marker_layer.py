@@ -0,0 +1,268 @@
+import math
+from dataclasses import field
+from typing import Optional
+
+import flet as ft
+from flet_map.map_layer import MapLayer
+from flet_map.marker_layer import Marker
+from flet_map.types import Camera, MapCoordinateArray
+
+__all__ = ["ClusteredMarkerLayer"]
+
+
+@ft.control("ClusteredMarkerLayer")
+class ClusteredMarkerLayer(MapLayer):
+    """
+    A layer to display a large number of points as markers, grouping nearby
+    ones into clusters.
+
+    Points are clustered on a grid for the current zoom level on the Python
+    side, and only the markers and clusters within the current camera are
+    sent to the map. Tell the layer where the camera is with
+    :meth:`set_camera`:
+
+    ```python
+    layer = fm.ClusteredMarkerLayer(
+        points=fm.MapCoordinateArray.from_arrays(latitudes, longitudes),
+        marker=fm.Marker(
+            content=ft.Icon(ft.Icons.LOCATION_ON),
+            coordinates=fm.MapCoordinateArray(),
+        ),
+    )
+    map = fm.Map(
+        layers=[fm.TileLayer(url_template="..."), layer],
+        on_position_change=lambda e: layer.set_camera(e.camera),
+    )
+    page.add(map)
+    layer.set_camera(await map.get_camera())
+    ```
+    """
+
+    marker: Marker
+    """
+    The marker drawn at each point that is not part of a cluster.
+
+    Its :attr:`~flet_map.Marker.coordinates` are set by this layer.
+    """
+
+    points: Optional[MapCoordinateArray] = field(default=None, metadata={"skip": True})
+    """
+    All points of this layer.
+
+    Kept on the Python side: only the visible part is sent to the map.
+    """
+
+    camera: Optional[Camera] = field(default=None, metadata={"skip": True})
+    """
+    The camera of the map this layer is displayed on, which determines the
+    zoom level clusters are computed for and the area markers are sent for.
+
+    If `None`, clusters are computed for zoom level `0` over the whole world.
+    Prefer setting it with :meth:`set_camera`.
+    """
+
+    cluster_radius: ft.Number = field(default=60.0, metadata={"skip": True})
+    """
+    The size, in logical pixels, of the grid cells points are clustered in.
+    """
+
+    max_cluster_zoom: ft.Number = field(default=16.0, metadata={"skip": True})
+    """
+    The zoom level above which points are no longer clustered.
+    """
+
+    cluster_marker: Optional[Marker] = None
+    """
+    The marker drawn at each cluster, with the number of points of the
+    cluster shown on top of its content.
+
+    Its :attr:`~flet_map.Marker.coordinates` are ignored. If `None`, clusters
+    are drawn as circles of :attr:`cluster_color`.
+    """
+
+    cluster_size: ft.Number = 40.0
+    """
+    The diameter of the default cluster circles.
+    """
+
+    cluster_color: Optional[ft.ColorValue] = None
+    """
+    The color of the default cluster circles.
+
+    Defaults to the primary color of the theme.
+    """
+
+    cluster_text_style: Optional[ft.TextStyle] = None
+    """
+    The text style of the number of points shown on clusters.
+    """
+
+    clusters: Optional[MapCoordinateArray] = None
+    """
+    Centers of the visible clusters.
+
+    Computed by this layer.
+    """
+
+    cluster_counts: Optional[list[int]] = None
+    """
+    Number of points of each of the visible :attr:`clusters`.
+
+    Computed by this layer.
+    """
+
+    alignment: Optional[ft.Alignment] = field(
+        default_factory=lambda: ft.Alignment.CENTER
+    )
+    """
+    The alignment of markers and clusters relative to their coordinates.
+    """
+
+    rotate: bool = False
+    """
+    Whether to counter-rotate markers and clusters to the map's rotation,
+    to keep a fixed orientation.
+    """
+
+    def init(self):
+        super().init()
+        self.__index: Optional[_ClusterIndex] = None
+
+    def set_camera(self, camera: Camera):
+        """
+        Updates this layer for a new position of the map camera.
+
+        Meant to be called from :attr:`flet_map.Map.on_position_change`; only
+        the markers and clusters that changed are sent to the map.
+
+        Args:
+            camera: The current camera of the map.
+        """
+        self.camera = camera
+        self.update()
+
+    def before_update(self):
+        super().before_update()
+        if self.cluster_radius <= 0:
+            raise ValueError(
+                f"cluster_radius must be greater than 0, got {self.cluster_radius}"
+            )
+        if self.points is None or not len(self.points):
+            singles, clusters = [], []
+        else:
+            if self.__index is None or self.__index.points is not self.points:
+                self.__index = _ClusterIndex(self.points)
+            singles, clusters = self.__index.query(
+                self.camera, self.cluster_radius, self.max_cluster_zoom
+            )
+        self.marker.coordinates = _pack(singles)
+        self.clusters = _pack(clusters)
+        self.cluster_counts = [c[4] for c in clusters]
+
+
+def _pack(items: list[tuple]) -> MapCoordinateArray:
+    return MapCoordinateArray.from_arrays(
+        [item[2] for item in items], [item[3] for item in items]
+    )
+
+
+def _mercator(latitude: float, longitude: float) -> tuple[float, float]:
+    """
+    Projects a coordinate to Web Mercator, normalized to `[0, 1]` over the
+    whole world.
+    """
+    sin_lat = min(max(math.sin(math.radians(latitude)), -0.9999), 0.9999)
+    return (
+        (longitude + 180.0) / 360.0,
+        0.5 - math.log((1 + sin_lat) / (1 - sin_lat)) / (4 * math.pi),
+    )
+
+
+def _x_ranges(west: float, east: float, margin: float) -> list[tuple[float, float]]:
+    """
+    Splits the normalized span from `west` to `east`, widened by `margin`, into
+    ranges within `[0, 1]`.
+
+    `west` greater than `east` means the span crosses the antimeridian, which
+    yields a range on each side of it.
+    """
+    span = east - west
+    if span < 0:
+        span += 1.0
+    if span + 2 * margin >= 1.0:
+        return [(0.0, 1.0)]
+    start = west - margin
+    start -= math.floor(start)
+    end = start + span + 2 * margin
+    if end <= 1.0:
+        return [(start, end)]
+    return [(start, 1.0), (0.0, end - 1.0)]
+
+
+class _ClusterIndex:
+    """
+    Grid clusters of a set of points, computed once per zoom level.
+
+    Items are `(x, y, latitude, longitude, count)` tuples, with `x` and `y`
+    the normalized Web Mercator position.
+    """
+
+    def __init__(self, points: MapCoordinateArray):
+        self.points = points
+        latitudes, longitudes = points.to_arrays()
+        self.items = [
+            (*_mercator(lat, lon), lat, lon, 1)
+            for lat, lon in zip(latitudes, longitudes)
+        ]
+        self.levels: dict[tuple[int, float], list[tuple]] = {}
+
+    def level(self, zoom: int, radius: float) -> list[tuple]:
+        items = self.levels.get((zoom, radius))
+        if items is not None:
+            return items
+        cell = radius / (256.0 * 2**zoom)
+        cells: dict[tuple[int, int], list] = {}
+        for x, y, lat, lon, _ in self.items:
+            key = (int(x / cell), int(y / cell))
+            acc = cells.get(key)
+            if acc is None:
+                cells[key] = [x, y, lat, lon, 1]
+            else:
+                acc[0] += x
+                acc[1] += y
+                acc[2] += lat
+                acc[3] += lon
+                acc[4] += 1
+        items = [
+            (x / n, y / n, lat / n, lon / n, n) for x, y, lat, lon, n in cells.values()
+        ]
+        self.levels[(zoom, radius)] = items
+        return items
+
+    def query(
+        self, camera: Optional[Camera], radius: float, max_cluster_zoom: float
+    ) -> tuple[list[tuple], list[tuple]]:
+        """
+        Returns the single points and the clusters visible by `camera`.
+        """
+        zoom = max(int(camera.zoom), 0) if camera is not None else 0
+        items = self.items if zoom > max_cluster_zoom else self.level(zoom, radius)
+        bounds = camera.visible_bounds if camera is not None else None
+        if bounds is not None:
+            # The map reports its north-west corner first, so a west edge east
+            # of the east edge means the view crosses the antimeridian. Keep a
+            # cell of margin so that clusters don't pop at the edges.
+            margin = radius / (256.0 * 2**zoom)
+            x1, y1 = _mercator(bounds.corner_1.latitude, bounds.corner_1.longitude)
+            x2, y2 = _mercator(bounds.corner_2.latitude, bounds.corner_2.longitude)
+            min_y, max_y = min(y1, y2) - margin, max(y1, y2) + margin
+            ranges = _x_ranges(x1, x2, margin)
+            items = [
+                item
+                for item in items
+                if min_y <= item[1] <= max_y
+                and any(west <= item[0] <= east for west, east in ranges)
+            ]
+        singles = [item for item in items if item[4] == 1]
+        clusters = [item for item in items if item[4] > 1]
+        return singles, clusters
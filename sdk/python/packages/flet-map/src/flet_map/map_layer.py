@@ -11,6 +11,7 @@ class MapLayer(ft.Control):
     The following layers are available:
 
     - :class:`~flet_map.CircleLayer`
+    - :class:`~flet_map.ClusteredMarkerLayer`
     - :class:`~flet_map.MarkerLayer`
     - :class:`~flet_map.OverlayImageLayer`
     - :class:`~flet_map.PolygonLayer`
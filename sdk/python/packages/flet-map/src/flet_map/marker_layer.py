@@ -1,9 +1,9 @@
 from dataclasses import field
-from typing import Optional
+from typing import Optional, Union
 
 import flet as ft
 from flet_map.map_layer import MapLayer
-from flet_map.types import MapLatitudeLongitude
+from flet_map.types import MapCoordinateArray, MapLatitudeLongitude
 
 __all__ = ["Marker", "MarkerLayer"]
 
@@ -23,12 +23,15 @@ class Marker(ft.BaseControl):
         ValueError: If it is not :attr:`~flet.Control.visible`.
     """
 
-    coordinates: MapLatitudeLongitude
+    coordinates: Union[MapLatitudeLongitude, MapCoordinateArray]
     """
     The coordinates of the marker.
 
     This will be the center of the marker,
     if :attr:`alignment` is :attr:`flet.Alignment.CENTER`.
+
+    With a :class:`~flet_map.MapCoordinateArray`, the same :attr:`content`
+    is drawn at each of the coordinates.
     """
 
     rotate: Optional[bool] = None
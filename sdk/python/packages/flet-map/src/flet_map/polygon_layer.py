@@ -1,8 +1,8 @@
-from typing import Optional
+from typing import Optional, Union
 
 import flet as ft
 from flet_map.map_layer import MapLayer
-from flet_map.types import MapLatitudeLongitude
+from flet_map.types import MapCoordinateArray, MapLatitudeLongitude
 
 __all__ = ["PolygonLayer", "PolygonMarker"]
 
@@ -13,9 +13,12 @@ class PolygonMarker(ft.BaseControl):
     A marker for the :class:`~flet_map.PolygonLayer`.
     """
 
-    coordinates: list[MapLatitudeLongitude]
+    coordinates: Union[list[MapLatitudeLongitude], MapCoordinateArray]
     """
     The points for the outline of this polygon.
+
+    Use a :class:`~flet_map.MapCoordinateArray` for polygons with many
+    points: it is much faster to build and send than a list.
     """
 
     label: Optional[str] = None
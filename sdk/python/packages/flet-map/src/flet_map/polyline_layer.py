@@ -1,9 +1,14 @@
 from dataclasses import field
-from typing import Optional
+from typing import Optional, Union
 
 import flet as ft
 from flet_map.map_layer import MapLayer
-from flet_map.types import MapLatitudeLongitude, SolidStrokePattern, StrokePattern
+from flet_map.types import (
+    MapCoordinateArray,
+    MapLatitudeLongitude,
+    SolidStrokePattern,
+    StrokePattern,
+)
 
 __all__ = ["PolylineLayer", "PolylineMarker"]
 
@@ -14,9 +19,12 @@ class PolylineMarker(ft.BaseControl):
     A marker for the :class:`~flet_map.PolylineLayer`.
     """
 
-    coordinates: list[MapLatitudeLongitude]
+    coordinates: Union[list[MapLatitudeLongitude], MapCoordinateArray]
     """
     The list of coordinates for the polyline.
+
+    Use a :class:`~flet_map.MapCoordinateArray` for long polylines, such as
+    GPS tracks: it is much faster to build and send than a list.
     """
 
     colors_stop: Optional[list[ft.Number]] = None
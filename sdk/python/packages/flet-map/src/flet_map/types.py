@@ -1,6 +1,8 @@
+import array
+import sys
 from dataclasses import dataclass, field  # dataclass kept for event types
 from enum import Enum, IntFlag
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 import flet as ft
 from flet.controls.animation import AnimationCurve
@@ -25,6 +27,7 @@ __all__ = [
     "MapEventSource",
     "MapEventType",
     "MapHoverEvent",
+    "MapCoordinateArray",
     "MapLatitudeLongitude",
     "MapLatitudeLongitudeBounds",
     "MapPointerEvent",
@@ -152,6 +155,11 @@ class Camera:
     The rotation (in degrees) of the camera.
     """
 
+    visible_bounds: Optional["MapLatitudeLongitudeBounds"] = None
+    """
+    The area of the map currently shown by this camera.
+    """
+
 
 @ft.value
 class StrokePattern:
@@ -288,6 +296,111 @@ class MapLatitudeLongitudeBounds:
     """The corner 2."""
 
 
+@ft.value
+class MapCoordinateArray:
+    """
+    Coordinates packed into a binary array: a compact alternative to lists of
+    :class:`~flet_map.MapLatitudeLongitude` for large shapes and point sets.
+
+    Build it from separate latitude and longitude arrays with
+    :meth:`from_arrays`, or from `(latitude, longitude)` pairs with
+    :meth:`from_points`. Both accept NumPy arrays, `array.array`, other
+    buffers or sequences of numbers.
+    """
+
+    data: bytes = b""
+    """
+    Interleaved latitude and longitude of each coordinate, in degrees, as
+    little-endian 64-bit floats.
+    """
+
+    @classmethod
+    def from_arrays(cls, latitudes: Any, longitudes: Any) -> "MapCoordinateArray":
+        """
+        Packs coordinates given as separate latitude and longitude arrays.
+
+        Raises:
+            ValueError: If `latitudes` and `longitudes` differ in length.
+        """
+        if hasattr(latitudes, "__array_interface__") or hasattr(
+            longitudes, "__array_interface__"
+        ):
+            import numpy as np
+
+            lat = np.asarray(latitudes, dtype="<f8").ravel()
+            lon = np.asarray(longitudes, dtype="<f8").ravel()
+            if lat.shape != lon.shape:
+                raise ValueError(
+                    "latitudes and longitudes must have the same length, "
+                    f"got {lat.size} and {lon.size}"
+                )
+            return cls(data=np.column_stack((lat, lon)).tobytes())
+        lat = _float_array(latitudes)
+        lon = _float_array(longitudes)
+        if len(lat) != len(lon):
+            raise ValueError(
+                "latitudes and longitudes must have the same length, "
+                f"got {len(lat)} and {len(lon)}"
+            )
+        packed = array.array("d", bytes(16 * len(lat)))
+        packed[0::2] = lat
+        packed[1::2] = lon
+        return cls(data=_to_little_endian(packed))
+
+    @classmethod
+    def from_points(cls, points: Any) -> "MapCoordinateArray":
+        """
+        Packs coordinates given as `(latitude, longitude)` pairs, such as an
+        array of shape `(n, 2)`.
+
+        Raises:
+            ValueError: If `points` is not made of pairs.
+        """
+        if hasattr(points, "__array_interface__"):
+            import numpy as np
+
+            packed = np.ascontiguousarray(points, dtype="<f8")
+            if packed.ndim != 2 or packed.shape[1] != 2:
+                raise ValueError(
+                    f"points must have a shape of (n, 2), got {packed.shape}"
+                )
+            return cls(data=packed.tobytes())
+        packed = array.array("d")
+        for point in points:
+            if len(point) != 2:
+                raise ValueError(
+                    f"points must be (latitude, longitude) pairs, got {point!r}"
+                )
+            packed.extend(point)
+        return cls(data=_to_little_endian(packed))
+
+    def __len__(self) -> int:
+        return len(self.data) // 16
+
+    def to_arrays(self) -> tuple[array.array, array.array]:
+        """
+        Returns the latitudes and longitudes of these coordinates.
+        """
+        values = array.array("d", self.data)
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values[0::2], values[1::2]
+
+
+def _float_array(values: Any) -> array.array:
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return array.array("d", values)
+    return array.array("d", view.cast("B").cast(view.format).tolist())
+
+
+def _to_little_endian(values: array.array) -> bytes:
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tobytes()
+
+
 class InteractionFlag(IntFlag):
     """
     Flags to enable/disable certain interaction events on the map.
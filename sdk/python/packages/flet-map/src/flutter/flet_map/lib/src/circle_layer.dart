@@ -17,16 +17,22 @@ class CircleLayerControl extends StatelessWidget with FletStoreMixin {
     var circles = control
         .children("circles")
         .where((c) => c.type == "CircleMarker")
-        .map((circle) {
+        .expand((circle) {
       circle.notifyParent = true;
-      return CircleMarker(
-          point: circle.getLatLng("coordinates")!,
-          color: circle.getColor("color", context, const Color(0xFF00FF00))!,
-          borderColor: circle.getColor(
-              "border_color", context, const Color(0xFFFFFF00))!,
-          borderStrokeWidth: circle.getDouble("border_stroke_width", 0.0)!,
-          useRadiusInMeter: circle.getBool("use_radius_in_meter", false)!,
-          radius: circle.getDouble("radius", 10)!);
+      var color = circle.getColor("color", context, const Color(0xFF00FF00))!;
+      var borderColor =
+          circle.getColor("border_color", context, const Color(0xFFFFFF00))!;
+      var borderStrokeWidth = circle.getDouble("border_stroke_width", 0.0)!;
+      var useRadiusInMeter = circle.getBool("use_radius_in_meter", false)!;
+      var radius = circle.getDouble("radius", 10)!;
+      return circle.getMarkerLatLngs("coordinates").map((point) =>
+          CircleMarker(
+              point: point,
+              color: color,
+              borderColor: borderColor,
+              borderStrokeWidth: borderStrokeWidth,
+              useRadiusInMeter: useRadiusInMeter,
+              radius: radius));
     }).toList();
 
     return BaseControl(control: control, child: CircleLayer(circles: circles));
@@ -0,0 +1,83 @@
+import 'package:flet/flet.dart';
+import 'package:flutter/material.dart';
+import 'package:flutter_map_animations/flutter_map_animations.dart';
+
+import 'utils/map.dart';
+
+class ClusteredMarkerLayerControl extends StatelessWidget with FletStoreMixin {
+  final Control control;
+
+  const ClusteredMarkerLayerControl({super.key, required this.control});
+
+  @override
+  Widget build(BuildContext context) {
+    debugPrint("ClusteredMarkerLayerControl build: ${control.id}");
+    final theme = Theme.of(context);
+
+    List<AnimatedMarker> markers = [];
+
+    // single points: the marker template drawn at each of its coordinates
+    var marker = control.child("marker");
+    if (marker != null) {
+      marker.notifyParent = true;
+      var rotate = marker.getBool("rotate");
+      var height = marker.getDouble("height", 30.0)!;
+      var width = marker.getDouble("width", 30.0)!;
+      var alignment = marker.getAlignment("alignment");
+      markers.addAll(marker.getMarkerLatLngs("coordinates").map((point) =>
+          AnimatedMarker(
+              point: point,
+              rotate: rotate,
+              height: height,
+              width: width,
+              alignment: alignment,
+              builder: (BuildContext context, Animation<double> animation) {
+                return marker.buildWidget("content") ??
+                    const ErrorControl("content must be provided and visible");
+              })));
+    }
+
+    // clusters: the cluster marker template, or a circle, with the count
+    var clusterMarker = control.child("cluster_marker");
+    clusterMarker?.notifyParent = true;
+    var counts = control.get<List>("cluster_counts") ?? const [];
+    var clusterSize = control.getDouble("cluster_size", 40.0)!;
+    var clusterColor =
+        control.getColor("cluster_color", context, theme.colorScheme.primary)!;
+    var textStyle = control.getTextStyle(
+        "cluster_text_style",
+        theme,
+        TextStyle(
+            color: theme.colorScheme.onPrimary,
+            fontWeight: FontWeight.bold))!;
+    var clusters = control.getLatLngList("clusters");
+    for (var i = 0; i < clusters.length && i < counts.length; i++) {
+      var count = Text(counts[i].toString(), style: textStyle);
+      markers.add(AnimatedMarker(
+          point: clusters[i],
+          rotate: clusterMarker?.getBool("rotate"),
+          height: clusterMarker?.getDouble("height", 30.0) ?? clusterSize,
+          width: clusterMarker?.getDouble("width", 30.0) ?? clusterSize,
+          alignment: clusterMarker?.getAlignment("alignment"),
+          builder: (BuildContext context, Animation<double> animation) {
+            var content = clusterMarker?.buildWidget("content") ??
+                DecoratedBox(
+                    decoration: BoxDecoration(
+                        color: clusterColor, shape: BoxShape.circle));
+            return Stack(
+                alignment: Alignment.center,
+                fit: StackFit.expand,
+                children: [content, Center(child: count)]);
+          }));
+    }
+
+    return BaseControl(
+      control: control,
+      child: AnimatedMarkerLayer(
+        markers: markers,
+        rotate: control.getBool("rotate", false)!,
+        alignment: control.getAlignment("alignment", Alignment.center)!,
+      ),
+    );
+  }
+}
@@ -2,6 +2,7 @@ import 'package:flet/flet.dart';
 import 'package:flutter/cupertino.dart';
 
 import 'circle_layer.dart';
+import 'clustered_marker_layer.dart';
 import 'map.dart';
 import 'marker_layer.dart';
 import 'overlay_image_layer.dart';
@@ -25,6 +26,8 @@ class Extension extends FletExtension {
         return TileLayerControl(key: key, control: control);
       case "MarkerLayer":
         return MarkerLayerControl(key: key, control: control);
+      case "ClusteredMarkerLayer":
+        return ClusteredMarkerLayerControl(key: key, control: control);
       case "OverlayImageLayer":
         return OverlayImageLayerControl(key: key, control: control);
       case "CircleLayer":
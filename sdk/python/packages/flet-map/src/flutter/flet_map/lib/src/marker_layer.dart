@@ -16,18 +16,19 @@ class MarkerLayerControl extends StatelessWidget with FletStoreMixin {
     var markers = control
         .children("markers")
         .where((c) => c.type == "Marker")
-        .map((marker) {
+        .expand((marker) {
       marker.notifyParent = true;
-      return AnimatedMarker(
-          point: marker.getLatLng("coordinates")!,
-          rotate: marker.getBool("rotate"),
-          height: marker.getDouble("height", 30.0)!,
-          width: marker.getDouble("width", 30.0)!,
-          alignment: marker.getAlignment("alignment"),
-          builder: (BuildContext context, Animation<double> animation) {
-            return marker.buildWidget("content") ??
-                const ErrorControl("content must be provided and visible");
-          });
+      return marker.getMarkerLatLngs("coordinates").map((point) =>
+          AnimatedMarker(
+              point: point,
+              rotate: marker.getBool("rotate"),
+              height: marker.getDouble("height", 30.0)!,
+              width: marker.getDouble("width", 30.0)!,
+              alignment: marker.getAlignment("alignment"),
+              builder: (BuildContext context, Animation<double> animation) {
+                return marker.buildWidget("content") ??
+                    const ErrorControl("content must be provided and visible");
+              }));
     }).toList();
 
     return BaseControl(
@@ -1,3 +1,5 @@
+import 'dart:typed_data';
+
 import 'package:flet/flet.dart';
 import 'package:flutter/gestures.dart';
 import 'package:flutter/material.dart';
@@ -12,6 +14,29 @@ LatLng? parseLatLng(dynamic value, [LatLng? defaultValue]) {
       parseDouble(value['latitude'], 0)!, parseDouble(value['longitude'], 0)!);
 }
 
+/// Decoded `MapCoordinateArray`s, keyed by their packed bytes.
+final Expando<List<LatLng>> _packedLatLngs = Expando();
+
+/// Parses a list of coordinates: either a list of `MapLatitudeLongitude`
+/// or a `MapCoordinateArray` of packed little-endian latitude/longitude
+/// pairs.
+List<LatLng>? parseLatLngList(dynamic value, [List<LatLng>? defaultValue]) {
+  if (value == null) return defaultValue;
+  if (value is Map) {
+    var bytes = value["data"];
+    if (bytes is! Uint8List) return defaultValue;
+    return _packedLatLngs[bytes] ??= () {
+      var data = ByteData.sublistView(bytes);
+      return List<LatLng>.generate(
+          bytes.lengthInBytes ~/ 16,
+          (i) => LatLng(data.getFloat64(i * 16, Endian.little),
+              data.getFloat64(i * 16 + 8, Endian.little)),
+          growable: false);
+    }();
+  }
+  return (value as List).map((c) => parseLatLng(c)).nonNulls.toList();
+}
+
 LatLngBounds? parseLatLngBounds(dynamic value, [LatLngBounds? defaultValue]) {
   if (value == null ||
       value['corner_1'] == null ||
@@ -220,10 +245,10 @@ extension LatLngExtension on LatLng {
 }
 
 extension LatLngBoundsExtension on LatLngBounds {
-  // TODO
-  // Map<String, dynamic> toMap() => {
-  //
-  //     };
+  Map<String, dynamic> toMap() => {
+        "corner_1": northWest.toMap(),
+        "corner_2": southEast.toMap(),
+      };
 }
 
 extension MapCameraExtension on MapCamera {
@@ -233,6 +258,7 @@ extension MapCameraExtension on MapCamera {
         "min_zoom": minZoom,
         "max_zoom": maxZoom,
         "rotation": rotation,
+        "visible_bounds": visibleBounds.toMap(),
       };
 }
 
@@ -408,11 +434,18 @@ extension MapParsersControlExtension on Control {
 
   List<LatLng> getLatLngList(String propertyName,
       [List<LatLng> defaultValue = const []]) {
-    return get<List>(propertyName)
-            ?.map((c) => parseLatLng(c))
-            .nonNulls
-            .toList() ??
-        defaultValue;
+    return parseLatLngList(get(propertyName), defaultValue)!;
+  }
+
+  /// Returns the coordinates of a marker: a single `MapLatitudeLongitude`
+  /// or all coordinates of a `MapCoordinateArray`.
+  List<LatLng> getMarkerLatLngs(String propertyName) {
+    var value = get(propertyName);
+    if (value is Map && value.containsKey("data")) {
+      return parseLatLngList(value, const [])!;
+    }
+    var point = parseLatLng(value);
+    return point != null ? [point] : const [];
   }
 
   StrokePattern? getStrokePattern(String propertyName,
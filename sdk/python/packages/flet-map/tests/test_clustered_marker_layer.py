@@ -0,0 +1,127 @@
+import array
+import struct
+
+import pytest
+
+import flet_map as fm
+from flet_map.clustered_marker_layer import _ClusterIndex
+
+
+def _camera(zoom, north_west=None, south_east=None):
+    bounds = None
+    if north_west is not None:
+        bounds = fm.MapLatitudeLongitudeBounds(
+            fm.MapLatitudeLongitude(*north_west),
+            fm.MapLatitudeLongitude(*south_east),
+        )
+    return fm.Camera(
+        center=fm.MapLatitudeLongitude(0, 0),
+        zoom=zoom,
+        min_zoom=0,
+        max_zoom=18,
+        rotation=0,
+        visible_bounds=bounds,
+    )
+
+
+def _coordinates(items):
+    return sorted((item[2], item[3]) for item in items)
+
+
+def test_packs_arrays_as_interleaved_little_endian_floats():
+    points = fm.MapCoordinateArray.from_arrays([1.5, -2], [10, 20.25])
+
+    assert len(points) == 2
+    assert points.data == struct.pack("<4d", 1.5, 10, -2, 20.25)
+    assert points.to_arrays() == (
+        array.array("d", [1.5, -2]),
+        array.array("d", [10, 20.25]),
+    )
+
+
+def test_packs_points_and_buffers():
+    points = fm.MapCoordinateArray.from_points([(1, 2), (3, 4)])
+    buffers = fm.MapCoordinateArray.from_arrays(
+        array.array("f", [1, 3]), array.array("i", [2, 4])
+    )
+
+    assert points.data == buffers.data == struct.pack("<4d", 1, 2, 3, 4)
+    assert len(fm.MapCoordinateArray()) == 0
+
+
+def test_packing_rejects_mismatched_coordinates():
+    with pytest.raises(ValueError):
+        fm.MapCoordinateArray.from_arrays([1, 2], [3])
+    with pytest.raises(ValueError):
+        fm.MapCoordinateArray.from_points([(1, 2), (3, 4, 5)])
+
+
+def test_packs_numpy_arrays():
+    np = pytest.importorskip("numpy")
+    latitudes = np.array([1.5, -2], dtype=np.float32)
+    longitudes = np.array([10, 20.25])
+
+    points = fm.MapCoordinateArray.from_arrays(latitudes, longitudes)
+
+    assert points.data == struct.pack("<4d", 1.5, 10, -2, 20.25)
+    assert (
+        fm.MapCoordinateArray.from_points(np.column_stack((latitudes, longitudes)))
+        == points
+    )
+    with pytest.raises(ValueError):
+        fm.MapCoordinateArray.from_points(np.zeros((2, 3)))
+
+
+def test_clusters_nearby_points_at_their_centroid():
+    index = _ClusterIndex(
+        fm.MapCoordinateArray.from_points([(10, 10), (10.2, 10.2), (-40, -60)])
+    )
+
+    singles, clusters = index.query(_camera(2), radius=80, max_cluster_zoom=10)
+
+    assert _coordinates(singles) == [(-40, -60)]
+    [cluster] = clusters
+    assert cluster[2:] == pytest.approx((10.1, 10.1, 2))
+
+
+def test_does_not_cluster_above_max_cluster_zoom():
+    index = _ClusterIndex(fm.MapCoordinateArray.from_points([(10, 10), (10.2, 10.2)]))
+
+    singles, clusters = index.query(_camera(12), radius=80, max_cluster_zoom=10)
+
+    assert _coordinates(singles) == [(10, 10), (10.2, 10.2)]
+    assert clusters == []
+
+
+def test_query_keeps_points_within_visible_bounds():
+    index = _ClusterIndex(
+        fm.MapCoordinateArray.from_points([(0, 0), (0, 40), (50, 0), (-30, -20)])
+    )
+
+    singles, _ = index.query(
+        _camera(12, (10, -30), (-40, 10)), radius=80, max_cluster_zoom=10
+    )
+
+    assert _coordinates(singles) == [(-30, -20), (0, 0)]
+
+
+def test_query_splits_bounds_crossing_the_antimeridian():
+    index = _ClusterIndex(
+        fm.MapCoordinateArray.from_points([(0, 175), (0, -175), (0, 0), (0, 100)])
+    )
+
+    singles, _ = index.query(
+        _camera(12, (10, 170), (-10, -170)), radius=80, max_cluster_zoom=10
+    )
+
+    assert _coordinates(singles) == [(0, -175), (0, 175)]
+
+
+def test_query_margin_wraps_around_the_antimeridian():
+    index = _ClusterIndex(fm.MapCoordinateArray.from_points([(0, 179.9), (0, 0)]))
+
+    singles, _ = index.query(
+        _camera(3, (10, -179.9), (-10, -170)), radius=80, max_cluster_zoom=1
+    )
+
+    assert _coordinates(singles) == [(0, 179.9)]
@@ -22,12 +22,14 @@ from flet.messaging.protocol import (
     ClientMessage,
     ControlEventBody,
     InvokeMethodResponseBody,
+    MessagePacker,
     RegisterClientRequestBody,
     RegisterClientResponseBody,
     UpdateControlPropsBody,
-    configure_encode_object_for_msgpack,
     decode_ext_from_msgpack,
 )
+from flet.messaging.replay_buffer import DEFAULT_REPLAY_BUFFER_AGE, ReplayBuffer
+from flet.messaging.send_queue import SendQueue, SendQueuePolicy, SendQueueStats
 from flet.messaging.session import Session
 from flet.utils import random_string, sha1
 from flet_web.fastapi.flet_app_manager import app_manager
@@ -40,6 +42,10 @@ transport_log = logging.getLogger("flet_transport")
 DEFAULT_FLET_SESSION_TIMEOUT = 3600
 DEFAULT_FLET_OAUTH_STATE_TIMEOUT = 600
 
+# Frames queued since the last send loop wakeup are bundled into WebSocket
+# messages of up to this size; larger frames are sent on their own.
+MAX_BUNDLE_SIZE = 256 * 1024
+
 
 class FletApp(Connection):
     """
@@ -59,6 +65,16 @@ class FletApp(Connection):
             and redirecting to OAuth callback URL.
         upload_endpoint_path: Absolute URL of upload endpoint, e.g. `/upload`.
         secret_key: Secret key to sign upload requests.
+        send_queue_high_water_mark: Maximum number of outbound bytes in flight
+            before `send_queue_policy` applies.
+        send_queue_policy: What to do with outbound frames once the
+            high-water mark is exceeded.
+        replay_buffer_size: Maximum size, in bytes, of outbound messages kept
+            per session to resume it after a reconnect without resending the
+            whole page. Every session holds up to this much memory, so
+            resuming is disabled (`0`) by default.
+        replay_buffer_age_seconds: Maximum age of outbound messages kept
+            for resuming a session.
     """
 
     def __init__(
@@ -71,6 +87,10 @@ class FletApp(Connection):
         oauth_state_timeout_seconds: int = DEFAULT_FLET_OAUTH_STATE_TIMEOUT,
         upload_endpoint_path: Optional[str] = None,
         secret_key: Optional[str] = None,
+        send_queue_high_water_mark: Optional[int] = None,
+        send_queue_policy: Optional[SendQueuePolicy] = None,
+        replay_buffer_size: int = 0,
+        replay_buffer_age_seconds: int = DEFAULT_REPLAY_BUFFER_AGE,
     ):
         super().__init__()
         self.__id = random_string(8)
@@ -84,6 +104,7 @@ class FletApp(Connection):
         self.__session_timeout_seconds = session_timeout_seconds
         self.__oauth_state_timeout_seconds = oauth_state_timeout_seconds
         self.__running_tasks = set()
+        self.__packer = MessagePacker(BaseControl)
 
         env_session_timeout_seconds = os.getenv("FLET_SESSION_TIMEOUT")
         if env_session_timeout_seconds:
@@ -93,8 +114,21 @@ class FletApp(Connection):
         if env_oauth_state_timeout_seconds:
             self.__oauth_state_timeout_seconds = int(env_oauth_state_timeout_seconds)
 
+        self.__replay_buffer_size = replay_buffer_size
+        env_replay_buffer_size = os.getenv("FLET_REPLAY_BUFFER_SIZE")
+        if env_replay_buffer_size:
+            self.__replay_buffer_size = int(env_replay_buffer_size)
+
+        self.__replay_buffer_age_seconds = replay_buffer_age_seconds
+        env_replay_buffer_age_seconds = os.getenv("FLET_REPLAY_BUFFER_AGE")
+        if env_replay_buffer_age_seconds:
+            self.__replay_buffer_age_seconds = int(env_replay_buffer_age_seconds)
+
         self.__upload_endpoint_path = upload_endpoint_path
         self.__secret_key = secret_key
+        self.__send_queue: Optional[SendQueue] = None
+        self.__send_queue_high_water_mark = send_queue_high_water_mark
+        self.__send_queue_policy = send_queue_policy
 
         # DataChannel mux registry keyed by channel_id minted on the Dart
         # side. Populated lazily on the first Control.get_data_channel(id)
@@ -131,7 +165,9 @@ class FletApp(Connection):
             )
 
         await self.__websocket.accept()
-        self.__send_queue = asyncio.Queue()
+        self.__send_queue = SendQueue(
+            self.__send_queue_high_water_mark, self.__send_queue_policy
+        )
         send_loop_task = asyncio.create_task(self.__send_loop())
         await self.__receive_loop()
         await send_loop_task
@@ -195,23 +231,26 @@ class FletApp(Connection):
         """
         Drain outbound message queue and forward packed frames to WebSocket.
 
-        The loop stops when `None` sentinel is received, then clears transport
+        All frames queued since the previous wakeup are taken at once and
+        bundled into as few WebSocket messages as possible (see
+        `bundle_packets()`).
+
+        The loop stops when the queue is closed, then clears transport
         references.
         """
 
         assert self.__websocket
         assert self.__send_queue
+        send_queue = self.__send_queue
         while True:
-            message = await self.__send_queue.get()
-            if message is None:
+            frames = await send_queue.get_batch()
+            if frames is None:
                 break
 
-            try:
-                await self.__websocket.send_bytes(message)
-            except Exception:
-                # re-enqueue the message to repeat it when re-connected
-                # self.__send_queue.put_nowait(message)
-                raise
+            packets = bundle_packets(frames)
+            for packet in packets:
+                await self.__websocket.send_bytes(packet)
+            send_queue.sent(len(frames), sum(map(len, frames)), len(packets))
         self.__websocket = None
         self.__send_queue = None
 
@@ -235,9 +274,11 @@ class FletApp(Connection):
                 if not data:
                     continue
                 ptype = data[0]
+                # Slices of a memoryview don't copy the frame.
+                view = memoryview(data)
                 if ptype == 0x00:
                     await self.__on_message(
-                        msgpack.unpackb(data[1:], ext_hook=decode_ext_from_msgpack)
+                        msgpack.unpackb(view[1:], ext_hook=decode_ext_from_msgpack)
                     )
                 elif ptype == 0x01:
                     if len(data) < 5:
@@ -246,7 +287,7 @@ class FletApp(Connection):
                     channel_id = int.from_bytes(data[1:5], "little", signed=False)
                     channel = self._data_channels.get(channel_id)
                     if channel is not None:
-                        channel._deliver(data[5:])
+                        channel._deliver(view[5:])
                 else:
                     logger.debug("Dropping packet with unknown type 0x%02x", ptype)
         except Exception as e:
@@ -254,7 +295,7 @@ class FletApp(Connection):
                 logger.warning(f"Receive loop error: {e}", exc_info=True)
             if self.__session:
                 # terminate __send_loop
-                await self.__send_queue.put(None)
+                self.__send_queue.close()
 
     async def __on_message(self, data: Any):
         """
@@ -274,6 +315,7 @@ class FletApp(Connection):
         task = None
         if action == ClientAction.REGISTER_CLIENT:
             req = RegisterClientRequestBody(**body)
+            self.configure_protocol(req.features)
 
             new_session = False
 
@@ -300,7 +342,14 @@ class FletApp(Connection):
                 new_session = True
 
                 # create new session
-                self.__session = Session(self)
+                self.__session = Session(
+                    self,
+                    replay_buffer=ReplayBuffer(
+                        self.__replay_buffer_size, self.__replay_buffer_age_seconds
+                    )
+                    if self.__replay_buffer_size > 0
+                    else None,
+                )
 
                 # register session
                 await app_manager.add_session(
@@ -333,16 +382,27 @@ class FletApp(Connection):
                         "Unhandled error in before_main() handler", exc_info=True
                     )
 
+            # a reconnecting client that still holds the page state is sent
+            # only the messages it has missed, replayed by reconnect_session()
+            resume = not new_session and self.__session.can_resume(
+                req.last_seq, self.intern_keys
+            )
+            if new_session:
+                page_patch = self.__session.get_page_patch()
+            elif resume:
+                page_patch = None
+            else:
+                page_patch = self.__session.page
+
             # register response
             self.send_message(
                 ClientMessage(
                     ClientAction.REGISTER_CLIENT,
                     RegisterClientResponseBody(
                         session_id=self.__session.id,
-                        page_patch=self.__session.get_page_patch()
-                        if new_session
-                        else self.__session.page,
+                        page_patch=page_patch,
                         error=register_error,
+                        last_seq=req.last_seq if resume else self.__session.last_seq,
                     ),
                 )
             )
@@ -356,7 +416,9 @@ class FletApp(Connection):
                 asyncio.create_task(self.__on_session_created())
             else:
                 await app_manager.reconnect_session(
-                    self.__get_unique_session_id(self.__session.id), self
+                    self.__get_unique_session_id(self.__session.id),
+                    self,
+                    last_seq=req.last_seq if resume else None,
                 )
 
                 if (
@@ -416,19 +478,43 @@ class FletApp(Connection):
         """
 
         transport_log.debug(f"send_message: {message}")
-        body = msgpack.packb(
-            [message.action, message.body],
-            default=configure_encode_object_for_msgpack(BaseControl),
+        self.send_encoded_message(
+            self.__packer.pack(
+                [message.action, message.body], intern_keys=self.intern_keys
+            )
         )
-        self.__send_queue.put_nowait(b"\x00" + body)
 
-    def send_data_channel_frame(self, channel_id: int, payload: bytes) -> None:
+    def send_encoded_message(self, data: bytes):
+        """
+        Enqueue an outbound MsgPack-encoded message as `[0x00][data]`, or, with
+        frame compression enabled, as `[0x03][deflated 0x00 packet]` if large
+        enough.
+
+        Args:
+            data: MsgPack-encoded message.
+        """
+        packet = b"\x00" + data
+        if self.frame_compressor is not None:
+            packet = self.frame_compressor.compress(packet)
+        self.__send_queue.put(packet)
+
+    def send_data_channel_frame(
+        self, channel_id: int, payload: bytes, droppable: bool = False
+    ) -> None:
         """Send a raw DataChannel frame `[0x01][channel_id:u32 LE][bytes]`
         over the WebSocket. Called by `_ProtocolMuxedDataChannel.send`."""
         if self.__send_queue is None:
             return  # client disconnected — the frame is moot
         header = b"\x01" + channel_id.to_bytes(4, "little", signed=False)
-        self.__send_queue.put_nowait(header + payload)
+        self.__send_queue.put(header + payload, channel_id, droppable)
+
+    @property
+    def send_queue_stats(self) -> Optional[SendQueueStats]:
+        return self.__send_queue.stats if self.__send_queue is not None else None
+
+    async def drain(self):
+        if self.__send_queue is not None:
+            await self.__send_queue.drain()
 
     def data_channel_for(self, channel_id: int):
         """Resolve or construct the muxed DataChannel for `channel_id`."""
@@ -511,3 +597,48 @@ class FletApp(Connection):
 
         logger.info(f"Disposing FletApp: {self.__id}")
         self.__session = None
+
+
+def bundle_packets(frames: list[bytes]) -> list[bytes]:
+    """
+    Packs consecutive frames into bundle packets to send them in one WebSocket
+    message.
+
+    Bundle wire format: `[0x02]([length:u32 LE][packet])*`, where each packet is
+    a regular `[type:u8][payload]` frame. A single frame, or a frame larger
+    than `MAX_BUNDLE_SIZE`, is sent as is.
+
+    Args:
+        frames: Outbound packets in send order.
+
+    Returns:
+        Packets to send, one per WebSocket message.
+    """
+    if len(frames) == 1:
+        return frames
+    packets: list[bytes] = []
+    bundle: list[bytes] = []
+    bundle_size = 1
+
+    def flush():
+        if len(bundle) == 1:
+            packets.append(bundle[0])
+        elif bundle:
+            parts = [b"\x02"]
+            for frame in bundle:
+                parts.append(len(frame).to_bytes(4, "little", signed=False))
+                parts.append(frame)
+            packets.append(b"".join(parts))
+        bundle.clear()
+
+    for frame in frames:
+        if bundle_size + 4 + len(frame) > MAX_BUNDLE_SIZE:
+            flush()
+            bundle_size = 1
+        if len(frame) + 5 > MAX_BUNDLE_SIZE:
+            packets.append(frame)
+            continue
+        bundle.append(frame)
+        bundle_size += 4 + len(frame)
+    flush()
+    return packets
@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import os
 import shutil
 import traceback
 from concurrent.futures import ThreadPoolExecutor
@@ -9,6 +10,7 @@ from typing import Optional
 import flet_web.fastapi as flet_fastapi
 from flet.messaging.connection import Connection
 from flet.messaging.session import Session
+from flet.pubsub.local_broker import LocalBrokerBackend
 from flet.pubsub.pubsub_hub import PubSubHub
 from flet_web.fastapi.oauth_state import OAuthState
 
@@ -43,6 +45,13 @@ class FletAppManager:
         """
         Get or create pub/sub hub associated with a session handler.
 
+        When `FLET_PUBSUB_BROKER` environment variable is set to the path of a
+        Unix domain socket, the hub exchanges messages with the hubs of the
+        same session handler in other processes, e.g. other Uvicorn workers,
+        through a :class:`~flet.pubsub.local_broker.LocalBroker` listening on
+        that socket. The broker is started by the first worker if it is not
+        run as a sidecar.
+
         Args:
             session_handler: Session entry handler used as cache key.
             loop: Event loop for new hub creation.
@@ -53,9 +62,17 @@ class FletAppManager:
 
         psh = self.__pubsubhubs.get(session_handler, None)
         if psh is None:
+            broker_path = os.getenv("FLET_PUBSUB_BROKER")
             psh = PubSubHub(
                 loop=loop or asyncio.get_running_loop(),
                 executor=self.__executor,
+                backend=LocalBrokerBackend(
+                    broker_path,
+                    channel=f"{getattr(session_handler, '__module__', '')}."
+                    f"{getattr(session_handler, '__qualname__', '')}",
+                )
+                if broker_path
+                else None,
             )
             self.__pubsubhubs[session_handler] = psh
         return psh
@@ -80,6 +97,8 @@ class FletAppManager:
         """
         logger.info("Shutting down Flet App Manager")
         self.delete_temp_dirs()
+        for psh in self.__pubsubhubs.values():
+            psh.close()
         if self.__evict_sessions_task:
             self.__evict_sessions_task.cancel()
         if self.__evict_oauth_states_task:
@@ -110,13 +129,21 @@ class FletAppManager:
         self.__sessions[session_id] = session
         logger.info(f"New session created ({len(self.__sessions)} total): {session_id}")
 
-    async def reconnect_session(self, session_id: str, conn: Connection):
+    async def reconnect_session(
+        self, session_id: str, conn: Connection, last_seq: Optional[int] = None
+    ):
         """
         Reconnect transport to an existing session.
 
+        When the client reports the sequence number of the last message it has
+        applied (`last_seq`), only the messages it has missed are replayed from
+        the session's replay buffer, provided the buffer still holds all of
+        them (see `Session.can_resume()`).
+
         Args:
             session_id: Unique session key.
             conn: New active transport connection.
+            last_seq: Sequence number of the last message applied by the client.
 
         Raises:
             RuntimeError: If session is expired or not found.
@@ -125,7 +152,7 @@ class FletAppManager:
         logger.info(f"Session reconnected: {session_id}")
         if session_id in self.__sessions:
             session = self.__sessions[session_id]
-            session.attach_connection(conn)
+            session.attach_connection(conn, last_seq)
 
             # Run connect event handlers asynchronously so websocket receive loop
             # isn't blocked by user handlers (e.g., on_connect invoking _invoke_method).
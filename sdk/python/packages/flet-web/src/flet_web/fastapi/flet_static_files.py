@@ -2,11 +2,16 @@ import logging
 import mimetypes
 import os
 import shutil
+import stat
 import tempfile
+from email.utils import formatdate
 from pathlib import Path
 from typing import Optional
 
 from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse
 from starlette.types import Receive, Scope, Send
 
 import flet_web.fastapi as flet_fastapi
@@ -19,6 +24,7 @@ from flet_web import (
     patch_manifest_json,
 )
 from flet_web.fastapi.flet_app_manager import app_manager
+from flet_web.fastapi.static_assets import StaticAssetCache
 
 logger = logging.getLogger(flet_fastapi.__name__)
 
@@ -27,11 +33,23 @@ logger = logging.getLogger(flet_fastapi.__name__)
 mimetypes.add_type("text/javascript", ".mjs")
 mimetypes.add_type("application/wasm", ".wasm")
 
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
 
 class FletStaticFiles(StaticFiles):
     """
     Serve Flet app static files.
 
+    Responses carry a strong ETag of the file content, so that browsers and
+    CDNs revalidate files with a `304 Not Modified` response, and files with
+    a content hash in their name, e.g. `app.3f2a9c1d.js`, are cached as
+    immutable. Compressible files are sent Brotli- or gzip-compressed, as
+    accepted by the client, from `.br`/`.gz` variants created at build time or
+    on first request, see
+    :class:`~flet_web.fastapi.static_assets.StaticAssetCache`. Small files are
+    served from memory.
+
     Args:
         assets_dir: An absolute path to app's assets directory.
         app_name: PWA application name.
@@ -43,6 +61,8 @@ class FletStaticFiles(StaticFiles):
         websocket_endpoint_path: Path of Flet app WebSocket handler. A path
             without a leading `/` is resolved against the app mount path.
             Defaults to `ws`.
+        asset_cache: Cache of file hashes, compressed variants and contents.
+            Defaults to a cache shared by all `FletStaticFiles` instances.
     """
 
     def __init__(
@@ -56,6 +76,7 @@ class FletStaticFiles(StaticFiles):
         route_url_strategy: RouteUrlStrategy = RouteUrlStrategy.PATH,
         no_cdn: bool = False,
         websocket_endpoint_path: Optional[str] = None,
+        asset_cache: Optional[StaticAssetCache] = None,
     ) -> None:
         self.index = ["index.html"]
         self.manifest_json = ["manifest.json"]
@@ -70,6 +91,7 @@ class FletStaticFiles(StaticFiles):
         self.__no_cdn = no_cdn
         self.__websocket_endpoint_path = websocket_endpoint_path
         self.__once = Once()
+        self.__asset_cache = asset_cache or _default_asset_cache()
 
         env_web_renderer = os.getenv("FLET_WEB_RENDERER")
         if env_web_renderer:
@@ -109,16 +131,77 @@ class FletStaticFiles(StaticFiles):
         logger.debug(f"StaticFiles.lookup_path: {self.__app_mount_path} {path}")
         full_path, stat_result = super().lookup_path(path)
 
-        if stat_result is not None:
-            return full_path, stat_result
-
-        # Not found: SPA fallback only for route-like paths.
-        ext = os.path.splitext(path)[1].lower()
-        if ext == "" or ext == ".html":
-            return super().lookup_path(self.index[0])
+        if stat_result is None:
+            # Not found: SPA fallback only for route-like paths.
+            ext = os.path.splitext(path)[1].lower()
+            if ext == "" or ext == ".html":
+                full_path, stat_result = super().lookup_path(self.index[0])
 
+        if stat_result is not None and stat.S_ISREG(stat_result.st_mode):
+            # Called in a worker thread: hash and read the file here, so that
+            # file_response(), called on the event loop, doesn't block it.
+            self.__asset_cache.load(full_path, stat_result)
         return full_path, stat_result
 
+    def file_response(
+        self,
+        full_path: "os.PathLike[str] | str",
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        """
+        Build the response of a static file, in the best content coding
+        accepted by the client, with a content-hash ETag.
+
+        Args:
+            full_path: Resolved path of the requested file.
+            stat_result: Stat of the requested file.
+            scope: ASGI request scope.
+            status_code: Response status code.
+
+        Returns:
+            The file response, or `304 Not Modified` if the client has the
+                file already.
+        """
+        full_path = os.fspath(full_path)
+        request_headers = Headers(scope=scope)
+        asset = self.__asset_cache.get(full_path, stat_result)
+        encoding, path, path_stat = self.__asset_cache.negotiate(
+            asset, stat_result, request_headers.get("accept-encoding", "")
+        )
+
+        headers = {
+            "etag": asset.etag(encoding),
+            "cache-control": IMMUTABLE_CACHE_CONTROL
+            if asset.fingerprinted
+            else REVALIDATE_CACHE_CONTROL,
+        }
+        if asset.compressible:
+            headers["vary"] = "Accept-Encoding"
+        if encoding:
+            headers["content-encoding"] = encoding
+        media_type = mimetypes.guess_type(full_path)[0] or "text/plain"
+
+        content = self.__asset_cache.cached(path, path_stat)
+        if content is not None:
+            headers["last-modified"] = formatdate(stat_result.st_mtime, usegmt=True)
+            response = Response(
+                content, status_code=status_code, headers=headers, media_type=media_type
+            )
+        else:
+            response = FileResponse(
+                path,
+                status_code=status_code,
+                headers=headers,
+                media_type=media_type,
+                stat_result=path_stat,
+            )
+
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
     async def __config(self, root_path: str):
         """
         Prepare a patched temporary web root and initialize static file serving.
@@ -232,3 +315,13 @@ class FletStaticFiles(StaticFiles):
             self.all_directories.append(self.__assets_dir)
 
         self.all_directories.append(web_dir)
+
+
+_asset_cache: Optional[StaticAssetCache] = None
+
+
+def _default_asset_cache() -> StaticAssetCache:
+    global _asset_cache
+    if _asset_cache is None:
+        _asset_cache = StaticAssetCache()
+    return _asset_cache
@@ -0,0 +1,464 @@
+"""
+Content hashes, compressed variants and an in-memory cache of static files.
+
+Compressed variants can be created at build time, as `.br` and `.gz` siblings
+of the files of a directory, with:
+
+```
+python -m flet_web.fastapi.static_assets build/web
+```
+"""
+
+import argparse
+import functools
+import gzip
+import hashlib
+import logging
+import os
+import re
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+
+logger = logging.getLogger("flet_web.fastapi")
+
+__all__ = ["StaticAsset", "StaticAssetCache", "precompress_directory"]
+
+COMPRESSIBLE_EXTENSIONS = frozenset(
+    {
+        ".css",
+        ".html",
+        ".ico",
+        ".js",
+        ".json",
+        ".map",
+        ".mjs",
+        ".otf",
+        ".svg",
+        ".txt",
+        ".ttf",
+        ".wasm",
+        ".xml",
+    }
+)
+"""
+Extensions of the files served compressed.
+"""
+
+MIN_COMPRESS_SIZE = 1024
+"""
+Size in bytes under which files are not compressed.
+"""
+
+FINGERPRINT_PATTERN = re.compile(r"[.-](?=[0-9]*[a-f])[0-9a-f]{8,}\.[^./]+$")
+"""
+Matches file names with a content hash, e.g. `app.3f2a9c1d.js`, which are
+served as immutable.
+
+A hash must contain a letter, so that dates and version numbers, e.g.
+`data-20241231.json`, are not taken for one.
+"""
+
+# encoding -> file extension, in order of preference
+_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass(slots=True)
+class StaticAsset:
+    """
+    A static file, identified by its path, size and modification time.
+    """
+
+    path: str
+    """Absolute path of the file."""
+
+    size: int
+    """Size of the file in bytes."""
+
+    mtime_ns: int
+    """Modification time of the file, in nanoseconds."""
+
+    content_hash: str
+    """Hash of the file content."""
+
+    @property
+    def compressible(self) -> bool:
+        """Whether the file is served compressed, if a variant is available."""
+        return (
+            self.size >= MIN_COMPRESS_SIZE
+            and os.path.splitext(self.path)[1].lower() in COMPRESSIBLE_EXTENSIONS
+        )
+
+    @property
+    def fingerprinted(self) -> bool:
+        """Whether the file name contains a content hash."""
+        return FINGERPRINT_PATTERN.search(os.path.basename(self.path)) is not None
+
+    def etag(self, encoding: Optional[str] = None) -> str:
+        """
+        Returns the strong ETag of the file content in `encoding`.
+        """
+        if encoding:
+            return f'"{self.content_hash}-{encoding}"'
+        return f'"{self.content_hash}"'
+
+
+class StaticAssetCache:
+    """
+    Content hashes, compressed variants and in-memory contents of static
+    files, shared by the requests of a process.
+
+    Compressed variants are looked up, in order:
+
+    - next to the file, as `<file>.br` and `<file>.gz`, e.g. created at
+      build time with :func:`precompress_directory`;
+    - in `cache_dir`, by content hash, created in the background on first
+      request. As the cache directory is content-addressed, it can be shared
+      by the processes of a server and kept across restarts. It is only used
+      if owned by the user running the server.
+
+    Brotli variants are only created if `brotli` package is installed.
+
+    Args:
+        cache_dir: Directory of the compressed variants created on first
+            request. Defaults to `FLET_WEB_CACHE_DIR` environment variable or
+            `flet-web-cache-<uid>` in the system temporary directory.
+        memory_cache_size: Maximum total size in bytes of the file contents
+            kept in memory.
+        memory_file_size: Maximum size in bytes of a file kept in memory.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        memory_cache_size: int = 32 * 1024 * 1024,
+        memory_file_size: int = 256 * 1024,
+    ):
+        if cache_dir is None:
+            cache_dir = os.getenv("FLET_WEB_CACHE_DIR") or os.path.join(
+                tempfile.gettempdir(),
+                f"flet-web-cache-{os.getuid()}"
+                if hasattr(os, "getuid")
+                else "flet-web-cache",
+            )
+        self.cache_dir = cache_dir
+        self.memory_cache_size = memory_cache_size
+        self.memory_file_size = memory_file_size
+        self.__assets: dict[str, StaticAsset] = {}
+        # key: (path, mtime_ns, size), value: file content
+        self.__memory: OrderedDict[tuple[str, int, int], bytes] = OrderedDict()
+        self.__memory_size = 0
+        self.__lock = threading.Lock()
+        self.__pending: set[str] = set()
+        self.__executor: Optional[ThreadPoolExecutor] = None
+        self.__cache_dir_checked: Optional[bool] = None
+
+    def get(self, path: str, stat_result: os.stat_result) -> StaticAsset:
+        """
+        Returns the asset of the file at `path`, hashing its content on first
+        request or when the file has changed.
+
+        Reads the file if it is hashed: see :meth:`load` to hash files off the
+        event loop.
+        """
+        asset = self.__assets.get(path)
+        if (
+            asset is None
+            or asset.size != stat_result.st_size
+            or asset.mtime_ns != stat_result.st_mtime_ns
+        ):
+            asset = StaticAsset(
+                path=path,
+                size=stat_result.st_size,
+                mtime_ns=stat_result.st_mtime_ns,
+                content_hash=_hash_file(path),
+            )
+            self.__assets[path] = asset
+        return asset
+
+    def negotiate(
+        self, asset: StaticAsset, stat_result: os.stat_result, accept_encoding: str
+    ) -> tuple[Optional[str], str, os.stat_result]:
+        """
+        Selects the representation of `asset` to send for an `Accept-Encoding`
+        request header.
+
+        Compressed variants missing from the cache directory are created in
+        the background, and the file itself is sent meanwhile.
+
+        Args:
+            asset: The requested file.
+            stat_result: Stat of the requested file.
+            accept_encoding: Value of the `Accept-Encoding` request header.
+
+        Returns:
+            A tuple of the content coding, or `None` for the file itself, and
+                the path and stat of the file to send.
+        """
+        selected = None
+        if asset.compressible:
+            accepted = _accepted_encodings(accept_encoding)
+            missing = False
+            for encoding, ext in _ENCODINGS:
+                if encoding not in accepted:
+                    continue
+                variant = self.__find_variant(asset, ext)
+                if variant is None:
+                    missing = missing or encoding == "gzip" or _brotli() is not None
+                elif selected is None:
+                    selected = (encoding, *variant)
+            if missing:
+                self.__schedule_compression(asset)
+        return selected or (None, asset.path, stat_result)
+
+    def load(self, path: str, stat_result: os.stat_result) -> StaticAsset:
+        """
+        Returns the asset of the file at `path`, after hashing it if needed and
+        loading it and its compressed variants in memory if they are small.
+
+        Meant to be called from a worker thread before serving the file, so
+        that :meth:`get` and :meth:`cached` don't block the event loop.
+        """
+        asset = self.get(path, stat_result)
+        self.read(path, stat_result)
+        if asset.compressible:
+            for _, ext in _ENCODINGS:
+                variant = self.__find_variant(asset, ext)
+                if variant is not None:
+                    self.read(*variant)
+        return asset
+
+    def cached(self, path: str, stat_result: os.stat_result) -> Optional[bytes]:
+        """
+        Returns the content of a file if it is in memory, without reading it.
+        """
+        key = (path, stat_result.st_mtime_ns, stat_result.st_size)
+        with self.__lock:
+            content = self.__memory.get(key)
+            if content is not None:
+                self.__memory.move_to_end(key)
+            return content
+
+    def read(self, path: str, stat_result: os.stat_result) -> Optional[bytes]:
+        """
+        Returns the content of a small file, from memory if possible, or
+        `None` if the file is too large to be kept in memory.
+        """
+        size = stat_result.st_size
+        if size > self.memory_file_size:
+            return None
+        content = self.cached(path, stat_result)
+        if content is not None:
+            return content
+        key = (path, stat_result.st_mtime_ns, size)
+        with open(path, "rb") as f:
+            content = f.read()
+        with self.__lock:
+            if key not in self.__memory:
+                self.__memory[key] = content
+                self.__memory_size += len(content)
+                while self.__memory_size > self.memory_cache_size:
+                    _, evicted = self.__memory.popitem(last=False)
+                    self.__memory_size -= len(evicted)
+        return content
+
+    def close(self):
+        """
+        Stops creating compressed variants.
+        """
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=False, cancel_futures=True)
+            self.__executor = None
+
+    def __find_variant(
+        self, asset: StaticAsset, ext: str
+    ) -> Optional[tuple[str, os.stat_result]]:
+        try:
+            stat_result = os.stat(asset.path + ext)
+            if stat_result.st_mtime_ns >= asset.mtime_ns:
+                return asset.path + ext, stat_result
+        except OSError:
+            pass
+        if self.__cache_dir_usable():
+            path = os.path.join(self.cache_dir, asset.content_hash + ext)
+            try:
+                return path, os.stat(path)
+            except OSError:
+                pass
+        return None
+
+    def __cache_dir_usable(self) -> bool:
+        """
+        Creates the cache directory if needed, and returns whether it is
+        owned by the current user, so that its files can be trusted.
+        """
+        if self.__cache_dir_checked is None:
+            try:
+                os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+                usable = not hasattr(os, "getuid") or (
+                    os.stat(self.cache_dir).st_uid == os.getuid()
+                )
+            except OSError:
+                usable = False
+            if not usable:
+                logger.warning(
+                    "Static files cache directory %s is not usable, static files "
+                    "are served uncompressed unless precompressed",
+                    self.cache_dir,
+                )
+            self.__cache_dir_checked = usable
+        return self.__cache_dir_checked
+
+    def __schedule_compression(self, asset: StaticAsset):
+        if not self.__cache_dir_usable():
+            return
+        with self.__lock:
+            if asset.content_hash in self.__pending:
+                return
+            self.__pending.add(asset.content_hash)
+            if self.__executor is None:
+                # One thread, so that compressing large files on first request
+                # does not compete with app sessions for the CPU.
+                self.__executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="flet_web_compress"
+                )
+            self.__executor.submit(self.__compress, asset)
+
+    def __compress(self, asset: StaticAsset):
+        try:
+            with open(asset.path, "rb") as f:
+                content = f.read()
+            for encoding, ext in _ENCODINGS:
+                target = os.path.join(self.cache_dir, asset.content_hash + ext)
+                if os.path.exists(target):
+                    continue
+                compressed = _compress(content, encoding)
+                if compressed is not None:
+                    _write_atomic(target, compressed)
+                    logger.debug(
+                        "Compressed %s with %s: %d -> %d bytes",
+                        asset.path,
+                        encoding,
+                        len(content),
+                        len(compressed),
+                    )
+        except Exception:
+            logger.exception("Unable to compress static file %s", asset.path)
+        finally:
+            with self.__lock:
+                self.__pending.discard(asset.content_hash)
+
+
+def precompress_directory(directory: str) -> int:
+    """
+    Creates `.br` and `.gz` siblings of the compressible files of a
+    directory and its subdirectories, for :class:`StaticAssetCache` to serve.
+
+    Siblings newer than their file are kept. Brotli variants are only created
+    if `brotli` package is installed.
+
+    Args:
+        directory: The directory to precompress, e.g. a `flet build web`
+            output directory.
+
+    Returns:
+        Number of variants created.
+    """
+    created = 0
+    for root, _, files in os.walk(directory):
+        for name in files:
+            path = os.path.join(root, name)
+            stat_result = os.stat(path)
+            if (
+                stat_result.st_size < MIN_COMPRESS_SIZE
+                or os.path.splitext(name)[1].lower() not in COMPRESSIBLE_EXTENSIONS
+            ):
+                continue
+            content = None
+            for encoding, ext in _ENCODINGS:
+                target = path + ext
+                if (
+                    os.path.exists(target)
+                    and os.stat(target).st_mtime_ns >= stat_result.st_mtime_ns
+                ):
+                    continue
+                if content is None:
+                    with open(path, "rb") as f:
+                        content = f.read()
+                compressed = _compress(content, encoding)
+                if compressed is not None:
+                    _write_atomic(target, compressed)
+                    created += 1
+    return created
+
+
+def _hash_file(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            h.update(chunk)
+    return h.hexdigest()[:32]
+
+
+def _accepted_encodings(accept_encoding: str) -> set[str]:
+    accepted = set()
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                if float(q[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        if coding == "*":
+            accepted.update(encoding for encoding, _ in _ENCODINGS)
+        elif coding:
+            accepted.add(coding)
+    return accepted
+
+
+@functools.cache
+def _brotli():
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def _compress(content: bytes, encoding: str) -> Optional[bytes]:
+    if encoding == "gzip":
+        return gzip.compress(content, compresslevel=9, mtime=0)
+    brotli = _brotli()
+    return brotli.compress(content, quality=11) if brotli is not None else None
+
+
+def _write_atomic(path: str, content: bytes):
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Create .br and .gz variants of Flet web app static files"
+    )
+    parser.add_argument("directory", help="directory of the static files")
+    args = parser.parse_args()
+    created = precompress_directory(args.directory)
+    print(f"{created} compressed variants created in {args.directory}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+import gzip
+import os
+
+import pytest
+
+pytest.importorskip("starlette")
+
+from flet_web.fastapi.flet_static_files import (  # noqa: E402
+    IMMUTABLE_CACHE_CONTROL,
+    REVALIDATE_CACHE_CONTROL,
+    FletStaticFiles,
+)
+from flet_web.fastapi.static_assets import (  # noqa: E402
+    FINGERPRINT_PATTERN,
+    StaticAssetCache,
+)
+
+CONTENT = b"console.log('flet');\n" * 100
+
+
+@pytest.fixture
+def asset_cache(tmp_path):
+    return StaticAssetCache(cache_dir=str(tmp_path / "cache"))
+
+
+@pytest.fixture
+def static_files(tmp_path, monkeypatch, asset_cache):
+    web_dir = tmp_path / "web"
+    web_dir.mkdir()
+    (web_dir / "index.html").write_bytes(b"<html><head></head></html>")
+    (web_dir / "manifest.json").write_bytes(b"{}")
+    (web_dir / "app.js").write_bytes(CONTENT)
+    (web_dir / "app.js.gz").write_bytes(gzip.compress(CONTENT, mtime=0))
+    (web_dir / "main.3f2a9c1d.js").write_bytes(CONTENT)
+    monkeypatch.setenv("FLET_WEB_PATH", str(web_dir))
+    return FletStaticFiles(asset_cache=asset_cache)
+
+
+async def _get(files, path, **headers):
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": f"/{path}",
+        "root_path": "",
+        "headers": [
+            (name.replace("_", "-").encode(), value.encode())
+            for name, value in headers.items()
+        ],
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        messages.append(message)
+
+    await files(scope, receive, send)
+    start, *body = messages
+    return (
+        start["status"],
+        {name.decode(): value.decode() for name, value in start["headers"]},
+        b"".join(message.get("body", b"") for message in body),
+    )
+
+
+@pytest.mark.parametrize(
+    ("name", "fingerprinted"),
+    [
+        ("app.3f2a9c1d.js", True),
+        ("main-0a1b2c3d4e5f.css", True),
+        ("data-20241231.json", False),
+        ("build.12345678.js", False),
+        ("main.dart.js", False),
+        ("app.js", False),
+    ],
+)
+def test_fingerprint_pattern(name, fingerprinted):
+    assert (FINGERPRINT_PATTERN.search(name) is not None) == fingerprinted
+
+
+@pytest.mark.asyncio
+async def test_sends_accepted_encoding(static_files):
+    status, headers, body = await _get(
+        static_files, "app.js", accept_encoding="br;q=1, gzip"
+    )
+
+    assert status == 200
+    assert headers["content-encoding"] == "gzip"
+    assert headers["vary"] == "Accept-Encoding"
+    assert headers["etag"].endswith('-gzip"')
+    assert gzip.decompress(body) == CONTENT
+
+
+@pytest.mark.asyncio
+async def test_sends_file_itself_if_no_encoding_accepted(static_files):
+    for accept_encoding in ("", "identity", "gzip;q=0"):
+        _, headers, body = await _get(
+            static_files, "app.js", accept_encoding=accept_encoding
+        )
+
+        assert "content-encoding" not in headers
+        assert headers["vary"] == "Accept-Encoding"
+        assert body == CONTENT
+
+
+@pytest.mark.asyncio
+async def test_etag_differs_by_encoding(static_files):
+    _, plain, _ = await _get(static_files, "app.js")
+    _, compressed, _ = await _get(static_files, "app.js", accept_encoding="gzip")
+
+    assert plain["etag"] != compressed["etag"]
+    assert plain["cache-control"] == REVALIDATE_CACHE_CONTROL
+
+
+@pytest.mark.asyncio
+async def test_matching_etag_is_not_modified(static_files):
+    _, headers, _ = await _get(static_files, "app.js", accept_encoding="gzip")
+    etag = headers["etag"]
+
+    status, headers, body = await _get(
+        static_files, "app.js", accept_encoding="gzip", if_none_match=etag
+    )
+    assert (status, body) == (304, b"")
+    assert headers["etag"] == etag
+
+    status, _, _ = await _get(static_files, "app.js", if_none_match=etag)
+    assert status == 200
+
+
+@pytest.mark.asyncio
+async def test_fingerprinted_files_are_immutable(static_files):
+    _, headers, _ = await _get(static_files, "main.3f2a9c1d.js")
+
+    assert headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+
+
+@pytest.mark.asyncio
+async def test_files_are_loaded_when_looked_up(static_files, asset_cache):
+    await _get(static_files, "index.html")
+    full_path, stat_result = static_files.lookup_path("app.js")
+
+    assert asset_cache.cached(full_path, stat_result) == CONTENT
+    gz_path = full_path + ".gz"
+    assert asset_cache.cached(gz_path, os.stat(gz_path)) is not None
@@ -41,12 +41,14 @@ if TYPE_CHECKING:
     from flet.components.router import (
         LocationInfo,
         Route,
+        RouteLoaderCache,
         Router,
         is_route_active,
         use_route_loader_data,
         use_route_location,
         use_route_outlet,
         use_route_params,
+        use_route_prefetch,
         use_view_path,
     )
     from flet.controls import (
@@ -183,7 +185,16 @@ if TYPE_CHECKING:
     from flet.controls.core.page_view import PageView
     from flet.controls.core.pagelet import Pagelet
     from flet.controls.core.placeholder import Placeholder
-    from flet.controls.core.raw_image import RawImage
+    from flet.controls.core.raw_image import (
+        JpegCodec,
+        PngCodec,
+        RawImage,
+        RawImageCodec,
+        RawImageEncoderPool,
+        RawImageStats,
+        WebPCodec,
+        ZlibCodec,
+    )
     from flet.controls.core.reorderable_drag_handle import ReorderableDragHandle
     from flet.controls.core.responsive_row import ResponsiveRow
     from flet.controls.core.rotated_box import RotatedBox
@@ -327,6 +338,7 @@ if TYPE_CHECKING:
     )
     from flet.controls.icon_data import IconData
     from flet.controls.id_counter import IdCounter
+    from flet.controls.item_builder_control import ItemBuilderControl, ItemsRequestEvent
     from flet.controls.keys import (
         Key,
         KeyValue,
@@ -724,8 +736,9 @@ if TYPE_CHECKING:
         DataChannel,
         DataChannelOpenEvent,
     )
+    from flet.pubsub.pubsub_backend import PubSubBackend
     from flet.pubsub.pubsub_client import PubSubClient
-    from flet.pubsub.pubsub_hub import PubSubHub
+    from flet.pubsub.pubsub_hub import PubSubHub, PubSubSessionStats
 
 
 __all__ = [
@@ -962,6 +975,9 @@ __all__ = [
     "InteractiveViewer",
     "IosDeviceInfo",
     "IosUtsname",
+    "ItemBuilderControl",
+    "ItemsRequestEvent",
+    "JpegCodec",
     "Key",
     "KeyDownEvent",
     "KeyRepeatEvent",
@@ -1054,6 +1070,7 @@ __all__ = [
     "PaintingStyle",
     "Placeholder",
     "PlatformBrightnessChangeEvent",
+    "PngCodec",
     "PointerDeviceType",
     "PointerEvent",
     "PopupMenuButton",
@@ -1063,8 +1080,10 @@ __all__ = [
     "ProgressBar",
     "ProgressIndicatorTheme",
     "ProgressRing",
+    "PubSubBackend",
     "PubSubClient",
     "PubSubHub",
+    "PubSubSessionStats",
     "QueryString",
     "RadialGradient",
     "Radio",
@@ -1072,6 +1091,9 @@ __all__ = [
     "RadioTheme",
     "RangeSlider",
     "RawImage",
+    "RawImageCodec",
+    "RawImageEncoderPool",
+    "RawImageStats",
     "Rect",
     "Ref",
     "ReorderableDragHandle",
@@ -1085,6 +1107,7 @@ __all__ = [
     "RoundedRectangleBorder",
     "Route",
     "RouteChangeEvent",
+    "RouteLoaderCache",
     "RouteUrlStrategy",
     "Router",
     "Row",
@@ -1212,6 +1235,7 @@ __all__ = [
     "Wakelock",
     "WebBrowserName",
     "WebDeviceInfo",
+    "WebPCodec",
     "WebRenderer",
     "WebViewConfiguration",
     "Window",
@@ -1220,6 +1244,7 @@ __all__ = [
     "WindowEventType",
     "WindowResizeEdge",
     "WindowsDeviceInfo",
+    "ZlibCodec",
     "__version__",
     "alignment",
     "app",
@@ -1256,6 +1281,7 @@ __all__ = [
     "use_route_location",
     "use_route_outlet",
     "use_route_params",
+    "use_route_prefetch",
     "use_state",
     "use_view_path",
     "value",
@@ -1496,6 +1522,9 @@ _LAZY = {
     "InteractiveViewer": "flet.controls.core.interactive_viewer",
     "IosDeviceInfo": "flet.controls.device_info",
     "IosUtsname": "flet.controls.device_info",
+    "ItemBuilderControl": "flet.controls.item_builder_control",
+    "ItemsRequestEvent": "flet.controls.item_builder_control",
+    "JpegCodec": "flet.controls.core.raw_image",
     "Key": "flet.controls.keys",
     "KeyDownEvent": "flet.controls.core.keyboard_listener",
     "KeyRepeatEvent": "flet.controls.core.keyboard_listener",
@@ -1588,6 +1617,7 @@ _LAZY = {
     "PaintingStyle": "flet.controls.painting",
     "Placeholder": "flet.controls.core.placeholder",
     "PlatformBrightnessChangeEvent": "flet.controls.page",
+    "PngCodec": "flet.controls.core.raw_image",
     "PointerDeviceType": "flet.controls.types",
     "PointerEvent": "flet.controls.events",
     "PopupMenuButton": "flet.controls.material.popup_menu_button",
@@ -1597,8 +1627,10 @@ _LAZY = {
     "ProgressBar": "flet.controls.material.progress_bar",
     "ProgressIndicatorTheme": "flet.controls.theme",
     "ProgressRing": "flet.controls.material.progress_ring",
+    "PubSubBackend": "flet.pubsub.pubsub_backend",
     "PubSubClient": "flet.pubsub.pubsub_client",
     "PubSubHub": "flet.pubsub.pubsub_hub",
+    "PubSubSessionStats": "flet.pubsub.pubsub_hub",
     "QueryString": "flet.controls.query_string",
     "RadialGradient": "flet.controls.gradients",
     "Radio": "flet.controls.material.radio",
@@ -1606,6 +1638,9 @@ _LAZY = {
     "RadioTheme": "flet.controls.theme",
     "RangeSlider": "flet.controls.material.range_slider",
     "RawImage": "flet.controls.core.raw_image",
+    "RawImageCodec": "flet.controls.core.raw_image",
+    "RawImageEncoderPool": "flet.controls.core.raw_image",
+    "RawImageStats": "flet.controls.core.raw_image",
     "Rect": "flet.controls.geometry",
     "Ref": "flet.controls.ref",
     "ReorderableDragHandle": "flet.controls.core.reorderable_drag_handle",
@@ -1619,6 +1654,7 @@ _LAZY = {
     "RoundedRectangleBorder": "flet.controls.buttons",
     "Route": "flet.components.router",
     "RouteChangeEvent": "flet.controls.page",
+    "RouteLoaderCache": "flet.components.router",
     "RouteUrlStrategy": "flet.controls.types",
     "Router": "flet.components.router",
     "Row": "flet.controls.core.row",
@@ -1746,6 +1782,7 @@ _LAZY = {
     "Wakelock": "flet.controls.services.wakelock",
     "WebBrowserName": "flet.controls.device_info",
     "WebDeviceInfo": "flet.controls.device_info",
+    "WebPCodec": "flet.controls.core.raw_image",
     "WebRenderer": "flet.controls.types",
     "WebViewConfiguration": "flet.controls.services.url_launcher",
     "Window": "flet.controls.core.window",
@@ -1754,6 +1791,7 @@ _LAZY = {
     "WindowEventType": "flet.controls.core.window",
     "WindowResizeEdge": "flet.controls.core.window",
     "WindowsDeviceInfo": "flet.controls.device_info",
+    "ZlibCodec": "flet.controls.core.raw_image",
     "alignment": "flet.controls",
     "app": "flet.app",
     "app_async": "flet.app",
@@ -1789,6 +1827,7 @@ _LAZY = {
     "use_route_location": "flet.components.router",
     "use_route_outlet": "flet.components.router",
     "use_route_params": "flet.components.router",
+    "use_route_prefetch": "flet.components.router",
     "use_state": "flet.components.hooks.use_state",
     "use_view_path": "flet.components.router",
     "value": "flet.controls.base_control",
@@ -8,7 +8,11 @@ from typing import Any, Callable, TypeVar
 
 from flet.components.hooks.hook import Hook
 from flet.components.hooks.use_effect import EffectHook
-from flet.components.observable import Observable, ObservableSubscription
+from flet.components.observable import (
+    Observable,
+    ObservableSubscription,
+    track_field_reads,
+)
 from flet.components.utils import (
     _CURRENT_RENDERER,
     shallow_compare_args_and_kwargs,
@@ -143,7 +147,7 @@ class Component(BaseControl):
         self._detach_observable_subscriptions()
         self._subscribe_observable_args(self.args, self.kwargs)
 
-        b = Renderer(self).render(self.fn, *self.args, **self.kwargs)
+        b = self._render()
 
         for item in b if isinstance(b, list) else [b] if b is not None else []:
             object.__setattr__(item, "_frozen", True)
@@ -191,7 +195,7 @@ class Component(BaseControl):
         self._state.hook_cursor = 0
         self._detach_observable_subscriptions()
         self._subscribe_observable_args(self.args, self.kwargs)
-        b = Renderer(self).render(self.fn, *self.args, **self.kwargs)
+        b = self._render()
 
         for item in b if isinstance(b, list) else [b] if b is not None else []:
             object.__setattr__(item, "_frozen", True)
@@ -204,6 +208,21 @@ class Component(BaseControl):
         self._b = b
         self._run_render_effects()
 
+    def _render(self):
+        """
+        Run the component function and limit observable subscriptions to the
+        fields it read, so that changes of other fields don't re-render it.
+
+        Returns:
+            Rendered control(s).
+        """
+
+        with track_field_reads() as reads:
+            b = Renderer(self).render(self.fn, *self.args, **self.kwargs)
+        for sub in self._state.observable_subscriptions:
+            sub.fields = reads.get(sub.observable_id, set())
+        return b
+
     def _schedule_update(self):
         """
         Mark component dirty and enqueue a session update.
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import contextlib
 import weakref
-from dataclasses import InitVar, dataclass
+from collections.abc import Generator
+from contextvars import ContextVar
+from dataclasses import InitVar, dataclass, field
 from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from flet.components.utils import value_equal
@@ -15,6 +17,78 @@ from flet.components.component_owned import ComponentOwned
 Listener = Callable[[Any, Optional[str]], None]  # (sender, field|None)
 
 
+class _Transaction:
+    """Changes deferred by a :func:`transaction` block."""
+
+    __slots__ = ("changes", "closed")
+
+    def __init__(self):
+        # (id(observable), field) -> observable
+        self.changes: dict[tuple[int, str | None], Observable] = {}
+        # Set when the block ends. Tasks created in the block inherit it
+        # through their context: their later changes are emitted at once.
+        self.closed = False
+
+
+_pending_changes: ContextVar[_Transaction | None] = ContextVar(
+    "_pending_changes", default=None
+)
+
+# id(observable) -> names of fields read, or `None` for all fields
+_field_reads: ContextVar[dict[int, set[str] | None] | None] = ContextVar(
+    "_field_reads", default=None
+)
+
+
+@contextlib.contextmanager
+def transaction() -> Generator[None, None, None]:
+    """
+    Defers change notifications of observables until the end of the block.
+
+    Listeners are notified once per changed field when the outermost
+    transaction ends, in the order fields first changed, even if the block
+    raises. Nested transactions are part of the outermost one.
+
+    Example:
+        ```python
+        with transaction():
+            for i in range(1000):
+                model.items.append(i)  # listeners are notified once
+            model.title = "Done"
+        ```
+    """
+    current = _pending_changes.get()
+    if current is not None and not current.closed:
+        yield
+        return
+    pending = _Transaction()
+    token = _pending_changes.set(pending)
+    try:
+        yield
+    finally:
+        pending.closed = True
+        _pending_changes.reset(token)
+        for (_, changed_field), sender in pending.changes.items():
+            sender._emit(changed_field)
+
+
+@contextlib.contextmanager
+def track_field_reads() -> Generator[dict[int, set[str] | None], None, None]:
+    """
+    Records the observable fields read in the block.
+
+    Yields:
+        Names of the fields read, by `id()` of the observable; `None` when
+            all fields may have been read (e.g. through `__dict__`).
+    """
+    reads: dict[int, set[str] | None] = {}
+    token = _field_reads.set(reads)
+    try:
+        yield reads
+    finally:
+        _field_reads.reset(token)
+
+
 def observable(cls):
     """
     Makes a class observable by mixing in :class:`~flet.Observable`.
@@ -63,8 +137,17 @@ class ObservableSubscription(ComponentOwned):
     Observable object to subscribe to.
     """
 
+    fields: set[str] | None = field(default=None, init=False)
+    """
+    Names of the fields whose changes update the component, `None` for all.
+
+    Set to the fields read by the last render of the component. Generic
+    changes (`field` is `None`) always update it.
+    """
+
     def __post_init__(self, owner: Component, observable: Observable) -> None:
         super().__post_init__(owner)
+        self.observable_id = id(observable)
         self.__disposer = observable.subscribe(self.__on_change)
 
     def dispose(self):
@@ -85,6 +168,8 @@ class ObservableSubscription(ComponentOwned):
             _field: Name of changed field, or `None` for generic change.
         """
 
+        if _field is not None and self.fields is not None and _field not in self.fields:
+            return
         if self.component:
             self.component._schedule_update()
 
@@ -163,14 +248,48 @@ class Observable:
         """
         Notify all listeners about a field change.
 
+        Within a :func:`transaction`, listeners are notified when it ends.
+
         Args:
             field: Changed field name, or `None` for a generic change.
         """
 
         self.__version__ += 1
+        pending = _pending_changes.get()
+        if pending is not None and not pending.closed:
+            pending.changes.setdefault((id(self), field), self)
+            return
+        self._emit(field)
+
+    def _emit(self, field: str | None):
+        """
+        Call all listeners with a field change.
+
+        Args:
+            field: Changed field name, or `None` for a generic change.
+        """
+
         for fn in list(self.__listeners):
             fn(self, field)
 
+    def batch(self) -> contextlib.AbstractContextManager[None]:
+        """
+        Notifies listeners once per changed field at the end of the block,
+        instead of on every change.
+
+        Changes of other observables made in the block are batched as well,
+        see :func:`~flet.components.observable.transaction`.
+
+        Example:
+            ```python
+            with model.batch():
+                for item in items:
+                    model.items.append(item)
+                model.count = len(model.items)
+            ```
+        """
+        return transaction()
+
     def notify(self):
         """
         Manually notify listeners that something changed.
@@ -198,12 +317,34 @@ class Observable:
         return value
 
     # attribute interception
+    def __getattribute__(
+        self,
+        name: str,
+        _get_reads=_field_reads.get,
+        _getattribute=object.__getattribute__,
+    ) -> Any:
+        reads = _get_reads()
+        if reads is not None:
+            # record fields read while rendering a component
+            if name == "__dict__":
+                reads[id(self)] = None
+            elif name[0] != "_":
+                key = id(self)
+                if key not in reads:
+                    reads[key] = {name}
+                elif reads[key] is not None:
+                    reads[key].add(name)
+        return _getattribute(self, name)
+
     def __setattr__(self, name: str, value: Any):
         if name.startswith("_"):  # private/internal, don't notify
             object.__setattr__(self, name, value)
             return
         value = self._wrap_if_collection(name, value)
-        old = object.__getattribute__(self, name) if hasattr(self, name) else None
+        try:
+            old = object.__getattribute__(self, name)
+        except AttributeError:
+            old = None
         object.__setattr__(self, name, value)
         if not value_equal(old, value):
             self._notify(name)
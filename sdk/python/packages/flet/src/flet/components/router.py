@@ -8,7 +8,12 @@ navigation with swipe-back gesture support.
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import inspect
 import re
+import time
+from collections.abc import Awaitable, Hashable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Callable
 from urllib.parse import urlparse
@@ -28,12 +33,14 @@ from flet.controls.context import context
 __all__ = [
     "LocationInfo",
     "Route",
+    "RouteLoaderCache",
     "Router",
     "is_route_active",
     "use_route_loader_data",
     "use_route_location",
     "use_route_outlet",
     "use_route_params",
+    "use_route_prefetch",
     "use_view_path",
 ]
 
@@ -63,9 +70,10 @@ class Route:
         component: A `@component` function to render when this route
             matches.
         children: Nested child routes.
-        loader: Optional data loader function. Called with the matched
-            params dict when the route matches. Result is available via
-            :func:`~flet.use_route_loader_data`.
+        loader: Optional data loader function, sync or async. Called with
+            the matched params dict when the route matches. Result is
+            available via :func:`~flet.use_route_loader_data`, and cached
+            according to the Router's `loader_cache`.
         outlet: When `True` and `manage_views=True`, this route acts
             as a layout that wraps its matched child via
             :func:`~flet.use_route_outlet` within a single
@@ -160,6 +168,178 @@ def _normalize_path(path: str) -> str:
     return path
 
 
+# Segments that match exactly one URL segment: static text, or a plain
+# dynamic segment (`:name`).
+_STATIC_SEGMENT = re.compile(r"[^:*?+()\\]+")
+_PARAM_SEGMENT = re.compile(r":\w+")
+
+
+@functools.lru_cache(maxsize=4096)
+def _compile_path(path: str, end: bool) -> re.Pattern[str]:
+    """Compile a full route path into a regex matching a pathname."""
+    return re.compile(repath.pattern(path, end=end))
+
+
+@functools.lru_cache(maxsize=4096)
+def _segment_depth(path: str) -> int | None:
+    """
+    Number of URL segments matched by `path`, or `None` if it can match a
+    varying number of segments (optional segments, splats, custom regexes).
+    """
+    segments = path.rstrip("/").split("/")[1:]
+    for segment in segments:
+        if segment and not (
+            _STATIC_SEGMENT.fullmatch(segment) or _PARAM_SEGMENT.fullmatch(segment)
+        ):
+            return None
+    return len(segments)
+
+
+def _static_segment(route: Route) -> str | None:
+    """The first segment of `route.path` if it is static text, else `None`."""
+    if route.index or not route.path:
+        return None
+    path = route.path if route.path.startswith("/") else "/" + route.path
+    segment = path.split("/", 2)[1]
+    return segment if _STATIC_SEGMENT.fullmatch(segment) else None
+
+
+def _route_full_path(route: Route, parent_path: str) -> str:
+    """Full path of `route` nested under `parent_path`."""
+    if route.index:
+        return _normalize_path(parent_path) if parent_path else "/"
+    return _join_paths(parent_path, route.path or "") or "/"
+
+
+class _CompiledRoute:
+    """
+    A route with its path patterns compiled, on first match, for the parent
+    path it is declared under.
+
+    Routes matched under another parent path (i.e. below a recursive
+    route, whose parent path is the consumed pathname) fall back to
+    patterns compiled for that path. Patterns are only compiled for the
+    parent paths a route is actually matched under, as those of a
+    recursive route's children may not compile under the route's own
+    pattern (e.g. a `:slug` child of a recursive `:slug` route).
+    """
+
+    __slots__ = ("_children", "exact", "full_path", "parent_path", "prefix", "route")
+
+    def __init__(self, route: Route, parent_path: str):
+        self.route = route
+        self.parent_path = parent_path
+        self.full_path = _route_full_path(route, parent_path)
+        self.exact: re.Pattern[str] | None = None
+        self.prefix: re.Pattern[str] | None = None
+        self._children: _CompiledRoutes | None = None
+
+    @property
+    def children(self) -> _CompiledRoutes:
+        # Compiled on first use: only visited branches are compiled, and
+        # routes listing themselves as children don't recurse forever.
+        if self._children is None:
+            route = self.route
+            self._children = _CompiledRoutes(
+                [
+                    c
+                    for c in route.children or []
+                    if c is not route or not route.recursive
+                ],
+                self.full_path,
+            )
+        return self._children
+
+    def patterns(
+        self, parent_path: str
+    ) -> tuple[str, re.Pattern[str], re.Pattern[str]]:
+        """Full path, exact and prefix patterns of the route under `parent_path`."""
+        if parent_path == self.parent_path:
+            if self.exact is None:
+                self.exact = _compile_path(self.full_path, True)
+                self.prefix = _compile_path(self.full_path, False)
+            return self.full_path, self.exact, self.prefix
+        full_path = _route_full_path(self.route, parent_path)
+        return (
+            full_path,
+            _compile_path(full_path, True),
+            _compile_path(full_path, False),
+        )
+
+
+class _CompiledRoutes:
+    """
+    Sibling routes indexed by their first static segment.
+
+    A pathname can only match routes whose static first segment equals its
+    segment at the siblings' depth, plus routes starting with a dynamic
+    segment, pathless and index routes. Candidates are returned in
+    declaration order, so the first matching route still wins.
+    """
+
+    __slots__ = ("_candidates", "_dynamic", "_static", "all", "dynamic")
+
+    def __init__(self, routes: list[Route], parent_path: str):
+        self.all = tuple(_CompiledRoute(r, parent_path) for r in routes)
+        self._static: dict[str, list[int]] = {}
+        self._dynamic: list[int] = []
+        for i, route in enumerate(routes):
+            key = _static_segment(route)
+            if key is None:
+                self._dynamic.append(i)
+            else:
+                self._static.setdefault(key, []).append(i)
+        self.dynamic = tuple(self.all[i] for i in self._dynamic)
+        # merged static and dynamic candidates, built per segment on first use
+        self._candidates: dict[str, tuple[_CompiledRoute, ...]] = {}
+
+    def candidates(self, pathname: str, parent_path: str) -> tuple[_CompiledRoute, ...]:
+        """Routes that can match `pathname` under `parent_path`, in order."""
+        if not self._static:
+            return self.all
+        depth = _segment_depth(parent_path)
+        if depth is None:
+            return self.all
+        segments = pathname.split("/", depth + 2)
+        if len(segments) < depth + 2:
+            return self.dynamic
+        key = segments[depth + 1]
+        candidates = self._candidates.get(key)
+        if candidates is None:
+            static = self._static.get(key)
+            if static is None:
+                return self.dynamic
+            candidates = self._candidates[key] = tuple(
+                self.all[i] for i in sorted(static + self._dynamic)
+            )
+        return candidates
+
+
+class _RouteMatcher:
+    """
+    Route tree compiled for matching pathnames.
+
+    Compiled patterns are kept per route, so matching a pathname only
+    runs precompiled regexes of the routes whose static segments fit it.
+    """
+
+    __slots__ = ("_compiled", "parent_path", "routes")
+
+    def __init__(self, routes: list[Route], parent_path: str = ""):
+        self.routes = routes
+        self.parent_path = parent_path
+        self._compiled = _CompiledRoutes(routes, parent_path)
+
+    def match(self, pathname: str) -> list[_RouteMatch] | None:
+        """
+        Match pathname against the route tree.
+
+        Returns a chain of matched routes from outermost to innermost,
+        or `None` if no route matches.
+        """
+        return _match_compiled(self._compiled, pathname, self.parent_path)
+
+
 def _match_routes(
     routes: list[Route],
     pathname: str,
@@ -171,25 +351,35 @@ def _match_routes(
     Returns a chain of matched routes from outermost to innermost,
     or `None` if no route matches.
     """
-    for route in routes:
-        result = _try_match(route, pathname, parent_path)
+    return _RouteMatcher(routes, parent_path).match(pathname)
+
+
+def _match_compiled(
+    routes: _CompiledRoutes,
+    pathname: str,
+    parent_path: str,
+) -> list[_RouteMatch] | None:
+    """Match pathname against the first matching of sibling routes."""
+    for node in routes.candidates(pathname, parent_path):
+        result = _try_match(node, pathname, parent_path)
         if result is not None:
             return result
     return None
 
 
 def _try_match(
-    route: Route,
+    node: _CompiledRoute,
     pathname: str,
     parent_path: str,
 ) -> list[_RouteMatch] | None:
     """Try to match a single route (and its children) against pathname."""
 
+    route = node.route
+    full_path, exact_pattern, prefix_pattern = node.patterns(parent_path)
+
     if route.index:
         # Index routes match the parent path exactly
-        full_path = _normalize_path(parent_path) if parent_path else "/"
-        pattern = repath.pattern(full_path)
-        m = re.match(pattern, pathname)
+        m = exact_pattern.match(pathname)
         if m:
             return [
                 _RouteMatch(
@@ -201,7 +391,7 @@ def _try_match(
             ]
         # Also try with trailing slash stripped from pathname
         if pathname.endswith("/") and pathname != "/":
-            m = re.match(pattern, pathname.rstrip("/"))
+            m = exact_pattern.match(pathname.rstrip("/"))
             if m:
                 return [
                     _RouteMatch(
@@ -213,20 +403,13 @@ def _try_match(
                 ]
         return None
 
-    # Build full path for this route
-    route_path = route.path or ""
-    full_path = _join_paths(parent_path, route_path)
-    if not full_path:
-        full_path = "/"
-
     if route.recursive:
         # Recursive routes consume one matched segment per recursion and
         # try non-recursive children before self-recursing — so a more
         # specific sibling (e.g. `example/:gp*`) wins over the
         # recursive `:slug` at every depth without duplicate
         # declarations.
-        prefix_pattern = repath.pattern(full_path, end=False)
-        prefix_m = re.match(prefix_pattern, pathname)
+        prefix_m = prefix_pattern.match(pathname)
         if not prefix_m:
             return None
         consumed = prefix_m.group(0)
@@ -243,15 +426,12 @@ def _try_match(
         if not remainder or remainder == "/":
             return [head]
         # 1) Try non-recursive children first (more specific match).
-        for child in route.children or []:
-            if child is route:
-                continue
-            child_result = _try_match(child, pathname, consumed)
-            if child_result is not None:
-                return [head] + child_result
+        child_result = _match_compiled(node.children, pathname, consumed)
+        if child_result is not None:
+            return [head] + child_result
         # 2) Fall back to self-recursion with the consumed prefix as
         #    the parent path.
-        recurse = _try_match(route, pathname, consumed)
+        recurse = _try_match(node, pathname, consumed)
         if recurse is None:
             return None
         return [head] + recurse
@@ -260,32 +440,29 @@ def _try_match(
         # Parent route — try prefix match to extract params, then match children
         parent_params: dict[str, str] = {}
         parent_resolved = full_path
-        if route_path:
+        if route.path:
             # Only do prefix match if route has a path segment
-            prefix_pattern = repath.pattern(full_path, end=False)
-            prefix_m = re.match(prefix_pattern, pathname)
+            prefix_m = prefix_pattern.match(pathname)
             if not prefix_m:
                 return None
             parent_params = prefix_m.groupdict()
             parent_resolved = prefix_m.group(0)
 
         # Try matching children
-        for child in route.children:
-            child_result = _try_match(child, pathname, full_path)
-            if child_result is not None:
-                return [
-                    _RouteMatch(
-                        route=route,
-                        params=parent_params,
-                        full_path=full_path,
-                        resolved_path=parent_resolved,
-                    )
-                ] + child_result
+        child_result = _match_compiled(node.children, pathname, full_path)
+        if child_result is not None:
+            return [
+                _RouteMatch(
+                    route=route,
+                    params=parent_params,
+                    full_path=full_path,
+                    resolved_path=parent_resolved,
+                )
+            ] + child_result
 
         # No children matched — if this route has a component, try exact match
         if route.component:
-            exact_pattern = repath.pattern(full_path)
-            exact_m = re.match(exact_pattern, pathname)
+            exact_m = exact_pattern.match(pathname)
             if exact_m:
                 return [
                     _RouteMatch(
@@ -299,8 +476,7 @@ def _try_match(
         return None
 
     # Leaf route — exact match
-    leaf_pattern = repath.pattern(full_path)
-    m = re.match(leaf_pattern, pathname)
+    m = exact_pattern.match(pathname)
     if m:
         return [
             _RouteMatch(
@@ -314,6 +490,254 @@ def _try_match(
     return None
 
 
+# ---------------------------------------------------------------------------
+# Route loaders
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _LoaderEntry:
+    """Cached result of a route loader."""
+
+    data: Any = None
+    loaded_at: float | None = None
+    future: asyncio.Future | None = None
+
+
+class RouteLoaderCache:
+    """
+    Cache of route loader results, keyed on the route and its params.
+
+    A :class:`~flet.Router` creates a cache of its own, used by a single
+    session, unless one is passed as its `loader_cache`. Passing the same
+    cache to the Routers of several sessions shares loaded data between them.
+
+    Concurrent loads of the same route and params, e.g. a prefetch and the
+    navigation following it, share a single loader call.
+
+    Args:
+        ttl: Number of seconds loaded data stays fresh. Navigating to a
+            route with fresh data renders it without calling the loader
+            again. With `0` (default), loaders run on every navigation.
+        stale_while_revalidate: Number of seconds after `ttl` during which
+            stale data is rendered while the loader runs again in the
+            background.
+        max_entries: Maximum number of cached results. The least recently
+            loaded ones are evicted first.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 0,
+        stale_while_revalidate: float = 0,
+        max_entries: int = 256,
+    ):
+        self.ttl = ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self.max_entries = max_entries
+        self.__entries: dict[Hashable, _LoaderEntry] = {}
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def invalidate(self, loader: Callable[..., Any] | None = None):
+        """
+        Drops cached results, so that the next navigation calls the loader.
+
+        Args:
+            loader: Loader function whose results to drop. `None` drops all
+                cached results.
+        """
+        for key in list(self.__entries):
+            if loader is None or key[0] == loader:
+                entry = self.__entries[key]
+                if entry.future is None:
+                    del self.__entries[key]
+                else:
+                    entry.loaded_at = None
+
+    @staticmethod
+    def _key(loader: Callable[..., Any], full_path: str, params: dict[str, str]):
+        return loader, full_path, tuple(sorted(params.items()))
+
+    def _lookup(self, key: Hashable) -> tuple[str, Any]:
+        """
+        Returns the state of the cached result — `"fresh"`, `"stale"`,
+        `"loading"` or `"missing"` — and its data.
+        """
+        entry = self.__entries.get(key)
+        if entry is None:
+            return "missing", None
+        if entry.loaded_at is not None:
+            age = time.monotonic() - entry.loaded_at
+            if age < self.ttl:
+                return "fresh", entry.data
+            if entry.future is None and age < self.ttl + self.stale_while_revalidate:
+                return "stale", entry.data
+        if entry.future is not None:
+            return "loading", entry.data
+        return "missing", None
+
+    def _store(self, key: Hashable, data: Any):
+        entry = self.__entries.pop(key, None)
+        if self.ttl + self.stale_while_revalidate <= 0:
+            return  # would never be served
+        entry = entry or _LoaderEntry()
+        entry.data = data
+        entry.loaded_at = time.monotonic()
+        self.__entries[key] = entry
+        excess = len(self.__entries) - self.max_entries
+        if excess > 0:
+            evicted = [k for k, e in self.__entries.items() if e.future is None]
+            for k in evicted[:excess]:
+                del self.__entries[k]
+
+    async def _load(
+        self,
+        key: Hashable,
+        loader: Callable[..., Any],
+        params: dict[str, str],
+        result: Awaitable[Any] | None = None,
+    ) -> Any:
+        """
+        Calls `loader`, or awaits `result` of a call already made, unless a
+        call is already in flight for `key`, whose result is then awaited.
+        """
+        entry = self.__entries.get(key)
+        if entry is not None and entry.future is not None:
+            if inspect.iscoroutine(result):
+                result.close()
+            return await asyncio.shield(entry.future)
+        if entry is None:
+            entry = self.__entries[key] = _LoaderEntry()
+        future = entry.future = asyncio.get_running_loop().create_future()
+        # mark the exception retrieved when no one else waits for it
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        try:
+            data = loader(params) if result is None else result
+            if inspect.isawaitable(data):
+                data = await data
+        except asyncio.CancelledError:
+            future.cancel()
+            self.__forget(key, entry)
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            self.__forget(key, entry)
+            raise
+        finally:
+            entry.future = None
+        self._store(key, data)
+        future.set_result(data)
+        return data
+
+    def __forget(self, key: Hashable, entry: _LoaderEntry):
+        """Drops the entry of a failed load, so that the next one retries it."""
+        if self.__entries.get(key) is entry:
+            del self.__entries[key]
+
+
+@dataclass
+class _LoaderState:
+    """Loader results for the pathname a Router has rendered."""
+
+    pathname: str
+    data: dict[Hashable, Any] = field(default_factory=dict)
+    pending: set[Hashable] = field(default_factory=set)
+
+
+class _RouteLoaders:
+    """
+    Runs the loaders of the routes matched by a Router.
+
+    Sync loaders without cached data run during render, as before. Async
+    loaders and revalidations of stale data run as page tasks, and the
+    Router re-renders with their results when they complete.
+    """
+
+    def __init__(self, cache: RouteLoaderCache, page: Any):
+        self.cache = cache
+        self.page = page
+        self.matcher: _RouteMatcher | None = None
+        self.on_loaded: Callable[[], None] = lambda: None
+        self.state = _LoaderState("")
+
+    def load(
+        self, chain: list[_RouteMatch], params: dict[str, str], pathname: str
+    ) -> dict[int, Any]:
+        """
+        Returns loader results by index of the route in `chain`, starting
+        the loads of results not available yet.
+        """
+        if self.state.pathname != pathname:
+            self.state = _LoaderState(pathname)
+        state = self.state
+        results: dict[int, Any] = {}
+        for i, m in enumerate(chain):
+            loader = m.route.loader
+            if loader is None:
+                continue
+            key = self.cache._key(loader, m.full_path, params)
+            if key not in state.data and key not in state.pending:
+                status, data = self.cache._lookup(key)
+                result = None
+                if status == "missing":
+                    # Sync loaders complete here; the results of async ones
+                    # (coroutine functions, but also lambdas or partials
+                    # returning awaitables) are awaited in a task.
+                    result = loader(params)
+                    if not inspect.isawaitable(result):
+                        state.data[key] = result
+                        self.cache._store(key, result)
+                        results[i] = result
+                        continue
+                if status == "fresh":
+                    state.data[key] = data
+                else:
+                    # render stale data, if any, until the load completes
+                    if status != "missing":
+                        state.data[key] = data
+                    state.pending.add(key)
+                    self.page.run_task(self.__load, state, key, loader, params, result)
+            results[i] = state.data.get(key)
+        return results
+
+    async def __load(
+        self,
+        state: _LoaderState,
+        key: Hashable,
+        loader: Callable[..., Any],
+        params: dict[str, str],
+        result: Awaitable[Any] | None = None,
+    ):
+        try:
+            data = await self.cache._load(key, loader, params, result)
+        finally:
+            state.pending.discard(key)
+        if state is self.state:
+            state.data[key] = data
+            self.on_loaded()
+
+    def prefetch(self, path: str):
+        """Starts loading the data of the routes matching `path`."""
+        pathname = _normalize_path(urlparse(path).path or "/")
+        if pathname == self.state.pathname or self.matcher is None:
+            return
+        chain = self.matcher.match(pathname)
+        if chain is None:
+            return
+        params: dict[str, str] = {}
+        for m in chain:
+            params.update(m.params)
+        for m in chain:
+            loader = m.route.loader
+            if loader is None:
+                continue
+            key = self.cache._key(loader, m.full_path, params)
+            if self.cache._lookup(key)[0] in ("missing", "stale"):
+                self.page.run_task(self.cache._load, key, loader, params)
+
+
 # ---------------------------------------------------------------------------
 # Contexts
 # ---------------------------------------------------------------------------
@@ -325,6 +749,7 @@ _params_context = create_context(_MISSING)
 _outlet_context = create_context(_MISSING)
 _loader_data_context = create_context(_MISSING)
 _view_path_context = create_context(_MISSING)
+_loaders_context = create_context(_MISSING)
 
 
 def _is_inside_router(value: Any) -> bool:
@@ -425,6 +850,38 @@ def use_route_loader_data():
     return value
 
 
+def use_route_prefetch() -> Callable[[str], None]:
+    """
+    Returns a function that starts loading the data of the route matching a
+    path, e.g. when the pointer enters a navigation link.
+
+    The loaded data is used when navigating to the path while it is still
+    fresh, see :class:`~flet.RouteLoaderCache`. A load still in progress is
+    shared with the navigation. Paths of the current location are not
+    prefetched.
+
+    Must be called inside a component rendered by a :class:`~flet.Router`.
+    Returns a function doing nothing if called outside a Router tree.
+
+    Returns:
+        A function accepting the path to prefetch (e.g. `"/products/42"`).
+
+    Example:
+        ```python
+        prefetch = ft.use_route_prefetch()
+        ft.Container(
+            content=ft.Text("Products"),
+            on_click=lambda: ft.context.page.navigate("/products"),
+            on_hover=lambda e: prefetch("/products") if e.data else None,
+        )
+        ```
+    """
+    loaders = use_context(_loaders_context)
+    if not _is_inside_router(loaders):
+        return lambda path: None
+    return loaders.prefetch
+
+
 def is_route_active(path: str, exact: bool = False) -> bool:
     """
     Check whether the given path matches the current location.
@@ -595,6 +1052,7 @@ def Router(
     routes: list[Route],
     not_found: Callable | None = None,
     manage_views: bool = False,
+    loader_cache: RouteLoaderCache | None = None,
 ) -> Control:
     """
     Top-level router component that matches the current page route against
@@ -613,6 +1071,9 @@ def Router(
     and :class:`~flet.AppBar` implicit back button on mobile.
     Must be used with :meth:`~flet.Page.render_views`.
 
+    Route patterns are compiled once per `routes` list; pass a new list,
+    rather than changing it in place, to update the route tree.
+
     Args:
         routes: List of top-level :class:`~flet.Route` definitions.
         not_found: Optional component to render when no route matches (404).
@@ -621,6 +1082,15 @@ def Router(
             single component tree. Route components should return
             :class:`~flet.View` instances with `route` and `appbar`
             set. Use with :meth:`~flet.Page.render_views`.
+        loader_cache: Cache of route loader results. Defaults to a cache
+            of this Router without expiration time, so loaders run on every
+            navigation. Pass a :class:`~flet.RouteLoaderCache` with a `ttl`
+            to render revisited and prefetched routes from cache, or the
+            same cache to the Routers of several sessions to share it.
+
+    Route loaders can be sync or async functions. Async loaders run in the
+    background: :func:`~flet.use_route_loader_data` returns `None` until
+    they complete and the Router re-renders with their data.
 
     Example:
         ```python
@@ -656,6 +1126,21 @@ def Router(
     # chain ends in a modal route. `None` otherwise. Set whenever a
     # modal route matches.
     current_modal_pop_to_ref = use_ref(None)
+    # Route tree compiled for matching, kept while `routes` is the same
+    # list — so navigations don't recompile route patterns.
+    matcher_ref = use_ref(None)
+    if matcher_ref.current is None or matcher_ref.current.routes is not routes:
+        matcher_ref.current = _RouteMatcher(routes)
+    matcher = matcher_ref.current
+    own_loader_cache_ref = use_ref(RouteLoaderCache)
+    cache = loader_cache if loader_cache is not None else own_loader_cache_ref.current
+    loaders_ref = use_ref(None)
+    if loaders_ref.current is None or loaders_ref.current.cache is not cache:
+        loaders_ref.current = _RouteLoaders(cache, page)
+    loaders = loaders_ref.current
+    loaders.matcher = matcher
+    _, set_loaded_count = use_state(0)
+    loaders.on_loaded = lambda: set_loaded_count(lambda count: count + 1)
 
     # Subscribe to route changes on mount
     def setup_listeners():
@@ -726,7 +1211,7 @@ def Router(
     hash_val = parsed.fragment or ""
 
     # Match routes
-    chain = _match_routes(routes, pathname)
+    chain = matcher.match(pathname)
 
     if chain is None:
         if not_found is not None:
@@ -759,7 +1244,7 @@ def Router(
     if manage_views and modal_idx == 0:
         base_location = prev_non_modal_location_ref.current or "/"
         base_pathname = _normalize_path(urlparse(base_location).path or "/")
-        base_chain = _match_routes(routes, base_pathname) or []
+        base_chain = matcher.match(base_pathname) or []
         # If the base path also resolves to a modal (shouldn't happen
         # in practice — non-modal navigations are the only ones that
         # update prev_non_modal_location_ref), fall back to no base.
@@ -799,10 +1284,7 @@ def Router(
         all_params.update(m.params)
 
     # Run loaders
-    loader_results: dict[int, Any] = {}
-    for i, m in enumerate(chain):
-        if m.route.loader is not None:
-            loader_results[i] = m.route.loader(all_params)
+    loader_results = loaders.load(chain, all_params, pathname)
 
     # Build location info
     loc = LocationInfo(pathname=pathname, search=search, hash=hash_val)
@@ -810,10 +1292,13 @@ def Router(
     if not manage_views:
         # Single-view mode (existing behavior). `modal` is ignored
         # here — it only affects stack composition in multi-view mode.
-        return _location_context(
-            loc,
-            lambda: _params_context(
-                all_params, lambda: _build_outlet_chain(chain, loader_results)
+        return _loaders_context(
+            loaders,
+            lambda: _location_context(
+                loc,
+                lambda: _params_context(
+                    all_params, lambda: _build_outlet_chain(chain, loader_results)
+                ),
             ),
         )
 
@@ -884,14 +1369,17 @@ def Router(
                 _level_view_path=level_view_path,
                 _sub_chain=sub_chain,
             ):
-                return _view_path_context(
-                    _level_view_path,
-                    lambda: _location_context(
-                        _level_loc,
-                        lambda: _params_context(
-                            _level_params,
-                            lambda: _build_view_level(
-                                _layouts, _match, loader_results, _sub_chain
+                return _loaders_context(
+                    loaders,
+                    lambda: _view_path_context(
+                        _level_view_path,
+                        lambda: _location_context(
+                            _level_loc,
+                            lambda: _params_context(
+                                _level_params,
+                                lambda: _build_view_level(
+                                    _layouts, _match, loader_results, _sub_chain
+                                ),
                             ),
                         ),
                     ),
@@ -1,6 +1,9 @@
+import contextlib
 import inspect
 import logging
 import sys
+import time
+import weakref
 from dataclasses import InitVar, dataclass, field
 from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar, Union, overload
 
@@ -458,17 +461,13 @@ class BaseControl:
         Internal helper that builds event objects, calls `before_event()`,
         executes sync/async handlers, and notifies session progress.
         """
-        field_name = f"on_{event_name}"
-        if not hasattr(self, field_name):
-            # field_name not defined
-            return
-
-        event_type = get_event_field_type(self, field_name)
-        if event_type is None:
+        dispatch = _get_event_dispatch(self.__class__, event_name)
+        if dispatch is None:
             return
+        field_name, event_type = dispatch
 
         if e is None:
-            if event_type == ControlEvent or not isinstance(event_data, dict):
+            if event_type is None or not isinstance(event_data, dict):
                 # simple ControlEvent
                 e = ControlEvent(control=self, name=event_name, data=event_data)
             else:
@@ -497,33 +496,47 @@ class BaseControl:
 
             # Handle async and sync event handlers accordingly
             event_handler = getattr(self, field_name)
-            if inspect.iscoroutinefunction(event_handler):
-                if get_param_count(event_handler) == 0:
-                    await event_handler()
-                else:
-                    await event_handler(e)
-
-            elif inspect.isasyncgenfunction(event_handler):
-                if get_param_count(event_handler) == 0:
-                    async for _ in event_handler():
-                        await session.after_event(session.index.get(self._i))
-                else:
-                    async for _ in event_handler(e):
-                        await session.after_event(session.index.get(self._i))
-
-            elif inspect.isgeneratorfunction(event_handler):
-                if get_param_count(event_handler) == 0:
-                    for _ in event_handler():
-                        await session.after_event(session.index.get(self._i))
-                else:
-                    for _ in event_handler(e):
-                        await session.after_event(session.index.get(self._i))
-
-            elif callable(event_handler):
-                if get_param_count(event_handler) == 0:
-                    event_handler()
-                else:
-                    event_handler(e)
+            kind, no_args = _get_handler_kind(event_handler)
+            if kind == _HANDLER_SYNC and session.sync_handlers_in_executor:
+                await session.run_sync_handler(
+                    event_handler, () if no_args else (e,), self._i
+                )
+                return
+
+            started = time.perf_counter()
+            try:
+                if kind == _HANDLER_ASYNC:
+                    if no_args:
+                        await event_handler()
+                    else:
+                        await event_handler(e)
+
+                elif kind == _HANDLER_ASYNC_GENERATOR:
+                    if no_args:
+                        async for _ in event_handler():
+                            await session.after_event(session.index.get(self._i))
+                    else:
+                        async for _ in event_handler(e):
+                            await session.after_event(session.index.get(self._i))
+
+                elif kind == _HANDLER_GENERATOR:
+                    if no_args:
+                        for _ in event_handler():
+                            await session.after_event(session.index.get(self._i))
+                    else:
+                        for _ in event_handler(e):
+                            await session.after_event(session.index.get(self._i))
+
+                elif kind == _HANDLER_SYNC:
+                    if no_args:
+                        event_handler()
+                    else:
+                        event_handler(e)
+            finally:
+                if kind != _HANDLER_NONE:
+                    session.record_handler_time(
+                        event_handler, time.perf_counter() - started
+                    )
 
             await session.after_event(session.index.get(self._i))
 
@@ -548,6 +561,93 @@ class BaseControl:
         return f"{self._c}({self._i} - {id(self)})"
 
 
+_EVENT_DISPATCH_ATTR = "__flet_event_dispatch__"
+
+
+def _get_event_dispatch(
+    cls: type, event_name: str
+) -> Optional[tuple[str, Optional[type]]]:
+    """
+    Returns the dispatch entry for `event_name` on control class `cls`.
+
+    Entries are resolved lazily, on the first event of each name, and cached in
+    a table stored in the class' own `__dict__` (so subclasses and redefined
+    classes build their own). An entry is a `(field_name, event_type)` tuple,
+    where `event_type` is the resolved event dataclass to build with
+    `from_dict()`, or `None` when a plain `ControlEvent` is used. `None` is
+    returned (and cached) for events the control does not declare.
+    """
+    table = cls.__dict__.get(_EVENT_DISPATCH_ATTR)
+    if table is None:
+        table = {}
+        setattr(cls, _EVENT_DISPATCH_ATTR, table)
+    elif event_name in table:
+        return table[event_name]
+
+    field_name = f"on_{event_name}"
+    dispatch = None
+    if hasattr(cls, field_name):
+        event_type = get_event_field_type(cls, field_name)
+        if event_type is not None:
+            dispatch = (
+                field_name,
+                None if event_type == ControlEvent else event_type,
+            )
+    table[event_name] = dispatch
+    return dispatch
+
+
+_HANDLER_NONE = 0
+_HANDLER_SYNC = 1
+_HANDLER_ASYNC = 2
+_HANDLER_ASYNC_GENERATOR = 3
+_HANDLER_GENERATOR = 4
+
+_handler_kinds: "weakref.WeakKeyDictionary[Any, tuple[int, bool]]" = (
+    weakref.WeakKeyDictionary()
+)
+_bound_handler_kinds: "weakref.WeakKeyDictionary[Any, tuple[int, bool]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_handler_kind(handler: Any) -> tuple[int, bool]:
+    """
+    Returns `(kind, no_args)` for an event handler.
+
+    `kind` tells whether the handler is a coroutine, async generator, generator
+    or plain function and `no_args` whether it takes no parameters. Both are
+    cached per underlying function, so `inspect.signature()` runs once per
+    handler rather than once per event. Bound methods are keyed on their
+    `__func__` because a new bound method object is created on every access.
+    """
+    func = getattr(handler, "__func__", None)
+    cache, key = (
+        (_handler_kinds, handler) if func is None else (_bound_handler_kinds, func)
+    )
+    try:
+        return cache[key]
+    except (KeyError, TypeError):
+        pass
+
+    if inspect.iscoroutinefunction(handler):
+        kind = _HANDLER_ASYNC
+    elif inspect.isasyncgenfunction(handler):
+        kind = _HANDLER_ASYNC_GENERATOR
+    elif inspect.isgeneratorfunction(handler):
+        kind = _HANDLER_GENERATOR
+    elif callable(handler):
+        kind = _HANDLER_SYNC
+    else:
+        kind = _HANDLER_NONE
+    result = (kind, kind != _HANDLER_NONE and get_param_count(handler) == 0)
+
+    # unhashable or not weak-referenceable handlers are simply not cached
+    with contextlib.suppress(TypeError):
+        cache[key] = result
+    return result
+
+
 # Install Prop descriptors for BaseControl's own public fields (key).
 # Subclasses decorated with @control get this called via _apply_control.
 _install_props(BaseControl)
@@ -40,7 +40,9 @@ def get_event_field_type(control: Any, field_name: str):
 
     Inspects merged annotations across the control MRO and evaluates forward
     references so runtime event objects can be created with the right type.
+    `control` may be either a control instance or a control class.
     """
+    control_cls = control if isinstance(control, type) else control.__class__
     frame = inspect.currentframe().f_back
     localns = frame.f_globals.copy()
     localns.update(frame.f_locals)
@@ -48,7 +50,7 @@ def get_event_field_type(control: Any, field_name: str):
     merged_annotations = {}
     annotation_modules = {}
 
-    for cls in control.__class__.__mro__:
+    for cls in control_cls.__mro__:
         annotations = getattr(cls, "__annotations__", {})
         module = sys.modules.get(cls.__module__)
         module_dict = module.__dict__ if module else {}
@@ -68,7 +70,7 @@ def get_event_field_type(control: Any, field_name: str):
     annotation = merged_annotations[field_name]
 
     globalns = {}
-    current_module = sys.modules.get(control.__class__.__module__)
+    current_module = sys.modules.get(control_cls.__module__)
     if current_module:
         globalns.update(current_module.__dict__)
 
@@ -78,7 +80,7 @@ def get_event_field_type(control: Any, field_name: str):
             globalns.setdefault(key, value)
 
     globalns.setdefault("__builtins__", __builtins__)
-    type_params = getattr(control.__class__, "__type_params__", ())
+    type_params = getattr(control_cls, "__type_params__", ())
 
     try:
         # Resolve forward refs manually
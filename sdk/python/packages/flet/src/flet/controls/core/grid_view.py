@@ -4,6 +4,7 @@ from typing import Optional
 from flet.controls.adaptive_control import AdaptiveControl
 from flet.controls.base_control import control
 from flet.controls.control import Control
+from flet.controls.item_builder_control import ItemBuilderControl
 from flet.controls.layout_control import LayoutControl
 from flet.controls.padding import PaddingValue
 from flet.controls.scrollable_control import ScrollableControl
@@ -13,7 +14,7 @@ __all__ = ["GridView"]
 
 
 @control("GridView")
-class GridView(LayoutControl, ScrollableControl, AdaptiveControl):
+class GridView(LayoutControl, ScrollableControl, ItemBuilderControl, AdaptiveControl):
     """
     A scrollable, 2D array of controls.
 
@@ -42,11 +43,18 @@ class GridView(LayoutControl, ScrollableControl, AdaptiveControl):
         ],
     )
     ```
+
+    For large grids, set :attr:`~flet.ItemBuilderControl.item_count` and
+    :attr:`~flet.ItemBuilderControl.item_builder` instead of :attr:`controls`,
+    so that only the items being shown are built and sent.
     """
 
     controls: list[Control] = field(default_factory=list)
     """
     A list of controls to display inside grid.
+
+    If :attr:`~flet.ItemBuilderControl.item_builder` is set, the items built
+    around the ones being shown, maintained by this control.
     """
 
     horizontal: bool = False
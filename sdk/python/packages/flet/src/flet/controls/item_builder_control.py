@@ -0,0 +1,159 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Optional, Union
+
+from flet.controls.base_control import control
+from flet.controls.control import Control
+from flet.controls.control_event import ControlEvent, Event, EventHandler
+
+__all__ = ["ItemBuilderControl", "ItemsRequestEvent"]
+
+MIN_ITEMS_OVERSCAN = 20
+"""
+Minimum number of items built before and after the ones shown by the client.
+"""
+
+
+@dataclass
+class ItemsRequestEvent(Event["ItemBuilderControl"]):
+    """
+    Payload for :attr:`flet.ItemBuilderControl.on_items_request` handlers.
+    """
+
+    start: int
+    """
+    Index of the first item built by the client.
+    """
+
+    stop: int
+    """
+    Index after the last item built by the client.
+    """
+
+
+@control(kw_only=True)
+class ItemBuilderControl(Control):
+    """
+    Shared item windowing for scrollable controls with a list of `controls`.
+
+    This mixin-style control is inherited by :class:`~flet.ListView` and
+    :class:`~flet.GridView`. Instead of a full list of `controls`, they can
+    be given an :attr:`item_count` and an :attr:`item_builder`: the client
+    then reports the range of items it shows as the user scrolls, and only
+    those items, plus some around them, are built and sent.
+
+    ```python
+    ft.ListView(
+        item_count=100_000,
+        item_builder=lambda i: ft.Text(f"Item {i}"),
+        item_extent=30,
+    )
+    ```
+
+    Built items are kept in a least recently used cache of
+    :attr:`item_cache_size` items, so scrolling back to them reuses the same
+    controls. Call :meth:`invalidate` after the data of items changes.
+    """
+
+    item_count: Optional[int] = None
+    """
+    The number of items built by :attr:`item_builder`.
+
+    If `None`, all :attr:`controls` are shown.
+    """
+
+    item_builder: Optional[Callable[[int], Control]] = field(
+        default=None, metadata={"skip": True}
+    )
+    """
+    A function returning the control of an item, given its index.
+
+    Called only for the items about to be shown, and at most once per item
+    until it is evicted from the cache or invalidated.
+    """
+
+    item_cache_size: int = field(default=500, metadata={"skip": True})
+    """
+    The maximum number of built items kept for reuse.
+
+    Items being shown are always kept, whatever this value.
+    """
+
+    items_offset: int = 0
+    """
+    The index of the item of the first of `controls`, when
+    :attr:`item_builder` is set.
+
+    Maintained by this control.
+    """
+
+    on_items_request: Optional[EventHandler[ItemsRequestEvent]] = None
+    """
+    Called when the client shows items that are not built, after they are.
+    """
+
+    def init(self):
+        super().init()
+        self.__items: OrderedDict[int, Control] = OrderedDict()
+        self.__visible = (0, 0)
+
+    def invalidate(self, items: Union[int, range, None] = None):
+        """
+        Discards built items so that :attr:`item_builder` is called again for
+        them, and updates this control.
+
+        Args:
+            items: The index or the range of indexes of the items to discard,
+                or `None` to discard all of them.
+        """
+        if items is None:
+            self.__items.clear()
+        elif isinstance(items, int):
+            self.__items.pop(items, None)
+        elif len(items) < len(self.__items):
+            for index in items:
+                self.__items.pop(index, None)
+        else:
+            for index in [i for i in self.__items if i in items]:
+                del self.__items[index]
+        self.update()
+
+    def before_event(self, e: ControlEvent):
+        if isinstance(e, ItemsRequestEvent):
+            self.__visible = (e.start, e.stop)
+            if self.item_builder is not None:
+                self.update()
+        return super().before_event(e)
+
+    def before_update(self):
+        super().before_update()
+        if self.item_builder is not None and self.item_count is not None:
+            self.__build_items()
+
+    def __build_items(self):
+        """
+        Sets `controls` to the items around the ones shown by the client.
+        """
+        count = max(self.item_count, 0)
+        start, stop = self.__visible
+        overscan = max((stop - start) // 2, MIN_ITEMS_OVERSCAN)
+        start = max(min(start, count) - overscan, 0)
+        stop = min(max(stop, start) + overscan, count)
+
+        cache = self.__items
+        controls = []
+        for index in range(start, stop):
+            item = cache.get(index)
+            if item is None:
+                item = self.item_builder(index)
+                cache[index] = item
+            else:
+                cache.move_to_end(index)
+            controls.append(item)
+        # Items just used are the most recent ones: the evicted ones are never
+        # shown.
+        while len(cache) > max(self.item_cache_size, len(controls)):
+            cache.popitem(last=False)
+
+        self.controls = controls
+        self.items_offset = start
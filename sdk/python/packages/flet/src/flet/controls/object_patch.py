@@ -38,6 +38,7 @@ from enum import Enum
 from typing import Any, Optional
 
 from flet.controls.keys import Key
+from flet.messaging.protocol import INTERNED_KEYS
 
 logger = logging.getLogger("flet_object_patch")
 logger.setLevel(logging.INFO)
@@ -352,8 +353,14 @@ class ObjectPatch:
 
         return cls(ops), added, removed
 
-    def to_message(self) -> list[Any]:
-        """Encode patch operations into the compact protocol message format."""
+    def to_message(self, intern_keys: bool = False) -> list[Any]:
+        """
+        Encode patch operations into the compact protocol message format.
+
+        Args:
+            intern_keys: Whether to intern the field names of paths, see
+                `configure_encode_object_for_msgpack()`.
+        """
         state = {"i": 0}
         paths = [state["i"]]
         state["i"] += 1
@@ -362,7 +369,7 @@ class ObjectPatch:
             """Encode a patch path into shared path-table coordinates."""
             node = paths
             parent = paths
-            parts = path
+            parts = [INTERNED_KEYS.get(p, p) for p in path] if intern_keys else path
             len_parts = len(parts)
             if len_parts == 0:
                 return [0, 0]  # root object
@@ -754,6 +754,25 @@ class Page(BasePage):
 
         self.schedule_update()
 
+    def batch(self):
+        """
+        Returns a context manager that sends all control updates made inside it \
+        as a single message.
+
+        Each updated control is diffed as usual, but the resulting patches are
+        sent to the client together, in one frame, when the block exits and are
+        applied by the client at once, so no intermediate state is rendered.
+
+        Example:
+            ```python
+            with page.batch():
+                for card in cards:
+                    card.title = "Updated"
+                    card.update()
+            ```
+        """
+        return self.session.batch()
+
     def __update(self, *controls: Control):
         """
         Send control patches for the provided controls.
@@ -762,8 +781,13 @@ class Page(BasePage):
             *controls: Controls whose updates should be sent to the client.
         """
 
-        for c in controls:
-            self.session.patch_control(c)
+        if len(controls) == 1:
+            self.session.patch_control(controls[0])
+            return
+
+        with self.session.batch():
+            for c in controls:
+                self.session.patch_control(c)
 
     def error(self, message: str) -> None:
         """
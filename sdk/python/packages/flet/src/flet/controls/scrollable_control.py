@@ -390,6 +390,7 @@ class ScrollableControl(Control):
         scroll_key: Union[ScrollKey, str, int, float, bool, None] = None,
         duration: DurationValue = 0,
         curve: AnimationCurve = AnimationCurve.EASE,
+        index: Optional[int] = None,
     ):
         """
         Moves the scroll position.
@@ -402,13 +403,20 @@ class ScrollableControl(Control):
             scroll_key: Key of the target control to scroll to.
             duration: The scroll animation duration.
             curve: The scroll animation curve.
+            index: Index of the item to scroll to, for :class:`~flet.ListView` and
+                :class:`~flet.GridView`, including items not built yet with
+                :attr:`~flet.ItemBuilderControl.item_builder`. The position is
+                exact for a `ListView` with :attr:`~flet.ListView.item_extent` and
+                no :attr:`~flet.ListView.spacing`, and for a `GridView`, and
+                estimated from the average item size otherwise.
 
         Notes:
-            - Exactly one of `offset`, `delta` or `scroll_key` should be provided.
+            - Exactly one of `offset`, `delta`, `scroll_key` or `index` should be
+                provided.
             - :attr:`auto_scroll` must be `False`.
-            - This method is ineffective for controls (e.g.
+            - `scroll_key` is ineffective for items of controls (e.g.
                 :class:`~flet.ListView`, :class:`~flet.GridView`) that build items \
-                dynamically.
+                dynamically and are not built yet: use `index` instead.
 
         Examples:
             ```python
@@ -416,6 +424,7 @@ class ScrollableControl(Control):
             await products.scroll_to(offset=-1, duration=1000)  # to the end
             await products.scroll_to(delta=50)  # forward 50px
             await products.scroll_to(scroll_key="item_20", duration=500)
+            await products.scroll_to(index=5_000)  # ListView or GridView item
             ```
         """
 
@@ -427,5 +436,6 @@ class ScrollableControl(Control):
                 "scroll_key": scroll_key,
                 "duration": duration,
                 "curve": curve,
+                "index": index,
             },
         )
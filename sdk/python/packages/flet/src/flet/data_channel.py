@@ -21,14 +21,24 @@ Allocation lives on the Dart side. The widget's Dart code calls
 The Python widget declares `on_data_channel_open:
 Optional[ft.EventHandler[DataChannelOpenEvent]] = None` and inside the
 handler calls `self.get_data_channel(e.channel_id)` to attach.
+
+Inbound frames are either pushed to a handler registered with `on_bytes()`
+or pulled with `recv_into()` / `async for frame in channel`. Muxed
+transports slice frames out of the receive buffer without copying, so a
+handler registered with `zero_copy=True` and the pull API see a
+`memoryview` over the transport's own buffer.
 """
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
+import threading
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import AsyncIterator, Sequence
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Callable, Union
 
 from flet.controls.control_event import Event
 
@@ -51,14 +61,45 @@ class DataChannelOpenEvent(Event["BaseControl"]):
     channel_id: int = 0
 
 
+DEFAULT_MAX_PENDING_FRAMES = 64
+"""Inbound frames a channel buffers for `recv_into()` before dropping the
+oldest ones."""
+
+Payload = Union[bytes, memoryview]
+
+
 class DataChannel(ABC):
     """Abstract widget-facing byte channel."""
 
+    def __init__(self) -> None:
+        self._handler: Callable[[Payload], None] | None = None
+        self._zero_copy = False
+        self._closed = False
+        self.max_pending_frames = DEFAULT_MAX_PENDING_FRAMES
+        self.dropped_frames = 0
+        # Outbound frames may be dropped or superseded by the transport's
+        # send queue policy (`FLET_SEND_QUEUE_POLICY`) under load. Only
+        # for channels whose receiver doesn't acknowledge every frame.
+        self.droppable = False
+        # Created by the first `recv_into()`; frames that arrive while
+        # nobody receives and no handler is set are dropped, as before.
+        self._pending: deque[Payload] | None = None
+        self._pending_ready: asyncio.Event | None = None
+        self._receiver_loop: asyncio.AbstractEventLoop | None = None
+        self._receiver_thread: int | None = None
+
     @abstractmethod
-    def on_bytes(self, handler: Callable[[bytes], None] | None) -> None:
+    def on_bytes(
+        self, handler: Callable[[Payload], None] | None, zero_copy: bool = False
+    ) -> None:
         """Register a handler for bytes pushed from Dart. Pass `None` to
         clear. The handler runs synchronously on whatever thread the
-        transport delivers from — push heavy work to a queue/worker."""
+        transport delivers from — push heavy work to a queue/worker.
+
+        With `zero_copy=True` the handler receives a read-only `memoryview`
+        over the transport's receive buffer instead of a `bytes` copy of
+        the payload. While a handler is set, frames are not available to
+        `recv_into()`."""
         ...
 
     @abstractmethod
@@ -66,11 +107,126 @@ class DataChannel(ABC):
         """Send bytes Python → Dart. Fire-and-forget."""
         ...
 
+    async def drain(self) -> None:
+        """Wait until the transport can take more frames. Await between
+        `send()` calls to be paced by a slow client instead of queueing
+        frames without bound. No-op on transports without a send queue."""
+        return
+
     @abstractmethod
     def close(self) -> None:
         """Release the channel. Idempotent."""
         ...
 
+    async def recv_into(self, buffer: bytearray | memoryview) -> int:
+        """Wait for the next inbound frame and copy it into `buffer`.
+
+        The payload is copied once, from the transport's receive buffer
+        straight into `buffer`, so a receiver that reuses its buffers
+        allocates nothing per frame.
+
+        Returns:
+            Number of bytes written to the start of `buffer`.
+
+        Raises:
+            ValueError: If the frame does not fit into `buffer`. The frame
+                stays queued, so the call can be retried with a larger one.
+            EOFError: If the channel is closed.
+        """
+        pending = await self._wait_pending()
+        frame = pending[0]
+        target = memoryview(buffer).cast("B")
+        size = len(frame)
+        if size > len(target):
+            raise ValueError(
+                f"Buffer of {len(target)} bytes is too small for a frame "
+                f"of {size} bytes"
+            )
+        target[:size] = frame
+        pending.popleft()
+        return size
+
+    async def frames(
+        self, buffers: Sequence[bytearray | memoryview] | None = None
+    ) -> AsyncIterator[memoryview]:
+        """Iterate over inbound frames until the channel is closed.
+
+        Without `buffers`, each frame is yielded as a `memoryview` over the
+        transport's receive buffer. With `buffers`, frames are received
+        into them in turn with `recv_into()` and yielded as views of the
+        filled part — a view stays valid until its buffer is reused,
+        `len(buffers)` frames later.
+
+        Args:
+            buffers: Reusable receive buffers, each large enough for the
+                largest expected frame.
+        """
+        index = 0
+        while True:
+            try:
+                if not buffers:
+                    pending = await self._wait_pending()
+                    yield memoryview(pending.popleft())
+                    continue
+                buffer = buffers[index]
+                index = (index + 1) % len(buffers)
+                size = await self.recv_into(buffer)
+            except EOFError:
+                return
+            yield memoryview(buffer)[:size]
+
+    def __aiter__(self) -> AsyncIterator[memoryview]:
+        return self.frames()
+
+    def _start_receiving(self) -> None:
+        """Start buffering inbound frames for `recv_into()`."""
+        self._pending = deque()
+        self._pending_ready = asyncio.Event()
+        self._receiver_loop = asyncio.get_running_loop()
+        self._receiver_thread = threading.get_ident()
+
+    async def _wait_pending(self) -> deque[Payload]:
+        if self._pending is None:
+            self._start_receiving()
+        pending = self._pending
+        ready = self._pending_ready
+        assert pending is not None and ready is not None
+        while not pending:
+            if self._closed:
+                raise EOFError("DataChannel is closed")
+            ready.clear()
+            await ready.wait()
+        return pending
+
+    def _enqueue(self, payload: Payload) -> None:
+        """Buffer an inbound frame for `recv_into()`. Safe to call from
+        any thread."""
+        if self._receiver_thread == threading.get_ident():
+            self._append_pending(payload)
+        elif self._receiver_loop is not None:
+            self._receiver_loop.call_soon_threadsafe(self._append_pending, payload)
+
+    def _append_pending(self, payload: Payload) -> None:
+        pending = self._pending
+        if pending is None or self._closed:
+            return
+        if len(pending) >= self.max_pending_frames:
+            pending.popleft()
+            self.dropped_frames += 1
+        pending.append(payload)
+        assert self._pending_ready is not None
+        self._pending_ready.set()
+
+    def _stop_receiving(self) -> None:
+        """Wake pending `recv_into()` calls after the channel is closed."""
+        if self._pending_ready is None:
+            return
+        if self._receiver_thread == threading.get_ident():
+            self._pending_ready.set()
+        elif self._receiver_loop is not None:
+            with contextlib.suppress(RuntimeError):  # loop already closed
+                self._receiver_loop.call_soon_threadsafe(self._pending_ready.set)
+
 
 class _DartBridgeDataChannel(DataChannel):
     """Embedded native mode: bytes flow over a dedicated PythonBridge port.
@@ -80,14 +236,32 @@ class _DartBridgeDataChannel(DataChannel):
     def __init__(self, port: int) -> None:
         import dart_bridge  # type: ignore — built-in module from libdart_bridge
 
+        super().__init__()
         self._port = port
         self._dart_bridge = dart_bridge
-        self._handler: Callable[[bytes], None] | None = None
-        self._closed = False
 
-    def on_bytes(self, handler: Callable[[bytes], None] | None) -> None:
+    def on_bytes(
+        self, handler: Callable[[Payload], None] | None, zero_copy: bool = False
+    ) -> None:
         self._handler = handler
-        self._dart_bridge.set_enqueue_handler_func(self._port, handler)
+        self._zero_copy = zero_copy
+        self.__register()
+
+    def _start_receiving(self) -> None:
+        super()._start_receiving()
+        self.__register()
+
+    def __register(self) -> None:
+        # dart_bridge hands over a fresh `bytes` object per frame, so a
+        # memoryview over it costs no copy.
+        handler = self._handler
+        if handler is not None and self._zero_copy:
+            native = lambda payload: handler(memoryview(payload))  # noqa: E731
+        elif handler is None and self._pending is not None:
+            native = self._enqueue
+        else:
+            native = handler
+        self._dart_bridge.set_enqueue_handler_func(self._port, native)
 
     def send(self, payload: bytes) -> None:
         if self._closed:
@@ -98,10 +272,11 @@ class _DartBridgeDataChannel(DataChannel):
         if self._closed:
             return
         self._closed = True
-        if self._handler is not None:
+        if self._handler is not None or self._pending is not None:
             with contextlib.suppress(Exception):
                 self._dart_bridge.set_enqueue_handler_func(self._port, None)
             self._handler = None
+        self._stop_receiving()
 
 
 class _ProtocolMuxedDataChannel(DataChannel):
@@ -111,34 +286,44 @@ class _ProtocolMuxedDataChannel(DataChannel):
     """
 
     def __init__(self, channel_id: int, conn: Connection) -> None:
+        super().__init__()
         self._id = channel_id
         self._conn = conn
-        self._handler: Callable[[bytes], None] | None = None
-        self._closed = False
 
-    def on_bytes(self, handler: Callable[[bytes], None] | None) -> None:
+    def on_bytes(
+        self, handler: Callable[[Payload], None] | None, zero_copy: bool = False
+    ) -> None:
         self._handler = handler
+        self._zero_copy = zero_copy
 
     def send(self, payload: bytes) -> None:
         if self._closed:
             return
         # Connection knows the wire format for its transport (length
         # prefix on stream transports, none on message transports).
-        self._conn.send_data_channel_frame(self._id, payload)
+        self._conn.send_data_channel_frame(self._id, payload, self.droppable)
+
+    async def drain(self) -> None:
+        await self._conn.drain()
 
-    def _deliver(self, payload: bytes) -> None:
+    def _deliver(self, payload: Payload) -> None:
+        """Route an inbound payload, usually a view into the transport's
+        receive buffer, to the handler or the `recv_into()` queue."""
         if self._closed:
             return
         handler = self._handler
-        if handler is not None:
-            try:
-                handler(payload)
-            except Exception:
-                import logging
+        if handler is None:
+            if self._pending is not None:
+                self._append_pending(payload)
+            return
+        try:
+            handler(payload if self._zero_copy else bytes(payload))
+        except Exception:
+            import logging
 
-                logging.getLogger("flet").exception(
-                    "DataChannel handler raised; channel id=%s", self._id
-                )
+            logging.getLogger("flet").exception(
+                "DataChannel handler raised; channel id=%s", self._id
+            )
 
     def close(self) -> None:
         if self._closed:
@@ -151,3 +336,4 @@ class _ProtocolMuxedDataChannel(DataChannel):
             with contextlib.suppress(Exception):
                 unreg(self._id)
         self._handler = None
+        self._stop_receiving()
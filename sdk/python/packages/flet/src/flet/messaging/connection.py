@@ -3,8 +3,14 @@ from asyncio import AbstractEventLoop
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
 
-from flet.messaging.protocol import ClientMessage
+from flet.messaging.frame_compression import (
+    FRAME_COMPRESSION_FEATURE,
+    FrameCompressor,
+)
+from flet.messaging.protocol import KEY_INTERNING_FEATURE, ClientMessage
+from flet.messaging.send_queue import SendQueueStats
 from flet.pubsub.pubsub_hub import PubSubHub
+from flet.utils.platform_utils import get_bool_env_var
 
 logger = logging.getLogger("flet")
 
@@ -26,6 +32,10 @@ class Connection:
         # speed. Widgets may use this to prefer uncompressed payloads over
         # encoded ones.
         self.local_data_transport: bool = False
+        # Optional protocol features enabled for the connected client, see
+        # configure_protocol().
+        self.intern_keys: bool = False
+        self.frame_compressor: Optional[FrameCompressor] = None
         self.__pubsubhub = None
         self.__loop: Optional[AbstractEventLoop] = None
         self.__executor: Optional[ThreadPoolExecutor] = None
@@ -87,6 +97,29 @@ class Connection:
     def pubsubhub(self, value: PubSubHub):
         self.__pubsubhub = value
 
+    def configure_protocol(self, features: Optional[list[str]]):
+        """
+        Enables the optional protocol features supported by the client.
+
+        Field names are interned for clients supporting it. Frames are
+        compressed for clients supporting it, unless the client runs on the
+        same machine (see `local_data_transport`) or as set with
+        `FLET_PROTOCOL_COMPRESSION` environment variable.
+
+        Args:
+            features: Protocol features announced by the client on registration.
+        """
+        features = features or []
+        self.intern_keys = KEY_INTERNING_FEATURE in features
+        compress = get_bool_env_var("FLET_PROTOCOL_COMPRESSION")
+        if compress is None:
+            compress = not self.local_data_transport
+        self.frame_compressor = (
+            FrameCompressor()
+            if compress and FRAME_COMPRESSION_FEATURE in features
+            else None
+        )
+
     def send_message(self, message: ClientMessage):
         """
         Sends a message to the connected Flet client.
@@ -96,6 +129,39 @@ class Connection:
         """
         raise NotImplementedError()
 
+    def send_encoded_message(self, data: bytes):
+        """
+        Sends a message already encoded with MessagePack to the connected client.
+
+        Used by sessions that sequence and buffer their outbound messages for
+        replay.
+
+        Args:
+            data: MessagePack-encoded message.
+        """
+        raise NotImplementedError()
+
+    @property
+    def send_queue_stats(self) -> Optional[SendQueueStats]:
+        """
+        Returns metrics of the outbound frame queue.
+
+        Returns:
+            Queue depth, bytes in flight and related counters, or `None` if the
+            transport does not queue outbound frames or no client is connected.
+        """
+        return None
+
+    async def drain(self):
+        """
+        Waits until the outbound queue falls below its high-water mark.
+
+        Producers of bulk data (e.g. DataChannel frames) can await this
+        between sends to be paced by a slow client. Returns immediately on
+        transports without an outbound queue.
+        """
+        pass
+
     def get_upload_url(self, file_name: str, expires: int) -> str:
         """
         Returns an upload URL for built-in file upload storage.
@@ -146,11 +212,14 @@ class Connection:
             "(transport-specific implementation missing)."
         )
 
-    def send_data_channel_frame(self, channel_id: int, payload: bytes) -> None:
+    def send_data_channel_frame(
+        self, channel_id: int, payload: bytes, droppable: bool = False
+    ) -> None:
         """Send a raw DataChannel frame for `channel_id`. Used by the
         protocol-muxed implementation only — dart_bridge channels go
         through their own dedicated `dart_bridge.send_bytes(port, ...)`
-        call instead.
+        call instead. A `droppable` frame may be dropped or superseded by
+        the transport's send queue policy under load.
         """
         raise NotImplementedError(
             f"{type(self).__name__} does not implement send_data_channel_frame."
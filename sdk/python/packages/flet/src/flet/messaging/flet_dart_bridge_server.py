@@ -39,10 +39,10 @@ from flet.messaging.protocol import (
     ClientMessage,
     ControlEventBody,
     InvokeMethodResponseBody,
+    MessagePacker,
     RegisterClientRequestBody,
     RegisterClientResponseBody,
     UpdateControlPropsBody,
-    configure_encode_object_for_msgpack,
     decode_ext_from_msgpack,
 )
 from flet.messaging.session import Session
@@ -82,6 +82,7 @@ class FletDartBridgeServer(Connection):
         self.__inbound_queue: asyncio.Queue[bytes] = asyncio.Queue()
         self.__inbound_task: Optional[asyncio.Task] = None
         self.__running_tasks: set[asyncio.Task] = set()
+        self.__packer = MessagePacker(BaseControl)
         # In-process transport — DataChannel bytes move at memcpy speed.
         self.local_data_transport = True
         self.loop = loop
@@ -226,10 +227,7 @@ class FletDartBridgeServer(Connection):
         length prefix (the bridge preserves message boundaries).
         """
         transport_log.debug("send_message: %s", message)
-        body = msgpack.packb(
-            [message.action, message.body],
-            default=configure_encode_object_for_msgpack(BaseControl),
-        )
+        body = self.__packer.pack([message.action, message.body])
         packet = b"\x00" + body
         try:
             dart_bridge.send_bytes(self.__port, packet)
@@ -19,12 +19,13 @@ from flet.messaging.protocol import (
     ClientMessage,
     ControlEventBody,
     InvokeMethodResponseBody,
+    MessagePacker,
     RegisterClientRequestBody,
     RegisterClientResponseBody,
     UpdateControlPropsBody,
-    configure_encode_object_for_msgpack,
     decode_ext_from_msgpack,
 )
+from flet.messaging.send_queue import SendQueue, SendQueuePolicy, SendQueueStats
 from flet.messaging.session import Session
 from flet.pubsub.pubsub_hub import PubSubHub
 from flet.utils import get_free_tcp_port, is_windows, random_string
@@ -54,6 +55,8 @@ class FletSocketServer(Connection):
         before_main: Optional["AppCallable"] = None,
         blocking: bool = False,
         executor: Optional[ThreadPoolExecutor] = None,
+        send_queue_high_water_mark: Optional[int] = None,
+        send_queue_policy: Optional[SendQueuePolicy] = None,
     ):
         super().__init__()
         self.__server = None
@@ -64,13 +67,16 @@ class FletSocketServer(Connection):
         self.__connection_lock = asyncio.Lock()
         self.__connection_token = 0
         self.session = None
-        self.__send_queue: asyncio.Queue[bytes] | None = None
+        self.__send_queue: SendQueue | None = None
+        self.__send_queue_high_water_mark = send_queue_high_water_mark
+        self.__send_queue_policy = send_queue_policy
         self.__port = port
         self.__uds_path = uds_path
         self.__on_session_created = on_session_created
         self.__before_main = before_main
         self.__blocking = blocking
         self.__running_tasks = set()
+        self.__packer = MessagePacker(BaseControl)
         # DataChannel mux registry. Keyed by channel_id minted on the Dart
         # side; populated lazily on the first Control.get_data_channel(id)
         # call. Frames for unknown ids are silently dropped.
@@ -147,7 +153,9 @@ class FletSocketServer(Connection):
             self.__connection_token += 1
             connection_token = self.__connection_token
             self.__writer = writer
-            send_queue: asyncio.Queue[bytes] = asyncio.Queue()
+            send_queue = SendQueue(
+                self.__send_queue_high_water_mark, self.__send_queue_policy
+            )
             self.__send_queue = send_queue
 
             logger.debug("Connected new socket client")
@@ -240,6 +248,8 @@ class FletSocketServer(Connection):
 
         old_writer = self.__writer
         self.__writer = None
+        if self.__send_queue is not None:
+            self.__send_queue.close()
         self.__send_queue = None
         self.__connected = False
 
@@ -283,15 +293,17 @@ class FletSocketServer(Connection):
                 if self.__connection_token != connection_token:
                     return
                 ptype = packet[0]
+                # Slices of a memoryview don't copy the packet.
+                view = memoryview(packet)
                 if ptype == 0x00:
-                    msg = msgpack.unpackb(packet[1:], ext_hook=decode_ext_from_msgpack)
+                    msg = msgpack.unpackb(view[1:], ext_hook=decode_ext_from_msgpack)
                     await self.__on_message(msg)
                 elif ptype == 0x01:
                     if len(packet) < 5:
                         logger.debug("Dropping malformed data-channel frame.")
                         continue
                     channel_id = int.from_bytes(packet[1:5], "little", signed=False)
-                    self.__on_data_channel_frame(channel_id, packet[5:])
+                    self.__on_data_channel_frame(channel_id, view[5:])
                 else:
                     logger.debug("Dropping packet with unknown type 0x%02x", ptype)
         except asyncio.CancelledError:
@@ -301,7 +313,7 @@ class FletSocketServer(Connection):
         finally:
             logger.debug("Receive loop exiting.")
 
-    def __on_data_channel_frame(self, channel_id: int, payload: bytes) -> None:
+    def __on_data_channel_frame(self, channel_id: int, payload: memoryview) -> None:
         """Routes an inbound `[0x01][channel_id][payload]` frame to its
         registered DataChannel. Silently drops frames for unknown ids
         (handles unmount races)."""
@@ -312,27 +324,33 @@ class FletSocketServer(Connection):
     async def __send_loop(
         self,
         writer: asyncio.StreamWriter,
-        send_queue: asyncio.Queue[bytes],
+        send_queue: SendQueue,
         connection_token: int,
     ):
         """
         Sends outbound frames from the queue to the active socket writer.
 
-        The loop exits when the connection token changes (connection replaced) or
-        when cancelled.
+        All frames queued since the previous wakeup are written with a single
+        vectored write followed by one `drain()`.
+
+        The loop exits when the connection token changes (connection replaced),
+        the queue is closed or when cancelled.
 
         Args:
             writer: Socket writer used to send bytes.
-            send_queue: Queue of pre-encoded MsgPack frames.
+            send_queue: Queue of length-prefixed frames.
             connection_token: Token identifying the connection generation.
         """
         try:
             while True:
                 if self.__connection_token != connection_token:
                     return
-                message = await send_queue.get()
-                writer.write(message)
+                frames = await send_queue.get_batch()
+                if frames is None:
+                    return
+                writer.writelines(frames)
                 await writer.drain()
+                send_queue.sent(len(frames), sum(map(len, frames)))
         except asyncio.CancelledError:
             logger.debug("Send loop cancelled.")
         except Exception as e:
@@ -363,6 +381,7 @@ class FletSocketServer(Connection):
         task = None
         if action == ClientAction.REGISTER_CLIENT:
             req = RegisterClientRequestBody(**body)
+            self.configure_protocol(req.features)
 
             # create new session
             self.session = Session(self)
@@ -435,16 +454,34 @@ class FletSocketServer(Connection):
             message: Protocol message to send.
         """
         transport_log.debug("send_message: %s", message)
-        body = msgpack.packb(
-            [message.action, message.body],
-            default=configure_encode_object_for_msgpack(BaseControl),
+        self.send_encoded_message(
+            self.__packer.pack(
+                [message.action, message.body], intern_keys=self.intern_keys
+            )
         )
-        packet = b"\x00" + body
-        framed = len(packet).to_bytes(4, "little", signed=False) + packet
+
+    def send_encoded_message(self, data: bytes):
+        """
+        Queues an outbound MsgPack-encoded message as
+        `[length:u32 LE][0x00][data]`, or, with frame compression enabled, as
+        `[length:u32 LE][0x03][deflated 0x00 packet]` if large enough.
+
+        Args:
+            data: MsgPack-encoded message.
+        """
+        if self.frame_compressor is not None:
+            packet = self.frame_compressor.compress(b"\x00" + data)
+            framed = len(packet).to_bytes(4, "little", signed=False) + packet
+        else:
+            framed = b"".join(
+                [(1 + len(data)).to_bytes(4, "little", signed=False), b"\x00", data]
+            )
         if self.__send_queue is not None:
-            self.__send_queue.put_nowait(framed)
+            self.__send_queue.put(framed)
 
-    def send_data_channel_frame(self, channel_id: int, payload: bytes) -> None:
+    def send_data_channel_frame(
+        self, channel_id: int, payload: bytes, droppable: bool = False
+    ) -> None:
         """Send a raw DataChannel frame `[length][0x01][channel_id:u32 LE][bytes]`.
         Called by `_ProtocolMuxedDataChannel.send` on the Python side."""
         # Single-copy assembly — sequential concats would copy the
@@ -458,7 +495,15 @@ class FletSocketServer(Connection):
             ]
         )
         if self.__send_queue is not None:
-            self.__send_queue.put_nowait(framed)
+            self.__send_queue.put(framed, channel_id, droppable)
+
+    @property
+    def send_queue_stats(self) -> Optional[SendQueueStats]:
+        return self.__send_queue.stats if self.__send_queue is not None else None
+
+    async def drain(self):
+        if self.__send_queue is not None:
+            await self.__send_queue.drain()
 
     def data_channel_for(self, channel_id: int):
         """Resolve or construct the muxed DataChannel for `channel_id`.
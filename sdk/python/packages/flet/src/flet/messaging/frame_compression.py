@@ -0,0 +1,170 @@
+"""
+Compression of outbound protocol frames with a preset dictionary.
+
+Frames are compressed one at a time, with raw deflate primed with
+`PROTOCOL_DICTIONARY`, a dictionary trained from representative Flet messages
+and shipped with the client. Each frame can be decompressed on its own, so
+compressed frames can be bundled, dropped or replayed like any other frame.
+"""
+
+import heapq
+import zlib
+from collections import Counter
+from collections.abc import Iterable
+
+from flet.messaging.protocol_dictionary import PROTOCOL_DICTIONARY
+
+__all__ = [
+    "COMPRESSED_PACKET_TYPE",
+    "FRAME_COMPRESSION_FEATURE",
+    "MIN_COMPRESS_SIZE",
+    "FrameCompressor",
+    "decompress_packet",
+    "train_dictionary",
+]
+
+FRAME_COMPRESSION_FEATURE = "deflate1"
+"""
+Protocol feature announced by clients that decompress `COMPRESSED_PACKET_TYPE`
+packets with `PROTOCOL_DICTIONARY`.
+"""
+
+COMPRESSED_PACKET_TYPE = 0x03
+"""
+Type byte of a packet carrying another packet, `[type:u8][payload]`,
+compressed with raw deflate and `PROTOCOL_DICTIONARY`.
+"""
+
+MIN_COMPRESS_SIZE = 128
+"""
+Size, in bytes, of the smallest packet worth compressing.
+"""
+
+
+class FrameCompressor:
+    """
+    Compresses outbound packets above a size threshold.
+
+    Args:
+        min_size: Size of the smallest packet to compress, in bytes.
+        level: zlib compression level, from `1` (fastest) to `9` (smallest).
+        dictionary: Preset dictionary, must be the one used by the client.
+    """
+
+    def __init__(
+        self,
+        min_size: int = MIN_COMPRESS_SIZE,
+        level: int = 6,
+        dictionary: bytes = PROTOCOL_DICTIONARY,
+    ):
+        self.min_size = min_size
+        # Priming a compressor with the dictionary is not free; copying a
+        # primed one is.
+        self.__compressor = zlib.compressobj(
+            level, zlib.DEFLATED, -zlib.MAX_WBITS, zdict=dictionary
+        )
+        self.packets_compressed = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def compress(self, packet: bytes) -> bytes:
+        """
+        Compresses `packet` if it is large enough and compression makes it
+        smaller.
+
+        Args:
+            packet: Outbound packet, `[type:u8][payload]`.
+
+        Returns:
+            `[COMPRESSED_PACKET_TYPE][deflated packet]`, or `packet` as is.
+        """
+        if len(packet) < self.min_size:
+            return packet
+        compressor = self.__compressor.copy()
+        compressed = compressor.compress(packet) + compressor.flush()
+        if len(compressed) + 1 >= len(packet):
+            return packet
+        self.packets_compressed += 1
+        self.bytes_in += len(packet)
+        self.bytes_out += len(compressed) + 1
+        return bytes([COMPRESSED_PACKET_TYPE]) + compressed
+
+
+def decompress_packet(packet: bytes, dictionary: bytes = PROTOCOL_DICTIONARY) -> bytes:
+    """
+    Restores the packet carried by a `COMPRESSED_PACKET_TYPE` packet.
+
+    Args:
+        packet: Compressed packet, including its type byte.
+        dictionary: Preset dictionary the packet was compressed with.
+
+    Returns:
+        The original packet.
+    """
+    decompressor = zlib.decompressobj(-zlib.MAX_WBITS, zdict=dictionary)
+    return decompressor.decompress(packet[1:]) + decompressor.flush()
+
+
+def train_dictionary(
+    samples: Iterable[bytes],
+    size: int = 16 * 1024,
+    segment_size: int = 32,
+    k: int = 6,
+) -> bytes:
+    """
+    Builds a preset dictionary from sample frames.
+
+    Greedily picks the segments of the samples covering the most frequent
+    `k`-byte substrings not covered yet, with the most useful segments at the
+    end of the dictionary, where deflate references them with the shortest
+    distances.
+
+    Args:
+        samples: Representative encoded frames.
+        size: Maximum dictionary size, in bytes. deflate only uses the last
+            32 KiB.
+        segment_size: Size of dictionary segments, in bytes.
+        k: Size of the substrings whose frequency is counted, in bytes.
+
+    Returns:
+        Dictionary bytes.
+    """
+    samples = list(samples)
+    frequency: Counter[bytes] = Counter()
+    for sample in samples:
+        frequency.update({sample[i : i + k] for i in range(len(sample) - k + 1)})
+
+    segments: dict[bytes, frozenset[bytes]] = {}
+    step = max(1, segment_size // 4)
+    for sample in samples:
+        for start in range(0, max(1, len(sample) - segment_size + 1), step):
+            segment = sample[start : start + segment_size]
+            if segment not in segments:
+                segments[segment] = frozenset(
+                    segment[i : i + k] for i in range(len(segment) - k + 1)
+                )
+
+    def score(kmers: frozenset[bytes]) -> int:
+        # substrings found in one sample only are not worth a dictionary slot
+        return sum(f for f in map(frequency.__getitem__, kmers) if f > 1)
+
+    heap = [(-score(kmers), segment) for segment, kmers in segments.items()]
+    heapq.heapify(heap)
+    chosen: list[bytes] = []
+    total = 0
+    while heap and total < size:
+        negative_score, segment = heapq.heappop(heap)
+        current = score(segments[segment])
+        if current <= 0:
+            continue
+        if current < -negative_score:
+            # stale score, re-queue with the current one
+            heapq.heappush(heap, (-current, segment))
+            continue
+        chosen.append(segment)
+        total += len(segment)
+        for kmer in segments[segment]:
+            frequency[kmer] = 0
+
+    dictionary = b"".join(reversed(chosen))
+    return dictionary[-size:]
@@ -1,7 +1,10 @@
+import contextlib
 import datetime
-from dataclasses import dataclass, fields, is_dataclass
+import functools
+import threading
+from dataclasses import dataclass, fields
 from enum import Enum
-from typing import Any
+from typing import Any, Optional
 
 import msgpack
 
@@ -23,7 +26,394 @@ def _get_root_dataclass_field(cls, field_name):
     return None
 
 
-def configure_encode_object_for_msgpack(control_cls):
+_ENCODE_PLAN_ATTR = "__flet_encode_plan__"
+_FIELDS = "__dataclass_fields__"
+_SCALAR_TYPES = frozenset({str, int, float, bool})
+_ENCODED_ATTR = "__flet_encoded__"
+_ENCODED_INTERNED_ATTR = "__flet_encoded_interned__"
+
+EXT_TYPE_MSGPACK = 5
+"""MsgPack extension type carrying an embedded, pre-encoded MsgPack value."""
+
+EXT_TYPE_KEY = 6
+"""MsgPack extension type carrying the 1-byte index of a `PROTOCOL_KEYS` string."""
+
+KEY_INTERNING_FEATURE = "keys1"
+"""
+Protocol feature announced by clients that decode `EXT_TYPE_KEY` values with
+the `PROTOCOL_KEYS` table.
+"""
+
+PROTOCOL_KEYS: tuple[str, ...] = (
+    # messages
+    "session_id",
+    "page_patch",
+    "error",
+    "last_seq",
+    "patch",
+    "patches",
+    "control_id",
+    "call_id",
+    "name",
+    "args",
+    "result",
+    "target",
+    "data",
+    "props",
+    # page
+    "_internals",
+    "_overlay",
+    "_dialogs",
+    "_services",
+    "views",
+    "route",
+    "media",
+    "padding",
+    "view_padding",
+    "view_insets",
+    "device_pixel_ratio",
+    "orientation",
+    "always_use_24_hour_format",
+    "window",
+    "platform",
+    "platform_brightness",
+    "width",
+    "height",
+    "title",
+    "theme",
+    "dark_theme",
+    "theme_mode",
+    "locale_configuration",
+    "host_expanded",
+    "host_positioned",
+    "skip_properties",
+    # common control properties
+    "key",
+    "uid",
+    "value",
+    "content",
+    "controls",
+    "expand",
+    "expand_loose",
+    "opacity",
+    "visible",
+    "disabled",
+    "tooltip",
+    "badge",
+    "left",
+    "top",
+    "right",
+    "bottom",
+    "margin",
+    "scale",
+    "offset",
+    "rotate",
+    "align",
+    "alignment",
+    "aspect_ratio",
+    "animate_opacity",
+    "animate_size",
+    "animate_position",
+    "animate_scale",
+    "bgcolor",
+    "color",
+    "icon",
+    "icon_color",
+    "icon_size",
+    "label",
+    "text",
+    "size",
+    "weight",
+    "style",
+    "text_style",
+    "text_align",
+    "font_family",
+    "italic",
+    "max_lines",
+    "overflow",
+    "selectable",
+    "spans",
+    "spacing",
+    "run_spacing",
+    "wrap",
+    "tight",
+    "scroll",
+    "auto_scroll",
+    "horizontal_alignment",
+    "vertical_alignment",
+    "border",
+    "border_radius",
+    "border_color",
+    "border_width",
+    "shape",
+    "elevation",
+    "shadow",
+    "shadows",
+    "gradient",
+    "image",
+    "blur",
+    "clip_behavior",
+    "ink",
+    "animate",
+    "leading",
+    "trailing",
+    "subtitle",
+    "actions",
+    "selected",
+    "selected_index",
+    "destinations",
+    "options",
+    "items",
+    "item_extent",
+    "item_count",
+    "first_item_prototype",
+    "divider_thickness",
+    "build_controls_on_demand",
+    "hint_text",
+    "helper",
+    "counter",
+    "prefix",
+    "suffix",
+    "prefix_icon",
+    "suffix_icon",
+    "password",
+    "can_reveal_password",
+    "multiline",
+    "min_lines",
+    "read_only",
+    "autofocus",
+    "filled",
+    "fill_color",
+    "dense",
+    "src",
+    "fit",
+    "url",
+    "semantics_label",
+    "adaptive",
+    "active_color",
+    "check_color",
+    "thumb_color",
+    "min",
+    "max",
+    "divisions",
+    "open",
+    "modal",
+    "duration",
+    "bar_height",
+    "radius",
+    "stroke_width",
+    "center",
+    "runs_count",
+    "max_extent",
+    "child_aspect_ratio",
+    "col",
+    "columns",
+    "rows",
+    "cells",
+    "mouse_cursor",
+    "on_click",
+    "on_change",
+    "on_submit",
+    "on_focus",
+    "on_blur",
+    "on_hover",
+    "on_long_press",
+    "on_tap",
+    "on_dismiss",
+    "on_scroll",
+    "on_select",
+    "on_size_change",
+    "on_animation_end",
+    # control types
+    "Page",
+    "View",
+    "Overlay",
+    "Dialogs",
+    "ServiceRegistry",
+    "Window",
+    "Text",
+    "TextSpan",
+    "Icon",
+    "Image",
+    "Container",
+    "Column",
+    "Row",
+    "Stack",
+    "ListView",
+    "GridView",
+    "ResponsiveRow",
+    "SafeArea",
+    "Card",
+    "Divider",
+    "VerticalDivider",
+    "ListTile",
+    "ExpansionTile",
+    "AppBar",
+    "BottomAppBar",
+    "NavigationBar",
+    "NavigationBarDestination",
+    "NavigationRail",
+    "NavigationRailDestination",
+    "NavigationDrawer",
+    "NavigationDrawerDestination",
+    "Tabs",
+    "Tab",
+    "TabBar",
+    "TabBarView",
+    "Button",
+    "ElevatedButton",
+    "FilledButton",
+    "FilledTonalButton",
+    "OutlinedButton",
+    "TextButton",
+    "IconButton",
+    "FloatingActionButton",
+    "PopupMenuButton",
+    "PopupMenuItem",
+    "TextField",
+    "Dropdown",
+    "DropdownOption",
+    "Checkbox",
+    "Radio",
+    "RadioGroup",
+    "Switch",
+    "Slider",
+    "Chip",
+    "CircleAvatar",
+    "ProgressBar",
+    "ProgressRing",
+    "AlertDialog",
+    "BottomSheet",
+    "SnackBar",
+    "Banner",
+    "DataTable",
+    "DataColumn",
+    "DataRow",
+    "DataCell",
+    "GestureDetector",
+    "Markdown",
+    "AnimatedSwitcher",
+    "SearchBar",
+    "MenuBar",
+    "SubmenuButton",
+    "MenuItemButton",
+)
+"""
+Field names, message keys and control type names replaced by key-interning
+encoders with an `EXT_TYPE_KEY` value holding their index in this table, see
+`configure_encode_object_for_msgpack()`.
+
+The table is shared with the Dart client, so entries must only be appended,
+and `KEY_INTERNING_FEATURE` bumped when the table changes.
+"""
+
+INTERNED_KEYS = {
+    key: msgpack.ExtType(EXT_TYPE_KEY, bytes([index]))
+    for index, key in enumerate(PROTOCOL_KEYS)
+}
+"""
+Interned `EXT_TYPE_KEY` value of each key in `PROTOCOL_KEYS`.
+"""
+
+
+class _EncodePlan:
+    """
+    Per-class encoding metadata, resolved once per dataclass type.
+
+    `fast` plans (for `@control`/`@value` types) hold the event fields, root
+    defaults, subclass default overrides and `(name, scalar_default)` pairs of
+    structural fields; plain dataclass plans hold `(name, is_event, default)`
+    tuples of their serializable fields.
+    """
+
+    __slots__ = (
+        "is_control",
+        "fast",
+        "event_fields",
+        "root_defaults",
+        "override_props",
+        "structural_fields",
+        "fields",
+    )
+
+    def __init__(self, cls, control_cls):
+        self.is_control = issubclass(cls, control_cls)
+        structural_fields = getattr(cls, "_structural_fields", None)
+        self.fast = structural_fields is not None and (
+            self.is_control or issubclass(cls, Value)
+        )
+        self.event_fields = getattr(cls, "_event_fields", frozenset())
+        self.root_defaults = getattr(cls, "_root_defaults", {})
+        self.override_props = tuple(getattr(cls, "_override_props", {}).items())
+
+        dc_fields = cls.__dataclass_fields__
+        self.structural_fields = []
+        for fname in structural_fields or ():
+            fmeta = dc_fields.get(fname)
+            default_value = fmeta.default if fmeta is not None else _UNSET
+            root_field = _get_root_dataclass_field(cls, fname)
+            if root_field is not None:
+                default_value = root_field.default
+            self.structural_fields.append((fname, default_value))
+
+        self.fields = []
+        for field in fields(cls):
+            if "skip" in field.metadata:
+                continue
+            default_value = field.default
+            if self.is_control:
+                root_field = _get_root_dataclass_field(cls, field.name)
+                if root_field is not None:
+                    default_value = root_field.default
+            is_event = field.name.startswith("on_") and field.metadata.get(
+                "event", True
+            )
+            self.fields.append((field.name, is_event, default_value))
+
+
+def _get_encode_plan(cls, control_cls) -> _EncodePlan:
+    """
+    Returns the encoding plan of dataclass `cls`, building it on first use.
+
+    The plan is stored in the class's own `__dict__`, so subclasses (and classes
+    re-created under the same name) get their own.
+    """
+    plan = cls.__dict__.get(_ENCODE_PLAN_ATTR)
+    if plan is None:
+        plan = _EncodePlan(cls, control_cls)
+        with contextlib.suppress(AttributeError, TypeError):
+            setattr(cls, _ENCODE_PLAN_ATTR, plan)
+    return plan
+
+
+def _is_frozen(obj) -> bool:
+    return "_frozen" in getattr(obj, "__dict__", ()) or hasattr(obj, "_frozen")
+
+
+def _is_frozen_value(v) -> bool:
+    return hasattr(type(v), _FIELDS) and _is_frozen(v)
+
+
+def _intern_keys(r: dict) -> dict:
+    """
+    Replaces the `PROTOCOL_KEYS` keys of encoded dataclass dictionary `r`, and
+    of its control internals, and its control type name with their
+    `EXT_TYPE_KEY` values.
+    """
+    interned = {INTERNED_KEYS.get(k, k): v for k, v in r.items()}
+    control_type = r.get("_c")
+    if control_type is not None:
+        interned["_c"] = INTERNED_KEYS.get(control_type, control_type)
+    internals = r.get("_internals")
+    if internals:
+        interned[INTERNED_KEYS["_internals"]] = {
+            INTERNED_KEYS.get(k, k): v for k, v in internals.items()
+        }
+    return interned
+
+
+@functools.cache
+def configure_encode_object_for_msgpack(control_cls, intern_keys: bool = False):
     """
     Builds an object encoder callback for Flet's MessagePack transport.
 
@@ -36,149 +426,181 @@ def configure_encode_object_for_msgpack(control_cls):
     - event handler fields (`on_*`) are serialized as booleans (`True` when set);
     - list/dict/dataclass snapshots are captured into `__prev_*` attributes for patch
       diffing unless the object is frozen (`_frozen`);
+    - frozen `@value` objects whose nested values are frozen too (e.g. a `Theme`
+      in a component output) are encoded once; the bytes are cached on the object
+      and embedded as an `EXT_TYPE_MSGPACK` extension value on every later send;
     - datetime/date/time and duration values are encoded as MsgPack extension types;
-    - callables are rejected to prevent accidental method serialization.
+    - callables are rejected to prevent accidental method serialization;
+    - with `intern_keys`, dataclass field names and control type names found in
+      `PROTOCOL_KEYS` are encoded as 3-byte `EXT_TYPE_KEY` values.
+
+    The callback is stateless and created once per `control_cls` and
+    `intern_keys`.
 
     Args:
         control_cls: Base control type used to apply root-dataclass default comparison
             rules for Flet controls.
+        intern_keys: Whether to intern field and control type names, for clients
+            supporting `KEY_INTERNING_FEATURE`.
 
     Returns:
         Callable that serializes unsupported objects for MsgPack packing.
     """
 
-    def encode_object_for_msgpack(obj):
-        """Encode object for MessagePack."""
-        if is_dataclass(obj):
-            r = {}
-            prev_lists = {}
-            prev_dicts = {}
-            prev_classes = {}
-
-            _values = getattr(obj, "_values", None)
-            _structural_fields = getattr(type(obj), "_structural_fields", None)
-            is_control = isinstance(obj, control_cls)
-
-            if (
-                _values is not None
-                and _structural_fields is not None
-                and (is_control or isinstance(obj, Value))
-            ):
-                # ── Fast path for @control / @value types ────────────────────
-                # Only non-default values are in _values; structural fields
-                # (lists, dicts, nested dataclasses, and internal scalars like
-                # _i / _c) are iterated separately — there are typically very
-                # few of them.
-                _event_fields = getattr(type(obj), "_event_fields", frozenset())
-                _root_defaults = getattr(type(obj), "_root_defaults", {})
-
-                # 1. Emit sparse non-default Prop values.
-                #    Even though these are Prop-tracked scalars, their runtime
-                #    value may be a dataclass, list, or dict (e.g. content=…).
-                #    Those must be added to the prev_* snapshots so that the
-                #    next diff can compare old vs new correctly.
-                for fname, v in _values.items():
-                    if v is None:
-                        continue
-                    # Skip if the value happens to equal the Dart-side root
-                    # default (e.g. a subclass Prop was set to the base value).
-                    root_def = _root_defaults.get(fname, _UNSET)
-                    if root_def is not _UNSET and v == root_def:
-                        continue
-                    if is_dataclass(v):
+    def encode_dataclass(obj, plan: _EncodePlan):
+        r = {}
+        prev_lists = {}
+        prev_dicts = {}
+        prev_classes = {}
+
+        _values = getattr(obj, "_values", None) if plan.fast else None
+        if _values is not None:
+            # ── Fast path for @control / @value types ────────────────────
+            # Only non-default values are in _values; structural fields
+            # (lists, dicts, nested dataclasses, and internal scalars like
+            # _i / _c) are iterated separately — there are typically very
+            # few of them.
+            _event_fields = plan.event_fields
+            _root_defaults = plan.root_defaults
+
+            # 1. Emit sparse non-default Prop values.
+            #    Even though these are Prop-tracked scalars, their runtime
+            #    value may be a dataclass, list, or dict (e.g. content=…).
+            #    Those must be added to the prev_* snapshots so that the
+            #    next diff can compare old vs new correctly.
+            for fname, v in _values.items():
+                if v is None:
+                    continue
+                # Skip if the value happens to equal the Dart-side root
+                # default (e.g. a subclass Prop was set to the base value).
+                root_def = _root_defaults.get(fname, _UNSET)
+                if root_def is not _UNSET and v == root_def:
+                    continue
+                vt = type(v)
+                if vt in _SCALAR_TYPES:
+                    r[fname] = v
+                elif hasattr(vt, _FIELDS):
+                    r[fname] = v
+                    prev_classes[fname] = v
+                elif isinstance(v, list):
+                    v = v[:]
+                    # Values stored in _values were assigned explicitly, so
+                    # an empty list is a meaningful override, not a default
+                    # structural field to omit.
+                    r[fname] = v
+                    prev_lists[fname] = v
+                elif isinstance(v, dict):
+                    v = v.copy()
+                    # Same reasoning as lists above: preserve explicit empty
+                    # dictionaries while keeping structural defaults sparse.
+                    r[fname] = v
+                    prev_dicts[fname] = v
+                else:
+                    r[fname] = True if fname in _event_fields else v
+
+            # 2. Emit subclass-overridden defaults that are absent from
+            #    _values because they equal the subclass Prop.default.
+            for fname, v in plan.override_props:
+                if fname not in r and v is not None:
+                    r[fname] = v
+
+            # 3. Structural fields: lists, dicts, nested dataclasses, and
+            #    fixed-scalar internals (_i, _c, …).
+            for fname, default_value in plan.structural_fields:
+                v = getattr(obj, fname)
+                if v is None:
+                    continue
+                if type(v) in _SCALAR_TYPES:
+                    # Scalar structural field (e.g. _i, _c).
+                    if v != default_value:
                         r[fname] = v
-                        prev_classes[fname] = v
-                    elif isinstance(v, list):
-                        v = v[:]
-                        # Values stored in _values were assigned explicitly, so
-                        # an empty list is a meaningful override, not a default
-                        # structural field to omit.
+                elif isinstance(v, list):
+                    v = v[:]
+                    if len(v) > 0:
                         r[fname] = v
-                        prev_lists[fname] = v
-                    elif isinstance(v, dict):
-                        v = v.copy()
-                        # Same reasoning as lists above: preserve explicit empty
-                        # dictionaries while keeping structural defaults sparse.
+                    prev_lists[fname] = v
+                elif isinstance(v, dict):
+                    v = v.copy()
+                    if len(v) > 0:
                         r[fname] = v
-                        prev_dicts[fname] = v
-                    else:
-                        r[fname] = True if fname in _event_fields else v
-
-                # 2. Emit subclass-overridden defaults that are absent from
-                #    _values because they equal the subclass Prop.default.
-                for fname, v in getattr(type(obj), "_override_props", {}).items():
-                    if fname not in r and v is not None:
+                    prev_dicts[fname] = v
+                elif hasattr(type(v), _FIELDS):
+                    r[fname] = v
+                    prev_classes[fname] = v
+                elif v != default_value:
+                    r[fname] = v
+        else:
+            # ── Slow path for plain @dataclass types ─────────────────────
+            is_control = plan.is_control
+            for fname, is_event, default_value in plan.fields:
+                v = getattr(obj, fname)
+                if isinstance(v, list):
+                    v = v[:]
+                    if len(v) > 0:
                         r[fname] = v
-
-                # 3. Structural fields: lists, dicts, nested dataclasses, and
-                #    fixed-scalar internals (_i, _c, …).
-                obj_dc_fields = type(obj).__dataclass_fields__
-                for fname in _structural_fields:
-                    v = getattr(obj, fname)
-                    if isinstance(v, list):
-                        v = v[:]
-                        if len(v) > 0:
-                            r[fname] = v
-                        prev_lists[fname] = v
-                    elif isinstance(v, dict):
-                        v = v.copy()
-                        if len(v) > 0:
-                            r[fname] = v
-                        prev_dicts[fname] = v
-                    elif is_dataclass(v):
+                    prev_lists[fname] = v
+                elif isinstance(v, dict):
+                    v = v.copy()
+                    if len(v) > 0:
+                        r[fname] = v
+                    prev_dicts[fname] = v
+                elif is_event:
+                    v = v is not None
+                    if v:
                         r[fname] = v
-                        prev_classes[fname] = v
-                    elif v is not None:
-                        # Scalar structural field (e.g. _i, _c).
-                        fmeta = obj_dc_fields.get(fname)
-                        default_value = fmeta.default if fmeta is not None else _UNSET
-                        root_field = _get_root_dataclass_field(type(obj), fname)
-                        if root_field is not None:
-                            default_value = root_field.default
-                        if v != default_value:
-                            r[fname] = v
-            else:
-                # ── Slow path for plain @dataclass types ─────────────────────
-                for field in fields(obj):
-                    if "skip" in field.metadata:
-                        continue
-                    v = getattr(obj, field.name)
-                    if isinstance(v, list):
-                        v = v[:]
-                        if len(v) > 0:
-                            r[field.name] = v
-                        prev_lists[field.name] = v
-                    elif isinstance(v, dict):
-                        v = v.copy()
-                        if len(v) > 0:
-                            r[field.name] = v
-                        prev_dicts[field.name] = v
-                    elif field.name.startswith("on_") and field.metadata.get(
-                        "event", True
-                    ):
-                        v = v is not None
-                        if v:
-                            r[field.name] = v
-                    elif is_dataclass(v):
-                        r[field.name] = v
-                        prev_classes[field.name] = v
-                    else:
-                        default_value = field.default
-                        if is_control:
-                            root_field = _get_root_dataclass_field(
-                                type(obj), field.name
-                            )
-                            if root_field is not None:
-                                default_value = root_field.default
-                        if v is not None and (v != default_value or not is_control):
-                            r[field.name] = v
-
-            if not hasattr(obj, "_frozen"):
-                setattr(obj, "__prev_lists", prev_lists)
-                setattr(obj, "__prev_dicts", prev_dicts)
-                setattr(obj, "__prev_classes", prev_classes)
-
-            return r
+                elif hasattr(type(v), _FIELDS):
+                    r[fname] = v
+                    prev_classes[fname] = v
+                elif v is not None and (v != default_value or not is_control):
+                    r[fname] = v
+
+        return r, prev_lists, prev_dicts, prev_classes
+
+    encoded_attr = _ENCODED_INTERNED_ATTR if intern_keys else _ENCODED_ATTR
+
+    def encode_object_for_msgpack(obj):
+        """Encode object for MessagePack."""
+        cls = type(obj)
+        plan = cls.__dict__.get(_ENCODE_PLAN_ATTR)
+        if plan is None:
+            if isinstance(obj, Enum):
+                return obj.value
+            if hasattr(cls, _FIELDS) and not isinstance(obj, type):
+                plan = _get_encode_plan(cls, control_cls)
+        if plan is not None:
+            if _is_frozen(obj):
+                if not plan.is_control:
+                    encoded = obj.__dict__.get(encoded_attr)
+                    if encoded is not None:
+                        return msgpack.ExtType(EXT_TYPE_MSGPACK, encoded)
+                r, prev_lists, prev_dicts, prev_classes = encode_dataclass(obj, plan)
+                if intern_keys:
+                    r = _intern_keys(r)
+                if (
+                    not plan.is_control
+                    and all(map(_is_frozen_value, prev_classes.values()))
+                    and not any(
+                        hasattr(type(item), _FIELDS)
+                        for items in prev_lists.values()
+                        for item in items
+                    )
+                    and not any(
+                        hasattr(type(item), _FIELDS)
+                        for items in prev_dicts.values()
+                        for item in items.values()
+                    )
+                ):
+                    encoded = msgpack.packb(r, default=encode_object_for_msgpack)
+                    with contextlib.suppress(AttributeError):
+                        obj.__dict__[encoded_attr] = encoded
+                    return msgpack.ExtType(EXT_TYPE_MSGPACK, encoded)
+                return r
+
+            r, prev_lists, prev_dicts, prev_classes = encode_dataclass(obj, plan)
+            setattr(obj, "__prev_lists", prev_lists)
+            setattr(obj, "__prev_dicts", prev_dicts)
+            setattr(obj, "__prev_classes", prev_classes)
+            return _intern_keys(r) if intern_keys else r
         elif isinstance(obj, Enum):
             return obj.value
         elif isinstance(obj, (datetime.datetime, datetime.date)):
@@ -209,6 +631,51 @@ def configure_encode_object_for_msgpack(control_cls):
     return encode_object_for_msgpack
 
 
+class MessagePacker:
+    """
+    Reusable MessagePack packer for outbound messages of one connection.
+
+    Wraps a `msgpack.Packer` configured with the Flet object encoder, so its
+    internal buffer is reused instead of building a new packer per message, and
+    another one interning keys, created on first use. Safe to call from several
+    threads.
+
+    Args:
+        control_cls: Base control type, see `configure_encode_object_for_msgpack()`.
+    """
+
+    def __init__(self, control_cls):
+        self.__control_cls = control_cls
+        self.__packer = msgpack.Packer(
+            default=configure_encode_object_for_msgpack(control_cls)
+        )
+        self.__interning_packer: Optional[msgpack.Packer] = None
+        self.__lock = threading.Lock()
+
+    def pack(self, value: Any, intern_keys: bool = False) -> bytes:
+        """
+        Encodes `value` with the Flet object encoder.
+
+        Args:
+            value: Value to encode, e.g. `[action, body]` of a message.
+            intern_keys: Whether to intern field and control type names, see
+                `configure_encode_object_for_msgpack()`.
+
+        Returns:
+            MessagePack bytes.
+        """
+        with self.__lock:
+            if not intern_keys:
+                return self.__packer.pack(value)
+            if self.__interning_packer is None:
+                self.__interning_packer = msgpack.Packer(
+                    default=configure_encode_object_for_msgpack(
+                        self.__control_cls, intern_keys=True
+                    )
+                )
+            return self.__interning_packer.pack(value)
+
+
 def decode_ext_from_msgpack(code, data):
     """Decode MessagePack extension types used in Flet protocol."""
     if code == 1:
@@ -219,6 +686,10 @@ def decode_ext_from_msgpack(code, data):
         return Duration.from_unit(microseconds=int(data))
     elif code == 4:
         return data.decode("utf-8")
+    elif code == EXT_TYPE_MSGPACK:
+        return msgpack.unpackb(data, ext_hook=decode_ext_from_msgpack)
+    elif code == EXT_TYPE_KEY:
+        return PROTOCOL_KEYS[data[0]]
     return msgpack.ExtType(code, data)
 
 
@@ -267,6 +738,12 @@ class ClientAction(Enum):
     Body shape: `{text: str, is_stderr: bool}`.
     """
 
+    PATCH_CONTROLS = 8
+    """
+    Server-to-client batch of control tree patches applied by the client in
+    one step.
+    """
+
 
 @dataclass
 class ClientMessage:
@@ -274,6 +751,8 @@ class ClientMessage:
     Top-level protocol frame with action and payload.
 
     Messages are serialized as a two-item sequence: `[action_code, body]`.
+    Sessions with a replay buffer append a sequence number:
+    `[action_code, body, seq]`.
     """
 
     action: ClientAction
@@ -313,6 +792,18 @@ class RegisterClientRequestBody:
     Initial page state snapshot (route, media, window, and related metadata).
     """
 
+    last_seq: Optional[int] = None
+    """
+    Sequence number of the last message applied by the client, if it still
+    holds the page state of session `session_id`.
+    """
+
+    features: Optional[list[str]] = None
+    """
+    Optional protocol features supported by the client, e.g.
+    `KEY_INTERNING_FEATURE`.
+    """
+
 
 @dataclass
 class SessionPayload:
@@ -351,6 +842,9 @@ class RegisterClientResponseBody:
     page_patch: Any
     """
     Patch payload used to initialize/update client page state.
+
+    `None` when the session is resumed: the client keeps its page state and
+    the messages it has missed are replayed after this response.
     """
 
     error: str
@@ -358,6 +852,13 @@ class RegisterClientResponseBody:
     Startup error details, or empty string when registration succeeded.
     """
 
+    last_seq: Optional[int] = None
+    """
+    Sequence number of the last message reflected in the client page state once
+    this response is applied, or `None` if the session does not sequence
+    messages.
+    """
+
 
 @dataclass
 class PatchControlBody:
@@ -378,6 +879,22 @@ class PatchControlBody:
     """
 
 
+@dataclass
+class PatchControlsBody:
+    """
+    Server-to-client batch of control patches.
+
+    Carries several control patches produced in one batch (see
+    :meth:`flet.Page.batch`) so that they are encoded and sent as a single frame
+    and applied by the client together, in order.
+    """
+
+    patches: list[PatchControlBody]
+    """
+    Control patches in the order they were produced.
+    """
+
+
 @dataclass
 class UpdateControlPropsBody:
     """
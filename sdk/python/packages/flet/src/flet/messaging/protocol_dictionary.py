@@ -0,0 +1,39 @@
+# Generated by tests/bench_protocol_compression.py --write-tables.
+# Do not edit: the Dart client ships the same dictionary.
+import base64
+
+PROTOCOL_DICTIONARY = base64.b64decode(
+    "gdQGLJIBggGRAgKRA5QAAtQGKqMxNTOUAAPUBirLP9yB1AYskgGCAZECApEDlAAC1AYqozExOZQA"
+    "A9QGKss/1oHUBiySAYIBkQICkQOUAALUBiqiODWUAAPUBirLP9AAgdQGLJIBggGRAgKRA5QAAtQG"
+    "KqI2OJQAA9QGKss/yZmB1AYskgGCAZECApEDlAAC1AYqojUxlAAD1AYqyz/DM2nNAbCiX2PUBsWi"
+    "X2nNAbGG1AYgg9QGKqlQZXJzb24gX2nNArqiX2PUBruiX2nNArvUBhUQ1AZDp2dyZXkxMDBfY9QG"
+    "16Jfac0CX6JfY9QGvKJfac0CYKJfY9QGu6JfaSrDol9j1Abgol9pIKJfY9QGxaJfaSGG1AYgg9QG"
+    "KqhQJYTUBkikQ2l0edQGeapFbnRlciBjaXR5ol9j1Abdol8VtaJfY9QGuKJfaUrUBmyCol9j1Abg"
+    "ol9pTaJfY9QGxRW1ol9j1Aa4ol9pGNQGbIKiX2PUBuCiX2kbol9j1AbFBuCiX2lSol9j1AbFol9p"
+    "U4bUBiCD1AYqqVBlcnNvbiAG16Jfac0C5qJfY9QGvKJfac0C56JfY9QGu6Jfac0C6Aa6ol9pzQMy"
+    "1AYVhNQGNArUBjUK1AY2CtQGNwqiX2nNBmyCol9j1Abgol9pzKeiX2PUBsWiX2nMqIbUBiCD1AYG"
+    "K6VTaGFyZaJfY9QG16Jfac0CeqJfY9QGvKJfac0CewYBiNQGEIKiX2PUBrOiX2nNAgbUBhuCol9j"
+    "1Aa1ol9pAtSiX2PUBryiX2nNAtWiX2PUBruiX2nNAtbUBhUQ1AYCjKJfY9QGvKJfac0CjaJfY9QG"
+    "u6Jfac0CjtQGFRDUBoHUBiySAYIBkQICkQOUAALUBiqjMzA2lAAD1AYqyz/sYXJlol9j1AbXol9p"
+    "zQKDol9j1Aa8ol9pzQKEol9j1AZhcmWiX2PUBteiX2nNAimiX2PUBryiX2nNAiqiX2PUBl9pzQLd"
+    "ol9j1Aa8ol9pzQLeol9j1Aa7ol9pzQLf1AYVX2nNAkSiX2PUBryiX2nNAkWiX2PUBruiX2nNAkbU"
+    "BhVfac0CAITUBg6B1AYlw9QGLJKF1AYtw9QGSKZTZWFyY1aiX2PUBryiX2nNAleiX2PUBruiX2nN"
+    "AljUBhUQ1AZDAJICgqJpZBLUBgSSkgCB1AZskQGUAAHUBirDac0DCqJfY9QGvKJfac0DC6JfY9QG"
+    "u6Jfac0DDNQGFRAGKaowMDAwMDAwMDAwol9j1Aa0ol9pzQMgol9pAdQGAoHUBiySAYIBkQICkQOU"
+    "AALUBiqiMTeUAAPUBirLP6mZgdQGLJIBggGRAgKRA5QAAtQGKqMyMDSUAAPUBirLP+NpzQMYhNQG"
+    "Rc4AAQ8s1AZIpVN0YXRzol9j1AbKol9pzWyCol9j1Abgol9pzQEBol9j1AbFol9pzQEChtQGIIPU"
+    "AhDUBgSSkgCB1AYskgGBApEClAAC1AYqywAAAAAAAAAAkgKComlkzQMn1AYEkpEAlAAA1AYskEVu"
+    "dGVyIG5hbWWiX2PUBt2iX2nNAyKE1AZIpUVtYWlsZWlnaHSmbWFyZ2luol9j1Aa6ol9pzQMy1AYV"
+    "hNQGNAoyol9j1Aa8ol9pzQIzol9j1Aa7ol9pzQI01AYVENQGQwMc1AYToS+iX2PUBrGiX2PUBrDU"
+    "BhSG1AYVgNQGFoDUFNQGS6Rib2xkol9j1Aa2ol9pzQMPhdQGKqEw1AZKINQGDoHUBieTpXdpZHRo"
+    "pmhlaWdodKZtYXJnaW6iX2PUBtQGEYPUBg6B1AYpqjAwMDAwMDAwMDCiX2PUBrSiX2nNFYTUBjQK"
+    "1AY1CtQGNgrUBjcKol9pA9QGE6Evol9j1AYF1AYbgqJfY9QGtaJfaQLUBhKRhtQGDoHUBiXD1AYs"
+    "k3JhaXTUBhrC1AYPg9QGDoHUBibDol9j1Aayol9pzQIFBhSG1AYVgNQGFoDUBheA1AYYANQGGahw"
+    "b3J0cmFpdNQAkgGD1AYAp3Nlc3Npb27UBgGI1AYQgqJfY9QGs6JfaQCSAoKiaWTNAyLUBgSSkQCU"
+    "AADUBgKoUmVxdWlyZWSB1AYskgGCAZECApEDlAAC1AYqozEwMpQAA9QGKss/0wCSAoKiaWQN1AYE"
+    "kpIAgdQGbJEBlAAB1AYqwgCSAoKiaWTNAhnUBgSTkgCB1AYskgGCAZECApEDlAAC"
+)
+"""
+Preset dictionary of protocol frame compression, see
+:mod:`flet.messaging.frame_compression`.
+"""
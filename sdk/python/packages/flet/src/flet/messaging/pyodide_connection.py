@@ -15,10 +15,10 @@ from flet.messaging.protocol import (
     ClientMessage,
     ControlEventBody,
     InvokeMethodResponseBody,
+    MessagePacker,
     RegisterClientRequestBody,
     RegisterClientResponseBody,
     UpdateControlPropsBody,
-    configure_encode_object_for_msgpack,
     decode_ext_from_msgpack,
 )
 from flet.messaging.session import Session
@@ -50,6 +50,7 @@ class PyodideConnection(Connection):
         self.__before_main = before_main
         flet_js.start_connection = self.connect
         self.__running_tasks = set()
+        self.__packer = MessagePacker(BaseControl)
         # DataChannel mux registry. Pyodide mode has no dart_bridge, so
         # DataChannels ride the same postMessage transport as the Flet
         # protocol — disambiguated by the wire-format type byte.
@@ -84,7 +85,9 @@ class PyodideConnection(Connection):
         """
         while True:
             data = await self.__receive_queue.get()
-            packet = bytes(data.to_py())
+            # `to_py()` already copies the JS buffer into a Python-owned
+            # one; slices of a view over it don't copy again.
+            packet = memoryview(data.to_py()).cast("B")
             if not packet:
                 continue
             ptype = packet[0]
@@ -203,13 +206,12 @@ class PyodideConnection(Connection):
             message: Client message to serialize with MsgPack and send.
         """
         transport_log.debug("send_message: %s", message)
-        body = msgpack.packb(
-            [message.action, message.body],
-            default=configure_encode_object_for_msgpack(BaseControl),
-        )
+        body = self.__packer.pack([message.action, message.body])
         self.send_callback(b"\x00" + body)
 
-    def send_data_channel_frame(self, channel_id: int, payload: bytes) -> None:
+    def send_data_channel_frame(
+        self, channel_id: int, payload: bytes, droppable: bool = False
+    ) -> None:
         """Send a raw DataChannel frame `[0x01][channel_id:u32 LE][bytes]`
         over postMessage. Called by `_ProtocolMuxedDataChannel.send`."""
         header = b"\x01" + channel_id.to_bytes(4, "little", signed=False)
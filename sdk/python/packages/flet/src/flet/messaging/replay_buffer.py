@@ -0,0 +1,104 @@
+import time
+from collections import deque
+from typing import Optional
+
+DEFAULT_REPLAY_BUFFER_SIZE = 4 * 1024 * 1024
+DEFAULT_REPLAY_BUFFER_AGE = 300
+
+
+class ReplayBuffer:
+    """
+    Bounded ring of encoded outbound messages kept by a session, so that a
+    reconnecting client is sent only the messages it has missed.
+
+    Messages are evicted, oldest first, once the buffer holds more than
+    `max_bytes` or they are older than `max_age_seconds`.
+
+    Args:
+        max_bytes: Maximum total size of buffered messages.
+        max_age_seconds: Maximum age of buffered messages.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_REPLAY_BUFFER_SIZE,
+        max_age_seconds: float = DEFAULT_REPLAY_BUFFER_AGE,
+    ):
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.__entries: deque[tuple[int, float, bytes, bool]] = deque()
+        self.__size = 0
+        self.__last_seq = 0
+
+    @property
+    def size(self) -> int:
+        """
+        Total size of buffered messages, in bytes.
+        """
+        return self.__size
+
+    @property
+    def last_seq(self) -> int:
+        """
+        Sequence number of the last appended message, `0` if none.
+        """
+        return self.__last_seq
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def append(self, seq: int, data: bytes, interned: bool = False) -> None:
+        """
+        Adds an encoded message.
+
+        Args:
+            seq: Message sequence number, greater than any appended before.
+            data: Encoded message.
+            interned: Whether the message was encoded with interned keys.
+        """
+        self.__entries.append((seq, time.monotonic(), data, interned))
+        self.__size += len(data)
+        self.__last_seq = seq
+        self.__evict()
+
+    def since(self, seq: int, interned: bool = False) -> Optional[list[bytes]]:
+        """
+        Returns the messages appended after message `seq`.
+
+        Args:
+            seq: Sequence number of the last message the client has applied.
+            interned: Whether the client decodes interned keys.
+
+        Returns:
+            Encoded messages in sequence order, or `None` if some of them have
+                already been evicted (or `seq` is unknown), or were encoded
+                with interned keys the client doesn't decode.
+        """
+        self.__evict()
+        if seq == self.__last_seq:
+            return []
+        if seq > self.__last_seq or not self.__entries:
+            return None
+        if self.__entries[0][0] > seq + 1:
+            return None
+        missed = []
+        for s, _, data, entry_interned in self.__entries:
+            if s <= seq:
+                continue
+            if entry_interned and not interned:
+                return None
+            missed.append(data)
+        return missed
+
+    def clear(self) -> None:
+        """
+        Removes all buffered messages.
+        """
+        self.__entries.clear()
+        self.__size = 0
+
+    def __evict(self):
+        expires = time.monotonic() - self.max_age_seconds
+        entries = self.__entries
+        while entries and (self.__size > self.max_bytes or entries[0][1] < expires):
+            self.__size -= len(entries.popleft()[2])
@@ -0,0 +1,294 @@
+import asyncio
+import os
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Optional, Union
+
+DEFAULT_SEND_QUEUE_HIGH_WATER_MARK = 16 * 1024 * 1024
+
+
+class SendQueuePolicy(Enum):
+    """
+    What a `SendQueue` does when queued bytes exceed its high-water mark.
+
+    Only DataChannel frames queued as droppable (see `DataChannel.droppable`)
+    are ever dropped or superseded. Protocol frames (control patches, method
+    calls, etc.) are incremental and the client state would diverge without
+    them; frames of acknowledged channels, such as `RawImage`, expect one
+    ack per frame. Both are always kept.
+    """
+
+    BLOCK = "block"
+    """Keep every frame. Producers that await `drain()` between sends (e.g.
+    `RawImage` and other `DataChannel` producers) wait for the queue to fall
+    below the high-water mark; protocol messages are queued without
+    waiting."""
+
+    COALESCE = "coalesce"
+    """A new droppable DataChannel frame supersedes the queued, not yet sent
+    droppable frame of the same channel (latest frame wins)."""
+
+    DROP = "drop"
+    """Queued droppable DataChannel frames are dropped, oldest first, to
+    make room; a droppable frame that still does not fit is dropped too."""
+
+
+@dataclass
+class SendQueueStats:
+    """
+    Snapshot of `SendQueue` metrics.
+    """
+
+    depth: int
+    """Number of frames waiting to be sent."""
+
+    bytes_queued: int
+    """Total size of the frames waiting to be sent."""
+
+    bytes_in_flight: int
+    """Bytes queued plus bytes handed to the transport and not yet written."""
+
+    max_depth: int
+    """The largest queue depth observed."""
+
+    frames_sent: int
+    """Number of frames written to the transport."""
+
+    bytes_sent: int
+    """Number of bytes written to the transport."""
+
+    writes: int
+    """Number of transport writes; one write can carry many frames."""
+
+    frames_coalesced: int
+    """Droppable frames superseded by a newer frame of the same channel."""
+
+    frames_dropped: int
+    """Droppable frames dropped to stay under the high-water mark."""
+
+
+@dataclass(slots=True)
+class _Entry:
+    frame: Optional[bytes]
+    channel_id: Optional[int]
+    droppable: bool
+
+
+class SendQueue:
+    """
+    Outbound frame queue shared by the socket and WebSocket transports.
+
+    Producers call `put()` synchronously; the transport's send loop takes all
+    frames queued since its last wakeup with `get_batch()` and writes them at
+    once, then reports completion with `sent()`.
+
+    Args:
+        high_water_mark: Maximum number of bytes in flight before `policy`
+            applies. Defaults to `FLET_SEND_QUEUE_HIGH_WATER_MARK` environment
+            variable or 16 MiB.
+        policy: What to do with droppable frames above the high-water mark.
+            Defaults to `FLET_SEND_QUEUE_POLICY` environment variable or
+            `SendQueuePolicy.BLOCK`.
+    """
+
+    def __init__(
+        self,
+        high_water_mark: Optional[int] = None,
+        policy: Union[SendQueuePolicy, str, None] = None,
+    ):
+        if high_water_mark is None:
+            env_high_water_mark = os.getenv("FLET_SEND_QUEUE_HIGH_WATER_MARK")
+            high_water_mark = (
+                int(env_high_water_mark)
+                if env_high_water_mark
+                else DEFAULT_SEND_QUEUE_HIGH_WATER_MARK
+            )
+        if policy is None:
+            policy = os.getenv("FLET_SEND_QUEUE_POLICY") or SendQueuePolicy.BLOCK
+        self.high_water_mark = high_water_mark
+        self.policy = SendQueuePolicy(policy)
+
+        self.__entries: deque[_Entry] = deque()
+        self.__droppable_entries: dict[int, _Entry] = {}
+        self.__not_empty = asyncio.Event()
+        self.__writable = asyncio.Event()
+        self.__writable.set()
+        self.__closed = False
+
+        self.__depth = 0
+        self.__bytes_queued = 0
+        self.__droppable_bytes_queued = 0
+        self.__bytes_writing = 0
+        self.__max_depth = 0
+        self.__frames_sent = 0
+        self.__bytes_sent = 0
+        self.__writes = 0
+        self.__frames_coalesced = 0
+        self.__frames_dropped = 0
+
+    @property
+    def depth(self) -> int:
+        """
+        Number of frames waiting to be sent.
+        """
+        return self.__depth
+
+    @property
+    def bytes_in_flight(self) -> int:
+        """
+        Bytes queued plus bytes handed to the transport and not yet written.
+        """
+        return self.__bytes_queued + self.__bytes_writing
+
+    @property
+    def closed(self) -> bool:
+        """
+        Whether `close()` has been called.
+        """
+        return self.__closed
+
+    @property
+    def stats(self) -> SendQueueStats:
+        """
+        Returns a snapshot of the queue metrics.
+        """
+        return SendQueueStats(
+            depth=self.__depth,
+            bytes_queued=self.__bytes_queued,
+            bytes_in_flight=self.bytes_in_flight,
+            max_depth=self.__max_depth,
+            frames_sent=self.__frames_sent,
+            bytes_sent=self.__bytes_sent,
+            writes=self.__writes,
+            frames_coalesced=self.__frames_coalesced,
+            frames_dropped=self.__frames_dropped,
+        )
+
+    def put(
+        self, frame: bytes, channel_id: Optional[int] = None, droppable: bool = False
+    ) -> bool:
+        """
+        Queues an encoded frame.
+
+        Args:
+            frame: Frame bytes, ready to be written by the transport.
+            channel_id: DataChannel id for DataChannel frames, `None` for
+                protocol frames.
+            droppable: Whether `policy` may drop the frame or supersede it
+                with a newer frame of the same channel. Ignored for protocol
+                frames.
+
+        Returns:
+            `False` if the frame was dropped, `True` otherwise.
+        """
+        if self.__closed:
+            return False
+        size = len(frame)
+        droppable = droppable and channel_id is not None
+        if droppable and self.bytes_in_flight + size > self.high_water_mark:
+            if self.policy == SendQueuePolicy.COALESCE:
+                superseded = self.__droppable_entries.get(channel_id)
+                if superseded is not None:
+                    self.__remove(superseded)
+                    self.__frames_coalesced += 1
+            elif self.policy == SendQueuePolicy.DROP:
+                excess = self.bytes_in_flight + size - self.high_water_mark
+                if excess > self.__droppable_bytes_queued:
+                    # would not fit even without queued frames to drop
+                    self.__frames_dropped += 1
+                    return False
+                self.__drop_channel_frames(excess)
+
+        entry = _Entry(frame, channel_id, droppable)
+        self.__entries.append(entry)
+        if droppable:
+            self.__droppable_entries[channel_id] = entry
+            self.__droppable_bytes_queued += size
+        self.__depth += 1
+        self.__bytes_queued += size
+        if self.__depth > self.__max_depth:
+            self.__max_depth = self.__depth
+        self.__not_empty.set()
+        self.__update_writable()
+        return True
+
+    async def get_batch(self) -> Optional[list[bytes]]:
+        """
+        Waits for queued frames and takes all of them.
+
+        Returns:
+            Frames in queue order, or `None` once the queue is closed and
+                every frame queued before `close()` has been taken.
+        """
+        while not self.__depth:
+            if self.__closed:
+                return None
+            self.__not_empty.clear()
+            await self.__not_empty.wait()
+
+        batch = [entry.frame for entry in self.__entries if entry.frame is not None]
+        self.__entries.clear()
+        self.__droppable_entries.clear()
+        self.__bytes_writing += self.__bytes_queued
+        self.__bytes_queued = 0
+        self.__droppable_bytes_queued = 0
+        self.__depth = 0
+        return batch
+
+    def sent(self, frames: int, nbytes: int, writes: int = 1) -> None:
+        """
+        Reports that the transport has written frames taken with `get_batch()`.
+
+        Args:
+            frames: Number of frames written.
+            nbytes: Total size of the frames written.
+            writes: Number of transport writes used to write the frames.
+        """
+        self.__frames_sent += frames
+        self.__bytes_sent += nbytes
+        self.__writes += writes
+        self.__bytes_writing = max(0, self.__bytes_writing - nbytes)
+        self.__update_writable()
+
+    async def drain(self) -> None:
+        """
+        Waits until bytes in flight fall below the high-water mark.
+        """
+        while not self.__writable.is_set() and not self.__closed:
+            await self.__writable.wait()
+
+    def close(self) -> None:
+        """
+        Closes the queue: new frames are rejected, `get_batch()` returns the
+        frames still queued and then `None`, and `drain()` waiters are released.
+        """
+        self.__closed = True
+        self.__not_empty.set()
+        self.__writable.set()
+
+    def __remove(self, entry: _Entry) -> None:
+        if entry.frame is None:
+            return
+        self.__depth -= 1
+        self.__bytes_queued -= len(entry.frame)
+        if entry.droppable:
+            self.__droppable_bytes_queued -= len(entry.frame)
+        entry.frame = None
+        if self.__droppable_entries.get(entry.channel_id) is entry:
+            del self.__droppable_entries[entry.channel_id]
+
+    def __drop_channel_frames(self, nbytes: int) -> None:
+        for entry in self.__entries:
+            if nbytes <= 0:
+                break
+            if entry.droppable and entry.frame is not None:
+                nbytes -= len(entry.frame)
+                self.__remove(entry)
+                self.__frames_dropped += 1
+
+    def __update_writable(self) -> None:
+        if self.bytes_in_flight < self.high_water_mark or self.__closed:
+            self.__writable.set()
+        else:
+            self.__writable.clear()
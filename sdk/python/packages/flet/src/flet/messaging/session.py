@@ -1,11 +1,16 @@
 import asyncio
+import contextlib
+import contextvars
 import dataclasses
+import functools
 import inspect
 import logging
+import time
 import traceback
 import weakref
+from concurrent.futures import Executor
 from datetime import datetime, timedelta, timezone
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from flet.controls.base_control import BaseControl
 from flet.controls.context import _context_page, context
@@ -16,12 +21,17 @@ from flet.messaging.protocol import (
     ClientAction,
     ClientMessage,
     InvokeMethodRequestBody,
+    MessagePacker,
     PatchControlBody,
+    PatchControlsBody,
+    RegisterClientResponseBody,
     SessionCrashedBody,
 )
+from flet.messaging.replay_buffer import ReplayBuffer
 from flet.messaging.session_store import SessionStore
 from flet.pubsub.pubsub_client import PubSubClient
 from flet.utils.object_model import patch_dataclass
+from flet.utils.platform_utils import get_bool_env_var
 from flet.utils.strings import random_string
 
 if TYPE_CHECKING:
@@ -32,7 +42,32 @@ if TYPE_CHECKING:
 logger = logging.getLogger("flet")
 patch_logger = logging.getLogger("flet_object_patch")
 
-__all__ = ["Session"]
+__all__ = ["EventHandlerStats", "Session"]
+
+
+@dataclasses.dataclass
+class EventHandlerStats:
+    """
+    Latency metrics of an event handler of a session.
+    """
+
+    calls: int = 0
+    """Number of events handled."""
+
+    total_time: float = 0.0
+    """Seconds spent in the handler, over all events."""
+
+    max_time: float = 0.0
+    """Seconds spent in the handler for the slowest event."""
+
+    wait_time: float = 0.0
+    """Seconds events waited for the handlers of earlier events of the
+    session, over all events, when sync handlers run in the executor."""
+
+    @property
+    def average_time(self) -> float:
+        """Average seconds spent in the handler per event."""
+        return self.total_time / self.calls if self.calls else 0.0
 
 
 class Session:
@@ -42,11 +77,31 @@ class Session:
     A session owns the root :class:`~flet.Page`, tracks mounted controls, dispatches
     control events, synchronizes UI patches with the client connection, and coordinates
     deferred updates/effects.
+
+    Args:
+        conn: Connection the session is created for.
+        replay_buffer: When set, outbound messages are sequence-numbered and
+            kept in the buffer, so that a client reconnecting to this session
+            is sent only the messages it has missed.
+        sync_handlers_in_executor: Whether synchronous event handlers run in
+            the connection executor instead of on the event loop, see
+            :attr:`sync_handlers_in_executor`. Defaults to
+            `FLET_SYNC_HANDLERS_IN_EXECUTOR` environment variable.
     """
 
-    def __init__(self, conn: Connection):
+    def __init__(
+        self,
+        conn: Connection,
+        replay_buffer: Optional[ReplayBuffer] = None,
+        sync_handlers_in_executor: Optional[bool] = None,
+    ):
         self.__conn = conn
         self.__send_buffer: list[ClientMessage] = []
+        self.__replay_buffer = replay_buffer
+        self.__packer = (
+            MessagePacker(BaseControl) if replay_buffer is not None else None
+        )
+        self.__seq = 0
         self.__id = random_string(16)
         self.__expires_at = None
         self.__index: weakref.WeakValueDictionary[int, BaseControl] = (
@@ -60,14 +115,25 @@ class Session:
         self.__method_call_results: dict[asyncio.Event, tuple[Any, Optional[str]]] = {}
         self.__updates_ready: asyncio.Event = asyncio.Event()
         self.__pending_updates: set[BaseControl] = set()
+        self.__updates_requested = 0
+        self.__updates_performed = 0
         self.__pending_effects: list[tuple[weakref.ref[EffectHook], bool]] = []
         self.__updates_task: Optional[asyncio.Task] = None
+        self.__batch_depth = 0
+        self.__batch: list[PatchControlBody] = []
         self.__closed = False
         # Whether this session's app renders via the declarative components
         # API (page.render/render_views). Tracked per-session — not on the
         # global `context` singleton — so concurrent apps in one process
         # (e.g. an embedded FletApp) keep independent update behavior.
         self.__components_mode = False
+        if sync_handlers_in_executor is None:
+            sync_handlers_in_executor = get_bool_env_var(
+                "FLET_SYNC_HANDLERS_IN_EXECUTOR"
+            )
+        self.__sync_handlers_in_executor = bool(sync_handlers_in_executor)
+        self.__sync_handlers_lock = asyncio.Lock()
+        self.__handler_stats: dict[str, EventHandlerStats] = {}
 
         session_id = self.__id
         weakref.finalize(
@@ -90,6 +156,134 @@ class Session:
     def components_mode(self, value: bool) -> None:
         self.__components_mode = value
 
+    @property
+    def sync_handlers_in_executor(self) -> bool:
+        """
+        Whether synchronous event handlers run in the connection executor.
+
+        A slow synchronous handler, e.g. running a database query, otherwise
+        blocks the event loop and so the events and updates of all sessions.
+        In the executor, the synchronous handlers of a session still run one
+        at a time, in the order of their events, and the automatic update
+        after each one runs on the event loop before the next one starts.
+        As with :meth:`~flet.Page.run_thread`, async handlers of the session
+        can run meanwhile.
+
+        Has no effect when the connection has no executor, e.g. in Pyodide.
+        """
+        return self.__sync_handlers_in_executor
+
+    @sync_handlers_in_executor.setter
+    def sync_handlers_in_executor(self, value: bool) -> None:
+        self.__sync_handlers_in_executor = value
+
+    @property
+    def handler_stats(self) -> dict[str, EventHandlerStats]:
+        """
+        Latency metrics of the event handlers of this session, by handler
+        qualified name, e.g. `main.<locals>.button_click`.
+        """
+        return dict(self.__handler_stats)
+
+    def record_handler_time(
+        self, handler: Callable, elapsed: float, wait_time: float = 0.0
+    ):
+        """
+        Adds an event handled by `handler` to :attr:`handler_stats`.
+
+        Args:
+            handler: The event handler.
+            elapsed: Seconds spent in the handler.
+            wait_time: Seconds the event waited for the handlers of earlier
+                events.
+        """
+        name = getattr(handler, "__qualname__", None) or type(handler).__qualname__
+        stats = self.__handler_stats.get(name)
+        if stats is None:
+            stats = self.__handler_stats[name] = EventHandlerStats()
+        stats.calls += 1
+        stats.total_time += elapsed
+        stats.wait_time += wait_time
+        if elapsed > stats.max_time:
+            stats.max_time = elapsed
+
+    async def run_sync_handler(self, handler: Callable, args: tuple, control_id: int):
+        """
+        Runs a synchronous event handler in the connection executor, after the
+        synchronous handlers of the events dispatched before, then runs
+        :meth:`after_event` on the event loop.
+
+        The handler runs in a copy of the current context, so that it sees the
+        page and auto-update state of the event.
+
+        Args:
+            handler: The event handler.
+            args: Positional arguments to pass to the handler.
+            control_id: ID of the control that handled the event.
+        """
+        queued_at = time.perf_counter()
+        async with self.__sync_handlers_lock:
+            started = time.perf_counter()
+            try:
+                executor = self.__executor()
+                if executor is None:
+                    handler(*args)
+                else:
+                    await asyncio.get_running_loop().run_in_executor(
+                        executor,
+                        functools.partial(
+                            contextvars.copy_context().run, handler, *args
+                        ),
+                    )
+            finally:
+                self.record_handler_time(
+                    handler, time.perf_counter() - started, started - queued_at
+                )
+            await self.after_event(self.__index.get(control_id))
+
+    def __executor(self) -> Optional[Executor]:
+        if self.__conn is None:
+            return None
+        try:
+            return self.__conn.executor
+        except RuntimeError:
+            return None
+
+    @property
+    def updates_requested(self) -> int:
+        """
+        Returns the number of updates requested via :meth:`schedule_update`.
+
+        Returns:
+            Total count of scheduled control updates since the session started.
+        """
+        return self.__updates_requested
+
+    @property
+    def updates_performed(self) -> int:
+        """
+        Returns the number of control updates (diffs) run by the scheduler.
+
+        Updates requested for the same control in one scheduler tick, or for
+        controls already covered by an updated ancestor, are coalesced, so this
+        is at most :attr:`updates_requested`.
+
+        Returns:
+            Total count of control updates performed by the scheduler.
+        """
+        return self.__updates_performed
+
+    @property
+    def last_seq(self) -> int:
+        """
+        Returns the sequence number of the last outbound message.
+
+        Returns:
+            Last assigned sequence number, or `0` if the session has no replay
+            buffer or has not sent any message yet.
+        """
+        return self.__seq
+
     @property
     def connection(self) -> Connection:
         """
@@ -158,19 +352,66 @@ class Session:
         """
         return self.__store
 
-    def attach_connection(self, conn: Connection) -> None:
+    def can_resume(self, last_seq: Optional[int], intern_keys: bool = False) -> bool:
+        """
+        Checks whether a client that has applied messages up to `last_seq` can be
+        brought up to date by replaying buffered messages.
+
+        Args:
+            last_seq: Sequence number of the last message applied by the client.
+            intern_keys: Whether the client decodes interned keys (see
+                `Connection.intern_keys`).
+
+        Returns:
+            `True` if all messages after `last_seq` are still buffered, in an
+                encoding the client decodes.
+        """
+        return (
+            self.__replay_buffer is not None
+            and last_seq is not None
+            and self.__replay_buffer.since(last_seq, intern_keys) is not None
+        )
+
+    def attach_connection(
+        self, conn: Connection, last_seq: Optional[int] = None
+    ) -> None:
         """
         Attaches or re-attaches this session to an active connection.
 
         This method resets expiration state and flushes buffered outbound messages.
+        If the client reports the last message it has applied and the session
+        can resume (see :meth:`can_resume`), the messages it has missed are
+        replayed first. If they have been evicted from the replay buffer since,
+        the client is sent the whole page instead.
 
         Args:
             conn: Active connection to bind to this session.
+            last_seq: Sequence number of the last message applied by the client.
         """
         logger.debug("Connect session: %s", self.id)
         _context_page.set(self.__page)
         self.__conn = conn
         self.__expires_at = None
+        if self.__replay_buffer is not None and last_seq is not None:
+            missed = self.__replay_buffer.since(last_seq, conn.intern_keys)
+            if missed is None:
+                # evicted after the client was told it resumes the session
+                logger.debug("Cannot replay missed messages: %s", self.id)
+                conn.send_message(
+                    ClientMessage(
+                        ClientAction.REGISTER_CLIENT,
+                        RegisterClientResponseBody(
+                            session_id=self.id,
+                            page_patch=self.__page,
+                            error="",
+                            last_seq=self.__seq,
+                        ),
+                    )
+                )
+            elif missed:
+                logger.debug("Replaying %s messages: %s", len(missed), self.id)
+                for data in missed:
+                    conn.send_encoded_message(data)
         for message in self.__send_buffer:
             self.__send_message(message)
         self.__send_buffer.clear()
@@ -208,9 +449,14 @@ class Session:
             seconds=session_timeout_seconds
         )
         self.__send_buffer.clear()
-        self.__pending_updates.clear()
-        self.__pending_effects.clear()
-        self.__updates_ready.clear()
+        if self.__replay_buffer is not None:
+            # keep producing (sequenced) messages into the replay buffer
+            self.__flush_batch()
+        else:
+            self.__batch.clear()
+            self.__pending_updates.clear()
+            self.__pending_effects.clear()
+            self.__updates_ready.clear()
         if self.__conn:
             self.__conn.dispose()
             self.__conn = None
@@ -274,12 +520,11 @@ class Session:
             self.__index.pop(removed_control._i, None)
 
         if len(patch) > 1:
-            self.__send_message(
-                ClientMessage(
-                    ClientAction.PATCH_CONTROL,
-                    PatchControlBody(parent._i if parent else control._i, patch),
-                )
-            )
+            body = PatchControlBody(parent._i if parent else control._i, patch)
+            if self.__batch_depth > 0:
+                self.__batch.append(body)
+            else:
+                self.__send_message(ClientMessage(ClientAction.PATCH_CONTROL, body))
 
         patch_logger.debug("\npatch added_controls: (%s)", len(added_controls))
         for ac in added_controls:
@@ -291,6 +536,37 @@ class Session:
             if added_control._i not in removed_ids:
                 added_control.did_mount()
 
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Groups control patches produced inside the block into a single frame.
+
+        Controls are diffed as usual when they are updated, but the resulting
+        patches are held back and, when the outermost `batch()` block exits,
+        sent as one `PATCH_CONTROLS` message that the client applies in one
+        step. Blocks can be nested. Any other outbound message (e.g. a method
+        call) sends the patches collected so far first, preserving order.
+        """
+        self.__batch_depth += 1
+        try:
+            yield
+        finally:
+            self.__batch_depth -= 1
+            if self.__batch_depth == 0:
+                self.__flush_batch()
+
+    def __flush_batch(self):
+        """
+        Sends control patches collected by :meth:`batch`.
+        """
+        patches, self.__batch = self.__batch, []
+        if len(patches) == 1:
+            self.__send_message(ClientMessage(ClientAction.PATCH_CONTROL, patches[0]))
+        elif patches:
+            self.__send_message(
+                ClientMessage(ClientAction.PATCH_CONTROLS, PatchControlsBody(patches))
+            )
+
     def apply_patch(self, control_id: int, patch: dict[str, Any]):
         """
         Applies a partial property patch to a control in the session index.
@@ -574,7 +850,7 @@ class Session:
             if (
                 control.is_isolated()
                 and not hasattr(control, "_frozen")
-                and self.__conn
+                and (self.__conn or self.__replay_buffer is not None)
             ):
                 control.update()
                 break
@@ -598,6 +874,19 @@ class Session:
         Args:
             message: Outbound client message.
         """
+        if self.__batch:
+            # keep batched patches ahead of later messages
+            self.__flush_batch()
+        if self.__replay_buffer is not None:
+            self.__seq += 1
+            intern_keys = self.__intern_keys()
+            data = self.__packer.pack(
+                [message.action, message.body, self.__seq], intern_keys=intern_keys
+            )
+            self.__replay_buffer.append(self.__seq, data, intern_keys)
+            if self.__conn:
+                self.__conn.send_encoded_message(data)
+            return
         if self.__conn:
             self.__conn.send_message(message)
         elif self.__expires_at is not None:
@@ -607,6 +896,23 @@ class Session:
         else:
             self.__send_buffer.append(message)
 
+    def __intern_keys(self) -> bool:
+        """
+        Whether the connected client decodes interned keys.
+        """
+        return self.__conn is not None and self.__conn.intern_keys
+
+    def __is_suspended(self) -> bool:
+        """
+        Whether the session is disconnected and has no replay buffer to keep
+        outbound messages for a reconnecting client.
+        """
+        return (
+            self.__conn is None
+            and self.__expires_at is not None
+            and self.__replay_buffer is None
+        )
+
     def __get_update_control_patch(
         self,
         control: BaseControl,
@@ -649,7 +955,11 @@ class Session:
 
         # print("\n\npatch:", patch)
 
-        return patch.to_message(), added_controls, removed_controls
+        return (
+            patch.to_message(intern_keys=self.__intern_keys()),
+            added_controls,
+            removed_controls,
+        )
 
     def schedule_update(self, control: BaseControl):
         """
@@ -659,8 +969,9 @@ class Session:
             control: Control to update.
         """
         logger.debug("Schedule_update(%s)", control)
-        if self.__conn is None and self.__expires_at is not None:
+        if self.__is_suspended():
             return
+        self.__updates_requested += 1
         self.__pending_updates.add(control)
         self.__updates_ready.set()
 
@@ -673,7 +984,7 @@ class Session:
             is_cleanup: `True` to run cleanup, `False` to run setup.
         """
         logger.debug("Schedule_effect(%s, %s)", hook, is_cleanup)
-        if self.__conn is None and self.__expires_at is not None:
+        if self.__is_suspended():
             return
         # Hold a strong reference to the hook until it runs.  A weakref would
         # get cleared when the owning component unmounts and clears
@@ -690,6 +1001,40 @@ class Session:
             return
         self.__updates_task = asyncio.create_task(self.__updates_scheduler())
 
+    def __is_update_covered(
+        self, control: BaseControl, updated: set[BaseControl]
+    ) -> bool:
+        """
+        Checks whether a pending update was already handled in this tick.
+
+        A component is covered once it has been re-rendered (its dirty flag is
+        cleared), e.g. by the diff of an ancestor updated earlier in the tick.
+        Any other control is covered when an ancestor was updated in this tick
+        and no isolated control - whose subtree an ancestor diff skips - lies
+        between them.
+
+        Args:
+            control: Control with a pending update.
+            updated: Controls already updated in the current tick.
+
+        Returns:
+            `True` if updating `control` again can be skipped.
+        """
+        from flet.components.component import Component
+
+        if isinstance(control, Component):
+            return not control._state.is_dirty
+        if control.is_isolated():
+            return False
+        parent = control.parent
+        while parent is not None:
+            if parent in updated:
+                return True
+            if parent.is_isolated():
+                return False
+            parent = parent.parent
+        return False
+
     async def __updates_scheduler(self):
         """
         Background loop that drains queued updates and effect operations.
@@ -697,18 +1042,29 @@ class Session:
         The scheduler waits for work signals, updates pending controls, then executes
         pending effect hook setup/cleanup callbacks. Errors inside effect processing
         are reported to the client via :meth:`error`.
+
+        Pending updates are applied in depth order (parents before children) and
+        updates already covered by an ancestor's diff are skipped, so overlapping
+        subtrees are diffed once per tick. Patches of one tick are sent as a single
+        batch (see :meth:`batch`).
         """
         try:
             while not self.__closed:
                 await self.__updates_ready.wait()
                 self.__updates_ready.clear()
 
-                # Process pending updates
-                pending_updates = list(self.__pending_updates)
+                # Process pending updates, parents before children
+                pending_updates = sorted(self.__pending_updates, key=_control_depth)
                 self.__pending_updates.clear()
 
-                for control in pending_updates:
-                    control.update()
+                updated: set[BaseControl] = set()
+                with self.batch():
+                    for control in pending_updates:
+                        if self.__is_update_covered(control, updated):
+                            continue
+                        control.update()
+                        self.__updates_performed += 1
+                        updated.add(control)
 
                 # Process pending effects
                 pending_effects = list(self.__pending_effects)
@@ -739,3 +1095,15 @@ class Session:
                         self.error(f"Exception in effect: {ex}\n{tb}")
         except asyncio.CancelledError:
             pass
+
+
+def _control_depth(control: BaseControl) -> int:
+    """
+    Returns the number of ancestors of a control.
+    """
+    depth = 0
+    parent = control.parent
+    while parent is not None:
+        depth += 1
+        parent = parent.parent
+    return depth
@@ -1,7 +1,10 @@
+from .pubsub_backend import PubSubBackend
 from .pubsub_client import PubSubClient
-from .pubsub_hub import PubSubHub
+from .pubsub_hub import PubSubHub, PubSubSessionStats
 
 __all__ = [
+    "PubSubBackend",
     "PubSubClient",
     "PubSubHub",
+    "PubSubSessionStats",
 ]
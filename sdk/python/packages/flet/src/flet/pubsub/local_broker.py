@@ -0,0 +1,321 @@
+"""
+Local pub/sub broker relaying messages between the processes of one machine.
+
+Run as a sidecar with:
+
+```
+python -m flet.pubsub.local_broker /run/flet/pubsub.sock
+```
+"""
+
+import argparse
+import asyncio
+import contextlib
+import logging
+import os
+import pickle
+import socket
+import stat
+from typing import Any, Optional
+
+import msgpack
+
+from flet.pubsub.pubsub_backend import PubSubBackend, PubSubReceiver
+
+__all__ = ["LocalBroker", "LocalBrokerBackend"]
+
+logger = logging.getLogger("flet")
+
+MAX_CLIENT_BUFFER_SIZE = 16 * 1024 * 1024
+"""
+Bytes waiting to be written to a broker client above which messages to that
+client are dropped.
+"""
+
+_HEADER_SIZE = 4
+_PICKLED_EXT_TYPE = 1
+_MIN_RECONNECT_DELAY = 0.1
+_MAX_RECONNECT_DELAY = 5.0
+
+
+class LocalBroker:
+    """
+    Relays frames received from each client connected to a Unix domain
+    socket to all other clients.
+
+    Frames are not decoded: each one is a 4-byte big-endian length followed
+    by the msgpack-encoded message. The socket is only accessible to the user
+    running the broker.
+
+    Args:
+        path: Path of the Unix domain socket to listen on.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.__server: Optional[asyncio.AbstractServer] = None
+        self.__clients: set[asyncio.StreamWriter] = set()
+        self.frames_dropped = 0
+
+    async def start(self):
+        """
+        Starts listening on the socket.
+        """
+        # Left behind by a broker that exited without closing.
+        with contextlib.suppress(FileNotFoundError):
+            if stat.S_ISSOCK(os.stat(self.path).st_mode):
+                os.unlink(self.path)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # Peers' messages may be unpickled, so the socket must never be
+        # accessible to other users: it is created with owner-only
+        # permissions rather than restricted once bound.
+        umask = os.umask(0o177)
+        try:
+            sock.bind(self.path)
+        except BaseException:
+            sock.close()
+            raise
+        finally:
+            os.umask(umask)
+        self.__server = await asyncio.start_unix_server(self.__handle_client, sock=sock)
+        logger.info("Pub/sub broker listening on %s", self.path)
+
+    async def serve_forever(self):
+        """
+        Starts listening on the socket, if not started yet, and serves clients
+        until cancelled.
+        """
+        if self.__server is None:
+            await self.start()
+        await self.__server.serve_forever()
+
+    async def close(self):
+        """
+        Disconnects all clients and stops listening on the socket.
+        """
+        if self.__server is not None:
+            self.__server.close()
+            self.__server = None
+            with contextlib.suppress(OSError):
+                os.unlink(self.path)
+        for writer in list(self.__clients):
+            writer.close()
+        self.__clients.clear()
+
+    async def __handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        self.__clients.add(writer)
+        try:
+            while True:
+                frame = await _read_frame(reader)
+                for client in self.__clients:
+                    if client is writer:
+                        continue
+                    if client.transport.get_write_buffer_size() > (
+                        MAX_CLIENT_BUFFER_SIZE
+                    ):
+                        self.frames_dropped += 1
+                        continue
+                    client.write(frame)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except asyncio.CancelledError:
+            # Not re-raised: asyncio logs an error for cancelled client
+            # handlers, e.g. when the loop of the broker process shuts down.
+            pass
+        finally:
+            self.__clients.discard(writer)
+            writer.close()
+
+
+class LocalBrokerBackend(PubSubBackend):
+    """
+    Pub/sub backend forwarding messages through a :class:`LocalBroker`, to
+    share pub/sub between the worker processes of a web server on one
+    machine.
+
+    Messages are encoded with msgpack. Messages of other types, e.g.
+    dataclasses, are pickled, so they must be importable by all processes.
+
+    If no broker is listening on `path`, the first backend to find out starts
+    one in its process, and the others connect to it. When the process
+    hosting the broker exits, the backends of the other processes reconnect
+    and one of them starts a new broker. Messages published while a backend
+    is not connected are not forwarded.
+
+    Args:
+        path: Path of the broker Unix domain socket.
+        channel: Name shared by the hubs exchanging messages, e.g. of the app,
+            when several apps use one broker.
+        spawn: Whether to start a broker in this process if none is
+            listening on `path`.
+    """
+
+    def __init__(self, path: str, channel: str = "", spawn: bool = True):
+        self.path = path
+        self.channel = channel
+        self.spawn = spawn
+        self.__loop: Optional[asyncio.AbstractEventLoop] = None
+        self.__receiver: Optional[PubSubReceiver] = None
+        self.__task: Optional[asyncio.Task] = None
+        self.__writer: Optional[asyncio.StreamWriter] = None
+        self.__broker: Optional[LocalBroker] = None
+        self.__lock_fd: Optional[int] = None
+        self.__connected = asyncio.Event()
+
+    @property
+    def hosts_broker(self) -> bool:
+        """
+        Whether the broker runs in this process.
+        """
+        return self.__broker is not None
+
+    def start(self, loop: asyncio.AbstractEventLoop, receiver: PubSubReceiver):
+        self.__loop = loop
+        self.__receiver = receiver
+        loop.call_soon_threadsafe(self.__start_task)
+
+    async def wait_connected(self):
+        """
+        Waits until the backend is connected to the broker.
+        """
+        await self.__connected.wait()
+
+    def publish(
+        self, except_session_id: Optional[str], topic: Optional[str], message: Any
+    ):
+        try:
+            payload = msgpack.packb(
+                [self.channel, except_session_id, topic, message],
+                default=_pack_object,
+            )
+        except Exception:
+            logger.exception("Unable to encode pub/sub message for other processes")
+            return
+        frame = len(payload).to_bytes(_HEADER_SIZE, "big") + payload
+        self.__loop.call_soon_threadsafe(self.__write, frame)
+
+    def close(self):
+        if self.__loop is None or self.__loop.is_closed():
+            return
+        self.__loop.call_soon_threadsafe(self.__close)
+
+    def __start_task(self):
+        self.__task = self.__loop.create_task(self.__run())
+
+    def __write(self, frame: bytes):
+        if self.__writer is None:
+            logger.debug("Pub/sub broker not connected, message not forwarded")
+            return
+        self.__writer.write(frame)
+
+    def __close(self):
+        if self.__task is not None:
+            self.__task.cancel()
+            self.__task = None
+
+    async def __run(self):
+        delay = _MIN_RECONNECT_DELAY
+        try:
+            while True:
+                try:
+                    reader, writer = await self.__connect()
+                except OSError as e:
+                    logger.debug("Unable to connect to pub/sub broker: %s", e)
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, _MAX_RECONNECT_DELAY)
+                    continue
+                delay = _MIN_RECONNECT_DELAY
+                self.__writer = writer
+                self.__connected.set()
+                try:
+                    await self.__receive(reader)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    logger.info("Pub/sub broker connection lost, reconnecting")
+                finally:
+                    self.__connected.clear()
+                    self.__writer = None
+                    writer.close()
+        finally:
+            if self.__broker is not None:
+                await self.__broker.close()
+                self.__broker = None
+            if self.__lock_fd is not None:
+                os.close(self.__lock_fd)
+                self.__lock_fd = None
+
+    async def __connect(self):
+        try:
+            return await asyncio.open_unix_connection(self.path)
+        except (FileNotFoundError, ConnectionRefusedError):
+            if not self.spawn or not await self.__start_broker():
+                raise
+            return await asyncio.open_unix_connection(self.path)
+
+    async def __start_broker(self) -> bool:
+        """
+        Starts a broker in this process, unless another process or backend
+        holds the broker lock, i.e. hosts or is starting a broker.
+        """
+        import fcntl
+
+        fd = os.open(f"{self.path}.lock", os.O_CREAT | os.O_RDWR, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        try:
+            # Left behind by a broker process that exited.
+            with contextlib.suppress(OSError):
+                os.unlink(self.path)
+            broker = LocalBroker(self.path)
+            await broker.start()
+        except BaseException:
+            os.close(fd)
+            raise
+        self.__broker = broker
+        self.__lock_fd = fd
+        return True
+
+    async def __receive(self, reader: asyncio.StreamReader):
+        while True:
+            frame = await _read_frame(reader)
+            try:
+                channel, except_session_id, topic, message = msgpack.unpackb(
+                    memoryview(frame)[_HEADER_SIZE:], ext_hook=_unpack_object
+                )
+            except Exception:
+                logger.exception("Unable to decode pub/sub message")
+                continue
+            if channel == self.channel:
+                self.__receiver(except_session_id, topic, message)
+
+
+async def _read_frame(reader: asyncio.StreamReader) -> bytes:
+    header = await reader.readexactly(_HEADER_SIZE)
+    return header + await reader.readexactly(int.from_bytes(header, "big"))
+
+
+def _pack_object(obj: Any):
+    return msgpack.ExtType(_PICKLED_EXT_TYPE, pickle.dumps(obj))
+
+
+def _unpack_object(code: int, data: bytes):
+    if code == _PICKLED_EXT_TYPE:
+        return pickle.loads(data)
+    return msgpack.ExtType(code, data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Flet pub/sub local broker")
+    parser.add_argument("path", help="path of the Unix domain socket to listen on")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(LocalBroker(args.path).serve_forever())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Optional
+
+__all__ = ["PubSubBackend", "PubSubReceiver"]
+
+PubSubReceiver = Callable[[Optional[str], Optional[str], Any], None]
+"""
+Callback of a :class:`PubSubBackend` delivering a message published by another
+process, called on the hub event loop with `(except_session_id, topic,
+message)`. `topic` is `None` for global messages.
+"""
+
+
+class PubSubBackend(ABC):
+    """
+    Transport forwarding the messages of a :class:`~flet.pubsub.PubSubHub` to
+    the hubs of other processes, e.g. of the workers of a web server.
+
+    A hub delivers the messages published through it to its own subscribers,
+    and passes them to its backend with :meth:`publish`; the backend delivers
+    the messages published by other processes to the hub with the receiver
+    given to :meth:`start`. Session IDs are unique across processes, so
+    `except_session_id` is passed along as is.
+    """
+
+    @abstractmethod
+    def start(self, loop: asyncio.AbstractEventLoop, receiver: PubSubReceiver):
+        """
+        Starts forwarding messages. Called once, by the hub constructor.
+
+        Args:
+            loop: The hub event loop.
+            receiver: Callback delivering messages published by other
+                processes to the hub. Must be called on `loop`.
+        """
+
+    @abstractmethod
+    def publish(
+        self, except_session_id: Optional[str], topic: Optional[str], message: Any
+    ):
+        """
+        Forwards a message published through the hub to other processes.
+
+        Called from any thread, and must not block.
+
+        Args:
+            except_session_id: Session ID to exclude from delivery, if any.
+            topic: Topic the message was sent on, or `None` for a global
+                message.
+            message: Payload to forward.
+        """
+
+    @abstractmethod
+    def close(self):
+        """
+        Stops forwarding messages and releases the backend resources.
+        """
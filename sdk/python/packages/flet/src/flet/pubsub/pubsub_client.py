@@ -1,7 +1,7 @@
 import logging
-from typing import Any, Callable
+from typing import Any, Callable, Optional
 
-from flet.pubsub.pubsub_hub import PubSubHub
+from flet.pubsub.pubsub_hub import PubSubHub, PubSubSessionStats
 
 logger = logging.getLogger("flet")
 
@@ -19,6 +19,14 @@ class PubSubClient:
         self.__pubsub = pubsub
         self.__session_id = session_id
 
+    @property
+    def stats(self) -> Optional[PubSubSessionStats]:
+        """
+        Message delivery metrics of this session, or `None` if no message
+        was published to it yet.
+        """
+        return self.__pubsub.session_stats(self.__session_id)
+
     def send_all(self, message: Any):
         """
         Broadcasts a global message to all sessions.
@@ -68,18 +76,46 @@ class PubSubClient:
         """
         self.__pubsub.subscribe(self.__session_id, handler)
 
-    def subscribe_topic(self, topic: str, handler: Callable[[str, Any], Any]):
+    def subscribe_topic(
+        self,
+        topic: str,
+        handler: Callable[[str, Any], Any],
+        latest_only: bool = False,
+    ):
         """
-        Subscribes this session to a topic.
+        Subscribes this session to a topic, or to all topics matching a
+        pattern.
+
+        Topics are hierarchical, with levels separated by `/`. In a pattern,
+        `*` matches any one level and `#`, as the last level, any number of
+        levels, including none:
+
+        ```python
+        page.pubsub.subscribe_topic("org/42/#", on_org_message)
+        page.pubsub.send_all_on_topic("org/42/room/7", "hello")  # received
+        ```
 
         The handler is invoked with two positional arguments:
-        `(topic, message)`.
+        `(topic, message)`, where `topic` is the topic the message was sent
+        on.
+
+        With `latest_only=True`, a message replaces the message of the same
+        topic still waiting to be delivered to the handler, so that a
+        handler lagging behind a burst of updates, e.g. of a price or a
+        progress, only receives the latest one.
 
         Args:
-            topic: Topic name to subscribe to.
+            topic: Topic name or pattern to subscribe to.
             handler: Sync or async callback for topic messages.
+            latest_only: Whether only the latest message of each topic
+                matters to the handler.
+
+        Raises:
+            ValueError: If `#` is not the last level of `topic`.
         """
-        self.__pubsub.subscribe_topic(self.__session_id, topic, handler)
+        self.__pubsub.subscribe_topic(
+            self.__session_id, topic, handler, latest_only=latest_only
+        )
 
     def unsubscribe(self):
         """
@@ -92,7 +128,7 @@ class PubSubClient:
         Removes this session's subscriptions for a specific topic.
 
         Args:
-            topic: Topic to unsubscribe from.
+            topic: Topic name or pattern to unsubscribe from, as subscribed to.
         """
         self.__pubsub.unsubscribe_topic(self.__session_id, topic)
 
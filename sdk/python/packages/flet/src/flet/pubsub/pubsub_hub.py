@@ -1,16 +1,87 @@
 import asyncio
 import inspect
 import logging
+import os
 import threading
-from collections.abc import Awaitable, Iterable
+import time
+from collections import deque
+from collections.abc import Awaitable
 from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Any, Callable, Optional, Union
 
+from flet.pubsub.pubsub_backend import PubSubBackend
+from flet.pubsub.topic_trie import TopicTrie
 from flet.utils import is_pyodide
 from flet.utils.locks import NopeLock
 
 logger = logging.getLogger("flet")
 
+DEFAULT_PUBSUB_MAX_QUEUE_SIZE = 1000
+
+Handler = Union[Callable, Callable[..., Awaitable[Any]]]
+
+
+@dataclass
+class PubSubSessionStats:
+    """
+    Snapshot of the message delivery metrics of one session.
+    """
+
+    queued: int
+    """Number of messages waiting to be delivered."""
+
+    lag: float
+    """Seconds the oldest message waiting to be delivered has been queued."""
+
+    delivered: int
+    """Number of messages delivered to the session's handlers."""
+
+    dropped: int
+    """Messages dropped, oldest first, to stay under the queue size limit."""
+
+    coalesced: int
+    """Messages superseded by a newer message on the same topic, for
+    handlers subscribed with `latest_only=True`."""
+
+
+class _LatestOnly:
+    """
+    A topic handler interested only in the latest message of each topic.
+    """
+
+    __slots__ = ("handler",)
+
+    def __init__(self, handler: Handler):
+        self.handler = handler
+
+    def __eq__(self, other):
+        return isinstance(other, _LatestOnly) and other.handler == self.handler
+
+    def __hash__(self):
+        return hash((_LatestOnly, self.handler))
+
+
+@dataclass(slots=True)
+class _Delivery:
+    handler: Handler
+    args: tuple
+    enqueued_at: float
+    latest_key: Optional[tuple]
+
+
+class _SessionQueue:
+    __slots__ = ("coalesced", "deliveries", "delivered", "dropped", "latest", "task")
+
+    def __init__(self):
+        self.deliveries: deque[_Delivery] = deque()
+        # key: (handler, topic), value: queued delivery of a latest-only handler
+        self.latest: dict[tuple, _Delivery] = {}
+        self.task: Optional[asyncio.Task] = None
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+
 
 class PubSubHub:
     """
@@ -21,28 +92,77 @@ class PubSubHub:
     - global subscribers receive `(message)`;
     - topic subscribers receive `(topic, message)`.
 
+    Topics are hierarchical, with levels separated by `/`, and topic
+    subscriptions can use wildcard levels: `*` matches any one level and `#`,
+    as the last level, any number of levels, including none. For instance,
+    `org/42/#` receives messages sent on `org/42/room/7`, and `org/*/alerts`
+    those sent on `org/42/alerts`. Subscriptions are indexed in a
+    :class:`~flet.pubsub.topic_trie.TopicTrie`, so publishing costs in
+    proportion to the matching subscriptions only.
+
+    Publishing does not call handlers: the lock is only held to take a
+    snapshot of the matching subscribers, and the message is then queued for
+    each of their sessions on the hub event loop. Every session has its own
+    bounded queue, drained by its own task, so handlers of a session are
+    called one at a time, in publishing order, and a slow handler only delays
+    the messages of its own session. Sync handlers run in the executor, if
+    any. When a queue is full, its oldest message is dropped. Delivery
+    metrics of a session are returned by :meth:`session_stats`.
+
     This hub is used by session-scoped `PubSubClient`
-    instances to fan out messages between connected sessions.
+    instances to fan out messages between connected sessions. With a
+    `backend`, messages are also exchanged with the hubs of other processes,
+    e.g. of the workers of a web server, see
+    :class:`~flet.pubsub.local_broker.LocalBrokerBackend`.
+
+    Args:
+        loop: Event loop that handlers are called on.
+        executor: Executor that sync handlers run in. Sync handlers are
+            called on the event loop when not set.
+        max_queue_size: Maximum number of messages queued for a session.
+            Defaults to `FLET_PUBSUB_MAX_QUEUE_SIZE` environment variable or
+            `1000`.
+        backend: Transport exchanging messages with the hubs of other
+            processes. Requires `loop`.
     """
 
     def __init__(
         self,
         loop: Optional[asyncio.AbstractEventLoop] = None,
         executor: Optional[ThreadPoolExecutor] = None,
+        max_queue_size: Optional[int] = None,
+        backend: Optional[PubSubBackend] = None,
     ):
         logger.debug("Creating new PubSubHub instance")
+        if max_queue_size is None:
+            env_max_queue_size = os.getenv("FLET_PUBSUB_MAX_QUEUE_SIZE")
+            max_queue_size = (
+                int(env_max_queue_size)
+                if env_max_queue_size
+                else DEFAULT_PUBSUB_MAX_QUEUE_SIZE
+            )
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be at least 1")
         self.__loop = loop
         self.__executor = executor
+        self.__max_queue_size = max_queue_size
         self.__lock = threading.Lock() if not is_pyodide() else NopeLock()
+        # Handler sets are replaced, not mutated, so that publishing can
+        # snapshot them with a shallow copy of the dictionary.
         self.__subscribers: dict[
-            str, set[Union[Callable, Callable[..., Awaitable[Any]]]]
+            str, frozenset[Handler]
         ] = {}  # key: session_id, value: handler
-        self.__topic_subscribers: dict[
-            str, dict[str, set[Union[Callable, Callable[..., Awaitable[Any]]]]]
-        ] = {}  # key: topic, value: dict[session_id, handler]
+        self.__topic_subscribers = TopicTrie()
         self.__subscriber_topics: dict[
-            str, dict[str, set[Union[Callable, Callable[..., Awaitable[Any]]]]]
+            str, dict[str, set[Handler]]
         ] = {}  # key: session_id, value: dict[topic, handler]
+        # Only accessed on the event loop.
+        self.__queues: dict[str, _SessionQueue] = {}
+        self.__backend = backend
+        if backend is not None:
+            if loop is None:
+                raise ValueError("PubSubHub backend requires an event loop")
+            backend.start(loop, self.__receive)
 
     def send_all(self, message: Any):
         """
@@ -52,25 +172,22 @@ class PubSubHub:
             message: Payload to deliver.
         """
         logger.debug("pubsub.send_all(%s)", message)
-        with self.__lock:
-            for handlers in self.__subscribers.values():
-                for handler in handlers:
-                    self.__send(handler, [message])
+        self.__publish(None, None, message)
 
     def send_all_on_topic(self, topic: str, message: Any):
         """
-        Sends a topic message to all subscribers of `topic`.
+        Sends a topic message to all subscribers of topic patterns matching
+        `topic`.
+
+        A handler subscribed with several matching patterns receives the
+        message once.
 
         Args:
-            topic: Topic name to broadcast on.
+            topic: Topic name to broadcast on. Its levels are taken literally.
             message: Payload to deliver.
         """
         logger.debug("pubsub.send_all_on_topic(%s, %s)", topic, message)
-        with self.__lock:
-            if topic in self.__topic_subscribers:
-                for handlers in self.__topic_subscribers[topic].values():
-                    for handler in handlers:
-                        self.__send(handler, [topic, message])
+        self.__publish(None, topic, message)
 
     def send_others(self, except_session_id: str, message: Any):
         """
@@ -81,11 +198,7 @@ class PubSubHub:
             message: Payload to deliver.
         """
         logger.debug("pubsub.send_others(%s, %s)", except_session_id, message)
-        with self.__lock:
-            for session_id, handlers in self.__subscribers.items():
-                if except_session_id != session_id:
-                    for handler in handlers:
-                        self.__send(handler, [message])
+        self.__publish(except_session_id, None, message)
 
     def send_others_on_topic(self, except_session_id: str, topic: str, message: Any):
         """
@@ -99,12 +212,7 @@ class PubSubHub:
         logger.debug(
             "pubsub.send_others_on_topic(%s, %s, %s)", except_session_id, topic, message
         )
-        with self.__lock:
-            if topic in self.__topic_subscribers:
-                for session_id, handlers in self.__topic_subscribers[topic].items():
-                    if except_session_id != session_id:
-                        for handler in handlers:
-                            self.__send(handler, [topic, message])
+        self.__publish(except_session_id, topic, message)
 
     def subscribe(self, session_id: str, handler: Callable):
         """
@@ -120,29 +228,37 @@ class PubSubHub:
         """
         logger.debug("pubsub.subscribe(%s)", session_id)
         with self.__lock:
-            handlers = self.__subscribers.get(session_id)
-            if handlers is None:
-                handlers = set()
-                self.__subscribers[session_id] = handlers
-            handlers.add(handler)
+            handlers = self.__subscribers.get(session_id, frozenset())
+            self.__subscribers[session_id] = handlers | {handler}
 
     def subscribe_topic(
         self,
         session_id: str,
         topic: str,
-        handler: Union[Callable, Callable[..., Awaitable[Any]]],
+        handler: Handler,
+        latest_only: bool = False,
     ):
         """
         Registers a topic subscriber for a session.
 
-        The handler will receive two positional arguments: `(topic, message)`.
+        The handler will receive two positional arguments: `(topic, message)`,
+        where `topic` is the topic the message was sent on.
 
         Args:
             session_id: Session identifier that owns this subscription.
-            topic: Topic name to subscribe to.
+            topic: Topic name or pattern to subscribe to, e.g. `org/42/#`.
             handler: Sync or async callback invoked for topic messages.
+            latest_only: Whether only the latest message of each topic
+                matters to the handler. A message sent on a topic then
+                replaces the message of the same topic still waiting to be
+                delivered to the handler, if any.
+
+        Raises:
+            ValueError: If `#` is not the last level of `topic`.
         """
         logger.debug("pubsub.subscribe_topic(%s, %s)", session_id, topic)
+        if latest_only:
+            handler = _LatestOnly(handler)
         with self.__lock:
             self.__subscribe_topic(session_id, topic, handler)
 
@@ -150,29 +266,21 @@ class PubSubHub:
         self,
         session_id: str,
         topic: str,
-        handler: Union[Callable, Callable[..., Awaitable[Any]]],
+        handler: Handler,
     ):
         """
         Internal implementation of topic subscription bookkeeping.
 
-        Maintains both forward (`topic -> session -> handlers`) and reverse
-        (`session -> topic -> handlers`) indexes for efficient publish and
-        cleanup operations.
+        Maintains both forward (topic trie: `pattern -> session -> handlers`)
+        and reverse (`session -> pattern -> handlers`) indexes for efficient
+        publish and cleanup operations.
 
         Args:
             session_id: Session identifier that owns this subscription.
-            topic: Topic name to subscribe to.
+            topic: Topic name or pattern to subscribe to.
             handler: Sync or async callback invoked for topic messages.
         """
-        topic_subscribers = self.__topic_subscribers.get(topic)
-        if topic_subscribers is None:
-            topic_subscribers = {}
-            self.__topic_subscribers[topic] = topic_subscribers
-        handlers = topic_subscribers.get(session_id)
-        if handlers is None:
-            handlers = set()
-            topic_subscribers[session_id] = handlers
-        handlers.add(handler)
+        self.__topic_subscribers.add(topic, session_id, handler)
         subscriber_topics = self.__subscriber_topics.get(session_id)
         if subscriber_topics is None:
             subscriber_topics = {}
@@ -203,7 +311,7 @@ class PubSubHub:
 
         Args:
             session_id: Session identifier to remove from the topic.
-            topic: Topic to unsubscribe from.
+            topic: Topic name or pattern to unsubscribe from, as subscribed to.
         """
         logger.debug("pubsub.unsubscribe(%s, %s)", session_id, topic)
         with self.__lock:
@@ -211,7 +319,8 @@ class PubSubHub:
 
     def unsubscribe_all(self, session_id: str):
         """
-        Removes both global and topic subscriptions for a session.
+        Removes both global and topic subscriptions for a session, and
+        discards its messages waiting to be delivered.
 
         Args:
             session_id: Session identifier to fully unsubscribe.
@@ -222,6 +331,41 @@ class PubSubHub:
             if session_id in self.__subscriber_topics:
                 for topic in list(self.__subscriber_topics[session_id].keys()):
                     self.__unsubscribe_topic(session_id, topic)
+        if self.__loop is None or self.__in_loop():
+            self.__discard_queue(session_id)
+        else:
+            self.__loop.call_soon_threadsafe(self.__discard_queue, session_id)
+
+    def close(self):
+        """
+        Stops exchanging messages with other processes, if a backend is set.
+        """
+        if self.__backend is not None:
+            self.__backend.close()
+
+    def session_stats(self, session_id: str) -> Optional[PubSubSessionStats]:
+        """
+        Returns the message delivery metrics of a session, or `None` if no
+        message was published to it since it subscribed.
+
+        Metrics are updated on the hub event loop, so when called from
+        another thread they may be slightly behind.
+
+        Args:
+            session_id: Session identifier.
+        """
+        queue = self.__queues.get(session_id)
+        return self.__stats(queue) if queue is not None else None
+
+    def all_session_stats(self) -> dict[str, PubSubSessionStats]:
+        """
+        Returns the message delivery metrics of all sessions that messages
+        were published to, by session ID.
+        """
+        return {
+            session_id: self.__stats(queue)
+            for session_id, queue in list(self.__queues.items())
+        }
 
     def __unsubscribe(self, session_id: str):
         """
@@ -244,43 +388,190 @@ class PubSubHub:
             topic: Topic to unsubscribe from.
         """
         logger.debug("pubsub.__unsubscribe_topic(%s, %s)", session_id, topic)
-        topic_subscribers = self.__topic_subscribers.get(topic)
-        if topic_subscribers is not None:
-            topic_subscribers.pop(session_id, None)
-            if len(topic_subscribers) == 0:
-                self.__topic_subscribers.pop(topic, None)
+        self.__topic_subscribers.remove(topic, session_id)
         subscriber_topics = self.__subscriber_topics.get(session_id)
         if subscriber_topics is not None:
             subscriber_topics.pop(topic, None)
             if len(subscriber_topics) == 0:
                 self.__subscriber_topics.pop(session_id, None)
 
-    def __send(
-        self, handler: Union[Callable, Callable[..., Awaitable[Any]]], args: Iterable
+    def __in_loop(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self.__loop
+        except RuntimeError:
+            return False
+
+    def __publish(
+        self, except_session_id: Optional[str], topic: Optional[str], message: Any
+    ):
+        """
+        Delivers a message to the subscribers of this hub and forwards it to
+        the other processes, if a backend is set.
+        """
+        self.__deliver(except_session_id, topic, message)
+        if self.__backend is not None:
+            self.__backend.publish(except_session_id, topic, message)
+
+    def __receive(
+        self, except_session_id: Optional[str], topic: Optional[str], message: Any
     ):
         """
-        Dispatches a message to a handler in the configured execution context.
+        Delivers a message published by another process. Called by the
+        backend on the hub event loop.
+        """
+        logger.debug("pubsub.__receive(%s, %s, %s)", except_session_id, topic, message)
+        self.__deliver(except_session_id, topic, message)
 
-        Async handlers are scheduled on the hub event loop using
-        `run_coroutine_threadsafe`. Sync handlers are either submitted to the
-        configured executor or invoked inline when no executor is provided.
+    def __deliver(
+        self, except_session_id: Optional[str], topic: Optional[str], message: Any
+    ):
+        """
+        Snapshots the subscribers a message is sent to and queues it for them.
 
         Args:
-            handler: Subscriber callback to invoke.
-            args: Positional arguments to pass to the callback.
+            except_session_id: Session ID to exclude from delivery, if any.
+            topic: Topic the message was sent on, or `None` for a global
+                message.
+            message: Payload to deliver.
+        """
+        if topic is None:
+            with self.__lock:
+                subscribers = dict(self.__subscribers)
+            if except_session_id is not None:
+                subscribers.pop(except_session_id, None)
+            self.__dispatch(subscribers, (message,))
+        else:
+            with self.__lock:
+                subscribers = self.__topic_subscribers.match(topic, except_session_id)
+            self.__dispatch(subscribers, (topic, message), topic)
+
+    def __dispatch(
+        self,
+        subscribers: dict[str, Union[set[Handler], frozenset[Handler]]],
+        args: tuple,
+        topic: Optional[str] = None,
+    ):
+        """
+        Queues a message for the handlers of a subscribers snapshot.
+
+        The message is queued right away when called on the hub event loop,
+        or else scheduled to be queued with a single loop callback for all
+        subscribers.
+
+        Args:
+            subscribers: Handlers to deliver the message to, by session ID.
+            args: Positional arguments to pass to the handlers.
+            topic: Topic the message was sent on, for topic messages.
 
         Raises:
             RuntimeError: If the hub has no event loop configured.
         """
+        if not subscribers:
+            return
         if not self.__loop:
             raise RuntimeError("PubSub event loop is not set")
 
-        if inspect.iscoroutinefunction(handler):
-            asyncio.run_coroutine_threadsafe(handler(*args), self.__loop)
+        enqueued_at = time.monotonic()
+        if self.__in_loop():
+            self.__enqueue(subscribers, args, topic, enqueued_at)
         else:
-            if self.__executor:
-                self.__loop.call_soon_threadsafe(
-                    self.__loop.run_in_executor, self.__executor, handler, *args
-                )
-            else:
-                handler(*args)
+            self.__loop.call_soon_threadsafe(
+                self.__enqueue, subscribers, args, topic, enqueued_at
+            )
+
+    def __enqueue(
+        self,
+        subscribers: dict[str, Union[set[Handler], frozenset[Handler]]],
+        args: tuple,
+        topic: Optional[str],
+        enqueued_at: float,
+    ):
+        """
+        Appends a message to the queues of the subscribers' sessions and
+        starts their drain tasks. Runs on the hub event loop.
+        """
+        for session_id, handlers in subscribers.items():
+            queue = self.__queues.get(session_id)
+            if queue is None:
+                if (
+                    session_id not in self.__subscribers
+                    and session_id not in self.__subscriber_topics
+                ):
+                    # Unsubscribed since the snapshot was taken.
+                    continue
+                queue = self.__queues[session_id] = _SessionQueue()
+            deliveries = queue.deliveries
+            for handler in handlers:
+                latest_key = None
+                if isinstance(handler, _LatestOnly):
+                    handler = handler.handler
+                    latest_key = (handler, topic)
+                    delivery = queue.latest.get(latest_key)
+                    if delivery is not None:
+                        delivery.args = args
+                        queue.coalesced += 1
+                        continue
+                if len(deliveries) >= self.__max_queue_size:
+                    dropped = deliveries.popleft()
+                    if dropped.latest_key is not None:
+                        queue.latest.pop(dropped.latest_key, None)
+                    queue.dropped += 1
+                delivery = _Delivery(handler, args, enqueued_at, latest_key)
+                deliveries.append(delivery)
+                if latest_key is not None:
+                    queue.latest[latest_key] = delivery
+            if queue.task is None and deliveries:
+                queue.task = self.__loop.create_task(self.__drain(queue))
+
+    async def __drain(self, queue: _SessionQueue):
+        """
+        Delivers the queued messages of a session, one at a time, until its
+        queue is empty.
+
+        Async handlers are awaited on the hub event loop. Sync handlers run in
+        the configured executor or are invoked inline when no executor is
+        provided. Handler errors are logged.
+
+        Args:
+            queue: The session queue to drain.
+        """
+        deliveries = queue.deliveries
+        try:
+            while deliveries:
+                delivery = deliveries.popleft()
+                if delivery.latest_key is not None:
+                    queue.latest.pop(delivery.latest_key, None)
+                handler = delivery.handler
+                try:
+                    if inspect.iscoroutinefunction(handler):
+                        await handler(*delivery.args)
+                    elif self.__executor:
+                        await self.__loop.run_in_executor(
+                            self.__executor, handler, *delivery.args
+                        )
+                    else:
+                        handler(*delivery.args)
+                except Exception:
+                    logger.exception("Error in pubsub handler %s", handler)
+                queue.delivered += 1
+        finally:
+            queue.task = None
+
+    def __discard_queue(self, session_id: str):
+        queue = self.__queues.pop(session_id, None)
+        if queue is not None and queue.task is not None:
+            queue.task.cancel()
+
+    def __stats(self, queue: _SessionQueue) -> PubSubSessionStats:
+        deliveries = queue.deliveries
+        try:
+            lag = time.monotonic() - deliveries[0].enqueued_at
+        except IndexError:
+            lag = 0.0
+        return PubSubSessionStats(
+            queued=len(deliveries),
+            lag=lag,
+            delivered=queue.delivered,
+            dropped=queue.dropped,
+            coalesced=queue.coalesced,
+        )
@@ -0,0 +1,172 @@
+from collections.abc import Awaitable
+from typing import Any, Callable, Optional, Union
+
+__all__ = ["TOPIC_SEPARATOR", "TopicTrie"]
+
+TOPIC_SEPARATOR = "/"
+"""
+Separator of the levels of hierarchical topics, e.g. `org/42/room/7`.
+"""
+
+SINGLE_LEVEL_WILDCARD = "*"
+"""
+A topic pattern level matching exactly one level of a topic.
+"""
+
+MULTI_LEVEL_WILDCARD = "#"
+"""
+The last topic pattern level, matching any number of levels of a topic,
+including none.
+"""
+
+Handler = Union[Callable, Callable[..., Awaitable[Any]]]
+
+
+class _Node:
+    __slots__ = ("children", "subscribers")
+
+    def __init__(self):
+        self.children: dict[str, _Node] = {}
+        # key: session_id, value: handlers
+        self.subscribers: dict[str, set[Handler]] = {}
+
+
+class TopicTrie:
+    """
+    Topic subscriptions indexed level by level.
+
+    A subscription is made to a topic pattern: a topic whose levels, separated
+    by `/`, may be `*`, matching any one level, or, for the last one, `#`,
+    matching any number of levels, including none. `org/*/alerts` matches
+    `org/42/alerts`, and `org/42/#` matches `org/42`, `org/42/room/7`, etc.
+    Other levels, and topics without wildcards, match only themselves.
+
+    Subscriptions to topics without wildcards are kept in a dictionary, and
+    patterns in a trie. Finding the subscribers of a topic looks it up in
+    the dictionary and walks only the branches of the trie that match it, so
+    its cost depends on the number of levels of the topic and of matching
+    subscriptions, not on the total number of subscriptions.
+
+    Not thread-safe: :class:`~flet.pubsub.PubSubHub` guards it with its lock.
+    """
+
+    def __init__(self):
+        self.__root = _Node()
+        # key: topic without wildcards, value: dict[session_id, handlers]
+        self.__exact: dict[str, dict[str, set[Handler]]] = {}
+
+    def add(self, pattern: str, session_id: str, handler: Handler):
+        """
+        Subscribes `handler` of session `session_id` to `pattern`.
+
+        Raises:
+            ValueError: If `#` is not the last level of `pattern`.
+        """
+        levels = pattern.split(TOPIC_SEPARATOR)
+        if MULTI_LEVEL_WILDCARD in levels[:-1]:
+            raise ValueError(
+                f"'{MULTI_LEVEL_WILDCARD}' must be the last level of a topic "
+                f"pattern, got '{pattern}'"
+            )
+        if _is_pattern(levels):
+            node = self.__root
+            for level in levels:
+                child = node.children.get(level)
+                if child is None:
+                    child = node.children[level] = _Node()
+                node = child
+            subscribers = node.subscribers
+        else:
+            subscribers = self.__exact.get(pattern)
+            if subscribers is None:
+                subscribers = self.__exact[pattern] = {}
+        handlers = subscribers.get(session_id)
+        if handlers is None:
+            handlers = subscribers[session_id] = set()
+        handlers.add(handler)
+
+    def remove(self, pattern: str, session_id: str):
+        """
+        Removes all handlers of session `session_id` subscribed to `pattern`,
+        and the branches of the trie left empty.
+        """
+        levels = pattern.split(TOPIC_SEPARATOR)
+        if not _is_pattern(levels):
+            subscribers = self.__exact.get(pattern)
+            if subscribers is not None:
+                subscribers.pop(session_id, None)
+                if not subscribers:
+                    del self.__exact[pattern]
+            return
+        path = [self.__root]
+        for level in levels:
+            node = path[-1].children.get(level)
+            if node is None:
+                return
+            path.append(node)
+        path[-1].subscribers.pop(session_id, None)
+        for i in range(len(levels), 0, -1):
+            node = path[i]
+            if node.subscribers or node.children:
+                break
+            del path[i - 1].children[levels[i - 1]]
+
+    def match(
+        self, topic: str, except_session_id: Optional[str] = None
+    ) -> dict[str, set[Handler]]:
+        """
+        Returns the handlers subscribed to patterns matching `topic`, by
+        session ID.
+
+        A handler subscribed with several patterns matching `topic` is
+        returned once.
+
+        Args:
+            topic: The topic to match, its levels taken literally.
+            except_session_id: A session ID whose handlers are left out.
+        """
+        result: dict[str, set[Handler]] = {}
+        subscribers = self.__exact.get(topic)
+        if subscribers is not None:
+            _collect(result, subscribers, except_session_id)
+        if not self.__root.children:
+            return result
+        levels = topic.split(TOPIC_SEPARATOR)
+        count = len(levels)
+        stack = [(self.__root, 0)]
+        while stack:
+            node, depth = stack.pop()
+            children = node.children
+            rest = children.get(MULTI_LEVEL_WILDCARD)
+            if rest is not None:
+                _collect(result, rest.subscribers, except_session_id)
+            if depth == count:
+                _collect(result, node.subscribers, except_session_id)
+                continue
+            child = children.get(levels[depth])
+            if child is not None:
+                stack.append((child, depth + 1))
+            child = children.get(SINGLE_LEVEL_WILDCARD)
+            if child is not None:
+                stack.append((child, depth + 1))
+        return result
+
+
+def _is_pattern(levels: list[str]) -> bool:
+    return SINGLE_LEVEL_WILDCARD in levels or MULTI_LEVEL_WILDCARD in levels
+
+
+def _collect(
+    result: dict[str, set[Handler]],
+    subscribers: dict[str, set[Handler]],
+    except_session_id: Optional[str],
+):
+    for session_id, handlers in subscribers.items():
+        if session_id == except_session_id:
+            continue
+        existing = result.get(session_id)
+        if existing is None:
+            # Copied, as handlers of other patterns may be merged into it.
+            result[session_id] = set(handlers)
+        else:
+            existing |= handlers
@@ -1,8 +1,10 @@
+import contextlib
 import dataclasses
 import sys
 from enum import Enum
 from typing import (
     Any,
+    Callable,
     ForwardRef,
     TypeVar,
     Union,
@@ -15,6 +17,40 @@ from flet.utils.typing_utils import eval_type
 
 T = TypeVar("T")
 
+_PLAN_ATTR = "__flet_from_dict__"
+
+
+def _compile_dataclass(cls: type) -> list[tuple[str, str, str, Callable[[Any], Any]]]:
+    """
+    Builds and caches the conversion plan used by :func:`from_dict` for `cls`.
+
+    Type hints are resolved once per class and every field is reduced to a
+    `(field_name, prev_name, data_field_name, converter)` tuple. The plan is
+    stored in the class' own `__dict__`, so subclasses and redefined classes
+    compile their own.
+    """
+    try:
+        type_hints = get_type_hints(cls, globalns=sys.modules[cls.__module__].__dict__)
+    except Exception:
+        type_hints = {f.name: f.type for f in dataclasses.fields(cls)}  # fallback
+
+    plan = []
+    for field in dataclasses.fields(cls):
+        field_name = field.name
+        field_type = type_hints.get(field_name, field.type)
+        plan.append(
+            (
+                field_name,
+                f"_prev_{field_name}",
+                field.metadata.get("data_field", field_name),
+                compile_converter(field_type),
+            )
+        )
+
+    with contextlib.suppress(AttributeError, TypeError):
+        setattr(cls, _PLAN_ATTR, plan)
+    return plan
+
 
 def from_dict(cls: type[T], data: Any) -> T:
     """
@@ -44,28 +80,20 @@ def from_dict(cls: type[T], data: Any) -> T:
         cls = eval_type(cls, globalns, None)
 
     if dataclasses.is_dataclass(cls):
-        try:
-            type_hints = get_type_hints(
-                cls, globalns=sys.modules[cls.__module__].__dict__
-            )
-        except Exception:
-            type_hints = {f.name: f.type for f in dataclasses.fields(cls)}  # fallback
+        plan = cls.__dict__.get(_PLAN_ATTR)
+        if plan is None:
+            plan = _compile_dataclass(cls)
 
         init_values = {}
         post_values = {}
 
-        for field in dataclasses.fields(cls):
-            field_name = field.name
-            field_type = type_hints.get(field_name, field.type)
-            data_field_name = field.metadata.get("data_field", field_name)
-
+        for field_name, prev_name, data_field_name, convert in plan:
             if data_field_name in data:
-                value = data[data_field_name]
-                converted = convert_value(field_type, value)
+                converted = convert(data[data_field_name])
                 init_values[field_name] = converted
 
                 # set _prev_* values
-                post_values[f"_prev_{field_name}"] = converted
+                post_values[prev_name] = converted
 
         # First create the object using init-only fields
         instance = cls(**init_values)
@@ -127,6 +155,64 @@ def convert_value(field_type: type, value: Any) -> Any:
     return value  # literal
 
 
+def _identity(value: Any) -> Any:
+    return value
+
+
+def compile_converter(field_type: Any) -> Callable[[Any], Any]:
+    """
+    Returns a callable equivalent to `lambda value: convert_value(field_type, value)`.
+
+    The type annotation is inspected once, up front, so the returned converter
+    does not repeat `get_origin()`/`get_args()` reflection for every value.
+    Nested dataclasses are converted lazily through :func:`from_dict`, which
+    keeps self-referencing types from recursing at compile time.
+
+    Args:
+        field_type: The type to convert values to.
+
+    Returns:
+        A single-argument converter.
+    """
+    origin = get_origin(field_type)
+    args = get_args(field_type)
+
+    # Optional[T]
+    if origin is Union and type(None) in args:
+        inner = compile_converter([arg for arg in args if arg is not type(None)][0])
+        if inner is _identity:
+            return _identity
+        return lambda value: None if value is None else inner(value)
+
+    # Enum
+    if isinstance(field_type, type) and issubclass(field_type, Enum):
+        return field_type
+
+    # Dataclass
+    if dataclasses.is_dataclass(field_type):
+        return lambda value: (
+            from_dict(field_type, value) if isinstance(value, dict) else value
+        )
+
+    # List[T]; a bare `List` / `list` has no item type to convert to
+    if origin is list and args:
+        item = compile_converter(args[0])
+        return lambda value: (
+            [item(v) for v in value] if isinstance(value, list) else value
+        )
+
+    # Dict[K, V]
+    if origin is dict and len(args) == 2:
+        key, val = (compile_converter(arg) for arg in args)
+        return lambda value: (
+            {key(k): val(v) for k, v in value.items()}
+            if isinstance(value, dict)
+            else value
+        )
+
+    return _identity  # literal
+
+
 def is_literal(value: Any) -> bool:
     """
     Checks if a value is a basic literal (int, float, str, bool, or None).
@@ -1,11 +1,178 @@
+import contextlib
 import dataclasses
 import inspect
 import sys
+import types
 from enum import Enum
-from typing import Any, Union, get_args, get_origin, get_type_hints
+from typing import Any, Optional, Union, get_args, get_origin, get_type_hints
 
 from flet.utils.from_dict import from_dict
 
+_FIELD_SKIP = 0
+_FIELD_PLAIN = 1
+_FIELD_ENUM = 2
+_FIELD_DATACLASS = 3
+_FIELD_DATACLASS_LIST = 4
+_FIELD_LIST = 5
+
+_PATCHER_ATTR = "__flet_patcher__"
+
+
+class _DataclassPatcher:
+    """
+    Per-class compiled plan for applying inbound patches.
+
+    Type hints are resolved once when the patcher is built and every field is
+    reduced to a `(kind, type, is_prop, prop_default)` tuple, so applying a
+    patch is a plain dictionary walk without any annotation reflection.
+    """
+
+    __slots__ = ("fields", "prop_defaults", "has_props", "unresolved")
+
+    def __init__(self, cls: type, localns: Optional[dict] = None):
+        self.prop_defaults = getattr(cls, "_prop_defaults", None)
+        self.has_props = self.prop_defaults is not None
+        self.fields: dict[str, tuple[int, Any, bool, Any]] = {}
+        # fields whose annotation failed to resolve, retried by `resolve()`
+        self.unresolved: dict[str, tuple[Any, dict]] = {}
+
+        try:
+            globalns = sys.modules[cls.__module__].__dict__
+            hints = get_type_hints(cls, globalns=globalns, localns=localns)
+        except Exception:
+            # resolve field by field, so that a single unresolvable forward
+            # reference doesn't leave the other fields unconverted
+            hints = {}
+            for base in reversed(cls.__mro__):
+                module = sys.modules.get(base.__module__)
+                base_globalns = module.__dict__ if module else {}
+                for field_name, field_type in inspect.get_annotations(base).items():
+                    try:
+                        hints[field_name] = _resolve_hint(
+                            field_type, base_globalns, localns
+                        )
+                        self.unresolved.pop(field_name, None)
+                    except Exception:
+                        hints[field_name] = field_type
+                        self.unresolved[field_name] = (field_type, base_globalns)
+
+        for field_name, field_type in hints.items():
+            self._compile_field(field_name, field_type)
+
+    def _compile_field(self, field_name: str, field_type: Any) -> None:
+        actual_type = resolve_actual_type(field_type)
+        item_type = None
+        if isinstance(actual_type, str):
+            kind = _FIELD_SKIP  # unresolved forward ref
+        elif dataclasses.is_dataclass(actual_type):
+            kind = _FIELD_DATACLASS
+        elif get_origin(actual_type) is list:
+            # a bare `List` has no item type: its items are not converted
+            args = get_args(actual_type)
+            item_type = args[0] if args else None
+            kind = (
+                _FIELD_DATACLASS_LIST
+                if dataclasses.is_dataclass(item_type)
+                else _FIELD_LIST
+            )
+        elif is_enum(actual_type):
+            kind = _FIELD_ENUM
+        else:
+            kind = _FIELD_PLAIN
+
+        prop_defaults = self.prop_defaults
+        is_prop = self.has_props and field_name in prop_defaults
+        self.fields[field_name] = (
+            kind,
+            item_type if kind == _FIELD_DATACLASS_LIST else actual_type,
+            is_prop,
+            prop_defaults[field_name] if is_prop else None,
+        )
+
+    def resolve(self, localns: Optional[dict] = None) -> None:
+        """
+        Retries resolving the annotations of unresolved fields, e.g. forward
+        references to classes defined after the first patch.
+        """
+        for field_name, (field_type, globalns) in list(self.unresolved.items()):
+            try:
+                hint = _resolve_hint(field_type, globalns, localns)
+            except Exception:
+                continue
+            del self.unresolved[field_name]
+            self._compile_field(field_name, hint)
+
+    def apply(self, obj: Any, patch: dict) -> None:
+        """
+        Applies `patch` to `obj`, an instance of the class this patcher was
+        compiled for.
+        """
+        fields = self.fields
+        _values = getattr(obj, "_values", None) if self.has_props else None
+
+        for field_name, value in patch.items():
+            spec = fields.get(field_name)
+            if spec is None:
+                if field_name.startswith("_"):
+                    setattr(obj, field_name, value)
+                continue
+
+            kind, tp, is_prop, prop_default = spec
+            if kind == _FIELD_SKIP:
+                continue
+
+            # Nested dataclass patching
+            if kind == _FIELD_DATACLASS and isinstance(value, dict):
+                current_value = getattr(obj, field_name, None)
+                if current_value is not None:
+                    _get_patcher(type(current_value)).apply(current_value, value)
+                    continue
+                value = from_dict(tp, value)
+
+            # List of dataclasses
+            elif kind == _FIELD_DATACLASS_LIST and isinstance(value, list):
+                value = [from_dict(tp, item) for item in value]
+
+            # Enum
+            elif kind == _FIELD_ENUM:
+                value = tp(value)
+
+            # For @control / @value objects write Prop fields directly into
+            # _values, bypassing dirty-tracking and other Prop.__set__
+            # side-effects.
+            if is_prop and _values is not None:
+                if value == prop_default:
+                    _values.pop(field_name, None)  # keep _values sparse
+                else:
+                    _values[field_name] = value
+            else:
+                object.__setattr__(obj, field_name, value)
+
+
+def _resolve_hint(tp: Any, globalns: dict, localns: Optional[dict]) -> Any:
+    holder = types.SimpleNamespace(__annotations__={"hint": tp})
+    return get_type_hints(holder, globalns=globalns, localns=localns)["hint"]
+
+
+def _get_patcher(cls: type, localns: Optional[dict] = None) -> _DataclassPatcher:
+    """
+    Returns the compiled patcher for `cls`, building it on first use.
+
+    The patcher is stored in the class' own `__dict__` (never inherited), so
+    subclasses compile their own plan and a redefined class - a new class
+    object - never sees a stale one.
+
+    Fields whose annotation could not be resolved are not cached as final:
+    `patch_dataclass()` retries them when a patch touches them.
+    """
+    patcher = cls.__dict__.get(_PATCHER_ATTR)
+    if patcher is None:
+        patcher = _DataclassPatcher(cls, localns)
+        # immutable types simply recompile on the next patch
+        with contextlib.suppress(AttributeError, TypeError):
+            setattr(cls, _PATCHER_ATTR, patcher)
+    return patcher
+
 
 def patch_dataclass(obj: Any, patch: dict):
     """
@@ -16,6 +183,11 @@ def patch_dataclass(obj: Any, patch: dict):
     Fields starting with `_` are set directly even when they are not declared in type
     hints.
 
+    Type hints are resolved only once per class: the first call compiles a
+    per-class patcher mapping each field to its converter (enum, nested
+    dataclass, list of dataclasses or plain value) and subsequent patches
+    reuse it.
+
     For `@control` / `@value` objects (those with `_values` and
     `_prop_defaults`), Prop fields are written directly into `_values` rather
     than going through `Prop.__set__`.  This avoids unnecessary dirty-tracking,
@@ -27,69 +199,21 @@ def patch_dataclass(obj: Any, patch: dict):
         patch: Mapping of field names to new values.
     """
     cls = obj.__class__
-
-    try:
+    patcher = cls.__dict__.get(_PATCHER_ATTR)
+    if patcher is None or (
+        patcher.unresolved and not patcher.unresolved.keys().isdisjoint(patch)
+    ):
+        # forward references of locally defined classes are resolved against
+        # the caller's namespace, when compiling the patcher or retrying
+        # fields that failed to resolve before
         frame = inspect.currentframe().f_back
-        globalns = sys.modules[cls.__module__].__dict__
         localns = frame.f_globals.copy()
         localns.update(frame.f_locals)
-        hints = get_type_hints(cls, globalns=globalns, localns=localns)
-    except Exception:
-        hints = {f.name: f.type for f in dataclasses.fields(cls)}  # fallback
-        # print("ERROR: ", cls.__name__, e)
-
-    # For @control / @value objects write Prop fields directly into _values,
-    # bypassing dirty-tracking and other Prop.__set__ side-effects.
-    _values = getattr(obj, "_values", None)
-    _prop_defaults = getattr(type(obj), "_prop_defaults", None)
-
-    def _write(field_name: str, value: Any) -> None:
-        if (
-            _values is not None
-            and _prop_defaults is not None
-            and field_name in _prop_defaults
-        ):
-            prop_default = _prop_defaults[field_name]
-            if value == prop_default:
-                _values.pop(field_name, None)  # keep _values sparse
-            else:
-                _values[field_name] = value
+        if patcher is None:
+            patcher = _get_patcher(cls, localns)
         else:
-            object.__setattr__(obj, field_name, value)
-
-    for field_name, value in patch.items():
-        if field_name in hints:
-            field_type = hints[field_name]
-            current_value = getattr(obj, field_name, None)
-            actual_type = resolve_actual_type(field_type)
-
-            if isinstance(actual_type, str):
-                continue  # unresolved forward ref
-
-            # Nested dataclass patching
-            if dataclasses.is_dataclass(actual_type) and isinstance(value, dict):
-                if current_value is None:
-                    _write(field_name, from_dict(actual_type, value))
-                else:
-                    patch_dataclass(current_value, value)
-
-            # List of dataclasses or values
-            elif get_origin(actual_type) is list and isinstance(value, list):
-                item_type = get_args(actual_type)[0]
-                if dataclasses.is_dataclass(item_type):
-                    _write(field_name, [from_dict(item_type, item) for item in value])
-                else:
-                    _write(field_name, value)
-
-            # Enum
-            elif is_enum(actual_type):
-                _write(field_name, actual_type(value))
-
-            # Simple literal or other value
-            else:
-                _write(field_name, value)
-        elif field_name.startswith("_"):
-            setattr(obj, field_name, value)
+            patcher.resolve(localns)
+    patcher.apply(obj, patch)
 
 
 def resolve_actual_type(tp: Any) -> Any:
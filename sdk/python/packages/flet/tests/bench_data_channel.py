@@ -0,0 +1,217 @@
+"""
+Standalone benchmark for inbound DataChannel throughput.
+Run with: python bench_data_channel.py
+
+Sends 64 KB - 8 MB frames from a loopback client stand-in into a DataChannel
+and measures receive throughput (MB/s), and the memory allocated per frame
+between the transport's receive buffer and the consumer (1x the frame size
+is one payload copy), for:
+
+- a `bytes` handler (copy per frame, the default);
+- a `zero_copy=True` handler (memoryview over the receive buffer);
+- `recv_into()` a reused buffer pool.
+
+The socket transport runs a real `FletSocketServer` over loopback TCP. The
+WebSocket transport drives `FletApp`'s receive loop with a stand-in websocket
+that hands over pre-built messages; it's skipped if `flet-web` dependencies
+are not installed.
+"""
+
+import asyncio
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+from flet.data_channel import _ProtocolMuxedDataChannel
+from flet.messaging.connection import Connection
+from flet.messaging.flet_socket_server import FletSocketServer
+from flet.utils import get_free_tcp_port
+
+CHANNEL_ID = 1
+FRAME_SIZES = [64 * 1024, 512 * 1024, 2 * 1024 * 1024, 8 * 1024 * 1024]
+TOTAL_BYTES = 128 * 1024 * 1024
+
+# ---------------------------------------------------------------------------
+# Consumers
+# ---------------------------------------------------------------------------
+
+
+async def _consume_handler(channel, count: int, zero_copy: bool):
+    done = asyncio.get_running_loop().create_future()
+    received = 0
+
+    def on_bytes(payload):
+        nonlocal received
+        received += 1
+        if received == count:
+            done.set_result(None)
+
+    channel.on_bytes(on_bytes, zero_copy=zero_copy)
+    await done
+    channel.on_bytes(None)
+
+
+async def _consume_recv_into(channel, count: int, frame_size: int):
+    frames = channel.frames(buffers=_pool(frame_size))
+    for _ in range(count):
+        await frames.__anext__()
+    await frames.aclose()
+
+
+_pools: dict[int, list[bytearray]] = {}
+
+
+def _pool(frame_size: int) -> list[bytearray]:
+    # allocated once, outside of the measured runs
+    if frame_size not in _pools:
+        _pools[frame_size] = [bytearray(frame_size) for _ in range(2)]
+    return _pools[frame_size]
+
+
+CONSUMERS = {
+    "bytes handler": lambda ch, n, size: _consume_handler(ch, n, False),
+    "zero-copy handler": lambda ch, n, size: _consume_handler(ch, n, True),
+    "recv_into() pool": _consume_recv_into,
+}
+
+# ---------------------------------------------------------------------------
+# Transports
+# ---------------------------------------------------------------------------
+
+
+def _frame(payload: bytes) -> bytes:
+    return b"\x01" + CHANNEL_ID.to_bytes(4, "little") + payload
+
+
+async def _socket_transport():
+    """Real socket server; yields a `send(frames)` coroutine and a channel."""
+    server = FletSocketServer(
+        asyncio.get_running_loop(),
+        port=get_free_tcp_port(),
+        executor=ThreadPoolExecutor(),
+    )
+    await server.start()
+    host, port = server.page_url.removeprefix("tcp://").split(":")
+    _, writer = await asyncio.open_connection(host, int(port))
+
+    async def send(frames):
+        for frame in frames:
+            writer.write(len(frame).to_bytes(4, "little"))
+            writer.write(frame)
+            await writer.drain()
+
+    async def close():
+        writer.close()
+        await server.close()
+
+    return send, server.data_channel_for(CHANNEL_ID), close
+
+
+async def _websocket_transport():
+    from starlette.websockets import WebSocketDisconnect
+
+    from flet_web.fastapi.flet_app import FletApp
+
+    messages: asyncio.Queue = asyncio.Queue(maxsize=4)
+
+    class _WebSocket:
+        async def receive_bytes(self):
+            data = await messages.get()
+            if data is None:
+                raise WebSocketDisconnect()
+            return data
+
+    app = FletApp(asyncio.get_running_loop(), None, lambda page: None, None)
+    app._FletApp__websocket = _WebSocket()
+    task = asyncio.create_task(app._FletApp__receive_loop())
+
+    async def send(frames):
+        for frame in frames:
+            await messages.put(frame)
+
+    async def close():
+        await messages.put(None)
+        await task
+
+    return send, app.data_channel_for(CHANNEL_ID), close
+
+
+TRANSPORTS = {
+    "socket": _socket_transport,
+    "websocket": _websocket_transport,
+}
+
+# ---------------------------------------------------------------------------
+# Timing helper
+# ---------------------------------------------------------------------------
+
+
+async def _bench(label: str, transport, consumer, frame_size: int):
+    count = max(8, TOTAL_BYTES // frame_size)
+    frames = [_frame(bytes(frame_size))] * count
+    _pool(frame_size)
+
+    send, channel, close = await transport()
+    try:
+        t0 = time.perf_counter()
+        await asyncio.gather(send(frames), consumer(channel, count, frame_size))
+        elapsed = time.perf_counter() - t0
+    finally:
+        channel.close()
+        await close()
+
+    mb_s = count * frame_size / elapsed / 1e6
+    print(f"  {label:<20} {frame_size // 1024:>6} KB  {mb_s:10,.1f} MB/s")
+
+
+async def _bench_delivery(label: str, consumer, frame_size: int, count: int = 8):
+    """Traces allocations of the channel delivery path alone: frames are
+    handed over as the receive loops do, as a view into the packet."""
+    channel = _ProtocolMuxedDataChannel(CHANNEL_ID, Connection())
+    packet = _frame(bytes(frame_size))
+    _pool(frame_size)
+
+    async def send(_):
+        for _ in range(count):
+            await asyncio.sleep(0)  # let the consumer attach first
+            channel._deliver(memoryview(packet)[5:])
+
+    tracemalloc.start()
+    await asyncio.gather(send(None), consumer(channel, count, frame_size))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    channel.close()
+    print(f"  {label:<20} {frame_size // 1024:>6} KB  {peak / frame_size:5.2f}x frame")
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+
+async def main():
+    print(f"\n{'=' * 70}")
+    print("data channel receive benchmark")
+    print(f"Python {sys.version.split()[0]}")
+    print(f"{'=' * 70}")
+
+    print("\n--- allocations per frame, channel delivery ---")
+    for frame_size in FRAME_SIZES:
+        for label, consumer in CONSUMERS.items():
+            await _bench_delivery(label, consumer, frame_size)
+
+    for name, transport in TRANSPORTS.items():
+        print(f"\n--- {name} ---")
+        try:
+            for frame_size in FRAME_SIZES:
+                for label, consumer in CONSUMERS.items():
+                    await _bench(label, transport, consumer, frame_size)
+        except ImportError as e:
+            print(f"  skipped: {e}")
+
+    print()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
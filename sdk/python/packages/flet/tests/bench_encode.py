@@ -0,0 +1,142 @@
+"""
+Standalone benchmark for outbound message encoding.
+Run with: python bench_encode.py
+
+Measures MsgPack encode throughput of the protocol encoder for a page with 10k
+controls and for a `Theme` with all component themes set, both as a regular
+(mutable) value and as a frozen one, e.g. part of a component output, whose
+encoded bytes are cached.
+"""
+
+import contextlib
+import dataclasses
+import sys
+import time
+import typing
+
+import msgpack
+
+import flet as ft
+from flet.controls.base_control import BaseControl
+from flet.messaging.protocol import (
+    ClientAction,
+    MessagePacker,
+    configure_encode_object_for_msgpack,
+)
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+def _page_controls(count: int) -> list[ft.Control]:
+    return [
+        ft.Container(
+            content=ft.Text(f"Item {i}", size=14, color=ft.Colors.BLUE),
+            padding=8,
+            bgcolor=ft.Colors.GREY_100,
+        )
+        for i in range(count // 2)
+    ]
+
+
+def _unwrap(tp):
+    args = [a for a in typing.get_args(tp) if a is not type(None)]
+    return args[0] if typing.get_origin(tp) is typing.Union and args else tp
+
+
+def _fill(cls, depth: int = 0):
+    """Instantiates a theme dataclass with all color and nested theme fields set."""
+    try:
+        hints = typing.get_type_hints(cls)
+    except NameError:
+        return cls()
+    kwargs = {}
+    for field in dataclasses.fields(cls):
+        if field.name.startswith("_"):
+            continue
+        tp = hints[field.name]
+        if ft.Colors in typing.get_args(tp):
+            kwargs[field.name] = ft.Colors.DEEP_PURPLE
+            continue
+        tp = _unwrap(tp)
+        if dataclasses.is_dataclass(tp) and depth < 2:
+            with contextlib.suppress(TypeError):
+                kwargs[field.name] = _fill(tp, depth + 1)
+    return cls(**kwargs)
+
+
+def _freeze(obj):
+    if dataclasses.is_dataclass(obj):
+        object.__setattr__(obj, "_frozen", True)
+        for field in dataclasses.fields(obj):
+            _freeze(getattr(obj, field.name))
+    elif isinstance(obj, list):
+        for item in obj:
+            _freeze(item)
+    elif isinstance(obj, dict):
+        for item in obj.values():
+            _freeze(item)
+
+
+# ---------------------------------------------------------------------------
+# Timing helper
+# ---------------------------------------------------------------------------
+
+
+def _bench(label: str, encode, value, runs: int = 5, count: int = 1):
+    rates = []
+    size = 0
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        for _ in range(count):
+            size = len(encode(value))
+        rates.append(count / (time.perf_counter() - t0))
+    best = max(rates)
+    avg = sum(rates) / len(rates)
+    print(
+        f"  {label:<40} best={best:10,.1f} msg/s  avg={avg:10,.1f} msg/s  "
+        f"size={size:,} B"
+    )
+    return best
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+
+def main():
+    print(f"\n{'=' * 70}")
+    print("encode benchmark")
+    print(f"Python {sys.version.split()[0]}, msgpack {msgpack.version}")
+    print(f"{'=' * 70}\n")
+
+    packer = MessagePacker(BaseControl)
+
+    def packb(value):
+        return msgpack.packb(
+            value, default=configure_encode_object_for_msgpack(BaseControl)
+        )
+
+    page = ft.Column(_page_controls(10_000))
+    message = [ClientAction.PATCH_CONTROL, page]
+
+    print("--- 10k-control page ---")
+    _bench("msgpack.packb()", packb, message)
+    _bench("MessagePacker.pack()", packer.pack, message)
+
+    theme = _fill(ft.Theme)
+    frozen_theme = _fill(ft.Theme)
+    _freeze(frozen_theme)
+
+    print("\n--- Theme with all component themes set ---")
+    _bench("msgpack.packb()", packb, [1, theme], count=200)
+    _bench("MessagePacker.pack()", packer.pack, [1, theme], count=200)
+    _bench("MessagePacker.pack(), frozen", packer.pack, [1, frozen_theme], count=200)
+
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Standalone benchmark for control event dispatch.
+Run with: python bench_event_dispatch.py
+
+Measures how many events per second `Session.dispatch_event` can deliver for
+high-frequency pointer (`on_pan_update`, `on_hover`) and scroll (`on_scroll`)
+events. Auto-update is disabled so that only dispatch is measured.
+"""
+
+import asyncio
+import sys
+import time
+
+import flet as ft
+from flet.messaging.connection import Connection
+from flet.messaging.session import Session
+from flet.pubsub.pubsub_hub import PubSubHub
+
+# ---------------------------------------------------------------------------
+# Session fixture
+# ---------------------------------------------------------------------------
+
+
+def _make_session(*controls: ft.Control) -> Session:
+    conn = Connection()
+    conn.pubsubhub = PubSubHub()
+    session = Session(conn)
+    session.page.controls.extend(controls)
+    session.get_page_patch()  # mount controls
+    return session
+
+
+# ---------------------------------------------------------------------------
+# Timing helper
+# ---------------------------------------------------------------------------
+
+
+async def _bench(
+    label: str,
+    session: Session,
+    control_id: int,
+    event_name: str,
+    event_data,
+    count: int = 10_000,
+    runs: int = 5,
+):
+    rates = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        for _ in range(count):
+            await session.dispatch_event(control_id, event_name, event_data)
+        rates.append(count / (time.perf_counter() - t0))
+    best = max(rates)
+    avg = sum(rates) / len(rates)
+    print(f"  {label:<45} best={best:10,.0f} events/s  avg={avg:10,.0f} events/s")
+    return best
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+
+async def main():
+    print(f"\n{'=' * 70}")
+    print("event dispatch benchmark")
+    print(f"Python {sys.version.split()[0]}")
+    print(f"{'=' * 70}\n")
+
+    ft.context.disable_auto_update()
+
+    def on_sync(e):
+        pass
+
+    async def on_async(e):
+        pass
+
+    gd = ft.GestureDetector(on_pan_update=on_sync, on_hover=on_async)
+    col = ft.Column(on_scroll=on_sync)
+    session = _make_session(gd, col)
+
+    drag = {
+        "l": {"x": 10.0, "y": 20.0},
+        "g": {"x": 110.0, "y": 120.0},
+        "ld": {"x": 1.0, "y": 0.5},
+        "gd": {"x": 1.0, "y": 0.5},
+        "ts": 1000,
+    }
+    hover = {
+        "k": "mouse",
+        "l": {"x": 10.0, "y": 20.0},
+        "g": {"x": 110.0, "y": 120.0},
+        "ts": 1000,
+        "dev": 0,
+        "ps": 0.0,
+        "pMin": 0.0,
+        "pMax": 1.0,
+        "dist": 0.0,
+        "distMax": 0.0,
+        "size": 0.0,
+        "rMj": 0.0,
+        "rMn": 0.0,
+        "rMin": 0.0,
+        "rMax": 0.0,
+        "or": 0.0,
+        "tilt": 0.0,
+        "ld": {"x": 1.0, "y": 0.5},
+        "gd": {"x": 1.0, "y": 0.5},
+    }
+    scroll = {
+        "event_type": "update",
+        "pixels": 120.0,
+        "min_scroll_extent": 0.0,
+        "max_scroll_extent": 5000.0,
+        "viewport_dimension": 800.0,
+        "scroll_delta": 4.0,
+    }
+
+    print("--- Pointer events ---")
+    await _bench("on_pan_update (sync handler)", session, gd._i, "pan_update", drag)
+    await _bench("on_hover (async handler)", session, gd._i, "hover", hover)
+
+    print("\n--- Scroll events ---")
+    await _bench("on_scroll (sync handler)", session, col._i, "scroll", scroll)
+
+    print()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
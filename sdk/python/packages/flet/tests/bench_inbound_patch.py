@@ -0,0 +1,120 @@
+"""
+Standalone benchmark for inbound (client -> server) patch application.
+Run with: python bench_inbound_patch.py
+
+Measures how many client patches per second `Session.apply_patch` can apply
+to typical controls: `TextField` keystrokes, `Slider` drags and `Page`
+window/size updates sent on resize.
+"""
+
+import sys
+import time
+
+import flet as ft
+from flet.messaging.connection import Connection
+from flet.messaging.session import Session
+from flet.pubsub.pubsub_hub import PubSubHub
+
+# ---------------------------------------------------------------------------
+# Session fixture
+# ---------------------------------------------------------------------------
+
+
+def _make_session() -> Session:
+    conn = Connection()
+    conn.pubsubhub = PubSubHub()
+    return Session(conn)
+
+
+# ---------------------------------------------------------------------------
+# Timing helper
+# ---------------------------------------------------------------------------
+
+
+def _bench(label: str, session: Session, control_id: int, patches, runs: int = 5):
+    rates = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        for patch in patches:
+            session.apply_patch(control_id, patch)
+        rates.append(len(patches) / (time.perf_counter() - t0))
+    best = max(rates)
+    avg = sum(rates) / len(rates)
+    print(f"  {label:<45} best={best:12,.0f} patches/s  avg={avg:12,.0f} patches/s")
+    return best
+
+
+# ---------------------------------------------------------------------------
+# Scenarios
+# ---------------------------------------------------------------------------
+
+
+def _text_field_patches(count: int):
+    text = ""
+    patches = []
+    for i in range(count):
+        text += chr(ord("a") + i % 26)
+        patches.append(
+            {
+                "value": text,
+                "selection": {
+                    "base_offset": len(text),
+                    "extent_offset": len(text),
+                    "affinity": "downstream",
+                    "directional": False,
+                },
+            }
+        )
+    return patches
+
+
+def _slider_patches(count: int):
+    return [{"value": (i % 1000) / 10} for i in range(count)]
+
+
+def _page_patches(count: int):
+    return [
+        {
+            "width": 800.0 + i % 400,
+            "height": 600.0 + i % 300,
+            "window": {"width": 800.0 + i % 400, "height": 628.0 + i % 300},
+            "media": {
+                "padding": {"top": 0.0, "right": 0.0, "bottom": 0.0, "left": 0.0},
+                "view_insets": {"top": 0.0, "right": 0.0, "bottom": 0.0, "left": 0.0},
+            },
+        }
+        for i in range(count)
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+
+def main():
+    print(f"\n{'=' * 70}")
+    print("inbound patch benchmark")
+    print(f"Python {sys.version.split()[0]}")
+    print(f"{'=' * 70}\n")
+
+    session = _make_session()
+    text_field = ft.TextField()
+    slider = ft.Slider()
+    session.index[text_field._i] = text_field
+    session.index[slider._i] = slider
+
+    print("--- TextField keystrokes (value + selection) ---")
+    _bench("10k patches", session, text_field._i, _text_field_patches(10_000))
+
+    print("\n--- Slider drag (value) ---")
+    _bench("10k patches", session, slider._i, _slider_patches(10_000))
+
+    print("\n--- Page resize (width/height + window + media) ---")
+    _bench("10k patches", session, session.page._i, _page_patches(10_000))
+
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,417 @@
+"""
+Standalone benchmark for protocol frame compression and key interning.
+Run with: python bench_protocol_compression.py [--write-tables]
+
+Captures the frames sent for the initial load and for incremental updates of a
+few representative apps, and reports bytes on the wire and CPU time per frame
+for plain MsgPack, interned keys, and deflate with and without the preset
+dictionary. The dictionary is evaluated on an app it was not trained on.
+
+`--write-tables` trains the preset dictionary from the training apps and
+writes it to `flet/messaging/protocol_dictionary.py` and to the Dart client,
+along with the `PROTOCOL_KEYS` table of interned keys. Run it with
+`PYTHONHASHSEED=0` for a reproducible dictionary.
+"""
+
+import base64
+import sys
+import textwrap
+import time
+import zlib
+from pathlib import Path
+
+import msgpack
+
+import flet as ft
+from flet.controls.base_control import BaseControl
+from flet.messaging.connection import Connection
+from flet.messaging.frame_compression import FrameCompressor, train_dictionary
+from flet.messaging.protocol import (
+    PROTOCOL_KEYS,
+    ClientAction,
+    ClientMessage,
+    MessagePacker,
+    RegisterClientResponseBody,
+)
+from flet.messaging.protocol_dictionary import PROTOCOL_DICTIONARY
+from flet.messaging.session import Session
+from flet.pubsub.pubsub_hub import PubSubHub
+
+ROOT = Path(__file__).resolve().parents[5]
+PYTHON_DICTIONARY = (
+    ROOT / "sdk/python/packages/flet/src/flet/messaging/protocol_dictionary.py"
+)
+DART_TRANSPORT = ROOT / "packages/flet/lib/src/transport"
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+class _RecordingConnection(Connection):
+    def __init__(self, intern_keys: bool):
+        super().__init__()
+        self.intern_keys = intern_keys
+        self.packer = MessagePacker(BaseControl)
+        self.frames: list[bytes] = []
+
+    def send_message(self, message):
+        data = self.packer.pack(
+            [message.action, message.body], intern_keys=self.intern_keys
+        )
+        self.frames.append(b"\x00" + data)
+
+
+def _contacts_app():
+    tiles = [
+        ft.ListTile(
+            leading=ft.Icon(ft.Icons.PERSON),
+            title=ft.Text(f"Person {i}"),
+            subtitle=ft.Text(f"person{i}@example.com"),
+            trailing=ft.Checkbox(value=i % 2 == 0),
+        )
+        for i in range(100)
+    ]
+    search = ft.TextField(label="Search", prefix_icon=ft.Icons.SEARCH, expand=True)
+    controls = [
+        ft.AppBar(
+            title=ft.Text("Contacts"),
+            bgcolor=ft.Colors.BLUE_100,
+            actions=[ft.IconButton(ft.Icons.SETTINGS)],
+        ),
+        ft.Row([search, ft.Button("Add", icon=ft.Icons.ADD)]),
+        ft.ListView(tiles, expand=True, spacing=4),
+    ]
+
+    def updates():
+        for i in range(10):
+            tiles[i].trailing.value = not tiles[i].trailing.value
+            tiles[i].update()
+        search.value = "pers"
+        search.update()
+        tiles[0].title.value = "Renamed"
+        tiles[0].update()
+
+    return controls, updates
+
+
+def _dashboard_app():
+    cards = [
+        ft.Card(
+            content=ft.Container(
+                content=ft.Column(
+                    [
+                        ft.Text(f"Metric {i}", size=20, weight=ft.FontWeight.BOLD),
+                        ft.Text("0", size=32, color=ft.Colors.GREEN),
+                        ft.ProgressBar(value=0.5),
+                        ft.Row(
+                            [ft.TextButton("Details"), ft.OutlinedButton("Share")],
+                            alignment=ft.MainAxisAlignment.END,
+                        ),
+                    ]
+                ),
+                padding=16,
+                border_radius=8,
+                bgcolor=ft.Colors.GREY_100,
+            )
+        )
+        for i in range(30)
+    ]
+    controls = [
+        ft.NavigationBar(
+            destinations=[
+                ft.NavigationBarDestination(icon=ft.Icons.HOME, label="Home"),
+                ft.NavigationBarDestination(icon=ft.Icons.INSIGHTS, label="Stats"),
+            ]
+        ),
+        ft.ResponsiveRow(cards),
+    ]
+
+    def updates():
+        for n in range(20):
+            column = cards[n % len(cards)].content.content
+            column.controls[1].value = str(n * 17)
+            column.controls[2].value = n / 20
+            column.update()
+
+    return controls, updates
+
+
+def _form_app():
+    fields = [
+        ft.TextField(label=label, hint_text=f"Enter {label.lower()}")
+        for label in ("Name", "Email", "Phone", "Address", "City")
+    ]
+    errors = ft.Column()
+    controls = [
+        ft.Container(
+            content=ft.Column(
+                [
+                    ft.Text("Sign up", size=28, weight=ft.FontWeight.BOLD),
+                    *fields,
+                    ft.Dropdown(
+                        label="Country",
+                        options=[ft.DropdownOption(c) for c in ("DE", "FR", "US")],
+                    ),
+                    ft.Checkbox(label="Subscribe"),
+                    ft.Switch(label="Dark mode"),
+                    ft.Slider(min=0, max=10, divisions=10),
+                    errors,
+                    ft.FilledButton("Submit", icon=ft.Icons.SEND),
+                ],
+                spacing=12,
+            ),
+            padding=24,
+            alignment=ft.Alignment.CENTER,
+        )
+    ]
+
+    def updates():
+        for field in fields:
+            field.error = "Required"
+            field.update()
+        errors.controls.append(ft.Text("Fix the errors", color=ft.Colors.RED))
+        errors.update()
+        errors.controls.clear()
+        errors.update()
+
+    return controls, updates
+
+
+def _todo_app():
+    tasks = ft.Column()
+    new_task = ft.TextField(hint_text="What needs to be done?", expand=True)
+    controls = [
+        ft.Row([new_task, ft.FloatingActionButton(icon=ft.Icons.ADD)]),
+        ft.Tabs(
+            length=3,
+            content=ft.TabBar(
+                tabs=[ft.Tab(label="all"), ft.Tab(label="active"), ft.Tab(label="done")]
+            ),
+        ),
+        tasks,
+    ]
+
+    def updates():
+        for i in range(15):
+            tasks.controls.append(
+                ft.Row(
+                    [
+                        ft.Checkbox(label=f"Task {i}"),
+                        ft.IconButton(ft.Icons.CREATE_OUTLINED, tooltip="Edit"),
+                        ft.IconButton(ft.Icons.DELETE_OUTLINE, tooltip="Delete"),
+                    ],
+                    alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
+                )
+            )
+            tasks.update()
+        for row in tasks.controls[:5]:
+            row.controls[0].value = True
+            row.update()
+
+    return controls, updates
+
+
+TRAINING_APPS = [_contacts_app, _dashboard_app, _form_app]
+EVALUATION_APPS = [_todo_app]
+
+
+def _frames(app, intern_keys: bool) -> tuple[list[bytes], list[bytes]]:
+    """Returns the initial load and the incremental update frames of `app`."""
+    conn = _RecordingConnection(intern_keys)
+    conn.pubsubhub = PubSubHub()
+    session = Session(conn)
+    # random, made fixed for the dictionary to be reproducible
+    session.page._services._internals["uid"] = "0" * 10
+    controls, updates = app()
+    session.page.controls.extend(controls)
+    conn.send_message(
+        ClientMessage(
+            ClientAction.REGISTER_CLIENT,
+            RegisterClientResponseBody(
+                session_id="session", page_patch=session.get_page_patch(), error=""
+            ),
+        )
+    )
+    initial = conn.frames[:]
+    updates()
+    return initial, conn.frames[len(initial) :]
+
+
+# ---------------------------------------------------------------------------
+# Shared tables
+# ---------------------------------------------------------------------------
+
+
+def _write_tables():
+    samples = []
+    for app in TRAINING_APPS:
+        initial, updates = _frames(app, intern_keys=True)
+        samples.extend(initial + updates)
+    dictionary = train_dictionary(samples)
+    encoded = base64.b64encode(dictionary).decode()
+
+    python_lines = textwrap.wrap(encoded, 76)
+    PYTHON_DICTIONARY.write_text(
+        "# Generated by tests/bench_protocol_compression.py --write-tables.\n"
+        "# Do not edit: the Dart client ships the same dictionary.\n"
+        "import base64\n\n"
+        "PROTOCOL_DICTIONARY = base64.b64decode(\n"
+        + "".join(f'    "{line}"\n' for line in python_lines)
+        + ")\n"
+        '"""\nPreset dictionary of protocol frame compression, see\n'
+        ":mod:`flet.messaging.frame_compression`.\n"
+        '"""\n'
+    )
+    dart_lines = textwrap.wrap(encoded, 72)
+    dart_header = (
+        "// Generated by sdk/python/packages/flet/tests/"
+        "bench_protocol_compression.py\n"
+        "// --write-tables. Do not edit: the Python server uses the same table.\n\n"
+    )
+    (DART_TRANSPORT / "protocol_dictionary.dart").write_text(
+        dart_header
+        + "/// Base64-encoded preset dictionary of compressed protocol frames.\n"
+        "const String protocolDictionaryBase64 =\n"
+        + "\n".join(f"    '{line}'" for line in dart_lines)
+        + ";\n"
+    )
+    (DART_TRANSPORT / "protocol_keys.dart").write_text(
+        dart_header
+        + "/// Strings sent as their index in this list by servers interning keys.\n"
+        "const List<String> protocolKeys = [\n"
+        + "".join(f'  "{key}",\n' for key in PROTOCOL_KEYS)
+        + "];\n"
+    )
+    print(
+        f"Wrote {len(dictionary):,} B dictionary from {len(samples)} frames "
+        f"and {len(PROTOCOL_KEYS)} keys"
+    )
+
+
+# ---------------------------------------------------------------------------
+# Timing helper
+# ---------------------------------------------------------------------------
+
+
+def _us_per_frame(fn, frames, runs: int = 5) -> float:
+    best = float("inf")
+    repeat = max(1, 2000 // len(frames))
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            for frame in frames:
+                fn(frame)
+        best = min(best, (time.perf_counter() - t0) / (repeat * len(frames)))
+    return best * 1e6
+
+
+def _report(label: str, plain: list[bytes], interned: list[bytes]):
+    no_dictionary = FrameCompressor(min_size=0, dictionary=b"\x00")
+    with_dictionary = FrameCompressor(min_size=0)
+    threshold = FrameCompressor()
+    fast = FrameCompressor(min_size=0, level=1)
+
+    def size(frames, compressor=None):
+        if compressor is not None:
+            frames = [compressor.compress(f) for f in frames]
+        return sum(map(len, frames))
+
+    def inflate(frame):
+        d = zlib.decompressobj(-zlib.MAX_WBITS, zdict=PROTOCOL_DICTIONARY)
+        return d.decompress(frame[1:]) + d.flush()
+
+    compressed = [with_dictionary.compress(f) for f in interned]
+    print(f"--- {label}: {len(plain)} frames ---")
+    rows = [
+        ("msgpack", size(plain), None),
+        ("interned keys", size(interned), None),
+        (
+            "interned + deflate",
+            size(interned, no_dictionary),
+            _us_per_frame(no_dictionary.compress, interned),
+        ),
+        (
+            "interned + deflate + dictionary",
+            size(interned, with_dictionary),
+            _us_per_frame(with_dictionary.compress, interned),
+        ),
+        (
+            "  level 1",
+            size(interned, fast),
+            _us_per_frame(fast.compress, interned),
+        ),
+        (
+            f"  above {threshold.min_size} B only",
+            size(interned, threshold),
+            _us_per_frame(threshold.compress, interned),
+        ),
+    ]
+    base = rows[0][1]
+    for name, total, cpu in rows:
+        cpu_text = f"compress={cpu:8.1f} us/frame" if cpu is not None else ""
+        print(
+            f"  {name:<34} {total:>9,} B  {total / base:6.1%}  "
+            f"{total / len(plain):>8,.0f} B/frame  {cpu_text}"
+        )
+    print(
+        f"  {'decompress (dictionary)':<34} "
+        f"{_us_per_frame(inflate, compressed):8.1f} us/frame"
+    )
+
+
+def _bench_encode(apps):
+    print("--- encode CPU, initial load ---")
+    for intern_keys in (False, True):
+        conn = _RecordingConnection(intern_keys)
+        best = float("inf")
+        for _ in range(5):
+            pages = [a()[0] for a in apps]
+            t0 = time.perf_counter()
+            for controls in pages:
+                conn.packer.pack([1, ft.Column(controls)], intern_keys=intern_keys)
+            best = min(best, time.perf_counter() - t0)
+        label = "interned keys" if intern_keys else "msgpack"
+        print(f"  {label:<34} {best * 1e3 / len(apps):8.2f} ms/page")
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+
+def main():
+    if "--write-tables" in sys.argv:
+        _write_tables()
+        return
+
+    print(f"\n{'=' * 70}")
+    print("protocol compression benchmark")
+    print(
+        f"Python {sys.version.split()[0]}, msgpack {msgpack.version}, "
+        f"zlib {zlib.ZLIB_RUNTIME_VERSION}, "
+        f"dictionary {len(PROTOCOL_DICTIONARY):,} B"
+    )
+    print(f"{'=' * 70}\n")
+
+    for title, apps in (("training", TRAINING_APPS), ("evaluation", EVALUATION_APPS)):
+        plain = [_frames(app, intern_keys=False) for app in apps]
+        interned = [_frames(app, intern_keys=True) for app in apps]
+        _report(
+            f"{title} apps, initial load",
+            [f for p in plain for f in p[0]],
+            [f for i in interned for f in i[0]],
+        )
+        _report(
+            f"{title} apps, incremental updates",
+            [f for p in plain for f in p[1]],
+            [f for i in interned for f in i[1]],
+        )
+        print()
+
+    _bench_encode(TRAINING_APPS + EVALUATION_APPS)
+    print()
+
+
+if __name__ == "__main__":
+    main()
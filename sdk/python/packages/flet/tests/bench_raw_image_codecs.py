@@ -0,0 +1,163 @@
+"""
+Standalone benchmark for RawImage remote codecs.
+Run with: python bench_raw_image_codecs.py
+
+Encodes 720p and 1080p frames with every `RawImage` codec and reports the
+encode latency and the bytes per frame, for two kinds of content:
+
+- "camera": smooth gradients with sensor-like noise, which compresses poorly
+  losslessly;
+- "ui": flat colored panels and text-like stripes, which compresses well.
+
+A second section measures throughput of encoding a burst of frames one at a
+time in a thread (the default) and concurrently in a `RawImageEncoderPool`,
+with the frames still sent in order.
+
+Requires Pillow and NumPy.
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import numpy as np
+import PIL
+from PIL import Image
+
+import flet as ft
+
+SIZES = {"720p": (1280, 720), "1080p": (1920, 1080)}
+CODECS = {
+    "png (level 6)": ft.PngCodec(),
+    "png (level 1)": ft.PngCodec(compress_level=1),
+    "jpeg (q 75)": ft.JpegCodec(),
+    "jpeg (q 90)": ft.JpegCodec(quality=90),
+    "webp (q 80)": ft.WebPCodec(),
+    "webp (q 80, m 0)": ft.WebPCodec(method=0),
+    "webp lossless": ft.WebPCodec(lossless=True, quality=0),
+    "zlib (level 1)": ft.ZlibCodec(),
+    "zlib (level 6)": ft.ZlibCodec(level=6),
+}
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+def _camera(width: int, height: int) -> np.ndarray:
+    rng = np.random.default_rng(1)
+    y, x = np.mgrid[0:height, 0:width]
+    rgba = np.empty((height, width, 4), dtype=np.uint8)
+    rgba[:, :, 0] = x * 255 // width
+    rgba[:, :, 1] = y * 255 // height
+    rgba[:, :, 2] = (x + y) * 255 // (width + height)
+    noise = rng.integers(-12, 12, size=(height, width, 3))
+    rgba[:, :, :3] = np.clip(rgba[:, :, :3] + noise, 0, 255)
+    rgba[:, :, 3] = 255
+    return rgba
+
+
+def _ui(width: int, height: int) -> np.ndarray:
+    rgba = np.full((height, width, 4), 245, dtype=np.uint8)
+    rgba[:, :, 3] = 255
+    rgba[: height // 10] = (33, 150, 243, 255)  # app bar
+    rgba[:, : width // 5] = (236, 239, 241, 255)  # side panel
+    for row in range(height // 5, height, 40):
+        # "text" lines
+        rgba[row : row + 12, width // 4 : width * 3 // 4 : 3] = (60, 60, 60, 255)
+    return rgba
+
+
+CONTENT = {"camera": _camera, "ui": _ui}
+
+# ---------------------------------------------------------------------------
+# Timing helpers
+# ---------------------------------------------------------------------------
+
+
+def _sources(rgba: np.ndarray):
+    height, width = rgba.shape[:2]
+    pixels = rgba.tobytes()
+    return width, height, pixels, Image.frombuffer("RGBA", (width, height), pixels)
+
+
+def _bench_codec(label: str, codec, rgba: np.ndarray, runs: int = 3):
+    width, height, pixels, image = _sources(rgba)
+    times = []
+    size = 0
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        size = len(codec._encode(width, height, pixels, image))
+        times.append(time.perf_counter() - t0)
+    best = min(times) * 1000
+    ratio = len(pixels) / size
+    print(
+        f"  {label:<20} {best:8.1f} ms  {size / 1024:10,.0f} KB/frame  "
+        f"{ratio:6.1f}x smaller than raw"
+    )
+
+
+async def _bench_burst(label: str, pool, codec, rgba: np.ndarray, count: int = 16):
+    """Renders `count` frames through `RawImage.stream()` to a client that
+    acks instantly, so the encoding is the bottleneck."""
+    ri = ft.RawImage(codec=codec, encoder_pool=pool, max_frames_in_flight=count)
+    sent = []
+
+    class _Channel:
+        def send(self, packet):
+            sent.append(packet)
+            asyncio.get_running_loop().call_soon(ri._on_dart_message, b"\xff")
+
+        async def drain(self):
+            pass
+
+    ri._channel = _Channel()
+    ri._ready.set()
+
+    async def frames():
+        for _ in range(count):
+            yield rgba
+
+    if pool is not None:
+        # Start the workers outside of the measured run.
+        await pool._encode(codec, 1, 1, bytes(4), Image.new("RGBA", (1, 1)))
+    t0 = time.perf_counter()
+    stats = await ri.stream(frames())
+    elapsed = time.perf_counter() - t0
+    assert stats.frames_sent == count and len(sent) == count
+    print(f"  {label:<28} {count / elapsed:8.1f} frames/s")
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+
+async def main():
+    print(f"\n{'=' * 70}")
+    print("RawImage codec benchmark")
+    print(f"Python {sys.version.split()[0]}, Pillow {PIL.__version__}")
+    print(f"{'=' * 70}")
+
+    for size_label, (width, height) in SIZES.items():
+        for content_label, make in CONTENT.items():
+            rgba = make(width, height)
+            print(f"\n--- {size_label} {content_label} ---")
+            for label, codec in CODECS.items():
+                _bench_codec(label, codec, rgba)
+
+    workers = min(4, os.cpu_count() or 1)
+    rgba = _camera(*SIZES["1080p"])
+    print(f"\n--- 1080p camera burst, encoder pool of {workers} ---")
+    with ft.RawImageEncoderPool(max_workers=workers) as pool:
+        for label in ("png (level 1)", "jpeg (q 75)", "zlib (level 1)"):
+            codec = CODECS[label]
+            await _bench_burst(f"{label}, thread", None, codec, rgba)
+            await _bench_burst(f"{label}, pool", pool, codec, rgba)
+
+    print()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,206 @@
+"""
+Standalone benchmark for Router route matching.
+Run with: python bench_router.py
+
+Builds a route table of ~400 nested routes and measures how long it takes to
+match the pathname of a navigation with:
+
+- a linear scan of the route tree building `repath` patterns on every
+  navigation (how routes were matched before compilation),
+- `_match_routes`, which compiles the tree on every call,
+- a cached `_RouteMatcher`, as used by `Router` across navigations.
+
+Results of all three are checked to be equal.
+"""
+
+import random
+import re
+import sys
+import time
+
+import repath
+
+from flet.components.router import (
+    Route,
+    _join_paths,
+    _match_routes,
+    _normalize_path,
+    _RouteMatch,
+    _RouteMatcher,
+)
+
+# ---------------------------------------------------------------------------
+# Route table
+# ---------------------------------------------------------------------------
+
+
+def _page():
+    pass
+
+
+SECTIONS = 45
+
+
+def _routes() -> list[Route]:
+    routes = [Route(index=True, component=_page)]
+    for s in range(SECTIONS):
+        routes.append(
+            Route(
+                path=f"section{s}",
+                component=_page,
+                children=[
+                    Route(index=True, component=_page),
+                    Route(path="new", component=_page),
+                    Route(path="settings", component=_page),
+                    Route(
+                        path=":item_id",
+                        component=_page,
+                        children=[
+                            Route(index=True, component=_page),
+                            Route(path="edit", component=_page),
+                            Route(path="history", component=_page),
+                            Route(path="files/:path*", component=_page),
+                        ],
+                    ),
+                ],
+            )
+        )
+    routes.append(
+        Route(
+            path="folder",
+            component=_page,
+            children=[Route(path=":name", component=_page, recursive=True)],
+        )
+    )
+    return routes
+
+
+def _pathnames(count: int) -> list[str]:
+    rnd = random.Random(0)
+    suffixes = ["", "/new", "/settings", "/42", "/42/edit", "/42/files/a/b.txt"]
+    pathnames = [
+        f"/section{rnd.randrange(SECTIONS)}{rnd.choice(suffixes)}" for _ in range(count)
+    ]
+    pathnames += ["/", "/folder/a/b/c", "/missing/page"]
+    return pathnames
+
+
+def _count_routes(routes: list[Route]) -> int:
+    return sum(1 + _count_routes(r.children or []) for r in routes)
+
+
+# ---------------------------------------------------------------------------
+# Linear scan, building patterns on every match
+# ---------------------------------------------------------------------------
+
+
+def _scan_match(routes, pathname, parent_path=""):
+    for route in routes:
+        result = _scan_try(route, pathname, parent_path)
+        if result is not None:
+            return result
+    return None
+
+
+def _scan_try(route, pathname, parent_path):
+    if route.index:
+        full_path = _normalize_path(parent_path) if parent_path else "/"
+        pattern = repath.pattern(full_path)
+        m = re.match(pattern, pathname)
+        if not m and pathname.endswith("/") and pathname != "/":
+            m = re.match(pattern, pathname.rstrip("/"))
+        if m:
+            return [_RouteMatch(route, m.groupdict(), full_path, m.group(0))]
+        return None
+
+    full_path = _join_paths(parent_path, route.path or "") or "/"
+
+    if route.recursive:
+        prefix_m = re.match(repath.pattern(full_path, end=False), pathname)
+        if not prefix_m:
+            return None
+        consumed = prefix_m.group(0)
+        head = _RouteMatch(route, prefix_m.groupdict(), full_path, consumed)
+        remainder = pathname[len(consumed) :]
+        if not remainder or remainder == "/":
+            return [head]
+        for child in route.children or []:
+            if child is route:
+                continue
+            child_result = _scan_try(child, pathname, consumed)
+            if child_result is not None:
+                return [head] + child_result
+        recurse = _scan_try(route, pathname, consumed)
+        return None if recurse is None else [head] + recurse
+
+    if route.children:
+        params, resolved = {}, full_path
+        if route.path:
+            prefix_m = re.match(repath.pattern(full_path, end=False), pathname)
+            if not prefix_m:
+                return None
+            params, resolved = prefix_m.groupdict(), prefix_m.group(0)
+        for child in route.children:
+            child_result = _scan_try(child, pathname, full_path)
+            if child_result is not None:
+                return [_RouteMatch(route, params, full_path, resolved)] + child_result
+        if not route.component:
+            return None
+
+    m = re.match(repath.pattern(full_path), pathname)
+    if m:
+        return [_RouteMatch(route, m.groupdict(), full_path, m.group(0))]
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Timing helper
+# ---------------------------------------------------------------------------
+
+
+def _bench(label: str, match, pathnames: list[str], runs: int = 5) -> float:
+    times = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        for pathname in pathnames:
+            match(pathname)
+        times.append((time.perf_counter() - t0) / len(pathnames))
+    best = min(times) * 1e6
+    print(f"  {label:<45} {best:10.1f} us/navigation")
+    return best
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+
+def main():
+    print(f"\n{'=' * 70}")
+    print("router matching benchmark")
+    print(f"Python {sys.version.split()[0]}")
+    print(f"{'=' * 70}\n")
+
+    routes = _routes()
+    pathnames = _pathnames(2_000)
+    matcher = _RouteMatcher(routes)
+
+    for pathname in pathnames:
+        expected = _scan_match(routes, pathname)
+        assert _match_routes(routes, pathname) == expected, pathname
+        assert matcher.match(pathname) == expected, pathname
+
+    print(f"{_count_routes(routes)} routes, {len(pathnames)} navigations\n")
+    scan = _bench("linear scan", lambda p: _scan_match(routes, p), pathnames)
+    _bench(
+        "_match_routes (compiled per call)",
+        lambda p: _match_routes(routes, p),
+        pathnames,
+    )
+    cached = _bench("_RouteMatcher (compiled once)", matcher.match, pathnames)
+    print(f"\n  speedup: {scan / cached:.1f}x")
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -9,7 +9,13 @@ import flet as ft
 # import flet as ft
 # import flet.canvas as cv
 from flet.controls.object_patch import ObjectPatch
-from flet.messaging.protocol import configure_encode_object_for_msgpack
+from flet.messaging.connection import Connection
+from flet.messaging.protocol import (
+    configure_encode_object_for_msgpack,
+    decode_ext_from_msgpack,
+)
+from flet.messaging.session import Session
+from flet.pubsub.pubsub_hub import PubSubHub
 
 
 @ft.control("MyText")
@@ -59,7 +65,31 @@ def b_pack(data):
 
 
 def b_unpack(packed_data):
-    return msgpack.unpackb(packed_data)
+    return msgpack.unpackb(packed_data, ext_hook=decode_ext_from_msgpack)
+
+
+class RecordingConnection(Connection):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def send_message(self, message):
+        # encode like real transports do: encoding snapshots lists for diffs
+        b_pack(message.body)
+        self.messages.append(message)
+
+
+def make_session(
+    *controls: ft.Control, executor=None, **kwargs
+) -> tuple[Session, RecordingConnection]:
+    conn = RecordingConnection()
+    conn.pubsubhub = PubSubHub()
+    if executor is not None:
+        conn.executor = executor
+    session = Session(conn, **kwargs)
+    session.page.controls.extend(controls)
+    b_pack(session.get_page_patch())  # mount controls
+    return session, conn
 
 
 def make_diff(new: Any, old: Any = None, show_details=True):
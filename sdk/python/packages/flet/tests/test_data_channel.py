@@ -0,0 +1,107 @@
+import asyncio
+import threading
+
+import pytest
+
+from flet.data_channel import _ProtocolMuxedDataChannel
+from flet.messaging.connection import Connection
+
+
+def _channel():
+    return _ProtocolMuxedDataChannel(1, Connection())
+
+
+def test_handler_receives_bytes_copy_by_default():
+    channel = _channel()
+    received = []
+    channel.on_bytes(received.append)
+
+    packet = b"\x01\x01\x00\x00\x00abc"
+    channel._deliver(memoryview(packet)[5:])
+
+    assert received == [b"abc"]
+    assert type(received[0]) is bytes
+
+
+def test_zero_copy_handler_receives_view_of_packet():
+    channel = _channel()
+    received = []
+    channel.on_bytes(received.append, zero_copy=True)
+
+    packet = bytearray(b"\x01\x01\x00\x00\x00abc")
+    channel._deliver(memoryview(packet)[5:])
+    packet[5] = ord("x")
+
+    assert isinstance(received[0], memoryview)
+    assert received[0] == b"xbc"
+
+
+@pytest.mark.asyncio
+async def test_recv_into_copies_frames_into_buffer():
+    channel = _channel()
+    buffer = bytearray(8)
+    task = asyncio.create_task(channel.recv_into(buffer))
+    await asyncio.sleep(0)
+
+    channel._deliver(memoryview(b"abc"))
+    assert await task == 3
+    assert buffer[:3] == b"abc"
+
+    channel._deliver(memoryview(b"too long frame"))
+    with pytest.raises(ValueError):
+        await channel.recv_into(buffer)
+    assert await channel.recv_into(bytearray(16)) == 14  # frame is kept
+
+
+@pytest.mark.asyncio
+async def test_frames_reuses_buffer_pool_until_closed():
+    channel = _channel()
+    pool = [bytearray(4), bytearray(4)]
+
+    async def collect():
+        return [(view.obj, bytes(view)) async for view in channel.frames(buffers=pool)]
+
+    task = asyncio.create_task(collect())
+    await asyncio.sleep(0)
+    for payload in (b"a", b"bb", b"ccc"):
+        channel._deliver(memoryview(payload))
+    await asyncio.sleep(0)
+    channel.close()
+
+    frames = await asyncio.wait_for(task, 1)
+    assert [data for _, data in frames] == [b"a", b"bb", b"ccc"]
+    assert [buf is pool[i % 2] for i, (buf, _) in enumerate(frames)] == [True] * 3
+
+
+@pytest.mark.asyncio
+async def test_async_iteration_and_pending_limit():
+    channel = _channel()
+    channel.max_pending_frames = 2
+    received = []
+
+    async def consume():
+        async for frame in channel:
+            received.append(bytes(frame))
+
+    task = asyncio.create_task(consume())
+    await asyncio.sleep(0)
+    for payload in (b"1", b"2", b"3"):
+        channel._deliver(memoryview(payload))
+    channel.close()
+    await asyncio.wait_for(task, 1)
+
+    assert received == [b"2", b"3"]
+    assert channel.dropped_frames == 1
+
+
+@pytest.mark.asyncio
+async def test_frames_enqueued_from_another_thread():
+    channel = _channel()
+    task = asyncio.create_task(channel.recv_into(bytearray(4)))
+    await asyncio.sleep(0)
+
+    thread = threading.Thread(target=channel._enqueue, args=(b"abc",))
+    thread.start()
+    thread.join()
+
+    assert await asyncio.wait_for(task, 1) == 3
@@ -1,6 +1,19 @@
 import sys
 from typing import ForwardRef, get_args, get_origin, get_type_hints
 
+import pytest
+
+from flet.controls.base_control import (
+    _HANDLER_ASYNC,
+    _HANDLER_GENERATOR,
+    _HANDLER_NONE,
+    _HANDLER_SYNC,
+    _bound_handler_kinds,
+    _get_event_dispatch,
+    _get_handler_kind,
+    _handler_kinds,
+    control,
+)
 from flet.controls.base_page import PageResizeEvent
 from flet.controls.control_event import ControlEvent, Event, get_event_field_type
 from flet.controls.core.column import Column
@@ -136,3 +149,89 @@ def test_get_type_hints_control_event_forward_ref():
 
     hints = get_type_hints(handler, include_extras=True)
     assert hints["event"] == ControlEvent
+
+
+def test_event_dispatch_table_is_cached_per_class():
+    c = Container()
+    assert _get_event_dispatch(Container, "tap_down") == (
+        "on_tap_down",
+        TapEvent["Container"],
+    )
+    assert _get_event_dispatch(Container, "click") == (
+        "on_click",
+        Event[ForwardRef("Container")],
+    )
+    assert _get_event_dispatch(Container, "no_such_event") is None
+
+    table = Container.__dict__["__flet_event_dispatch__"]
+    assert set(table) == {"tap_down", "click", "no_such_event"}
+
+    @control("MyContainer")
+    class MyContainer(Container):
+        pass
+
+    assert _get_event_dispatch(MyContainer, "tap_down")[0] == "on_tap_down"
+    assert MyContainer.__dict__["__flet_event_dispatch__"] is not table
+    assert get_event_field_type(type(c), "on_tap_down") == TapEvent["Container"]
+
+
+def test_handler_kind_is_cached_per_function():
+    class Handlers:
+        def method(self, e):
+            pass
+
+        async def no_args(self):
+            pass
+
+    def gen(e):
+        yield
+
+    h = Handlers()
+    assert _get_handler_kind(h.method) == (_HANDLER_SYNC, False)
+    assert _get_handler_kind(h.no_args) == (_HANDLER_ASYNC, True)
+    assert _get_handler_kind(gen) == (_HANDLER_GENERATOR, False)
+    assert _get_handler_kind(None) == (_HANDLER_NONE, False)
+    assert Handlers.method in _bound_handler_kinds
+    assert gen in _handler_kinds
+
+
+@pytest.mark.asyncio
+async def test_dispatch_typed_events_to_sync_and_async_handlers():
+    conn = Connection()
+    conn.pubsubhub = PubSubHub()
+    session = Session(conn)
+    received = []
+
+    async def on_tap_down(e: TapEvent):
+        received.append(e)
+
+    container = Container(on_tap_down=on_tap_down, on_click=lambda: received.append(1))
+    col = Column(on_scroll=lambda e: received.append(e))
+    session.page.controls.extend([container, col])
+    session.get_page_patch()
+
+    for _ in range(2):
+        await session.dispatch_event(
+            container._i,
+            "tap_down",
+            {"k": "mouse", "l": {"x": 1, "y": 2}, "g": {"x": 4, "y": 5}},
+        )
+    await session.dispatch_event(container._i, "click", None)
+    await session.dispatch_event(
+        col._i,
+        "scroll",
+        {
+            "event_type": "update",
+            "pixels": 10,
+            "min_scroll_extent": 0,
+            "max_scroll_extent": 100,
+            "viewport_dimension": 100,
+        },
+    )
+
+    assert isinstance(received[0], TapEvent)
+    assert received[0].local_position.x == 1
+    assert received[1].kind == PointerDeviceType.MOUSE
+    assert received[2] == 1
+    assert isinstance(received[3], OnScrollEvent)
+    assert received[3].pixels == 10
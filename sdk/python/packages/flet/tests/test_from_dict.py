@@ -1,3 +1,4 @@
+import typing
 from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
@@ -63,3 +64,17 @@ def test_simple():
     assert user._prev_age == 30
     assert user.address._prev_city == "Springfield"
     assert user._prev_status == Status.ACTIVE
+
+
+def test_bare_generic_fields_are_not_converted():
+    @dataclass
+    class Bag:
+        items: typing.List  # noqa: UP006
+        meta: typing.Dict  # noqa: UP006
+        names: Optional[list]
+
+    bag = from_dict(Bag, {"items": [1, "a"], "meta": {"k": 1}, "names": ["x"]})
+
+    assert bag.items == [1, "a"]
+    assert bag.meta == {"k": 1}
+    assert bag.names == ["x"]
@@ -0,0 +1,118 @@
+import pytest
+
+import flet as ft
+from flet.controls.item_builder_control import MIN_ITEMS_OVERSCAN
+
+from .common import make_msg
+
+
+@ft.control("ListView")
+class UpdatableListView(ft.ListView):
+    """A ListView updated in place, without a page."""
+
+    def update(self):
+        self.before_update()
+
+
+def _request(control, start, stop):
+    control.before_event(
+        ft.ItemsRequestEvent(
+            name="items_request", control=control, start=start, stop=stop
+        )
+    )
+
+
+def _make(built, item_count=100_000, **kwargs):
+    def builder(index):
+        built.append(index)
+        return ft.Text(f"Item {index}")
+
+    return UpdatableListView(item_count=item_count, item_builder=builder, **kwargs)
+
+
+@pytest.mark.parametrize("cls", [ft.ListView, ft.GridView])
+def test_builds_only_first_items(cls):
+    control = cls(item_count=100_000, item_builder=lambda i: ft.Text(str(i)))
+    control.before_update()
+
+    assert control.items_offset == 0
+    assert [c.value for c in control.controls] == [
+        str(i) for i in range(MIN_ITEMS_OVERSCAN)
+    ]
+
+
+def test_builds_requested_range_with_overscan():
+    built = []
+    lv = _make(built)
+    lv.before_update()
+
+    _request(lv, 1000, 1060)
+
+    assert lv.items_offset == 970
+    assert [c.value for c in lv.controls] == [f"Item {i}" for i in range(970, 1090)]
+    assert len(built) == MIN_ITEMS_OVERSCAN + 120
+
+
+def test_range_is_clamped_to_item_count():
+    lv = _make([], item_count=30)
+    _request(lv, 25, 40)
+
+    assert lv.items_offset == 5
+    assert len(lv.controls) == 25
+
+
+def test_scrolling_back_reuses_cached_items():
+    built = []
+    lv = _make(built)
+    _request(lv, 0, 20)
+    first = list(lv.controls)
+    _request(lv, 500, 520)
+    count = len(built)
+
+    _request(lv, 0, 20)
+
+    assert len(built) == count
+    assert all(a is b for a, b in zip(lv.controls, first))
+
+
+def test_cache_evicts_least_recently_used_items():
+    built = []
+    lv = _make(built, item_cache_size=50)
+    _request(lv, 0, 10)  # items 0-29
+    _request(lv, 100, 110)  # items 80-129, evicts 0-29
+    _request(lv, 200, 210)  # items 180-229, evicts 80-129
+    built.clear()
+
+    _request(lv, 100, 110)
+
+    assert built == list(range(80, 130))
+
+
+def test_invalidate_rebuilds_items():
+    built = []
+    lv = _make(built)
+    _request(lv, 0, 10)
+    built.clear()
+
+    lv.invalidate(5)
+    assert built == [5]
+
+    built.clear()
+    lv.invalidate(range(10, 15))
+    assert built == list(range(10, 15))
+
+    built.clear()
+    lv.invalidate()
+    assert built == list(range(30))
+
+
+def test_window_update_sends_only_new_items():
+    lv = _make([])
+    _request(lv, 0, 20)  # items 0-39
+    make_msg(lv, {}, show_details=False)
+
+    _request(lv, 5, 25)  # items 0-44
+    _, patch, _, _, _ = make_msg(lv, lv, show_details=False)
+
+    assert [op["op"] for op in patch] == ["add"] * 5
+    assert [op["value"].value for op in patch] == [f"Item {i}" for i in range(40, 45)]
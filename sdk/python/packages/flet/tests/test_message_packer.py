@@ -0,0 +1,89 @@
+import msgpack
+
+import flet as ft
+from flet.controls.base_control import BaseControl
+from flet.messaging.protocol import (
+    EXT_TYPE_MSGPACK,
+    MessagePacker,
+    configure_encode_object_for_msgpack,
+    decode_ext_from_msgpack,
+)
+
+
+def _unpack(data):
+    return msgpack.unpackb(data, ext_hook=decode_ext_from_msgpack)
+
+
+def _freeze(obj):
+    object.__setattr__(obj, "_frozen", True)
+    return obj
+
+
+def test_encoder_is_created_once_per_control_class():
+    assert configure_encode_object_for_msgpack(
+        BaseControl
+    ) is configure_encode_object_for_msgpack(BaseControl)
+
+
+def test_message_packer_matches_packb():
+    packer = MessagePacker(BaseControl)
+    value = [2, ft.Column([ft.Text("a", size=12), ft.Container(padding=4)])]
+
+    expected = msgpack.packb(
+        value, default=configure_encode_object_for_msgpack(BaseControl)
+    )
+    assert packer.pack(value) == expected
+    assert packer.pack(value) == expected  # buffer is reset between messages
+
+
+def test_encode_plan_is_per_class():
+    @ft.control("Base1")
+    class Base1(ft.Control):
+        a: int = 1
+
+    @ft.control("Derived1")
+    class Derived1(Base1):
+        b: int = 2
+
+    packer = MessagePacker(BaseControl)
+    packer.pack(Base1(a=3))
+    assert "__flet_encode_plan__" not in Derived1.__dict__
+    assert _unpack(packer.pack(Derived1(a=3, b=4)))["b"] == 4
+    assert (
+        Derived1.__dict__["__flet_encode_plan__"]
+        is not (Base1.__dict__["__flet_encode_plan__"])
+    )
+
+
+def test_frozen_value_is_encoded_once():
+    packer = MessagePacker(BaseControl)
+    style = ft.TextStyle(size=12, color=ft.Colors.RED)
+    expected = _unpack(packer.pack(style))
+
+    frozen = _freeze(ft.TextStyle(size=12, color=ft.Colors.RED))
+    first = packer.pack(frozen)
+    cached = frozen.__dict__["__flet_encoded__"]
+
+    assert msgpack.unpackb(first) == msgpack.ExtType(EXT_TYPE_MSGPACK, cached)
+    assert packer.pack(frozen) == first
+    assert _unpack(first) == expected
+
+
+def test_frozen_value_with_mutable_nested_value_is_not_cached():
+    packer = MessagePacker(BaseControl)
+    nested = ft.ColorScheme(primary=ft.Colors.RED)
+    theme = _freeze(ft.Theme(color_scheme=nested))
+
+    packer.pack(theme)
+    assert "__flet_encoded__" not in theme.__dict__
+
+    nested.primary = ft.Colors.BLUE
+    assert _unpack(packer.pack(theme))["color_scheme"]["primary"] == "blue"
+
+
+def test_frozen_controls_are_not_cached():
+    packer = MessagePacker(BaseControl)
+    text = _freeze(ft.Text("a"))
+
+    packer.pack(text)
+    assert "__flet_encoded__" not in text.__dict__
@@ -1,6 +1,14 @@
+import asyncio
 from dataclasses import dataclass, field
 
+import pytest
+
 import flet as ft
+from flet.components.observable import track_field_reads, transaction
+from flet.controls.context import _context_page
+from flet.messaging.connection import Connection
+from flet.messaging.session import Session
+from flet.pubsub.pubsub_hub import PubSubHub
 
 
 class Foo(ft.Observable):
@@ -131,3 +139,149 @@ def test_observable_repr():
     foo.prop_b = "value2"
     updated_repr_2 = repr(foo)
     assert "version=2" in updated_repr_2
+
+
+class _RecordingConnection(Connection):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def send_message(self, message):
+        self.messages.append(message)
+
+
+@ft.observable
+@dataclass
+class Board:
+    title: str = ""
+    items: list[int] = field(default_factory=list)
+
+
+def _subscribe(obj):
+    changes = []
+
+    def subscriber(sender, field):
+        changes.append((sender, field))
+
+    # the disposer holds the subscriber
+    return changes, obj.subscribe(subscriber)
+
+
+def test_batch_notifies_once_per_changed_field():
+    board = Board()
+    changes, _dispose = _subscribe(board)
+    version = board.__version__
+
+    with board.batch():
+        for i in range(1000):
+            board.items.append(i)
+        board.title = "Done"
+        board.items.append(1000)
+        assert changes == []
+
+    assert changes == [(board, "items"), (board, "title")]
+    assert len(board.items) == 1001
+    # the version still counts every change
+    assert board.__version__ == version + 1002
+
+
+def test_nested_transaction_notifies_at_outermost_end():
+    first, second = Board(), Board()
+    first_changes, _dispose_first = _subscribe(first)
+    second_changes, _dispose_second = _subscribe(second)
+
+    with transaction():
+        first.title = "a"
+        with second.batch():
+            second.title = "b"
+            first.notify()
+        assert first_changes == second_changes == []
+
+    assert first_changes == [(first, "title"), (first, None)]
+    assert second_changes == [(second, "title")]
+
+
+def test_transaction_notifies_when_block_raises():
+    board = Board()
+    changes, _dispose = _subscribe(board)
+
+    with pytest.raises(ValueError), board.batch():
+        board.title = "a"
+        raise ValueError()
+
+    assert changes == [(board, "title")]
+
+
+@pytest.mark.asyncio
+async def test_changes_of_task_created_in_batch_are_notified():
+    board = Board()
+    changes, _dispose = _subscribe(board)
+
+    async def append():
+        board.items.append(1)
+
+    with board.batch():
+        board.items.append(0)
+        task = asyncio.create_task(append())
+    await task
+
+    assert board.items == [0, 1]
+    assert changes == [(board, "items"), (board, "items")]
+
+
+def test_track_field_reads():
+    board, other = Board(), Board()
+
+    with track_field_reads() as reads:
+        _ = board.title, board.title, board.items
+        _ = vars(other)
+        board.add_later = 1  # writes are not reads
+
+    assert reads == {id(board): {"title", "items"}, id(other): None}
+    # no tracking outside the block
+    _ = board.add_later
+    assert reads[id(board)] == {"title", "items"}
+
+
+@pytest.mark.asyncio
+async def test_component_rerenders_on_change_of_fields_it_read():
+    board = Board(title="Board")
+    renders = []
+
+    @ft.component
+    def Title(b: Board):
+        renders.append("title")
+        return ft.Text(b.title)
+
+    @ft.component
+    def Items(b: Board):
+        renders.append("items")
+        return ft.Column([ft.Text(str(i)) for i in b.items])
+
+    @ft.component
+    def App():
+        return ft.Column([Title(board), Items(board)])
+
+    conn = _RecordingConnection()
+    conn.pubsubhub = PubSubHub()
+    session = Session(conn)
+    token = _context_page.set(session.page)
+    try:
+        session.page.render(App)
+        session.get_page_patch()
+        renders.clear()
+
+        with board.batch():
+            for i in range(100):
+                board.items.append(i)
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert renders == ["items"]
+
+        board.title = "Renamed"
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert renders == ["items", "title"]
+    finally:
+        session.close()
+        _context_page.reset(token)
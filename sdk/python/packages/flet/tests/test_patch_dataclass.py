@@ -1,4 +1,6 @@
+import typing
 from dataclasses import dataclass, field
+from typing import Optional
 
 import msgpack
 
@@ -301,3 +303,101 @@ def test_prev_snapshots_are_released_when_changed_field_becomes_none():
     ObjectPatch.from_diff(c, c, control_cls=BaseControl)
 
     assert "items" not in getattr(c, "__prev_lists")
+
+
+def test_patch_dataclass_compiles_patcher_once_per_class():
+    @control("PatcherTestControl")
+    class PatcherTestControl(BaseControl):
+        value: str = ""
+        brightness: Optional[Brightness] = None
+        padding: Optional[Padding] = None
+
+    c = PatcherTestControl()
+    patch_dataclass(c, {"value": "a"})
+    patcher = PatcherTestControl.__dict__["__flet_patcher__"]
+
+    patch_dataclass(c, {"value": "", "brightness": "dark", "padding": {"left": 1}})
+    assert PatcherTestControl.__dict__["__flet_patcher__"] is patcher
+
+    # default values are kept out of sparse _values
+    assert c.value == ""
+    assert "value" not in c._values
+    assert c.brightness == Brightness.DARK
+    assert isinstance(c.padding, Padding)
+    assert c.padding.left == 1
+
+    patch_dataclass(c, {"padding": {"top": 2}})
+    assert c.padding.left == 1
+    assert c.padding.top == 2
+    assert len(c._dirty) == 0
+
+
+def test_patch_dataclass_patcher_is_not_inherited():
+    @control("PatcherBaseControl")
+    class PatcherBaseControl(BaseControl):
+        value: str = ""
+
+    patch_dataclass(PatcherBaseControl(), {"value": "a"})
+
+    @control("PatcherBaseControl")
+    class PatcherChildControl(PatcherBaseControl):
+        count: int = 0
+
+    child = PatcherChildControl()
+    patch_dataclass(child, {"value": "b", "count": 3})
+
+    assert child.value == "b"
+    assert child.count == 3
+    assert (
+        PatcherChildControl.__dict__["__flet_patcher__"]
+        is not PatcherBaseControl.__dict__["__flet_patcher__"]
+    )
+
+
+def test_patch_dataclass_redefined_class_gets_new_patcher():
+    def make_class():
+        @dataclass
+        class Redefined:
+            value: int = 0
+
+        return Redefined
+
+    first, second = make_class(), make_class()
+    a, b = first(), second()
+    patch_dataclass(a, {"value": 1})
+    patch_dataclass(b, {"value": 2})
+
+    assert (a.value, b.value) == (1, 2)
+    assert first.__dict__["__flet_patcher__"] is not second.__dict__["__flet_patcher__"]
+
+
+def test_patch_dataclass_retries_unresolved_type_hints():
+    @dataclass
+    class Holder:
+        child: Optional["LaterChild"] = None
+
+    holder = Holder()
+    patch_dataclass(holder, {"child": None})
+
+    @dataclass
+    class LaterChild:
+        value: int = 0
+
+    patch_dataclass(holder, {"child": {"value": 3}})
+
+    assert holder.child == LaterChild(value=3)
+    assert not Holder.__dict__["__flet_patcher__"].unresolved
+
+
+def test_patch_dataclass_with_bare_list_field():
+    @dataclass
+    class Holder:
+        items: typing.List = None  # noqa: UP006
+        count: int = 0
+
+    holder = Holder()
+    patch_dataclass(holder, {"count": 3})
+    patch_dataclass(holder, {"items": [{"a": 1}]})
+
+    assert holder.count == 3
+    assert holder.items == [{"a": 1}]
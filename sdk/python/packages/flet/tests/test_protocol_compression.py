@@ -0,0 +1,167 @@
+import os
+
+import msgpack
+
+import flet as ft
+from flet.controls.base_control import BaseControl
+from flet.messaging.connection import Connection
+from flet.messaging.frame_compression import (
+    COMPRESSED_PACKET_TYPE,
+    FRAME_COMPRESSION_FEATURE,
+    FrameCompressor,
+    decompress_packet,
+    train_dictionary,
+)
+from flet.messaging.protocol import (
+    EXT_TYPE_KEY,
+    KEY_INTERNING_FEATURE,
+    PROTOCOL_KEYS,
+    MessagePacker,
+    decode_ext_from_msgpack,
+)
+from flet.messaging.session import Session
+from flet.pubsub.pubsub_hub import PubSubHub
+
+
+def _unpack(data):
+    return msgpack.unpackb(data, ext_hook=decode_ext_from_msgpack)
+
+
+class _RecordingConnection(Connection):
+    def __init__(self, intern_keys=False):
+        super().__init__()
+        self.intern_keys = intern_keys
+        self.packer = MessagePacker(BaseControl)
+        self.frames = []
+
+    def send_message(self, message):
+        self.frames.append(
+            self.packer.pack(
+                [message.action, message.body], intern_keys=self.intern_keys
+            )
+        )
+
+
+def _page():
+    return ft.Column(
+        [
+            ft.Text("Hello", size=20, weight=ft.FontWeight.BOLD),
+            ft.Container(content=ft.Icon(ft.Icons.ADD), padding=8, expand=True),
+            ft.Checkbox(label="Done", value=True, on_change=lambda e: None),
+        ]
+    )
+
+
+def test_protocol_keys_fit_in_one_byte():
+    assert len(PROTOCOL_KEYS) <= 256
+    assert len(set(PROTOCOL_KEYS)) == len(PROTOCOL_KEYS)
+    assert all(len(key) >= 3 for key in PROTOCOL_KEYS)
+
+
+def test_interned_keys_decode_to_same_value():
+    packer = MessagePacker(BaseControl)
+    page = _page()
+
+    plain = packer.pack([2, page])
+    interned = packer.pack([2, page], intern_keys=True)
+
+    assert len(interned) < len(plain)
+    assert _unpack(interned) == _unpack(plain)
+    # the control type name is interned too
+    assert bytes([0xD4, EXT_TYPE_KEY, PROTOCOL_KEYS.index("Text")]) in interned
+    assert b"Text" not in interned
+
+
+def test_frozen_value_cache_is_per_encoding():
+    packer = MessagePacker(BaseControl)
+    style = ft.TextStyle(size=12, color=ft.Colors.RED)
+    object.__setattr__(style, "_frozen", True)
+
+    interned = packer.pack(style, intern_keys=True)
+    plain = packer.pack(style)
+
+    assert _unpack(interned) == _unpack(plain) == {"size": 12, "color": "red"}
+    assert packer.pack(style, intern_keys=True) == interned
+    assert packer.pack(style) == plain
+
+
+def test_session_interns_patch_paths():
+    messages = {}
+    for intern_keys in (False, True):
+        conn = _RecordingConnection(intern_keys)
+        conn.pubsubhub = PubSubHub()
+        session = Session(conn)
+        text = ft.Text("a")
+        session.page.controls.append(ft.Column([text]))
+        conn.packer.pack(session.get_page_patch(), intern_keys=intern_keys)
+        text.value = "b"
+        text.size = 12
+        text.update()
+        messages[intern_keys] = conn.frames[-1]
+
+    assert len(messages[True]) < len(messages[False])
+    assert _unpack(messages[True])[1]["patch"] == [
+        [0],
+        [0, 0, "value", "b"],
+        [0, 0, "size", 12],
+    ]
+    assert _unpack(messages[False])[1]["patch"] == _unpack(messages[True])[1]["patch"]
+
+
+def test_frame_compressor_round_trip():
+    compressor = FrameCompressor()
+    packet = b"\x00" + MessagePacker(BaseControl).pack([2, _page()], intern_keys=True)
+
+    compressed = compressor.compress(packet)
+
+    assert compressed[0] == COMPRESSED_PACKET_TYPE
+    assert len(compressed) < len(packet)
+    assert decompress_packet(compressed) == packet
+    assert compressor.packets_compressed == 1
+    assert compressor.bytes_out == len(compressed)
+
+
+def test_frame_compressor_keeps_small_and_incompressible_packets():
+    compressor = FrameCompressor(min_size=64)
+    small = b"\x00" + b"a" * 10
+    incompressible = b"\x00" + os.urandom(1024)
+
+    assert compressor.compress(small) is small
+    assert compressor.compress(incompressible) is incompressible
+    assert compressor.packets_compressed == 0
+
+
+def test_configure_protocol(monkeypatch):
+    monkeypatch.delenv("FLET_PROTOCOL_COMPRESSION", raising=False)
+    conn = Connection()
+
+    conn.configure_protocol([KEY_INTERNING_FEATURE, FRAME_COMPRESSION_FEATURE])
+    assert conn.intern_keys
+    assert conn.frame_compressor is not None
+
+    conn.configure_protocol(None)
+    assert not conn.intern_keys
+    assert conn.frame_compressor is None
+
+    # no compression for clients on the same machine, unless enabled
+    conn.local_data_transport = True
+    conn.configure_protocol([FRAME_COMPRESSION_FEATURE])
+    assert conn.frame_compressor is None
+    monkeypatch.setenv("FLET_PROTOCOL_COMPRESSION", "true")
+    conn.configure_protocol([FRAME_COMPRESSION_FEATURE])
+    assert conn.frame_compressor is not None
+
+
+def test_train_dictionary_keeps_shared_substrings():
+    samples = [
+        b"\x82\xa5value\xa1" + str(i).encode() + b"\xa2_c\xa4Text" + os.urandom(8)
+        for i in range(20)
+    ]
+
+    dictionary = train_dictionary(samples, size=64, segment_size=16, k=4)
+
+    assert 0 < len(dictionary) <= 64
+    assert b"Text" in dictionary
+    compressor = FrameCompressor(min_size=0, dictionary=dictionary)
+    packet = samples[0] * 2
+    assert decompress_packet(compressor.compress(packet), dictionary) == packet
@@ -0,0 +1,302 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from flet.pubsub import PubSubClient, PubSubHub
+from flet.pubsub.topic_trie import TopicTrie
+
+
+def _hub(**kwargs):
+    return PubSubHub(loop=asyncio.get_running_loop(), **kwargs)
+
+
+async def _flush(hub):
+    while any(q.task for q in hub._PubSubHub__queues.values()):
+        await asyncio.sleep(0.001)
+
+
+def _subscribe(hub, session_id, pattern, received):
+    hub.subscribe_topic(
+        session_id, pattern, lambda topic, message: received.append((topic, message))
+    )
+
+
+@pytest.mark.parametrize(
+    "pattern, topic, matches",
+    [
+        ("chat", "chat", True),
+        ("chat", "chat/1", False),
+        ("org/42/room", "org/42/room", True),
+        ("org/*/room", "org/42/room", True),
+        ("org/*/room", "org/42/43/room", False),
+        ("org/*", "org", False),
+        ("org/#", "org", True),
+        ("org/#", "org/42/room/7", True),
+        ("org/#", "orgs/42", False),
+        ("#", "anything/at/all", True),
+        ("*/*/room", "org/42/room", True),
+        ("org/4*", "org/42", False),
+        ("org/4*", "org/4*", True),
+    ],
+)
+@pytest.mark.asyncio
+async def test_topic_patterns(pattern, topic, matches):
+    hub = _hub()
+    received = []
+    _subscribe(hub, "s1", pattern, received)
+
+    hub.send_all_on_topic(topic, "hi")
+    await _flush(hub)
+
+    assert received == ([(topic, "hi")] if matches else [])
+
+
+@pytest.mark.asyncio
+async def test_handler_receives_message_once_for_overlapping_patterns():
+    hub = _hub()
+    received = []
+
+    def handler(topic, message):
+        received.append(topic)
+
+    for pattern in ("org/#", "org/42/#", "org/*/room", "org/42/room"):
+        hub.subscribe_topic("s1", pattern, handler)
+
+    hub.send_all_on_topic("org/42/room", "hi")
+    await _flush(hub)
+
+    assert received == ["org/42/room"]
+
+
+@pytest.mark.asyncio
+async def test_send_others_on_topic_skips_sender():
+    hub = _hub()
+    received = []
+    _subscribe(hub, "s1", "org/#", received)
+    _subscribe(hub, "s2", "org/*/room", received)
+
+    hub.send_others_on_topic("s1", "org/42/room", "hi")
+    await _flush(hub)
+
+    assert received == [("org/42/room", "hi")]
+
+
+@pytest.mark.asyncio
+async def test_unsubscribe_pattern():
+    hub = _hub()
+    received = []
+    _subscribe(hub, "s1", "org/#", received)
+    _subscribe(hub, "s1", "org/42", received)
+
+    hub.unsubscribe_topic("s1", "org/#")
+    hub.send_all_on_topic("org/42", 1)
+    hub.send_all_on_topic("org/43", 2)
+    await _flush(hub)
+    hub.unsubscribe_all("s1")
+    hub.send_all_on_topic("org/42", 3)
+    await _flush(hub)
+
+    assert received == [("org/42", 1)]
+
+
+@pytest.mark.asyncio
+async def test_client_subscribes_to_pattern():
+    hub = _hub()
+    received = []
+    client = PubSubClient(hub, "s1")
+    client.subscribe_topic("rooms/*", lambda t, m: received.append((t, m)))
+
+    PubSubClient(hub, "s2").send_all_on_topic("rooms/lobby", "hello")
+    await _flush(hub)
+
+    assert received == [("rooms/lobby", "hello")]
+
+
+def test_multi_level_wildcard_must_be_last():
+    hub = PubSubHub()
+    with pytest.raises(ValueError, match="last level"):
+        hub.subscribe_topic("s1", "org/#/room", lambda t, m: None)
+
+
+def test_trie_prunes_empty_branches():
+    trie = TopicTrie()
+    trie.add("a/*/c", "s1", print)
+    trie.add("a/#", "s2", print)
+    trie.add("a/b", "s3", print)
+
+    trie.remove("a/*/c", "s1")
+    assert trie.match("a/b/c") == {"s2": {print}}
+    assert trie.match("a/b") == {"s2": {print}, "s3": {print}}
+
+    trie.remove("a/#", "s2")
+    trie.remove("a/b", "s3")
+    trie.remove("x/*", "s2")  # not subscribed
+    assert trie._TopicTrie__root.children == {}
+    assert trie._TopicTrie__exact == {}
+
+
+@pytest.mark.asyncio
+async def test_publish_does_not_call_handlers():
+    hub = _hub()
+    received = []
+    hub.subscribe("s1", received.append)
+
+    hub.send_all(1)
+    hub.send_all(2)
+    assert received == []
+
+    await _flush(hub)
+    assert received == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_session_receives_messages_in_order():
+    hub = _hub()
+    received = []
+
+    async def handler(topic, message):
+        await asyncio.sleep(0.001 * (message % 3))
+        received.append(message)
+
+    hub.subscribe_topic("s1", "ticks", handler)
+    hub.subscribe_topic("s1", "tocks", lambda t, m: received.append(m))
+    for i in range(20):
+        hub.send_all_on_topic("ticks" if i % 2 else "tocks", i)
+    await _flush(hub)
+
+    assert received == list(range(20))
+    assert hub.session_stats("s1").delivered == 20
+
+
+@pytest.mark.asyncio
+async def test_slow_session_does_not_delay_others():
+    hub = _hub()
+    received = []
+    release = asyncio.Event()
+
+    async def slow(message):
+        await release.wait()
+        received.append(("slow", message))
+
+    hub.subscribe("slow", slow)
+    hub.subscribe("fast", lambda m: received.append(("fast", m)))
+    hub.send_all(1)
+    hub.send_all(2)
+    await asyncio.sleep(0.01)
+
+    assert received == [("fast", 1), ("fast", 2)]
+    stats = hub.session_stats("slow")
+    assert stats.queued == 1
+    assert stats.lag > 0
+
+    release.set()
+    await _flush(hub)
+    assert received[2:] == [("slow", 1), ("slow", 2)]
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_oldest_messages():
+    hub = _hub(max_queue_size=3)
+    received = []
+    hub.subscribe("s1", received.append)
+
+    for i in range(10):
+        hub.send_all(i)
+    await _flush(hub)
+
+    assert received == [7, 8, 9]
+    stats = hub.session_stats("s1")
+    assert (stats.queued, stats.delivered, stats.dropped) == (0, 3, 7)
+
+
+@pytest.mark.asyncio
+async def test_latest_only_coalesces_queued_messages_per_topic():
+    hub = _hub()
+    received = []
+    client = PubSubClient(hub, "s1")
+    client.subscribe_topic(
+        "prices/*", lambda t, m: received.append((t, m)), latest_only=True
+    )
+    client.subscribe_topic("prices/*", lambda t, m: received.append(("all", m)))
+
+    for i in range(5):
+        hub.send_all_on_topic("prices/a", i)
+        hub.send_all_on_topic("prices/b", i)
+    await _flush(hub)
+
+    assert [r for r in received if r[0] != "all"] == [
+        ("prices/a", 4),
+        ("prices/b", 4),
+    ]
+    assert len([r for r in received if r[0] == "all"]) == 10
+    assert client.stats.coalesced == 8
+
+
+@pytest.mark.asyncio
+async def test_publish_from_other_threads():
+    executor = ThreadPoolExecutor(max_workers=2)
+    hub = _hub(executor=executor)
+    received = []
+    threads = []
+
+    def handler(message):
+        threads.append(threading.current_thread())
+        received.append(message)
+
+    hub.subscribe("s1", handler)
+
+    def publish():
+        for i in range(100):
+            hub.send_all(i)
+
+    await asyncio.to_thread(publish)
+    await asyncio.sleep(0.01)
+    await _flush(hub)
+    executor.shutdown()
+
+    assert received == list(range(100))
+    assert threading.main_thread() not in threads
+
+
+@pytest.mark.asyncio
+async def test_handler_errors_are_logged(caplog):
+    hub = _hub()
+    received = []
+
+    def failing(message):
+        raise ValueError(message)
+
+    hub.subscribe("s1", failing)
+    hub.subscribe("s1", received.append)
+    hub.send_all("boom")
+    await _flush(hub)
+
+    assert received == ["boom"]
+    assert "Error in pubsub handler" in caplog.text
+    assert hub.session_stats("s1").delivered == 2
+
+
+@pytest.mark.asyncio
+async def test_unsubscribe_all_discards_queued_messages():
+    hub = _hub()
+    received = []
+    hub.subscribe("s1", received.append)
+    hub.send_all(1)
+
+    hub.unsubscribe_all("s1")
+    await asyncio.sleep(0.01)
+
+    assert received == []
+    assert hub.session_stats("s1") is None
+    assert hub.all_session_stats() == {}
+
+
+def test_publish_without_loop_raises():
+    hub = PubSubHub()
+    hub.send_all("nobody listens")
+
+    hub.subscribe("s1", print)
+    with pytest.raises(RuntimeError, match="loop is not set"):
+        hub.send_all("hi")
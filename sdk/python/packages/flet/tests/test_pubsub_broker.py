@@ -0,0 +1,228 @@
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass
+
+import pytest
+
+from flet.pubsub import PubSubHub
+from flet.pubsub.local_broker import LocalBroker, LocalBrokerBackend
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="Unix domain sockets are not available"
+)
+
+
+@dataclass
+class Message:
+    user: str
+    text: str
+
+
+@pytest.fixture
+def socket_path():
+    # Unix domain socket paths are limited to ~100 characters.
+    with tempfile.TemporaryDirectory(prefix="flet-") as temp_dir:
+        yield os.path.join(temp_dir, "pubsub.sock")
+
+
+async def _hub(socket_path, channel="app"):
+    backend = LocalBrokerBackend(socket_path, channel=channel)
+    hub = PubSubHub(loop=asyncio.get_running_loop(), backend=backend)
+    await asyncio.wait_for(backend.wait_connected(), 5)
+    return hub, backend
+
+
+async def _wait_for(predicate):
+    for _ in range(500):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("Timed out")
+
+
+@pytest.mark.asyncio
+async def test_messages_reach_hubs_of_other_workers(socket_path):
+    hub1, backend1 = await _hub(socket_path)
+    hub2, backend2 = await _hub(socket_path)
+    received = []
+    hub1.subscribe_topic("s1", "org/#", lambda t, m: received.append(("s1", t, m)))
+    hub2.subscribe_topic("s2", "org/*", lambda t, m: received.append(("s2", t, m)))
+    hub2.subscribe("s2", lambda m: received.append(("s2", m)))
+
+    hub1.send_all_on_topic("org/42", "hi")
+    hub2.send_all(Message("alice", "hello"))
+    await _wait_for(lambda: len(received) == 3)
+    await asyncio.sleep(0.05)
+
+    assert sorted(map(str, received)) == sorted(
+        map(
+            str,
+            [
+                ("s1", "org/42", "hi"),
+                ("s2", "org/42", "hi"),
+                ("s2", Message("alice", "hello")),
+            ],
+        )
+    )
+    assert [backend1.hosts_broker, backend2.hosts_broker].count(True) == 1
+    hub1.close()
+    hub2.close()
+
+
+@pytest.mark.asyncio
+async def test_send_others_and_channels_across_workers(socket_path):
+    hub1, _ = await _hub(socket_path)
+    hub2, _ = await _hub(socket_path)
+    other_app, _ = await _hub(socket_path, channel="other")
+    received = []
+    for hub, session_id in ((hub1, "s1"), (hub2, "s2"), (other_app, "s3")):
+        hub.subscribe(session_id, lambda m, s=session_id: received.append((s, m)))
+
+    hub1.send_others("s2", "not to s2")
+    hub2.send_others("s2", "not to s2 either")
+    await _wait_for(lambda: len(received) == 2)
+    await asyncio.sleep(0.05)
+
+    assert sorted(received) == [("s1", "not to s2"), ("s1", "not to s2 either")]
+    for hub in (hub1, hub2, other_app):
+        hub.close()
+
+
+@pytest.mark.asyncio
+async def test_another_worker_takes_over_broker(socket_path):
+    hub1, backend1 = await _hub(socket_path)
+    hub2, backend2 = await _hub(socket_path)
+    assert backend1.hosts_broker
+
+    hub1.close()
+    await _wait_for(lambda: backend2.hosts_broker)
+    hub3, _ = await _hub(socket_path)
+    received = []
+    hub3.subscribe("s3", received.append)
+    await asyncio.wait_for(backend2.wait_connected(), 5)
+
+    hub2.send_all("after failover")
+    await _wait_for(lambda: received == ["after failover"])
+    hub2.close()
+    hub3.close()
+
+
+@pytest.mark.asyncio
+async def test_broker_socket_is_never_accessible_to_others(socket_path, monkeypatch):
+    modes = []
+    bind = socket.socket.bind
+
+    def checked_bind(sock, address):
+        bind(sock, address)
+        modes.append(os.stat(address).st_mode & 0o777)
+
+    monkeypatch.setattr(socket.socket, "bind", checked_bind)
+    umask = os.umask(0o022)
+    try:
+        broker = LocalBroker(socket_path)
+        await broker.start()
+        assert os.umask(0o022) == 0o022
+    finally:
+        os.umask(umask)
+
+    assert modes == [0o600]
+    await broker.close()
+
+
+@pytest.mark.asyncio
+async def test_broker_replaces_stale_socket(socket_path):
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(socket_path)
+    stale.close()
+
+    broker = LocalBroker(socket_path)
+    await broker.start()
+    hub, backend = await _hub(socket_path)
+
+    assert not backend.hosts_broker
+    hub.close()
+    await broker.close()
+
+
+@pytest.mark.asyncio
+async def test_sidecar_broker(socket_path):
+    broker = LocalBroker(socket_path)
+    await broker.start()
+    assert oct(os.stat(socket_path).st_mode & 0o777) == oct(0o600)
+    hub1, backend1 = await _hub(socket_path)
+    hub2, backend2 = await _hub(socket_path)
+    received = []
+    hub2.subscribe("s2", received.append)
+
+    hub1.send_all({"n": 1, "items": [1, 2]})
+    await _wait_for(lambda: received == [{"n": 1, "items": [1, 2]}])
+
+    assert not backend1.hosts_broker and not backend2.hosts_broker
+    hub1.close()
+    hub2.close()
+    await broker.close()
+
+
+_WORKER = """
+import asyncio, json, sys
+from flet.pubsub import PubSubHub
+from flet.pubsub.local_broker import LocalBrokerBackend
+
+async def main(path, name, workers):
+    backend = LocalBrokerBackend(path, channel="app")
+    hub = PubSubHub(loop=asyncio.get_running_loop(), backend=backend)
+    await backend.wait_connected()
+    received = []
+    hub.subscribe_topic(name, "workers/*", lambda t, m: received.append(m))
+    print("ready", flush=True)
+    await asyncio.to_thread(sys.stdin.readline)
+    hub.send_others_on_topic(name, "workers/" + name, name)
+    for _ in range(500):
+        if len(received) == workers - 1:
+            break
+        await asyncio.sleep(0.01)
+    print(json.dumps(sorted(received)), flush=True)
+    # Keep relaying until all workers are done, in case this one hosts the broker.
+    await asyncio.to_thread(sys.stdin.readline)
+    hub.close()
+
+asyncio.run(main(*sys.argv[1:3], int(sys.argv[3])))
+"""
+
+
+def test_worker_processes_exchange_messages(socket_path):
+    names = [f"worker-{i}" for i in range(3)]
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    workers = [
+        subprocess.Popen(
+            [sys.executable, "-c", _WORKER, socket_path, name, str(len(names))],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            env=env,
+        )
+        for name in names
+    ]
+    try:
+        for worker in workers:
+            assert worker.stdout.readline().strip() == "ready"
+        for worker in workers:
+            worker.stdin.write("\n")
+            worker.stdin.flush()
+        results = [json.loads(worker.stdout.readline()) for worker in workers]
+        for worker in workers:
+            worker.stdin.write("\n")
+            worker.stdin.flush()
+            worker.wait(10)
+    finally:
+        for worker in workers:
+            worker.kill()
+            worker.wait()
+
+    for name, received in zip(names, results):
+        assert received == [n for n in names if n != name]
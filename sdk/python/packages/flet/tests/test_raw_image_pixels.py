@@ -1,11 +1,19 @@
 import asyncio
+import struct
+import time
+import zlib
+from dataclasses import dataclass
 
 import pytest
 
 import flet as ft
 from flet.controls.core.raw_image import (
     RawImage,
+    _changed_grid,
+    _changed_tiles,
+    _encode_delta_packet,
     _encode_raw_packet,
+    _grid_rects,
     _premultiply_pil,
     _rgba_is_opaque,
 )
@@ -62,29 +70,26 @@ def test_premultiply_pil_parity_with_numpy_math():
     assert np.abs(pil_out - expected.astype(np.int16)).max() <= 1
 
 
-def test_array_packet_premultiplies_straight_alpha():
+def test_array_pixels_premultiply_straight_alpha():
     np = pytest.importorskip("numpy")
     arr = np.zeros((1, 2, 4), dtype=np.uint8)
     arr[0, 0] = (200, 100, 50, 128)
     arr[0, 1] = (10, 20, 30, 255)
-    pkt = RawImage._array_packet(np, arr, premultiplied=False)
-    assert int.from_bytes(pkt[1:5], "little") == 2  # width
-    assert int.from_bytes(pkt[5:9], "little") == 1  # height
-    assert tuple(pkt[9:13]) == (
+    pixels = RawImage._array_pixels(np, arr, premultiplied=False)
+    assert tuple(pixels[0:4]) == (
         200 * 128 // 255,
         100 * 128 // 255,
         50 * 128 // 255,
         128,
     )
-    assert tuple(pkt[13:17]) == (10, 20, 30, 255)  # opaque pixel untouched
+    assert tuple(pixels[4:8]) == (10, 20, 30, 255)  # opaque pixel untouched
 
 
-def test_array_packet_opaque_frame_is_passthrough():
+def test_array_pixels_of_opaque_frame_are_passthrough():
     np = pytest.importorskip("numpy")
     arr = np.full((2, 2, 4), 255, dtype=np.uint8)
     arr[:, :, :3] = 42
-    pkt = RawImage._array_packet(np, arr, premultiplied=False)
-    assert pkt[9:] == arr.tobytes()
+    assert RawImage._array_pixels(np, arr, premultiplied=False) == arr.tobytes()
 
 
 def test_render_rejects_unknown_input():
@@ -116,6 +121,9 @@ class _SilentChannel:
     def send(self, payload: bytes) -> None:
         self.sent.append(payload)
 
+    async def drain(self) -> None:
+        pass
+
 
 def test_render_times_out_without_ack():
     ri = ft.RawImage(ack_timeout=0.05)
@@ -131,3 +139,416 @@ def test_render_times_out_without_ack():
         assert len(ri._channel.sent) == 1
 
     asyncio.run(run())
+
+
+class _AckingChannel(_SilentChannel):
+    """A channel whose client acks frames on demand."""
+
+    def __init__(self, ri):
+        super().__init__()
+        self.ri = ri
+
+    def on_bytes(self, handler) -> None:
+        pass
+
+    def ack(self, count: int = 1) -> None:
+        for _ in range(count):
+            self.ri._on_dart_message(b"\xff")
+
+
+def _attached(ri):
+    ri._channel = _AckingChannel(ri)
+    ri._ready.set()
+    return ri._channel
+
+
+async def _wait_sent(channel, count: int = 1):
+    # Encoding runs in an executor and may take a while on a busy machine.
+    for _ in range(500):
+        if len(channel.sent) >= count:
+            return
+        await asyncio.sleep(0.01)
+
+
+def _frame(i: int) -> bytes:
+    # Semi-transparent premultiplied pixel: always sent as a raw packet.
+    return bytes([i, 0, 0, 128])
+
+
+def test_render_waits_for_ack_with_single_frame_window():
+    ri = ft.RawImage()
+
+    async def run():
+        channel = _attached(ri)
+        task = asyncio.create_task(ri.render_rgba(1, 1, _frame(0)))
+        await asyncio.sleep(0)
+        assert len(channel.sent) == 1
+        assert not task.done()
+        channel.ack()
+        await asyncio.wait_for(task, 1)
+        assert ri.stats.frames_acked == 1
+
+    asyncio.run(run())
+
+
+def test_render_waits_for_send_queue_to_drain():
+    ri = ft.RawImage(max_frames_in_flight=4)
+
+    async def run():
+        channel = _attached(ri)
+        writable = asyncio.Event()
+        channel.drain = writable.wait
+        task = asyncio.create_task(ri.render_rgba(1, 1, _frame(0)))
+        await asyncio.sleep(0)
+        assert not channel.sent
+
+        writable.set()
+        await asyncio.wait_for(task, 1)
+        assert len(channel.sent) == 1
+
+    asyncio.run(run())
+
+
+def test_frame_window_keeps_frames_in_flight_and_drops_stale_ones():
+    ri = ft.RawImage(max_frames_in_flight=2)
+
+    async def run():
+        channel = _attached(ri)
+        for i in range(2):
+            await ri.render_rgba(1, 1, _frame(i))
+        assert len(channel.sent) == 2
+        assert ri.stats.frames_in_flight == 2
+
+        # The window is full: frames 2 and 3 wait, 3 supersedes 2.
+        waiting = [asyncio.create_task(ri.render_rgba(1, 1, _frame(i))) for i in (2, 3)]
+        await asyncio.sleep(0)
+        await asyncio.wait_for(waiting[0], 1)  # returns without being sent
+        assert not waiting[1].done()
+
+        channel.ack()
+        await asyncio.wait_for(waiting[1], 1)
+        assert [p[9] for p in channel.sent] == [0, 1, 3]
+
+        stats = ri.stats
+        assert stats.frames_sent == 3
+        assert stats.frames_acked == 1
+        assert stats.frames_dropped == 1
+        assert stats.frames_in_flight == 2
+
+    asyncio.run(run())
+
+
+def test_late_ack_of_abandoned_frame_is_ignored():
+    ri = ft.RawImage(ack_timeout=0.05, max_frames_in_flight=2)
+
+    async def run():
+        channel = _attached(ri)
+        for i in range(2):
+            await ri.render_rgba(1, 1, _frame(i))
+        # the window is full and frame 0 is never acked: give up on it
+        with pytest.raises(TimeoutError):
+            await ri.render_rgba(1, 1, _frame(2))
+        assert ri.stats.frames_in_flight == 1
+
+        await ri.render_rgba(1, 1, _frame(3))
+        first, second = (entry[0] for entry in ri._pending_acks)
+        channel.ack()  # late ack of frame 0
+        assert not first.done()
+        channel.ack()
+        assert first.done() and not second.done()
+        assert ri.stats.frames_acked == 1
+
+    asyncio.run(run())
+
+
+def test_stream_renders_all_frames_and_reports_stats():
+    np = pytest.importorskip("numpy")
+    ri = ft.RawImage(max_frames_in_flight=3)
+
+    async def run():
+        channel = _attached(ri)
+
+        async def client():
+            while True:
+                await asyncio.sleep(0.001)
+                channel.ack(ri.stats.frames_in_flight)
+
+        async def frames():
+            for i in range(20):
+                yield np.frombuffer(_frame(i), dtype=np.uint8).reshape(1, 1, 4)
+
+        acker = asyncio.create_task(client())
+        stats = await asyncio.wait_for(ri.stream(frames(), premultiplied=True), 2)
+        acker.cancel()
+
+        assert stats.frames_in_flight == 0
+        assert stats.frames_sent + stats.frames_dropped == 20
+        assert stats.frames_acked == stats.frames_sent
+        assert channel.sent[-1][9] == 19  # the latest frame always wins
+        assert stats.ack_latency_p50 <= stats.ack_latency_p99
+
+    asyncio.run(run())
+
+
+def _solid(width, height, value):
+    return bytes([value, 0, 0, 128]) * (width * height)
+
+
+def _patched(pixels, width, x, y, value):
+    out = bytearray(pixels)
+    offset = (y * width + x) * 4
+    out[offset : offset + 4] = bytes([value, 0, 0, 128])
+    return bytes(out)
+
+
+def test_changed_grid_rects_merge_tiles_and_clip_edges():
+    prev = _solid(10, 5, 1)
+    cur = _patched(_patched(prev, 10, 1, 1, 2), 10, 4, 1, 2)
+    cur = _patched(cur, 10, 9, 4, 2)
+
+    grid = _changed_grid(prev, cur, 10, 5, 4)
+    assert grid == [[True, True, False], [False, False, True]]
+    assert _grid_rects(grid, 10, 5, 4) == [(0, 0, 8, 4), (8, 4, 2, 1)]
+    assert _changed_tiles(prev, cur, 10, 5, 4) == grid
+    assert _changed_grid(prev, prev, 10, 5, 4) is None
+
+
+def test_delta_packet_layout():
+    width = 3
+    pixels = bytes(range(3 * 2 * 4))
+    pkt = _encode_delta_packet(width, 2, pixels, [(1, 0, 2, 2)])
+    assert pkt[0] == 0x05
+    assert struct.unpack_from("<III", pkt, 1) == (3, 2, 1)
+    assert struct.unpack_from("<IIII", pkt, 13) == (1, 0, 2, 2)
+    assert pkt[29:] == pixels[4:12] + pixels[16:24]
+
+
+def test_delta_encoding_sends_changed_tiles_and_replays_keyframe():
+    ri = ft.RawImage(max_frames_in_flight=4, delta_encoding=True, delta_tile_size=4)
+
+    async def run():
+        channel = _attached(ri)
+        base = _solid(8, 8, 1)
+        await ri.render_rgba(8, 8, base)
+        channel.ack()
+        changed = _patched(base, 8, 5, 6, 2)
+        await ri.render_rgba(8, 8, changed)
+        channel.ack()
+        everything = _solid(8, 8, 3)
+        await ri.render_rgba(8, 8, everything)
+        channel.ack()
+
+        keyframe, delta, full = channel.sent
+        assert keyframe == _encode_raw_packet(8, 8, base)
+        assert delta == _encode_delta_packet(8, 8, changed, [(4, 4, 4, 4)])
+        assert full == _encode_raw_packet(8, 8, everything)  # over threshold
+
+        await ri.render_rgba(8, 8, _patched(everything, 8, 0, 0, 4))
+        assert channel.sent[-1][0] == 0x05
+        assert ri._last_packet is None
+
+        # Remount: the shown frame is replayed as a keyframe.
+        ri.get_data_channel = lambda channel_id: channel
+        ri._capture_channel(ft.DataChannelOpenEvent(name="", control=ri))
+        assert channel.sent[-1] == _encode_raw_packet(
+            8, 8, _patched(everything, 8, 0, 0, 4)
+        )
+
+    asyncio.run(run())
+
+
+def test_delta_is_computed_against_the_frame_actually_sent():
+    ri = ft.RawImage(max_frames_in_flight=1, delta_encoding=True, delta_tile_size=4)
+
+    async def run():
+        channel = _attached(ri)
+        base = _solid(8, 8, 1)
+        first = asyncio.create_task(ri.render_rgba(8, 8, base))
+        await asyncio.sleep(0)
+        # Both wait for the window; the first one is dropped.
+        dropped = asyncio.create_task(ri.render_rgba(8, 8, _patched(base, 8, 0, 0, 2)))
+        await asyncio.sleep(0)
+        latest = _patched(base, 8, 7, 7, 3)
+        last = asyncio.create_task(ri.render_rgba(8, 8, latest))
+        await asyncio.sleep(0)
+        channel.ack()
+        await asyncio.wait_for(asyncio.gather(first, dropped), 1)
+        channel.ack()
+        await asyncio.wait_for(last, 1)
+
+        assert channel.sent[-1] == _encode_delta_packet(8, 8, latest, [(4, 4, 4, 4)])
+        assert ri.stats.frames_dropped == 1
+
+    asyncio.run(run())
+
+
+def test_delta_covers_tiles_changed_by_frames_in_flight():
+    ri = ft.RawImage(max_frames_in_flight=4, delta_encoding=True, delta_tile_size=4)
+
+    async def run():
+        channel = _attached(ri)
+        base = _solid(8, 8, 1)
+        await ri.render_rgba(8, 8, base)
+        # keyframes until the client has acknowledged a frame
+        await ri.render_rgba(8, 8, base)
+        assert [p[0] for p in channel.sent] == [0x04, 0x04]
+        channel.ack(2)
+
+        first = _patched(base, 8, 0, 0, 2)
+        await ri.render_rgba(8, 8, first)
+        # reverts the first frame's change while it is still in flight
+        second = _patched(base, 8, 7, 7, 3)
+        await ri.render_rgba(8, 8, second)
+
+        assert channel.sent[-2] == _encode_delta_packet(8, 8, first, [(0, 0, 4, 4)])
+        assert channel.sent[-1] == _encode_delta_packet(
+            8, 8, second, [(0, 0, 4, 4), (4, 4, 4, 4)]
+        )
+
+        channel.ack()
+        third = _patched(second, 8, 6, 6, 4)
+        await ri.render_rgba(8, 8, third)
+        assert channel.sent[-1] == _encode_delta_packet(
+            8, 8, third, [(0, 0, 4, 4), (4, 4, 4, 4)]
+        )
+        channel.ack(2)
+        fourth = _patched(third, 8, 1, 6, 5)
+        await ri.render_rgba(8, 8, fourth)
+        assert channel.sent[-1] == _encode_delta_packet(8, 8, fourth, [(0, 4, 4, 4)])
+
+    asyncio.run(run())
+
+
+def test_keyframe_is_sent_after_ack_timeout():
+    ri = ft.RawImage(ack_timeout=0.05, delta_encoding=True, delta_tile_size=4)
+
+    async def run():
+        channel = _attached(ri)
+        base = _solid(8, 8, 1)
+        task = asyncio.create_task(ri.render_rgba(8, 8, base))
+        await asyncio.sleep(0)
+        channel.ack()
+        await task
+        with pytest.raises(TimeoutError):
+            await ri.render_rgba(8, 8, _patched(base, 8, 0, 0, 2))
+        assert channel.sent[-1][0] == 0x05
+
+        # the client may not show the abandoned frame: send a keyframe
+        latest = _patched(base, 8, 7, 7, 3)
+        task = asyncio.create_task(ri.render_rgba(8, 8, latest))
+        await asyncio.sleep(0)
+        channel.ack(2)  # late ack of the abandoned frame, then this one's
+        await asyncio.wait_for(task, 1)
+        assert channel.sent[-1] == _encode_raw_packet(8, 8, latest)
+
+    asyncio.run(run())
+
+
+@pytest.mark.parametrize(
+    "make",
+    [
+        lambda: ft.PngCodec(compress_level=10),
+        lambda: ft.JpegCodec(quality=0),
+        lambda: ft.WebPCodec(method=7),
+        lambda: ft.ZlibCodec(level=-1),
+    ],
+)
+def test_codec_rejects_out_of_range_settings(make):
+    with pytest.raises(ValueError, match="must be between"):
+        make()
+
+
+def test_codec_base_is_abstract():
+    with pytest.raises(TypeError):
+        ft.RawImageCodec()
+
+
+def test_zlib_codec_compresses_premultiplied_pixels():
+    ri = ft.RawImage(codec=ft.ZlibCodec(level=9))
+
+    async def run():
+        channel = _attached(ri)
+        pixels = _solid(8, 4, 7)
+        task = asyncio.create_task(ri.render_rgba(8, 4, pixels))
+        await _wait_sent(channel)
+        channel.ack()
+        await asyncio.wait_for(task, 1)
+        pkt = channel.sent[0]
+        assert pkt[0] == 0x06
+        assert struct.unpack("<II", pkt[1:9]) == (8, 4)
+        assert zlib.decompress(pkt[9:]) == pixels
+        # Replayed as is on remount.
+        assert ri._last_packet == pkt
+
+    asyncio.run(run())
+
+
+@pytest.mark.parametrize(
+    "codec, signature",
+    [
+        (ft.PngCodec(compress_level=1), b"\x89PNG"),
+        (ft.JpegCodec(quality=50), b"\xff\xd8"),
+        (ft.WebPCodec(lossless=True), b"RIFF"),
+    ],
+)
+def test_image_codecs_encode_straight_alpha_source(codec, signature):
+    PILImage = pytest.importorskip("PIL.Image")
+    ri = ft.RawImage(codec=codec)
+    image = PILImage.new("RGBA", (4, 4), (200, 100, 50, 128))
+
+    async def run():
+        channel = _attached(ri)
+        task = asyncio.create_task(ri.render(image))
+        await _wait_sent(channel)
+        channel.ack()
+        await asyncio.wait_for(task, 1)
+        assert channel.sent[0][0] == 0x01
+        assert channel.sent[0][1:].startswith(signature)
+
+    asyncio.run(run())
+
+
+@dataclass
+class _SlowFirstCodec(ft.ZlibCodec):
+    """Encodes the frame with the first pixel value 0 slowest."""
+
+    def _encode(self, width, height, pixels, image):
+        time.sleep(0.1 if pixels[0] == 0 else 0)
+        return super()._encode(width, height, pixels, image)
+
+
+def test_concurrently_encoded_frames_are_sent_in_render_order():
+    ri = ft.RawImage(codec=_SlowFirstCodec(), max_frames_in_flight=3)
+
+    async def run():
+        channel = _attached(ri)
+        tasks = [asyncio.create_task(ri.render_rgba(1, 1, _frame(i))) for i in range(3)]
+        await asyncio.wait_for(asyncio.gather(*tasks), 1)
+        assert [zlib.decompress(p[9:])[0] for p in channel.sent] == [0, 1, 2]
+
+    asyncio.run(run())
+
+
+def test_stream_encodes_frames_in_encoder_pool():
+    np = pytest.importorskip("numpy")
+    with ft.RawImageEncoderPool(max_workers=2) as pool:
+        ri = ft.RawImage(
+            codec=ft.ZlibCodec(), encoder_pool=pool, max_frames_in_flight=8
+        )
+
+        async def run():
+            channel = _attached(ri)
+
+            async def frames():
+                for i in range(6):
+                    yield np.frombuffer(_frame(i), dtype=np.uint8).reshape(1, 1, 4)
+
+            task = asyncio.create_task(ri.stream(frames(), premultiplied=True))
+            while len(channel.sent) < 6:
+                await asyncio.sleep(0.01)
+            channel.ack(6)
+            stats = await asyncio.wait_for(task, 1)
+            assert stats.frames_sent == 6
+            assert [zlib.decompress(p[9:])[0] for p in channel.sent] == list(range(6))
+
+        asyncio.run(asyncio.wait_for(run(), 30))
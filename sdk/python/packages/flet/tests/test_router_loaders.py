@@ -0,0 +1,376 @@
+"""Unit tests for route loaders: `RouteLoaderCache` and the loader runner
+used by `Router`.
+
+The runner is exercised directly with a page double that runs tasks on the
+test event loop; rendering of loader data is unchanged and covered by the
+router example apps.
+"""
+
+import asyncio
+import functools
+
+import pytest
+
+import flet.components.router as router
+from flet.components.router import (
+    Route,
+    RouteLoaderCache,
+    _RouteLoaders,
+    _RouteMatcher,
+)
+
+
+def _dummy():
+    pass
+
+
+class _Page:
+    def __init__(self):
+        self.tasks = []
+
+    def run_task(self, handler, *args):
+        self.tasks.append(asyncio.ensure_future(handler(*args)))
+
+    async def wait(self):
+        while self.tasks:
+            await self.tasks.pop(0)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(router.time, "monotonic", clock)
+    return clock
+
+
+def _loaders(routes, cache=None):
+    page = _Page()
+    loaders = _RouteLoaders(cache if cache is not None else RouteLoaderCache(), page)
+    loaders.matcher = _RouteMatcher(routes)
+    loaded = []
+    loaders.on_loaded = lambda: loaded.append(True)
+    return loaders, page, loaded
+
+
+def _load(loaders, pathname):
+    chain = loaders.matcher.match(pathname)
+    params = {}
+    for m in chain:
+        params.update(m.params)
+    return loaders.load(chain, params, pathname)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_loads_share_one_call():
+    calls = []
+
+    async def loader(params):
+        calls.append(params)
+        await asyncio.sleep(0.01)
+        return params["pid"]
+
+    cache = RouteLoaderCache()
+    key = cache._key(loader, "/products/:pid", {"pid": "1"})
+
+    results = await asyncio.gather(
+        cache._load(key, loader, {"pid": "1"}),
+        cache._load(key, loader, {"pid": "1"}),
+    )
+
+    assert results == ["1", "1"]
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_load_is_not_cached():
+    calls = []
+
+    async def loader(params):
+        calls.append(params)
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    cache = RouteLoaderCache(ttl=60)
+    key = cache._key(loader, "/", {})
+
+    results = await asyncio.gather(
+        cache._load(key, loader, {}),
+        cache._load(key, loader, {}),
+        return_exceptions=True,
+    )
+
+    assert [type(r) for r in results] == [ValueError, ValueError]
+    assert len(calls) == 1
+    assert cache._lookup(key) == ("missing", None)
+
+
+def test_cache_expiration(clock):
+    cache = RouteLoaderCache(ttl=10, stale_while_revalidate=5)
+    cache._store("key", "data")
+
+    clock.now += 9
+    assert cache._lookup("key") == ("fresh", "data")
+    clock.now += 5
+    assert cache._lookup("key") == ("stale", "data")
+    clock.now += 2
+    assert cache._lookup("key") == ("missing", None)
+
+
+def test_cache_evicts_least_recently_loaded():
+    cache = RouteLoaderCache(ttl=60, max_entries=2)
+    for key in ("a", "b", "c"):
+        cache._store(key, key)
+
+    assert [cache._lookup(key)[0] for key in ("a", "b", "c")] == [
+        "missing",
+        "fresh",
+        "fresh",
+    ]
+
+
+def test_invalidate_drops_results_of_loader():
+    def load_a(params):
+        return "a"
+
+    def load_b(params):
+        return "b"
+
+    cache = RouteLoaderCache(ttl=60)
+    cache._store(cache._key(load_a, "/a", {}), "a")
+    cache._store(cache._key(load_b, "/b", {}), "b")
+
+    cache.invalidate(load_a)
+
+    assert cache._lookup(cache._key(load_a, "/a", {}))[0] == "missing"
+    assert cache._lookup(cache._key(load_b, "/b", {}))[0] == "fresh"
+
+
+def test_sync_loader_runs_once_per_navigation():
+    calls = []
+
+    def loader(params):
+        calls.append(params["pid"])
+        return {"pid": params["pid"]}
+
+    routes = [Route(path="products/:pid", component=_dummy, loader=loader)]
+    loaders, _, _ = _loaders(routes)
+
+    assert _load(loaders, "/products/1") == {0: {"pid": "1"}}
+    # re-render of the same location
+    assert _load(loaders, "/products/1") == {0: {"pid": "1"}}
+    _load(loaders, "/products/2")
+    # no ttl — revisiting calls the loader again
+    _load(loaders, "/products/1")
+
+    assert calls == ["1", "2", "1"]
+    # results that would never be served are not kept
+    assert len(loaders.cache) == 0
+
+
+def test_sync_loader_results_are_cached_with_ttl(clock):
+    calls = []
+
+    def loader(params):
+        calls.append(params["pid"])
+        return params["pid"]
+
+    routes = [Route(path="products/:pid", component=_dummy, loader=loader)]
+    loaders, _, _ = _loaders(routes, RouteLoaderCache(ttl=60))
+
+    _load(loaders, "/products/1")
+    _load(loaders, "/products/2")
+    assert _load(loaders, "/products/1") == {0: "1"}
+    clock.now += 60
+    _load(loaders, "/products/2")
+
+    assert calls == ["1", "2", "2"]
+    assert len(loaders.cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_async_loader_renders_when_loaded():
+    async def loader(params):
+        await asyncio.sleep(0)
+        return "data"
+
+    routes = [Route(path="home", component=_dummy, loader=loader)]
+    loaders, page, loaded = _loaders(routes)
+
+    assert _load(loaders, "/home") == {0: None}
+    # a re-render while loading doesn't start another load
+    _load(loaders, "/home")
+    assert len(page.tasks) == 1
+    await page.wait()
+
+    assert loaded == [True]
+    assert _load(loaders, "/home") == {0: "data"}
+    assert len(loaders.cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_async_loader_result_of_previous_location_is_dropped():
+    async def loader(params):
+        await asyncio.sleep(0)
+        return params["pid"]
+
+    routes = [Route(path="products/:pid", component=_dummy, loader=loader)]
+    loaders, page, loaded = _loaders(routes)
+
+    _load(loaders, "/products/1")
+    _load(loaders, "/products/2")
+    await page.wait()
+
+    assert loaded == [True]
+    assert _load(loaders, "/products/2") == {0: "2"}
+
+
+@pytest.mark.asyncio
+async def test_stale_data_is_rendered_while_revalidating(clock):
+    values = iter(["old", "new"])
+
+    async def loader(params):
+        return next(values)
+
+    routes = [
+        Route(path="home", component=_dummy, loader=loader),
+        Route(path="about", component=_dummy),
+    ]
+    cache = RouteLoaderCache(ttl=10, stale_while_revalidate=30)
+    loaders, page, _ = _loaders(routes, cache)
+
+    _load(loaders, "/home")
+    await page.wait()
+    _load(loaders, "/about")
+    clock.now += 20
+
+    assert _load(loaders, "/home") == {0: "old"}
+    await page.wait()
+    assert _load(loaders, "/home") == {0: "new"}
+
+
+@pytest.mark.asyncio
+async def test_prefetch_fills_cache_for_navigation():
+    calls = []
+
+    async def loader(params):
+        calls.append(params["pid"])
+        await asyncio.sleep(0.01)
+        return params["pid"]
+
+    routes = [
+        Route(index=True, component=_dummy),
+        Route(path="products/:pid", component=_dummy, loader=loader),
+    ]
+    loaders, page, _ = _loaders(routes, RouteLoaderCache(ttl=60))
+    _load(loaders, "/")
+
+    loaders.prefetch("/products/1")
+    loaders.prefetch("/products/1")
+    loaders.prefetch("/missing")
+    await page.wait()
+
+    assert _load(loaders, "/products/1") == {0: "1"}
+    # the current location is not prefetched
+    loaders.prefetch("/products/1")
+    assert not page.tasks
+    assert calls == ["1"]
+
+
+@pytest.mark.asyncio
+async def test_navigation_joins_prefetch_in_flight():
+    calls = []
+
+    async def loader(params):
+        calls.append(params)
+        await asyncio.sleep(0.01)
+        return "data"
+
+    routes = [
+        Route(index=True, component=_dummy),
+        Route(path="slow", component=_dummy, loader=loader),
+    ]
+    loaders, page, loaded = _loaders(routes)
+    _load(loaders, "/")
+
+    loaders.prefetch("/slow")
+    assert _load(loaders, "/slow") == {0: None}
+    await page.wait()
+
+    assert calls == [{}]
+    assert loaded == [True]
+    assert _load(loaders, "/slow") == {0: "data"}
+
+
+@pytest.mark.asyncio
+async def test_loaders_returning_awaitables_run_as_tasks():
+    async def fetch(kind, params):
+        await asyncio.sleep(0)
+        return f"{kind} {params['pid']}"
+
+    routes = [
+        Route(
+            path="products/:pid",
+            component=_dummy,
+            loader=functools.partial(fetch, "product"),
+            children=[
+                Route(
+                    path="reviews",
+                    component=_dummy,
+                    loader=lambda params: fetch("reviews", params),
+                )
+            ],
+        )
+    ]
+    loaders, page, loaded = _loaders(routes)
+
+    assert _load(loaders, "/products/1/reviews") == {0: None, 1: None}
+    assert len(page.tasks) == 2
+    await page.wait()
+
+    assert loaded == [True, True]
+    assert _load(loaders, "/products/1/reviews") == {
+        0: "product 1",
+        1: "reviews 1",
+    }
+
+
+@pytest.mark.asyncio
+async def test_failed_load_is_retried_on_next_navigation(clock):
+    calls = []
+
+    async def loader(params):
+        calls.append(params)
+        if len(calls) == 2:
+            raise ValueError("boom")
+        return len(calls)
+
+    routes = [
+        Route(path="home", component=_dummy, loader=loader),
+        Route(path="about", component=_dummy),
+    ]
+    cache = RouteLoaderCache(ttl=10, stale_while_revalidate=30)
+    loaders, page, _ = _loaders(routes, cache)
+
+    _load(loaders, "/home")
+    await page.wait()
+    _load(loaders, "/about")
+    clock.now += 20
+
+    # revalidation of stale data fails
+    assert _load(loaders, "/home") == {0: 1}
+    with pytest.raises(ValueError):
+        await page.wait()
+    _load(loaders, "/about")
+
+    assert _load(loaders, "/home") == {0: None}
+    await page.wait()
+    assert _load(loaders, "/home") == {0: 3}
+    assert len(calls) == 3
@@ -0,0 +1,158 @@
+"""Unit tests for the compiled route matcher behind `Router`.
+
+`_RouteMatcher` indexes sibling routes by their first static segment.
+These tests check that indexing never changes which route wins: the
+first matching route in declaration order, as with a linear scan.
+"""
+
+from flet.components.router import Route, _match_routes, _RouteMatcher
+
+
+def _dummy():
+    pass
+
+
+def _paths(chain):
+    return [(m.route.path, m.params, m.resolved_path) for m in chain]
+
+
+def test_dynamic_sibling_declared_first_wins():
+    routes = [
+        Route(path=":slug", component=_dummy),
+        Route(path="about", component=_dummy),
+    ]
+
+    assert _paths(_match_routes(routes, "/about")) == [
+        (":slug", {"slug": "about"}, "/about")
+    ]
+
+
+def test_static_sibling_declared_first_wins():
+    routes = [
+        Route(path="about", component=_dummy),
+        Route(path=":slug", component=_dummy),
+    ]
+
+    assert _paths(_match_routes(routes, "/about")) == [("about", {}, "/about")]
+    assert _paths(_match_routes(routes, "/other")) == [
+        (":slug", {"slug": "other"}, "/other")
+    ]
+
+
+def test_static_segments_under_dynamic_parent():
+    routes = [
+        Route(
+            path="users/:uid",
+            component=_dummy,
+            children=[
+                Route(index=True, component=_dummy),
+                Route(path="posts/:pid", component=_dummy),
+                Route(path="edit", component=_dummy),
+            ],
+        )
+    ]
+    matcher = _RouteMatcher(routes)
+
+    assert _paths(matcher.match("/users/7/edit")) == [
+        ("users/:uid", {"uid": "7"}, "/users/7"),
+        ("edit", {"uid": "7"}, "/users/7/edit"),
+    ]
+    assert _paths(matcher.match("/users/7/posts/3"))[1] == (
+        "posts/:pid",
+        {"uid": "7", "pid": "3"},
+        "/users/7/posts/3",
+    )
+    assert matcher.match("/users/7")[1].route.index
+    assert matcher.match("/users/7/history") is None
+
+
+def test_children_of_variable_depth_parent():
+    """Under a splat the child segment position is unknown — all children
+    are tried."""
+    routes = [
+        Route(
+            path="files/:path*",
+            component=_dummy,
+            children=[Route(path="raw", component=_dummy)],
+        )
+    ]
+
+    chain = _match_routes(routes, "/files/a/b/raw")
+
+    assert chain is not None
+    assert chain[-1].route.path == "raw"
+    assert chain[-1].params == {"path": "a/b"}
+
+
+def test_pathless_and_index_routes_are_always_candidates():
+    routes = [
+        Route(index=True, component=_dummy),
+        Route(
+            component=_dummy,
+            children=[Route(path="settings", component=_dummy)],
+        ),
+        Route(path="about", component=_dummy),
+    ]
+    matcher = _RouteMatcher(routes)
+
+    assert len(matcher.match("/")) == 1
+    assert [m.route.path for m in matcher.match("/settings")] == [None, "settings"]
+    assert [m.route.path for m in matcher.match("/about")] == ["about"]
+    assert matcher.match("/about/more") is None
+
+
+def test_matcher_is_reused_across_pathnames():
+    folder = Route(
+        path="folder",
+        component=_dummy,
+        children=[Route(path=":name", component=_dummy, recursive=True)],
+    )
+    matcher = _RouteMatcher([folder])
+
+    for depth in range(1, 6):
+        pathname = "/folder/" + "/".join(f"d{i}" for i in range(depth))
+        chain = matcher.match(pathname)
+        assert len(chain) == depth + 1
+        assert chain[-1].resolved_path == pathname
+
+
+def test_children_of_recursive_route_may_reuse_its_param_names():
+    """Children of a recursive route are matched under the consumed pathname,
+    so they are never compiled under the route's own `:slug` pattern."""
+    routes = [
+        Route(
+            path="docs",
+            component=_dummy,
+            children=[
+                Route(
+                    path=":slug",
+                    component=_dummy,
+                    recursive=True,
+                    children=[Route(path="v/:slug", component=_dummy)],
+                )
+            ],
+        )
+    ]
+    matcher = _RouteMatcher(routes)
+
+    assert _paths(matcher.match("/docs/intro/setup")) == [
+        ("docs", {}, "/docs"),
+        (":slug", {"slug": "intro"}, "/docs/intro"),
+        (":slug", {"slug": "setup"}, "/docs/intro/setup"),
+    ]
+    assert _paths(matcher.match("/docs/intro/v/2"))[-1] == (
+        "v/:slug",
+        {"slug": "2"},
+        "/docs/intro/v/2",
+    )
+
+
+def test_malformed_later_sibling_does_not_prevent_earlier_match():
+    routes = [
+        Route(path="items/:id", component=_dummy),
+        Route(path="items/:id([)", component=_dummy),
+    ]
+
+    assert _paths(_match_routes(routes, "/items/1")) == [
+        ("items/:id", {"id": "1"}, "/items/1")
+    ]
@@ -0,0 +1,114 @@
+import asyncio
+
+import pytest
+
+from flet.messaging.send_queue import SendQueue, SendQueuePolicy
+
+
+@pytest.mark.asyncio
+async def test_get_batch_takes_all_queued_frames():
+    queue = SendQueue(high_water_mark=1024)
+    queue.put(b"a")
+    queue.put(b"bb", channel_id=1)
+    queue.put(b"ccc")
+
+    assert queue.stats.depth == 3
+    assert queue.stats.bytes_queued == 6
+
+    assert await queue.get_batch() == [b"a", b"bb", b"ccc"]
+    assert queue.stats.depth == 0
+    assert queue.bytes_in_flight == 6
+
+    queue.sent(3, 6)
+    stats = queue.stats
+    assert stats.bytes_in_flight == 0
+    assert stats.frames_sent == 3
+    assert stats.writes == 1
+    assert stats.max_depth == 3
+
+
+@pytest.mark.asyncio
+async def test_get_batch_waits_for_frames_and_ends_after_close():
+    queue = SendQueue(high_water_mark=1024)
+    task = asyncio.create_task(queue.get_batch())
+    await asyncio.sleep(0)
+    assert not task.done()
+
+    queue.put(b"a")
+    assert await task == [b"a"]
+
+    queue.put(b"b")
+    queue.close()
+    assert not queue.put(b"c")
+    assert await queue.get_batch() == [b"b"]
+    assert await queue.get_batch() is None
+
+
+@pytest.mark.asyncio
+async def test_block_policy_keeps_frames_and_paces_drain():
+    queue = SendQueue(high_water_mark=4, policy=SendQueuePolicy.BLOCK)
+    for _ in range(3):
+        assert queue.put(b"xx", channel_id=1)
+
+    drained = asyncio.create_task(queue.drain())
+    await asyncio.sleep(0)
+    assert not drained.done()
+
+    frames = await queue.get_batch()
+    assert len(frames) == 3
+    await asyncio.sleep(0)
+    assert not drained.done()  # still in flight
+
+    queue.sent(len(frames), 6)
+    await asyncio.wait_for(drained, 1)
+
+
+@pytest.mark.asyncio
+async def test_coalesce_policy_keeps_latest_channel_frame():
+    queue = SendQueue(high_water_mark=10, policy=SendQueuePolicy.COALESCE)
+    queue.put(b"patch-1")
+    queue.put(b"f1", channel_id=1, droppable=True)
+    queue.put(b"g1", channel_id=2, droppable=True)
+    queue.put(b"f2", channel_id=1, droppable=True)
+    queue.put(b"f3", channel_id=1, droppable=True)
+    queue.put(b"patch-2")
+
+    assert await queue.get_batch() == [b"patch-1", b"g1", b"f3", b"patch-2"]
+    assert queue.stats.frames_coalesced == 2
+
+
+@pytest.mark.asyncio
+async def test_drop_policy_drops_channel_frames_first():
+    queue = SendQueue(high_water_mark=8, policy=SendQueuePolicy.DROP)
+    queue.put(b"f1", channel_id=1, droppable=True)
+    queue.put(b"patch1")
+    queue.put(b"f2", channel_id=2, droppable=True)  # drops f1
+    assert not queue.put(b"too-big", channel_id=1, droppable=True)
+    queue.put(b"patch2")  # protocol frames are never dropped
+
+    assert await queue.get_batch() == [b"patch1", b"f2", b"patch2"]
+    assert queue.stats.frames_dropped == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("policy", [SendQueuePolicy.COALESCE, SendQueuePolicy.DROP])
+async def test_channel_frames_are_kept_unless_droppable(policy):
+    # e.g. RawImage frames, each answered by an ack the sender counts on
+    queue = SendQueue(high_water_mark=4, policy=policy)
+    queue.put(b"f1", channel_id=1)
+    queue.put(b"f2", channel_id=1)
+    queue.put(b"f3-big", channel_id=1)
+    queue.put(b"g1", channel_id=2, droppable=True)
+    queue.put(b"g2", channel_id=2, droppable=True)
+
+    frames = await queue.get_batch()
+    assert frames[:3] == [b"f1", b"f2", b"f3-big"]
+    assert b"g1" not in frames
+
+
+def test_policy_from_environment(monkeypatch):
+    monkeypatch.setenv("FLET_SEND_QUEUE_HIGH_WATER_MARK", "100")
+    monkeypatch.setenv("FLET_SEND_QUEUE_POLICY", "drop")
+    queue = SendQueue()
+    assert queue.high_water_mark == 100
+    assert queue.policy == SendQueuePolicy.DROP
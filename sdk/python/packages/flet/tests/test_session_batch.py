@@ -0,0 +1,79 @@
+import msgpack
+
+import flet as ft
+from flet.messaging.protocol import ClientAction, PatchControlsBody
+
+from .common import b_pack, make_session
+
+
+def test_batch_sends_patches_as_single_frame():
+    texts = [ft.Text(str(i)) for i in range(3)]
+    session, conn = make_session(*texts)
+
+    with session.page.batch():
+        for t in texts:
+            t.value += "!"
+            t.update()
+        assert conn.messages == []
+
+    assert len(conn.messages) == 1
+    message = conn.messages[0]
+    assert message.action == ClientAction.PATCH_CONTROLS
+    assert isinstance(message.body, PatchControlsBody)
+    assert [p.id for p in message.body.patches] == [t._i for t in texts]
+
+    encoded = msgpack.unpackb(b_pack([message.action.value, message.body]))
+    assert encoded[0] == 8
+    assert [p["id"] for p in encoded[1]["patches"]] == [t._i for t in texts]
+
+
+def test_nested_batches_flush_once_on_outermost_exit():
+    t1, t2 = ft.Text("a"), ft.Text("b")
+    session, conn = make_session(t1, t2)
+
+    with session.batch():
+        t1.value = "a1"
+        t1.update()
+        with session.batch():
+            t2.value = "b1"
+            t2.update()
+        assert conn.messages == []
+
+    assert [m.action for m in conn.messages] == [ClientAction.PATCH_CONTROLS]
+
+
+def test_batch_with_single_patch_sends_patch_control():
+    t = ft.Text("a")
+    session, conn = make_session(t)
+
+    with session.batch():
+        t.value = "b"
+        t.update()
+
+    assert [m.action for m in conn.messages] == [ClientAction.PATCH_CONTROL]
+
+
+def test_batch_flushes_patches_before_other_messages():
+    t = ft.Text("a")
+    session, conn = make_session(t)
+
+    with session.batch():
+        t.value = "b"
+        t.update()
+        session.error("boom")
+
+    assert [m.action for m in conn.messages] == [
+        ClientAction.PATCH_CONTROL,
+        ClientAction.SESSION_CRASHED,
+    ]
+
+
+def test_page_update_with_several_controls_is_batched():
+    t1, t2 = ft.Text("a"), ft.Text("b")
+    session, conn = make_session(t1, t2)
+
+    t1.value = "a1"
+    t2.value = "b1"
+    session.page.update(t1, t2)
+
+    assert [m.action for m in conn.messages] == [ClientAction.PATCH_CONTROLS]
@@ -0,0 +1,178 @@
+import time
+
+import msgpack
+import pytest
+
+import flet as ft
+from flet.controls.base_control import BaseControl
+from flet.messaging.connection import Connection
+from flet.messaging.protocol import ClientAction, configure_encode_object_for_msgpack
+from flet.messaging.replay_buffer import ReplayBuffer
+from flet.messaging.session import Session
+from flet.pubsub.pubsub_hub import PubSubHub
+
+
+class _EncodedConnection(Connection):
+    def __init__(self):
+        super().__init__()
+        self.frames = []
+        self.messages = []
+
+    def send_message(self, message):
+        self.messages.append(message)
+
+    def send_encoded_message(self, data):
+        self.frames.append(data)
+
+
+def _make_session(replay_buffer: ReplayBuffer, *controls: ft.Control):
+    conn = _EncodedConnection()
+    conn.pubsubhub = PubSubHub()
+    session = Session(conn, replay_buffer=replay_buffer)
+    session.page.controls.extend(controls)
+    msgpack.packb(  # mount controls
+        session.get_page_patch(),
+        default=configure_encode_object_for_msgpack(BaseControl),
+    )
+    return session, conn
+
+
+def _decode(frames):
+    return [msgpack.unpackb(f, strict_map_key=False) for f in frames]
+
+
+def test_replay_buffer_returns_messages_after_seq():
+    buffer = ReplayBuffer(max_bytes=1024, max_age_seconds=60)
+    for seq in range(1, 4):
+        buffer.append(seq, bytes([seq]))
+
+    assert buffer.since(3) == []
+    assert buffer.since(1) == [b"\x02", b"\x03"]
+    assert buffer.since(0) == [b"\x01", b"\x02", b"\x03"]
+    assert buffer.since(4) is None
+
+
+def test_replay_buffer_reports_overrun_by_size():
+    buffer = ReplayBuffer(max_bytes=4, max_age_seconds=60)
+    for seq in range(1, 4):
+        buffer.append(seq, b"xx")
+
+    assert len(buffer) == 2
+    assert buffer.size == 4
+    assert buffer.since(1) == [b"xx", b"xx"]
+    assert buffer.since(0) is None
+
+
+def test_replay_buffer_keeps_interned_messages_from_other_clients():
+    buffer = ReplayBuffer(max_bytes=1024, max_age_seconds=60)
+    buffer.append(1, b"a", interned=True)
+    buffer.append(2, b"b")
+
+    assert buffer.since(0, interned=True) == [b"a", b"b"]
+    assert buffer.since(0) is None
+    assert buffer.since(1) == [b"b"]
+
+
+def test_replay_buffer_evicts_by_age(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    buffer = ReplayBuffer(max_bytes=1024, max_age_seconds=10)
+    buffer.append(1, b"a")
+    now[0] += 5
+    buffer.append(2, b"b")
+    now[0] += 6
+
+    assert buffer.since(1) == [b"b"]
+    assert buffer.since(0) is None
+
+
+@pytest.mark.asyncio
+async def test_session_sequences_messages_and_replays_missed_ones():
+    text = ft.Text("a")
+    session, conn = _make_session(ReplayBuffer(), text)
+
+    text.value = "b"
+    text.update()
+    assert _decode(conn.frames)[0][0] == ClientAction.PATCH_CONTROL.value
+    assert _decode(conn.frames)[0][2] == 1
+
+    await session.disconnect(60)
+    text.value = "c"
+    text.update()  # produced while disconnected
+    assert session.last_seq == 2
+
+    new_conn = _EncodedConnection()
+    assert session.can_resume(1)
+    session.attach_connection(new_conn, last_seq=1)
+
+    assert [m[2] for m in _decode(new_conn.frames)] == [2]
+    assert session.connection is new_conn
+
+
+@pytest.mark.asyncio
+async def test_session_cannot_resume_after_overrun():
+    text = ft.Text("a")
+    session, conn = _make_session(ReplayBuffer(max_bytes=1), text)
+
+    await session.disconnect(60)
+    text.value = "b"
+    text.update()
+
+    assert not session.can_resume(0)
+    assert not session.can_resume(None)
+
+    new_conn = _EncodedConnection()
+    session.attach_connection(new_conn, last_seq=0)
+    assert new_conn.frames == []
+
+
+@pytest.mark.asyncio
+async def test_session_sends_page_if_trimmed_after_resume_check():
+    text = ft.Text("a")
+    session, conn = _make_session(ReplayBuffer(max_bytes=200), text)
+
+    await session.disconnect(60)
+    text.value = "b"
+    text.update()
+    assert session.can_resume(0)
+
+    # produced while the client registers, evicting the message it missed
+    for value in ("c" * 100, "d" * 100):
+        text.value = value
+        text.update()
+
+    new_conn = _EncodedConnection()
+    session.attach_connection(new_conn, last_seq=0)
+
+    assert new_conn.frames == []
+    [message] = new_conn.messages
+    assert message.action == ClientAction.REGISTER_CLIENT
+    assert message.body.page_patch is session.page
+    assert message.body.last_seq == session.last_seq == 3
+
+
+@pytest.mark.asyncio
+async def test_session_does_not_replay_interned_messages_to_other_clients():
+    text = ft.Text("a")
+    session, conn = _make_session(ReplayBuffer(), text)
+    conn.intern_keys = True
+
+    text.value = "b"
+    text.update()
+    await session.disconnect(60)
+
+    assert session.can_resume(0, intern_keys=True)
+    assert not session.can_resume(0)
+
+    new_conn = _EncodedConnection()
+    session.attach_connection(new_conn, last_seq=0)
+    assert new_conn.frames == []
+    assert new_conn.messages[0].action == ClientAction.REGISTER_CLIENT
+
+
+def test_session_without_replay_buffer_does_not_sequence():
+    conn = _EncodedConnection()
+    conn.pubsubhub = PubSubHub()
+    session = Session(conn)
+    assert not session.can_resume(0)
+    assert session.last_seq == 0
@@ -0,0 +1,135 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import flet as ft
+from flet.messaging.connection import Connection
+from flet.messaging.protocol import ClientAction
+from flet.messaging.session import Session
+from flet.pubsub.pubsub_hub import PubSubHub
+
+from .common import make_session
+
+
+@pytest.fixture
+def executor():
+    executor = ThreadPoolExecutor(max_workers=4)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_sync_handler_runs_in_executor_without_blocking_loop(executor):
+    threads = []
+    release = threading.Event()
+
+    def on_click(e):
+        threads.append(threading.current_thread())
+        release.wait(5)
+
+    button = ft.Button("Go", on_click=on_click)
+    session, _ = make_session(button, executor=executor, sync_handlers_in_executor=True)
+
+    task = asyncio.create_task(session.dispatch_event(button._i, "click", None))
+    await asyncio.sleep(0.05)
+    # the loop keeps running while the handler is blocked
+    assert not task.done()
+    release.set()
+    await task
+
+    assert threads and threads[0] is not threading.main_thread()
+
+
+@pytest.mark.asyncio
+async def test_sync_handlers_keep_event_order(executor):
+    calls = []
+
+    def on_click(e):
+        time.sleep(0.01 if e.control.data % 2 else 0)
+        calls.append(e.control.data)
+
+    buttons = [ft.Button(str(i), data=i, on_click=on_click) for i in range(6)]
+    session, _ = make_session(
+        *buttons, executor=executor, sync_handlers_in_executor=True
+    )
+
+    await asyncio.gather(
+        *(session.dispatch_event(b._i, "click", None) for b in buttons)
+    )
+
+    assert calls == list(range(6))
+    stats = session.handler_stats[on_click.__qualname__]
+    assert stats.calls == 6
+    assert stats.max_time >= 0.01
+    assert stats.wait_time > 0
+
+
+@pytest.mark.asyncio
+async def test_auto_update_runs_on_loop_after_sync_handler(executor):
+    text = ft.Text("before")
+    update_threads = []
+
+    def on_click(e):
+        text.value = "after"
+
+    button = ft.Button("Go", on_click=on_click)
+    session, conn = make_session(
+        ft.Column([text, button]), executor=executor, sync_handlers_in_executor=True
+    )
+    patch_control = session.patch_control
+
+    def recording_patch_control(*args, **kwargs):
+        update_threads.append(threading.current_thread())
+        return patch_control(*args, **kwargs)
+
+    session.patch_control = recording_patch_control
+
+    await session.dispatch_event(button._i, "click", None)
+
+    assert update_threads == [threading.main_thread()]
+    assert any(m.action == ClientAction.PATCH_CONTROL for m in conn.messages)
+
+
+@pytest.mark.asyncio
+async def test_sync_handlers_run_on_loop_by_default(executor):
+    threads = []
+
+    def on_click():
+        threads.append(threading.current_thread())
+
+    button = ft.Button("Go", on_click=on_click)
+    session, _ = make_session(button, executor=executor)
+
+    await session.dispatch_event(button._i, "click", None)
+
+    assert not session.sync_handlers_in_executor
+    assert threads == [threading.main_thread()]
+    assert session.handler_stats[on_click.__qualname__].calls == 1
+
+
+@pytest.mark.asyncio
+async def test_handler_errors_are_recorded_and_reported(executor):
+    def on_click(e):
+        raise ValueError("boom")
+
+    button = ft.Button("Go", on_click=on_click)
+    session, conn = make_session(
+        button, executor=executor, sync_handlers_in_executor=True
+    )
+
+    await session.dispatch_event(button._i, "click", None)
+
+    assert session.handler_stats[on_click.__qualname__].calls == 1
+    assert any(m.action == ClientAction.SESSION_CRASHED for m in conn.messages)
+
+
+def test_mode_defaults_to_environment(monkeypatch):
+    monkeypatch.setenv("FLET_SYNC_HANDLERS_IN_EXECUTOR", "true")
+    conn = Connection()
+    conn.pubsubhub = PubSubHub()
+
+    assert Session(conn).sync_handlers_in_executor
+    assert not Session(conn, sync_handlers_in_executor=False).sync_handlers_in_executor
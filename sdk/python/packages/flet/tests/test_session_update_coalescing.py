@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+
+import flet as ft
+from flet.controls.base_control import control
+from flet.controls.context import _context_page
+from flet.messaging.protocol import ClientAction
+from flet.messaging.session import Session
+
+from .common import RecordingConnection, make_session
+
+
+@control("IsolatedColumn", isolated=True)
+class IsolatedColumn(ft.Column):
+    pass
+
+
+async def _run_scheduler_tick(session: Session):
+    session.start_updates_scheduler()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+
+def _patches(conn: RecordingConnection):
+    patches = []
+    for m in conn.messages:
+        if m.action == ClientAction.PATCH_CONTROL:
+            patches.append(m.body)
+        elif m.action == ClientAction.PATCH_CONTROLS:
+            patches.extend(m.body.patches)
+    return patches
+
+
+@pytest.mark.asyncio
+async def test_scheduler_collapses_updates_to_topmost_dirty_ancestor():
+    text = ft.Text("a")
+    col = ft.Column([text])
+    session, conn = make_session(col)
+
+    text.value = "b"
+    session.schedule_update(text)
+    session.schedule_update(col)
+    session.schedule_update(session.page)
+    await _run_scheduler_tick(session)
+
+    assert session.updates_requested == 3
+    assert session.updates_performed == 1
+    assert len(_patches(conn)) == 1
+    assert _patches(conn)[0].id == session.page._i
+
+
+@pytest.mark.asyncio
+async def test_scheduler_updates_unrelated_controls_separately():
+    text1 = ft.Text("a")
+    text2 = ft.Text("b")
+    session, conn = make_session(ft.Column([text1]), ft.Column([text2]))
+
+    text1.value = "a1"
+    text2.value = "b1"
+    session.schedule_update(text1)
+    session.schedule_update(text2)
+    await _run_scheduler_tick(session)
+
+    assert session.updates_performed == 2
+    assert {p.id for p in _patches(conn)} == {text1._i, text2._i}
+    # both patches of one tick go out in a single frame
+    assert [m.action for m in conn.messages] == [ClientAction.PATCH_CONTROLS]
+
+
+@pytest.mark.asyncio
+async def test_scheduler_does_not_skip_children_of_isolated_controls():
+    text = ft.Text("a")
+    isolated = IsolatedColumn([text])
+    session, conn = make_session(ft.Column([isolated]))
+
+    text.value = "b"
+    session.schedule_update(session.page)
+    session.schedule_update(text)
+    await _run_scheduler_tick(session)
+
+    # the page diff stops at the isolated column, so the text is still updated
+    assert session.updates_performed == 2
+    assert [p.id for p in _patches(conn)] == [text._i]
+
+
+@pytest.mark.asyncio
+async def test_scheduler_renders_dirty_child_component_once():
+    renders = {"parent": 0, "child": 0}
+    setters = {}
+
+    @ft.component
+    def Child():
+        value, setters["child"] = ft.use_state(0)
+        renders["child"] += 1
+        return ft.Text(f"child {value}")
+
+    @ft.component
+    def Parent():
+        value, setters["parent"] = ft.use_state(0)
+        renders["parent"] += 1
+        return ft.Column([ft.Text(f"parent {value}"), Child()])
+
+    session, _ = make_session()
+    _context_page.set(session.page)
+    session.page.render(Parent)
+    await _run_scheduler_tick(session)
+    renders.update(parent=0, child=0)
+    requested = session.updates_requested
+    performed = session.updates_performed
+
+    setters["child"](1)
+    setters["parent"](1)
+    await _run_scheduler_tick(session)
+
+    assert renders == {"parent": 1, "child": 1}
+    assert session.updates_requested - requested == 2
+    assert session.updates_performed - performed == 1
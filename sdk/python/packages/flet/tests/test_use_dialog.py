@@ -16,6 +16,8 @@ from flet.pubsub.pubsub_hub import PubSubHub
 
 
 class FakeSession:
+    sync_handlers_in_executor = False
+
     def __init__(self):
         self.patch_calls: list[tuple[object, dict]] = []
         self.scheduled_updates: list[object] = []
@@ -36,6 +38,9 @@ class FakeSession:
     async def after_event(self, control):
         pass
 
+    def record_handler_time(self, handler, elapsed, wait_time=0.0):
+        pass
+
 
 class _RecordingConnection(Connection):
     def __init__(self):